@@ -28,51 +28,117 @@ __all__ = [
     "VolumeMount",
 ]
 
+import importlib
+import typing
 from os import environ, path
 
 import dotenv
-import mlrun_pipelines
 
 from .config import config as mlconf
-from .datastore import DataItem, store_manager
-from .db import get_run_db
 from .errors import MLRunInvalidArgumentError, MLRunNotFoundError
-from .execution import MLClientCtx
-from .model import RunObject, RunTemplate, new_task
-from .package import ArtifactType, DefaultPackager, Packager, handler
-from .projects import (
-    ProjectMetadata,
-    build_function,
-    deploy_function,
-    get_or_create_project,
-    load_project,
-    new_project,
-    pipeline_context,
-    run_function,
-)
-from .projects.project import _add_username_to_project_name_if_needed
-from .run import (
-    _run_pipeline,
-    code_to_function,
-    function_to_module,
-    get_dataitem,
-    get_object,
-    get_or_create_ctx,
-    get_pipeline,
-    import_function,
-    new_function,
-    wait_for_pipeline_completion,
-)
-from .runtimes import new_model_server
 from .secrets import get_secret_or_env
 from .utils.version import Version
 
-__version__ = Version().get()["version"]
+if typing.TYPE_CHECKING:
+    from mlrun_pipelines.common.mounts import VolumeMount
+    from mlrun_pipelines.mounts import auto_mount, mount_v3io, v3io_cred
+
+    from .datastore import DataItem, store_manager
+    from .db import get_run_db
+    from .execution import MLClientCtx
+    from .model import RunObject, RunTemplate, new_task
+    from .package import ArtifactType, DefaultPackager, Packager, handler
+    from .projects import (
+        ProjectMetadata,
+        build_function,
+        deploy_function,
+        get_or_create_project,
+        load_project,
+        new_project,
+        pipeline_context,
+        run_function,
+    )
+    from .projects.project import _add_username_to_project_name_if_needed
+    from .run import (
+        _run_pipeline,
+        code_to_function,
+        function_to_module,
+        get_dataitem,
+        get_object,
+        get_or_create_ctx,
+        get_pipeline,
+        import_function,
+        new_function,
+        wait_for_pipeline_completion,
+    )
+    from .runtimes import new_model_server
+
+# The package attributes that are imported on first access (PEP 562), mapped to their module. The runtimes, projects,
+# packagers, datastores and the pipelines adapters (which import kfp) are slow to import, and most processes (the CLI,
+# the serving functions, the DB clients) use only some of them
+_lazy_attributes: dict[str, str] = {
+    "VolumeMount": "mlrun_pipelines.common.mounts",
+    "auto_mount": "mlrun_pipelines.mounts",
+    "mount_v3io": "mlrun_pipelines.mounts",
+    "v3io_cred": "mlrun_pipelines.mounts",
+    "DataItem": "mlrun.datastore",
+    "store_manager": "mlrun.datastore",
+    "get_run_db": "mlrun.db",
+    "MLClientCtx": "mlrun.execution",
+    "RunObject": "mlrun.model",
+    "RunTemplate": "mlrun.model",
+    "new_task": "mlrun.model",
+    "ArtifactType": "mlrun.package",
+    "DefaultPackager": "mlrun.package",
+    "Packager": "mlrun.package",
+    "handler": "mlrun.package",
+    "ProjectMetadata": "mlrun.projects",
+    "build_function": "mlrun.projects",
+    "deploy_function": "mlrun.projects",
+    "get_or_create_project": "mlrun.projects",
+    "load_project": "mlrun.projects",
+    "new_project": "mlrun.projects",
+    "pipeline_context": "mlrun.projects",
+    "run_function": "mlrun.projects",
+    "_add_username_to_project_name_if_needed": "mlrun.projects.project",
+    "_run_pipeline": "mlrun.run",
+    "code_to_function": "mlrun.run",
+    "function_to_module": "mlrun.run",
+    "get_dataitem": "mlrun.run",
+    "get_object": "mlrun.run",
+    "get_or_create_ctx": "mlrun.run",
+    "get_pipeline": "mlrun.run",
+    "import_function": "mlrun.run",
+    "new_function": "mlrun.run",
+    "wait_for_pipeline_completion": "mlrun.run",
+    "new_model_server": "mlrun.runtimes",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in _lazy_attributes:
+        value = getattr(importlib.import_module(_lazy_attributes[name]), name)
+    else:
+        # The subpackages used to be imported with the package, keep `mlrun.<subpackage>` working without importing it
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    # cache the attribute, the next accesses don't go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy_attributes))
 
-VolumeMount = mlrun_pipelines.common.mounts.VolumeMount
-mount_v3io = mlrun_pipelines.mounts.mount_v3io
-v3io_cred = mlrun_pipelines.mounts.v3io_cred
-auto_mount = mlrun_pipelines.mounts.auto_mount
+
+__version__ = Version().get()["version"]
 
 
 def get_version():
@@ -137,6 +203,8 @@ def set_environment(
         raise ValueError("DB/API path was not detected, please specify its address")
 
     # check connectivity and load remote defaults
+    from .db import get_run_db
+
     get_run_db()
     if api_path:
         environ["MLRUN_DBPATH"] = mlconf.dbpath
@@ -165,6 +233,8 @@ def set_environment(
 
 
 def get_current_project(silent=False):
+    from .projects import pipeline_context
+
     if not pipeline_context.project and not silent:
         raise MLRunInvalidArgumentError(
             "current project is not initialized, use new, get or load project methods first"
@@ -27,7 +27,6 @@ import click
 import dotenv
 import pandas as pd
 import yaml
-from mlrun_pipelines.mounts import auto_mount as auto_mount_modifier
 from tabulate import tabulate
 
 import mlrun
@@ -39,15 +38,6 @@ from .config import config as mlconf
 from .db import get_run_db
 from .errors import err_to_str
 from .model import RunTemplate
-from .projects import load_project
-from .run import (
-    get_object,
-    import_function,
-    import_function_to_dict,
-    load_func_code,
-    new_function,
-)
-from .runtimes import RemoteRuntime, RunError, RuntimeKinds, ServingRuntime
 from .secrets import SecretsStore
 from .utils import (
     RunKeys,
@@ -60,6 +50,9 @@ from .utils import (
 )
 from .utils.version import Version
 
+# the projects, run and runtimes modules are slow to import, the commands import what they use so that the commands
+# which don't need them (e.g. get, logs, config, version) start faster
+
 pd.set_option("mode.chained_assignment", None)
 
 
@@ -233,6 +226,8 @@ def run(
     returns,
 ):
     """Execute a task and inject parameters."""
+    from .run import get_object, new_function
+    from .runtimes import RunError
 
     if env_file:
         mlrun.set_env_from_file(env_file)
@@ -410,6 +405,9 @@ def run(
         if workdir:
             fn.spec.workdir = workdir
         if auto_mount:
+            # imported here as the pipelines mounts import kfp, which slows down the CLI startup
+            from mlrun_pipelines.mounts import auto_mount as auto_mount_modifier
+
             fn.apply(auto_mount_modifier())
         fn.is_child = from_env and not kfp
         if kfp:
@@ -506,6 +504,7 @@ def build(
     full_image_file_path,
 ):
     """Build a container image from code and requirements."""
+    from .run import import_function, new_function
 
     if env_file:
         mlrun.set_env_from_file(env_file)
@@ -645,6 +644,8 @@ def deploy(
     ensure_project,
 ):
     """Deploy model or function"""
+    from .runtimes import RemoteRuntime, RuntimeKinds, ServingRuntime
+
     if env_file:
         mlrun.set_env_from_file(env_file)
 
@@ -990,6 +991,8 @@ def project(
     save,
 ):
     """load and/or run a project"""
+    from .projects import load_project
+
     if env_file:
         mlrun.set_env_from_file(env_file)
 
@@ -1087,6 +1090,8 @@ def project(
 
 
 def validate_runtime_kind(ctx, param, value):
+    from .runtimes import RuntimeKinds
+
     possible_kinds = RuntimeKinds.runtime_with_handlers()
     if value is not None and value not in possible_kinds:
         raise click.BadParameter(
@@ -1328,6 +1333,9 @@ def dict_to_str(struct: dict):
 
 
 def func_url_to_runtime(func_url, ensure_project: bool = False):
+    from .projects import load_project
+    from .run import import_function_to_dict, load_func_code
+
     try:
         if func_url.startswith("db://"):
             func_url = func_url[5:]
@@ -1355,7 +1363,7 @@ def func_url_to_runtime(func_url, ensure_project: bool = False):
     return runtime
 
 
-def load_notification(notifications: str, project: mlrun.projects.MlrunProject):
+def load_notification(notifications: str, project: "mlrun.projects.MlrunProject"):
     """
     A dictionary or json file containing notification dictionaries can be used by the user to set notifications.
     Each notification is stored in a tuple called notifications.
@@ -1378,7 +1386,7 @@ def load_notification(notifications: str, project: mlrun.projects.MlrunProject):
 
 
 def add_notification_to_project(
-    notification: str, project: mlrun.projects.MlrunProject
+    notification: str, project: "mlrun.projects.MlrunProject"
 ):
     for notification_type, notification_params in notification.items():
         project.notifiers.add_notification(
@@ -1387,7 +1395,7 @@ def add_notification_to_project(
 
 
 def send_workflow_error_notification(
-    run_id: str, mlproject: mlrun.projects.MlrunProject, error: Exception
+    run_id: str, mlproject: "mlrun.projects.MlrunProject", error: Exception
 ):
     message = (
         f":x: Failed to run scheduled workflow {run_id} in Project {mlproject.name} !\n"
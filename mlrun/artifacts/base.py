@@ -24,6 +24,7 @@ import yaml
 import mlrun
 import mlrun.artifacts
 import mlrun.datastore
+import mlrun.datastore.transfer
 import mlrun.errors
 
 from ..model import ModelObj
@@ -662,6 +663,7 @@ class DirArtifact(Artifact):
             )
 
         files = os.listdir(self.spec.src_path)
+        uploads = []
         for file_name in files:
             file_path = os.path.join(self.spec.src_path, file_name)
             if not os.path.isfile(file_path):
@@ -681,10 +683,13 @@ class DirArtifact(Artifact):
                     "set to False"
                 )
 
-            mlrun.datastore.store_manager.object(url=target_path).upload(file_path)
+            uploads.append((file_path, target_path))
             # add files of the directory to the extra data of the artifact with value of the target path
             self.spec.extra_data[file_name] = target_path
 
+        # upload the directory files concurrently
+        mlrun.datastore.transfer.bulk_upload(uploads)
+
 
 class LinkArtifactSpec(ArtifactSpec):
     _dict_fields = ArtifactSpec._dict_fields + [
@@ -764,6 +769,7 @@ def upload_extra_data(
     if not extra_data:
         return
     target_path = artifact.target_path
+    uploads = []
     for key, item in extra_data.items():
         if isinstance(item, bytes):
             if target_path:
@@ -790,13 +796,16 @@ def upload_extra_data(
                 _, target = artifact.resolve_file_target_hash_path(
                     src_path, artifact_path=artifact_path
                 )
-            mlrun.datastore.store_manager.object(url=target).upload(src_path)
+            uploads.append((src_path, target))
             artifact.extra_data[prefix + key] = target
             continue
 
         if update_spec:
             artifact.extra_data[prefix + key] = item
 
+    # upload the extra data files (e.g. the model directory files) concurrently
+    mlrun.datastore.transfer.bulk_upload(uploads)
+
 
 def get_artifact_meta(artifact):
     """return artifact object, and list of extra data items
@@ -16,12 +16,15 @@
 import typing
 
 import mlrun_pipelines.common.ops
-import mlrun_pipelines.models
 
 import mlrun.common.types
 
 from .base import ObjectFormat
 
+if typing.TYPE_CHECKING:
+    # importing the pipeline models imports kfp, which is slow to import
+    import mlrun_pipelines.models
+
 
 class PipelineFormat(ObjectFormat, mlrun.common.types.StrEnum):
     full = "full"
@@ -31,16 +34,16 @@ class PipelineFormat(ObjectFormat, mlrun.common.types.StrEnum):
 
     @staticmethod
     def format_method(_format: str) -> typing.Optional[typing.Callable]:
-        def _full(run: mlrun_pipelines.models.PipelineRun) -> dict:
+        def _full(run: "mlrun_pipelines.models.PipelineRun") -> dict:
             return run.to_dict()
 
-        def _metadata_only(run: mlrun_pipelines.models.PipelineRun) -> dict:
+        def _metadata_only(run: "mlrun_pipelines.models.PipelineRun") -> dict:
             return mlrun.utils.helpers.format_run(run, with_project=True)
 
-        def _name_only(run: mlrun_pipelines.models.PipelineRun) -> str:
+        def _name_only(run: "mlrun_pipelines.models.PipelineRun") -> str:
             return run.get("name")
 
-        def _summary(run: mlrun_pipelines.models.PipelineRun) -> dict:
+        def _summary(run: "mlrun_pipelines.models.PipelineRun") -> dict:
             return mlrun_pipelines.common.ops.format_summary_from_kfp_run(
                 run, run["project"]
             )
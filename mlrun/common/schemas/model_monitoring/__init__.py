@@ -38,6 +38,7 @@ from .constants import (
     ResultStatusApp,
     SchedulingKeys,
     SpecialApps,
+    StreamProcessingMode,
     TDEngineSuperTables,
     TSDBTarget,
     V3IOTSDBTables,
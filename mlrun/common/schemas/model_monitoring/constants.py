@@ -158,6 +158,11 @@ class ModelEndpointTarget(MonitoringStrEnum):
     SQL = "sql"
 
 
+class StreamProcessingMode(MonitoringStrEnum):
+    ROWS = "rows"
+    COLUMNAR = "columnar"
+
+
 class StreamKind(MonitoringStrEnum):
     V3IO_STREAM = "v3io_stream"
     KAFKA = "kafka"
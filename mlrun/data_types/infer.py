@@ -12,15 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import concurrent.futures
+import functools
+import os
+
 import numpy as np
 import packaging.version
 import pandas as pd
 import pyarrow
 from pandas.io.json._table_schema import convert_pandas_type_to_json_field
 
+import mlrun.config
 from mlrun.utils import logger
 
 from .data_types import InferOptions, pa_type_to_value_type, pd_schema_to_value_type
+from .sketches import DataFrameSketch
 
 default_num_bins = 20
 
@@ -102,11 +108,18 @@ def infer_schema_from_df(
 
 
 def get_df_stats(df, options, num_bins=None, sample_size=None):
-    """get per column data stats from dataframe"""
+    """get per column data stats from dataframe
+
+    dataframes with mlrun.mlconf.feature_store.stats_sketch_min_rows rows or more are described with
+    mergeable sketches, see get_df_sketch_stats()
+    """
 
     results_dict = {}
     if df.empty:
         return results_dict
+    sketch_min_rows = int(mlrun.config.config.feature_store.stats_sketch_min_rows or 0)
+    if sketch_min_rows and df.shape[0] >= sketch_min_rows:
+        return get_df_sketch_stats(df, options, num_bins=num_bins)
     if sample_size and df.shape[0] > sample_size:
         df = df.sample(sample_size)
 
@@ -122,18 +135,9 @@ def get_df_stats(df, options, num_bins=None, sample_size=None):
         else {"datetime_is_numeric": True}
     )
     for col, values in df.describe(include="all", **kwargs).items():
-        stats_dict = {}
-        for stat, val in values.dropna().items():
-            if isinstance(val, (float, np.floating, np.float64)):
-                stats_dict[stat] = float(val)
-            elif isinstance(val, (int, np.integer, np.int64)):
-                # boolean values are considered subclass of int
-                if isinstance(val, bool):
-                    stats_dict[stat] = bool(val)
-                else:
-                    stats_dict[stat] = int(val)
-            else:
-                stats_dict[stat] = str(val)
+        stats_dict = {
+            stat: _to_stats_value(val) for stat, val in values.dropna().items()
+        }
 
         if InferOptions.get_common_options(
             options, InferOptions.Histogram
@@ -149,6 +153,122 @@ def get_df_stats(df, options, num_bins=None, sample_size=None):
     return results_dict
 
 
+def _to_stats_value(val):
+    # boolean values are considered subclass of int
+    if isinstance(val, (bool, np.bool_)):
+        return bool(val)
+    if isinstance(val, (float, np.floating, np.float64)):
+        return float(val)
+    if isinstance(val, (int, np.integer, np.int64)):
+        return int(val)
+    return str(val)
+
+
+def get_df_sketch_stats(
+    df, options, num_bins=None, partition_rows=None, max_workers=None
+) -> dict:
+    """get per column data stats from dataframe using mergeable sketches (same format as get_df_stats)
+
+    the dataframe is split to partitions which are sketched in parallel and merged. count, mean, std,
+    min and max are exact, quantiles (t-digest) and histograms are approximate, unique is exact up to
+    sketches.default_max_tracked_values distinct values and estimated (HyperLogLog) above that
+
+    :param df:             dataframe
+    :param options:        InferOptions (Index and Histogram are used)
+    :param num_bins:       number of histogram bins
+    :param partition_rows: rows per partition, default to default_sketch_partition_rows
+    :param max_workers:    max partitions sketched in parallel, default to the number of cpus
+    """
+    if df.empty:
+        return {}
+    df = _with_stats_index(df, options)
+    partition_rows = partition_rows or default_sketch_partition_rows
+    partitions = [
+        df.iloc[start : start + partition_rows]
+        for start in range(0, df.shape[0], partition_rows)
+    ]
+    if len(partitions) == 1:
+        sketch = DataFrameSketch().update(df)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers or os.cpu_count() or 1, len(partitions))
+        ) as executor:
+            sketches = executor.map(
+                lambda partition: DataFrameSketch().update(partition), partitions
+            )
+            sketch = functools.reduce(DataFrameSketch.merge, sketches)
+    return _sketch_to_stats(sketch, options, num_bins)
+
+
+def _with_stats_index(df, options):
+    # the index columns are described as well when the Index option is set (as in get_df_stats)
+    if InferOptions.get_common_options(options, InferOptions.Index) and df.index.names:
+        return df.reset_index()
+    return df
+
+
+def _sketch_to_stats(sketch: DataFrameSketch, options, num_bins=None) -> dict:
+    raw_stats = sketch.get_stats(
+        num_bins or default_num_bins,
+        histogram=bool(
+            InferOptions.get_common_options(options, InferOptions.Histogram)
+        ),
+    )
+    return {
+        column: {
+            stat: val if stat == "hist" else _to_stats_value(val)
+            for stat, val in stats_dict.items()
+        }
+        for column, stats_dict in raw_stats.items()
+    }
+
+
+class ChunkedDFStats:
+    """accumulate data stats over dataframe chunks with bounded memory
+
+    the stats are calculated with mergeable sketches (see get_df_sketch_stats), a uniform sample of up to
+    sample_size rows is kept for the schema inference and preview
+    """
+
+    def __init__(self, sample_size: int = None, options=InferOptions.all_stats()):
+        self.sample_size = sample_size or default_chunked_sample_size
+        self.options = options
+        self.rows = 0
+        self._sample = None
+        self._sketch = DataFrameSketch()
+        self._rng = np.random.default_rng()
+
+    @property
+    def sample(self) -> pd.DataFrame:
+        """uniform sample of the rows seen so far"""
+        if self._sample is None:
+            return pd.DataFrame()
+        return self._sample.drop(columns=[_sample_key_column])
+
+    def update(self, df: pd.DataFrame):
+        """add a chunk to the stats"""
+        if df is None or df.empty:
+            return
+        self.rows += len(df)
+        self._sketch.update(_with_stats_index(df, self.options))
+
+        # keep the rows with the smallest random keys (a uniform sample of all the chunks)
+        chunk = df.assign(**{_sample_key_column: self._rng.random(len(df))})
+        if self._sample is not None:
+            chunk = pd.concat([self._sample, chunk])
+        self._sample = chunk.nsmallest(self.sample_size, _sample_key_column)
+
+    def get_stats(self, options=None, num_bins=None) -> dict:
+        """return the stats in the get_df_stats() format"""
+        options = self.options if options is None else options
+        return _sketch_to_stats(self._sketch, options, num_bins)
+
+
+_sample_key_column = "__mlrun_sample_key__"
+default_chunked_sample_size = 1000
+default_sketch_partition_rows = 100000
+
+
 def get_df_preview(df, preview_lines=20):
     """capture preview data from df"""
     # record sample rows from the dataframe
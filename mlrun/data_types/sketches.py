@@ -0,0 +1,555 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""mergeable data sketches, used to calculate the data stats over chunks/partitions with bounded memory
+
+every sketch supports update() (add values) and merge() (combine with a sketch of another chunk), so the
+stats can be calculated over partitions in parallel and combined, in any order
+"""
+
+import math
+import typing
+
+import numpy as np
+import pandas as pd
+
+default_compression = 200
+default_hll_precision = 14
+default_max_tracked_values = 10000
+default_histogram_bins = 4096
+
+
+class TDigest:
+    """merging t-digest, approximate quantiles with a bounded number of centroids
+
+    the centroids are small at the tails and larger at the median (the arcsin scale function), so the
+    quantile error is relative to q * (1 - q). small datasets (up to buffer_size values) are kept as is,
+    and their quantiles are exact
+    """
+
+    def __init__(self, compression: int = default_compression):
+        self.compression = compression
+        self.buffer_size = compression * 5
+        self.means = np.empty(0, dtype=float)
+        self.weights = np.empty(0, dtype=float)
+
+    @property
+    def count(self) -> int:
+        return int(self.weights.sum())
+
+    def update(self, values: np.ndarray):
+        """add values to the digest"""
+        values = np.asarray(values, dtype=float)
+        self._add(values, np.ones(len(values)))
+
+    def merge(self, other: "TDigest"):
+        """merge the centroids of another digest"""
+        self._add(other.means, other.weights)
+        return self
+
+    def _add(self, means, weights):
+        self.means = np.concatenate([self.means, means])
+        self.weights = np.concatenate([self.weights, weights])
+        if len(self.means) > self.buffer_size:
+            self._compress()
+
+    def _compress(self):
+        self._sort()
+        cumulative = np.cumsum(self.weights)
+        quantiles = (cumulative - self.weights / 2) / cumulative[-1]
+        # centroids in the same scale function unit are merged
+        scale = np.floor(
+            self.compression * (np.arcsin(2 * quantiles - 1) / np.pi + 0.5)
+        )
+        starts = np.flatnonzero(np.r_[True, scale[1:] != scale[:-1]])
+        weights = np.add.reduceat(self.weights, starts)
+        self.means = np.add.reduceat(self.means * self.weights, starts) / weights
+        self.weights = weights
+
+    def _sort(self):
+        order = np.argsort(self.means, kind="stable")
+        self.means, self.weights = self.means[order], self.weights[order]
+
+    def quantile(self, quantiles, minimum: float, maximum: float) -> np.ndarray:
+        """return the (linearly interpolated) values at the given quantiles"""
+        self._sort()
+        total = self.weights.sum()
+        # the center (0 based index) of every centroid, exact for single value centroids
+        positions = np.cumsum(self.weights) - (self.weights + 1) / 2
+        return np.interp(
+            np.asarray(quantiles) * (total - 1),
+            np.r_[0, positions, total - 1],
+            np.r_[minimum, self.means, maximum],
+        )
+
+
+class FixedBinHistogram:
+    """mergeable histogram with fixed width bins
+
+    the bin width is a power of 2 and the bins are aligned to 0, so the histograms of different chunks
+    have the same bin boundaries (after combining adjacent bins of the finer one) and are merged by adding
+    the counts. the width grows to keep up to max_bins bins, histogram() re-bins the counts to the
+    requested bins (assuming uniform values within a bin)
+    """
+
+    def __init__(self, max_bins: int = default_histogram_bins):
+        self.max_bins = max_bins
+        # the bin width is 2**exponent, bin i covers [(offset + i) * width, (offset + i + 1) * width)
+        self.exponent = None
+        self.offset = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def update(self, values: np.ndarray):
+        """add (finite) values to the histogram"""
+        values = np.asarray(values, dtype=float)
+        if len(values) == 0:
+            return
+        if self.exponent is None:
+            self.exponent = self._initial_exponent(values.min(), values.max())
+        self._add(np.floor(np.ldexp(values, -self.exponent)), self.exponent)
+
+    def merge(self, other: "FixedBinHistogram"):
+        if other.exponent is not None and len(other.counts):
+            if self.exponent is None:
+                self.exponent = other.exponent
+            indices = other.offset + np.arange(len(other.counts), dtype=float)
+            self._add(indices, other.exponent, other.counts)
+        return self
+
+    def _initial_exponent(self, minimum: float, maximum: float) -> int:
+        if maximum > minimum:
+            return math.ceil(math.log2((maximum - minimum) / self.max_bins))
+        # a single value, the width grows when other values are added
+        return math.frexp(abs(maximum))[1] - 30
+
+    def _add(self, indices: np.ndarray, exponent: int, weights: np.ndarray = None):
+        if exponent > self.exponent:
+            self._coarsen(exponent - self.exponent)
+        elif exponent < self.exponent:
+            indices = np.floor(np.ldexp(indices, exponent - self.exponent))
+
+        low, high = indices.min(), indices.max()
+        if len(self.counts):
+            low = min(low, self.offset)
+            high = max(high, self.offset + len(self.counts) - 1)
+        shift = 0
+        while (
+            np.floor(np.ldexp(high, -shift)) - np.floor(np.ldexp(low, -shift))
+            >= self.max_bins
+        ):
+            shift += 1
+        if shift:
+            self._coarsen(shift)
+            indices = np.floor(np.ldexp(indices, -shift))
+            low, high = (
+                np.floor(np.ldexp(low, -shift)),
+                np.floor(np.ldexp(high, -shift)),
+            )
+
+        # extend the bins to cover the new values
+        low, high = int(low), int(high)
+        if not len(self.counts):
+            self.offset = low
+        self.counts = np.pad(
+            self.counts,
+            (self.offset - low, max(high - self.offset - len(self.counts) + 1, 0)),
+        )
+        self.offset = low
+        self.counts += np.bincount(
+            (indices - self.offset).astype(np.intp),
+            weights=weights,
+            minlength=len(self.counts),
+        ).astype(np.int64)
+
+    def _coarsen(self, shift: int):
+        """multiply the bin width by 2**shift (combine adjacent bins)"""
+        self.exponent += shift
+        if not len(self.counts):
+            return
+        indices = np.floor(
+            np.ldexp(self.offset + np.arange(len(self.counts), dtype=float), -shift)
+        )
+        self.offset = int(indices[0])
+        self.counts = np.bincount(
+            (indices - self.offset).astype(np.intp), weights=self.counts
+        ).astype(np.int64)
+
+    def histogram(self, bins: int, minimum: float, maximum: float):
+        """return (counts, bin edges) of equal width bins between minimum and maximum (the same bins as
+        numpy.histogram)"""
+        if minimum == maximum:
+            minimum, maximum = minimum - 0.5, maximum + 0.5
+        edges = np.linspace(minimum, maximum, bins + 1)
+        boundaries = np.ldexp(
+            self.offset + np.arange(len(self.counts) + 1, dtype=float), self.exponent
+        )
+        cumulative = np.r_[0, np.cumsum(self.counts)]
+        # the number of values below every edge (all the values are within the edges)
+        below = np.interp(edges, boundaries, cumulative)
+        below[0], below[-1] = 0, cumulative[-1]
+        return np.diff(np.rint(below)).astype(int), edges
+
+
+class HyperLogLog:
+    """HyperLogLog distinct count, ~0.8% standard error with the default precision (16K registers)"""
+
+    def __init__(self, precision: int = default_hll_precision):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, hashes: np.ndarray):
+        """add 64 bit hashes of the values"""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        bits = 64 - self.precision
+        index = (hashes >> np.uint64(bits)).astype(np.intp)
+        remainder = hashes & np.uint64((1 << bits) - 1)
+        # the rank is the position of the first set bit, the remainder fits in the float mantissa
+        ranks = np.full(len(hashes), bits + 1, dtype=np.uint8)
+        nonzero = remainder != 0
+        ranks[nonzero] = bits - np.floor(
+            np.log2(remainder[nonzero].astype(float))
+        ).astype(np.uint8)
+        np.maximum.at(self.registers, index, ranks)
+
+    def merge(self, other: "HyperLogLog"):
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self) -> int:
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size**2 / np.sum(np.ldexp(1.0, -self.registers.astype(int)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * size and zeros:
+            # linear counting for small cardinalities
+            estimate = size * math.log(size / zeros)
+        return int(round(estimate))
+
+
+class NumericSketch:
+    """count, mean, std, min and max (exact, merged with Chan's parallel algorithm), quantiles (t-digest)
+    and histogram (fixed bins)"""
+
+    def __init__(
+        self,
+        compression: int = default_compression,
+        histogram_bins: int = default_histogram_bins,
+        **kwargs,
+    ):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self.digest = TDigest(compression)
+        self.histogram = FixedBinHistogram(histogram_bins)
+
+    def update(self, series: pd.Series):
+        values = self._to_numbers(series.dropna())
+        if len(values) == 0:
+            return
+        mean = float(values.mean())
+        self._merge_moments(
+            len(values),
+            mean,
+            float(((values - mean) ** 2).sum()),
+            float(values.min()),
+            float(values.max()),
+        )
+        values = values[np.isfinite(values)]
+        self.digest.update(values)
+        if self.histogram is not None:
+            self.histogram.update(values)
+
+    def merge(self, other: "NumericSketch"):
+        if other.count:
+            self._merge_moments(other.count, other.mean, other.m2, other.min, other.max)
+            self.digest.merge(other.digest)
+            if self.histogram is not None:
+                self.histogram.merge(other.histogram)
+        return self
+
+    def _merge_moments(self, count, mean, m2, minimum, maximum):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta**2 * self.count * count / total
+        self.count = total
+        self.min = minimum if self.min is None else min(self.min, minimum)
+        self.max = maximum if self.max is None else max(self.max, maximum)
+
+    @staticmethod
+    def _to_numbers(series: pd.Series) -> np.ndarray:
+        return series.to_numpy(dtype=float)
+
+    def _quantiles(self) -> dict:
+        if not self.digest.count:
+            return {}
+        values = self.digest.quantile([0.25, 0.5, 0.75], self.min, self.max)
+        return dict(zip(["25%", "50%", "75%"], values))
+
+    def get_stats(self, num_bins: int, histogram: bool = True) -> dict:
+        if not self.count:
+            return {"count": 0.0}
+        stats = {"count": float(self.count), "mean": self.mean}
+        if self.count > 1:
+            stats["std"] = math.sqrt(self.m2 / (self.count - 1))
+        stats["min"] = self.min
+        stats.update(self._quantiles())
+        stats["max"] = self.max
+        if (
+            histogram
+            and self.digest.count
+            and np.isfinite(self.min)
+            and np.isfinite(self.max)
+        ):
+            counts, edges = self.histogram.histogram(num_bins, self.min, self.max)
+            stats["hist"] = [counts.tolist(), edges.tolist()]
+        return stats
+
+
+class DatetimeSketch(NumericSketch):
+    """count, mean, min, max and quantiles of datetime/timedelta values (as nanoseconds), and std of
+    timedelta values"""
+
+    def __init__(self, origin=None, **kwargs):
+        super().__init__(**kwargs)
+        self.origin = origin
+        # datetime stats have no histogram
+        self.histogram = None
+
+    def _to_numbers(self, series: pd.Series) -> np.ndarray:
+        return ((series - self.origin) // pd.Timedelta(1, "ns")).to_numpy(dtype=float)
+
+    def _to_value(self, nanoseconds: float):
+        return self.origin + pd.Timedelta(int(round(nanoseconds)), "ns")
+
+    def get_stats(self, num_bins: int, histogram: bool = True) -> dict:
+        if not self.count:
+            return {"count": 0}
+        stats = {"count": self.count, "mean": self._to_value(self.mean)}
+        if isinstance(self.origin, pd.Timedelta) and self.count > 1:
+            stats["std"] = pd.Timedelta(math.sqrt(self.m2 / (self.count - 1)), "ns")
+        stats["min"] = self._to_value(self.min)
+        for name, value in self._quantiles().items():
+            stats[name] = self._to_value(value)
+        stats["max"] = self._to_value(self.max)
+        return stats
+
+
+class CategoricalSketch:
+    """count, distinct count (unique), most frequent value (top) and its frequency (freq)
+
+    the value counts are exact up to max_tracked_values distinct values, above that only the most
+    frequent values are tracked (top/freq become approximate) and unique is estimated with HyperLogLog
+    """
+
+    def __init__(
+        self,
+        hll_precision: int = default_hll_precision,
+        max_tracked_values: int = default_max_tracked_values,
+        boolean: bool = False,
+        **kwargs,
+    ):
+        self.count = 0
+        # boolean columns are numeric for numpy.histogram
+        self.boolean = boolean
+        self.max_tracked_values = max_tracked_values
+        self.value_counts = pd.Series(dtype="int64")
+        self.hll = HyperLogLog(hll_precision)
+        # while the counts are exact the distinct values are known, the hll is updated once they are not
+        self.exact = True
+
+    def update(self, series: pd.Series):
+        series = series.dropna()
+        if series.empty:
+            return
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype(object)
+        self.count += len(series)
+        value_counts = series.value_counts(sort=False)
+        if not self.exact:
+            self._update_hll(value_counts)
+        self._merge_counts(value_counts)
+
+    def merge(self, other: "CategoricalSketch"):
+        self.count += other.count
+        if not other.exact:
+            self._make_approximate()
+            self.hll.merge(other.hll)
+        elif not self.exact:
+            self._update_hll(other.value_counts)
+        self._merge_counts(other.value_counts)
+        return self
+
+    def _update_hll(self, value_counts: pd.Series):
+        hashes = pd.util.hash_array(value_counts.index.to_numpy(dtype=object))
+        self.hll.update(hashes)
+
+    def _make_approximate(self):
+        if self.exact:
+            self._update_hll(self.value_counts)
+            self.exact = False
+
+    def _merge_counts(self, value_counts: pd.Series):
+        value_counts = value_counts[value_counts > 0]
+        if value_counts.empty:
+            return
+        if not self.value_counts.empty:
+            value_counts = (
+                pd.concat([self.value_counts, value_counts])
+                .groupby(level=0, sort=False)
+                .sum()
+            )
+        self.value_counts = value_counts.astype("int64")
+        if len(self.value_counts) > self.max_tracked_values:
+            self._make_approximate()
+            self.value_counts = self.value_counts.nlargest(self.max_tracked_values)
+
+    def get_stats(self, num_bins: int, histogram: bool = True) -> dict:
+        if not self.count:
+            return {"count": 0, "unique": 0}
+        unique = len(self.value_counts) if self.exact else self.hll.count()
+        stats = {"count": self.count, "unique": unique}
+        if not self.value_counts.empty:
+            top = self.value_counts.idxmax()
+            stats.update({"top": top, "freq": self.value_counts[top]})
+        if histogram and self.boolean:
+            counts, edges = np.histogram(
+                self.value_counts.index.to_numpy(dtype=float),
+                bins=num_bins,
+                weights=self.value_counts.to_numpy(),
+            )
+            stats["hist"] = [counts.astype(int).tolist(), edges.tolist()]
+        return stats
+
+
+def new_column_sketch(series: pd.Series, **kwargs):
+    """return an empty sketch for the column type (following the pandas describe() column kinds)"""
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return CategoricalSketch(boolean=True, **kwargs)
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return DatetimeSketch(origin=pd.Timestamp(0, tz=series.dt.tz), **kwargs)
+    if pd.api.types.is_timedelta64_dtype(dtype):
+        return DatetimeSketch(origin=pd.Timedelta(0), **kwargs)
+    if pd.api.types.is_numeric_dtype(dtype):
+        return NumericSketch(**kwargs)
+    return CategoricalSketch(**kwargs)
+
+
+def _sketch_kind(sketch) -> tuple:
+    # sketches of the same kind can be merged, the datetime sketches must share the origin (type and tz)
+    return (
+        type(sketch),
+        getattr(sketch, "boolean", False),
+        repr(getattr(sketch, "origin", None)),
+    )
+
+
+def to_categorical_sketch(sketch, **kwargs) -> CategoricalSketch:
+    """convert a column sketch to a categorical sketch (when the column type changes between chunks)
+
+    the numeric values are known only through the t-digest centroids, the value counts stay exact while
+    the digest holds every value (up to its buffer size) and are approximated by the centroids above that
+    """
+    if isinstance(sketch, CategoricalSketch):
+        sketch.boolean = False
+        return sketch
+    categorical = CategoricalSketch(**kwargs)
+    categorical.count = sketch.count
+    digest = sketch.digest
+    if not digest.count:
+        return categorical
+    values = digest.means
+    if isinstance(sketch, DatetimeSketch):
+        values = [sketch._to_value(value) for value in values]
+    value_counts = (
+        pd.Series(digest.weights, index=pd.Index(values, dtype=object))
+        .groupby(level=0, sort=False)
+        .sum()
+        .round()
+        .astype("int64")
+    )
+    categorical._merge_counts(value_counts)
+    if digest.count != sketch.count or (digest.weights != 1).any():
+        categorical._make_approximate()
+    return categorical
+
+
+class DataFrameSketch:
+    """per column mergeable sketches of a dataframe
+
+    example::
+
+        sketch = DataFrameSketch()
+        for chunk in pd.read_csv(path, chunksize=100000):
+            sketch.update(chunk)
+        stats = sketch.get_stats()
+
+    :param compression:        t-digest compression (max centroids per numeric column)
+    :param hll_precision:      HyperLogLog precision (2**precision registers per categorical column)
+    :param max_tracked_values: max exact value counts per categorical column
+    """
+
+    def __init__(
+        self,
+        compression: int = default_compression,
+        hll_precision: int = default_hll_precision,
+        max_tracked_values: int = default_max_tracked_values,
+    ):
+        self.sketch_args = {
+            "compression": compression,
+            "hll_precision": hll_precision,
+            "max_tracked_values": max_tracked_values,
+        }
+        self.columns: dict[typing.Hashable, typing.Any] = {}
+
+    def update(self, df: pd.DataFrame):
+        """add a chunk to the sketches"""
+        for column in df.columns:
+            series = df[column]
+            sketch = new_column_sketch(series, **self.sketch_args)
+            if column not in self.columns:
+                self.columns[column] = sketch
+            elif _sketch_kind(self.columns[column]) != _sketch_kind(sketch):
+                self._to_categorical(column)
+            self.columns[column].update(series)
+        return self
+
+    def merge(self, other: "DataFrameSketch"):
+        """merge the sketches of another chunk/partition"""
+        for column, sketch in other.columns.items():
+            if column not in self.columns:
+                self.columns[column] = sketch
+                continue
+            if _sketch_kind(self.columns[column]) != _sketch_kind(sketch):
+                self._to_categorical(column)
+                sketch = to_categorical_sketch(sketch, **self.sketch_args)
+            self.columns[column].merge(sketch)
+        return self
+
+    def _to_categorical(self, column):
+        # a column which changes its type between the chunks (e.g. numbers in one chunk and strings in
+        # another) is described as categorical, like the object column pandas has for the whole data
+        self.columns[column] = to_categorical_sketch(
+            self.columns[column], **self.sketch_args
+        )
+
+    def get_stats(self, num_bins: int, histogram: bool = True) -> dict:
+        """return the raw per column stats (in the pandas describe() order)"""
+        return {
+            column: sketch.get_stats(num_bins, histogram=histogram)
+            for column, sketch in self.columns.items()
+        }
@@ -30,6 +30,7 @@ from .base import DataStore, FileStats, make_datastore_schema_sanitizer
 
 class AzureBlobStore(DataStore):
     using_bucket = True
+    supports_ranged_get = True
     max_concurrency = 100
     max_blocksize = 1024 * 1024 * 4
     max_single_put_size = (
@@ -31,15 +31,18 @@ import mlrun.errors
 from mlrun.errors import err_to_str
 from mlrun.utils import StorePrefix, is_jupyter, logger
 
+from .file_cache import LocalFileCache, get_local_cache
 from .store_resources import is_store_uri, parse_store_uri
+from .transfer import chunked_download, chunked_upload, use_chunked_transfer
 from .utils import filter_df_start_end_time, select_columns_from_df
 
 
 class FileStats:
-    def __init__(self, size, modified, content_type=None):
+    def __init__(self, size, modified, content_type=None, etag=None):
         self.size = size
         self.modified = modified
         self.content_type = content_type
+        self.etag = etag
 
     def __repr__(self):
         return f"FileStats(size={self.size}, modified={self.modified}, type={self.content_type})"
@@ -47,6 +50,12 @@ class FileStats:
 
 class DataStore:
     using_bucket = False
+    # stores which support ranged get() download large objects in concurrent chunks
+    supports_ranged_get = False
+    # stores which implement the _multipart_upload_* methods upload large files in concurrent parts
+    supports_multipart_upload = False
+    # the min size in bytes of a multipart upload part (except for the last part), smaller chunks are enlarged
+    min_multipart_chunk_size = 0
 
     def __init__(self, parent, name, kind, endpoint="", secrets: dict = None):
         self._parent = parent
@@ -174,7 +183,18 @@ class DataStore:
     def listdir(self, key):
         raise ValueError("data store doesnt support listdir")
 
-    def download(self, key, target_path):
+    def download(self, key, target_path, stats=None):
+        """download the object to the target path, large objects are downloaded in chunks
+
+        :param key:         object key
+        :param target_path: local target path
+        :param stats:       object FileStats if known (to save the stat() call)
+        """
+        if self.supports_ranged_get and use_chunked_transfer():
+            stats = stats or self.stat(key)
+            if stats and use_chunked_transfer(stats.size):
+                return self.chunked_download(key, target_path, stats=stats)
+
         data = self.get(key)
         mode = "wb"
         if isinstance(data, str):
@@ -186,6 +206,84 @@ class DataStore:
     def upload(self, key, src_path):
         pass
 
+    def chunked_download(
+        self, key, target_path, stats=None, chunk_size=None, max_workers=None
+    ):
+        """download the object in concurrent ranges, a failed download is resumed on the next call
+
+        :param key:         object key
+        :param target_path: local target path
+        :param stats:       object FileStats (to save the stat() call)
+        :param chunk_size:  range size in bytes, defaults to mlrun.mlconf.storage.transfer.chunk_size
+        :param max_workers: max concurrent ranges, defaults to mlrun.mlconf.storage.transfer.max_workers
+        """
+        chunked_download(
+            self,
+            key,
+            target_path,
+            stats=stats,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+
+    def chunked_upload(self, key, src_path, chunk_size=None, max_workers=None):
+        """upload the file in concurrent parts, a failed upload is resumed on the next call
+
+        stores without multipart upload support fall back to a regular upload
+
+        :param key:         object key
+        :param src_path:    local source path
+        :param chunk_size:  part size in bytes, defaults to mlrun.mlconf.storage.transfer.chunk_size (at least
+                            min_multipart_chunk_size)
+        :param max_workers: max concurrent parts, defaults to mlrun.mlconf.storage.transfer.max_workers
+        """
+        if not self.supports_multipart_upload:
+            return self.upload(key, src_path)
+        chunked_upload(
+            self, key, src_path, chunk_size=chunk_size, max_workers=max_workers
+        )
+
+    def _multipart_upload_start(self, key) -> str:
+        """start a multipart upload, return the upload id"""
+        raise NotImplementedError()
+
+    def _multipart_upload_part(self, key, upload_id, part_number, data):
+        """upload a single part, return the part info needed to complete the upload"""
+        raise NotImplementedError()
+
+    def _multipart_upload_complete(self, key, upload_id, parts):
+        """complete the multipart upload from the list of (part number, part info)"""
+        raise NotImplementedError()
+
+    def _multipart_upload_abort(self, key, upload_id):
+        """abort the multipart upload and discard its uploaded parts"""
+        raise NotImplementedError()
+
+    def _download_to_local_cache(self, url, key) -> Optional[str]:
+        """download the object through the local file cache (mlrun.mlconf.storage.local_cache)
+
+        :return: the cached file path, None if the cache is disabled or the object version is unknown
+        """
+        cache = get_local_cache()
+        if not cache or self.kind in ["file", "memory"]:
+            return None
+        try:
+            stats = self.stat(key)
+        except Exception as exc:
+            logger.debug(
+                "Failed to stat object, skipping the local cache",
+                url=url,
+                exc=err_to_str(exc),
+            )
+            return None
+        _, suffix = path.splitext(key)
+        return cache.get(
+            url,
+            stats,
+            lambda target_path: self.download(key, target_path, stats=stats),
+            suffix=suffix,
+        )
+
     def get_spark_options(self):
         return {}
 
@@ -377,10 +475,14 @@ class DataStore:
                 kwargs["storage_options"] = storage_options
             df = reader(url, **kwargs)
         else:
-            temp_file = tempfile.NamedTemporaryFile(delete=False)
-            self.download(self._join(subpath), temp_file.name)
-            df = reader(temp_file.name, **kwargs)
-            remove(temp_file.name)
+            cached_path = self._download_to_local_cache(url, self._join(subpath))
+            if cached_path:
+                df = reader(cached_path, **kwargs)
+            else:
+                temp_file = tempfile.NamedTemporaryFile(delete=False)
+                self.download(self._join(subpath), temp_file.name)
+                df = reader(temp_file.name, **kwargs)
+                remove(temp_file.name)
 
         if is_json or is_csv:
             # for parquet file the time filtering is executed in `reader`
@@ -463,6 +565,7 @@ class DataItem:
         self._meta = meta
         self._artifact_url = artifact_url
         self._local_path = ""
+        self._local_path_is_cached = False
 
     @property
     def key(self):
@@ -555,10 +658,26 @@ class DataItem:
         return self._store.listdir(self._path)
 
     def local(self):
-        """get the local path of the file, download to tmp first if it's a remote object"""
+        """get the local path of the file, download to tmp first if it's a remote object
+
+        when the local cache is enabled (mlrun.mlconf.storage.local_cache) the object is downloaded
+        once per version and shared with other data items and processes on the node
+        """
         if self.kind == "file":
             return self._path
         if self._local_path:
+            if not self._local_path_is_cached:
+                return self._local_path
+            # the cached file may have been evicted since, in that case fetch it again
+            if LocalFileCache.touch(self._local_path):
+                return self._local_path
+            self._local_path = ""
+            self._local_path_is_cached = False
+
+        cached_path = self._store._download_to_local_cache(self._url, self._path)
+        if cached_path:
+            self._local_path = cached_path
+            self._local_path_is_cached = True
             return self._local_path
 
         dot = self._path.rfind(".")
@@ -575,8 +694,11 @@ class DataItem:
             return
 
         if self._local_path:
-            remove(self._local_path)
+            # cached files are shared and are removed by the cache eviction
+            if not self._local_path_is_cached:
+                remove(self._local_path)
             self._local_path = ""
+            self._local_path_is_cached = False
 
     def as_df(
         self,
@@ -674,7 +796,8 @@ class DataItem:
 def get_range(size, offset):
     byterange = f"bytes={offset}-"
     if size:
-        byterange += str(offset + size)
+        # the range end is inclusive
+        byterange += str(offset + size - 1)
     return byterange
 
 
@@ -0,0 +1,181 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import contextlib
+import hashlib
+import os
+import tempfile
+import threading
+import typing
+
+import mlrun.config
+from mlrun.utils import logger
+
+try:
+    import fcntl
+except ImportError:  # windows
+    fcntl = None
+
+_lock_suffix = ".lock"
+_partial_suffix = ".partial"
+_key_length = 64  # sha256 hex digest
+
+
+class LocalFileCache:
+    """content addressed on-disk cache for remote objects
+
+    objects are keyed by their url and version (etag, or modification time and size), so a new version
+    of an object is never served from the cache. the cache is shared by all the processes on the node
+    which use the same cache directory, a per-object file lock makes sure concurrent processes share
+    a single download. when the cache exceeds max_size the least recently used objects are evicted.
+    """
+
+    def __init__(self, path: str, max_size: int):
+        self.path = path
+        self.max_size = max_size
+        self._thread_lock = threading.RLock()
+        os.makedirs(self.path, exist_ok=True)
+
+    @staticmethod
+    def cache_key(url: str, stats) -> typing.Optional[str]:
+        """return the object cache key, or None if the object version cannot be determined"""
+        if stats is None:
+            return None
+        version = getattr(stats, "etag", None)
+        if not version:
+            if not stats.modified:
+                return None
+            version = f"{stats.modified}-{stats.size}"
+        return hashlib.sha256(f"{url}|{version}".encode()).hexdigest()
+
+    def get(
+        self,
+        url: str,
+        stats,
+        download: typing.Callable[[str], None],
+        suffix: str = "",
+    ) -> typing.Optional[str]:
+        """return the local path of the cached object, download it (once) if it's not cached
+
+        :param url:      object url
+        :param stats:    object FileStats (from the datastore stat())
+        :param download: download function, gets the local target path
+        :param suffix:   file suffix for the cached file (e.g. ".csv")
+
+        :return: cached file path, or None if the object is not cacheable
+        """
+        key = self.cache_key(url, stats)
+        if not key:
+            return None
+
+        target_path = os.path.join(self.path, key + suffix)
+        with self._file_lock(os.path.join(self.path, key + _lock_suffix)):
+            # update the access time, used for the LRU eviction
+            if self.touch(target_path):
+                return target_path
+
+            logger.info("Downloading object to local cache", url=url)
+            partial_path = (
+                f"{target_path}.{os.getpid()}-{threading.get_ident()}{_partial_suffix}"
+            )
+            try:
+                download(partial_path)
+                os.replace(partial_path, target_path)
+            finally:
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+
+        self.evict(keep=target_path)
+        return target_path
+
+    @staticmethod
+    def touch(cached_path: str) -> bool:
+        """mark the cached object as recently used, returns False if it was evicted"""
+        try:
+            os.utime(cached_path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def size(self) -> int:
+        """total size of the cached objects (in bytes)"""
+        return sum(os.path.getsize(path) for path, _ in self._cached_files())
+
+    def evict(self, keep: str = None):
+        """evict the least recently used objects until the cache size is below max_size
+
+        :param keep: path of an object which should not be evicted (e.g. was just downloaded)
+        """
+        with self._file_lock(os.path.join(self.path, _lock_suffix)):
+            files = sorted(self._cached_files(), key=lambda item: item[1].st_mtime)
+            total_size = sum(stat.st_size for _, stat in files)
+            for path, stat in files:
+                if total_size <= self.max_size:
+                    break
+                if path == keep:
+                    continue
+                # the cached file names start with the (fixed length) key
+                key = os.path.basename(path)[:_key_length]
+                with self._file_lock(os.path.join(self.path, key + _lock_suffix)):
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(path)
+                        total_size -= stat.st_size
+
+    def clear(self):
+        """remove all the cached objects"""
+        max_size, self.max_size = self.max_size, -1
+        try:
+            self.evict()
+        finally:
+            self.max_size = max_size
+
+    def _cached_files(self):
+        for entry in os.scandir(self.path):
+            if entry.is_file() and not entry.name.endswith(
+                (_lock_suffix, _partial_suffix)
+            ):
+                try:
+                    yield entry.path, entry.stat()
+                except FileNotFoundError:
+                    continue
+
+    @contextlib.contextmanager
+    def _file_lock(self, lock_path: str):
+        # the thread lock protects processes without fcntl (e.g. windows), the file lock
+        # synchronizes between processes on the same node
+        with self._thread_lock if fcntl is None else contextlib.nullcontext():
+            with open(lock_path, "a") as lock_file:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+_local_cache: typing.Optional[LocalFileCache] = None
+
+
+def get_local_cache() -> typing.Optional[LocalFileCache]:
+    """return the local file cache (see mlrun.mlconf.storage.local_cache), None if disabled"""
+    global _local_cache
+    cache_config = mlrun.config.config.storage.local_cache
+    if not cache_config.enabled:
+        return None
+    path = cache_config.path or os.path.join(tempfile.gettempdir(), "mlrun-cache")
+    if _local_cache is None or _local_cache.path != path:
+        _local_cache = LocalFileCache(path, int(cache_config.max_size))
+    else:
+        _local_cache.max_size = int(cache_config.max_size)
+    return _local_cache
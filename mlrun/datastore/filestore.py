@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import time
-from os import listdir, makedirs, path, stat
-from shutil import copyfile
+import uuid
+from os import listdir, makedirs, path, replace, stat
+from shutil import copyfile, copyfileobj, rmtree
 
 import fsspec
 
@@ -23,6 +24,9 @@ from .base import DataStore, FileStats
 
 
 class FileStore(DataStore):
+    supports_ranged_get = True
+    supports_multipart_upload = True
+
     def __init__(self, parent, schema, name, endpoint="", secrets: dict = None):
         super().__init__(parent, name, "file", endpoint, secrets=secrets)
 
@@ -71,7 +75,7 @@ class FileStore(DataStore):
             fp.write(data)
             fp.close()
 
-    def download(self, key, target_path):
+    def download(self, key, target_path, stats=None):
         fullpath = self._join(key)
         if fullpath == target_path:
             return
@@ -86,6 +90,36 @@ class FileStore(DataStore):
             makedirs(dir, exist_ok=True)
         copyfile(src_path, fullpath)
 
+    def _multipart_upload_start(self, key) -> str:
+        upload_id = uuid.uuid4().hex
+        makedirs(self._multipart_parts_dir(key, upload_id), exist_ok=True)
+        return upload_id
+
+    def _multipart_upload_part(self, key, upload_id, part_number, data):
+        part_path = path.join(
+            self._multipart_parts_dir(key, upload_id), str(part_number)
+        )
+        with open(part_path, "wb") as fp:
+            fp.write(data)
+        return len(data)
+
+    def _multipart_upload_complete(self, key, upload_id, parts):
+        fullpath = self._join(key)
+        parts_dir = self._multipart_parts_dir(key, upload_id)
+        temp_path = path.join(parts_dir, "object")
+        with open(temp_path, "wb") as target:
+            for part_number, _ in parts:
+                with open(path.join(parts_dir, str(part_number)), "rb") as part:
+                    copyfileobj(part, target)
+        replace(temp_path, fullpath)
+        rmtree(parts_dir)
+
+    def _multipart_upload_abort(self, key, upload_id):
+        rmtree(self._multipart_parts_dir(key, upload_id), ignore_errors=True)
+
+    def _multipart_parts_dir(self, key, upload_id):
+        return f"{self._join(key)}.{upload_id}.parts"
+
     def stat(self, key):
         s = stat(self._join(key))
         return FileStats(size=s.st_size, modified=s.st_mtime)
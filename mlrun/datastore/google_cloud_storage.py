@@ -30,6 +30,7 @@ from .base import DataStore, FileStats, make_datastore_schema_sanitizer
 
 class GoogleCloudStorageStore(DataStore):
     using_bucket = True
+    supports_ranged_get = True
     workers = 8
     chunk_size = 32 * 1024 * 1024
 
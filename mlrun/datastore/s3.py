@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import time
 
 import boto3
@@ -21,10 +22,15 @@ from fsspec.registry import get_filesystem_class
 import mlrun.errors
 
 from .base import DataStore, FileStats, get_range, make_datastore_schema_sanitizer
+from .transfer import use_chunked_transfer
 
 
 class S3Store(DataStore):
     using_bucket = True
+    supports_ranged_get = True
+    supports_multipart_upload = True
+    # the S3 min part size
+    min_multipart_chunk_size = 5 * 1024**2
 
     def __init__(self, parent, schema, name, endpoint="", secrets: dict = None):
         super().__init__(parent, name, schema, endpoint, secrets)
@@ -175,9 +181,48 @@ class S3Store(DataStore):
         return self.endpoint, path
 
     def upload(self, key, src_path):
+        if use_chunked_transfer(os.path.getsize(src_path)):
+            # resumable parallel multipart upload
+            return self.chunked_upload(key, src_path)
         bucket, key = self.get_bucket_and_key(key)
         self.s3.Bucket(bucket).upload_file(src_path, key, Config=self.config)
 
+    def _multipart_upload_start(self, key) -> str:
+        bucket, key = self.get_bucket_and_key(key)
+        response = self.s3.meta.client.create_multipart_upload(Bucket=bucket, Key=key)
+        return response["UploadId"]
+
+    def _multipart_upload_part(self, key, upload_id, part_number, data):
+        bucket, key = self.get_bucket_and_key(key)
+        response = self.s3.meta.client.upload_part(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return response["ETag"]
+
+    def _multipart_upload_complete(self, key, upload_id, parts):
+        bucket, key = self.get_bucket_and_key(key)
+        self.s3.meta.client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": part_number, "ETag": etag}
+                    for part_number, etag in parts
+                ]
+            },
+        )
+
+    def _multipart_upload_abort(self, key, upload_id):
+        bucket, key = self.get_bucket_and_key(key)
+        self.s3.meta.client.abort_multipart_upload(
+            Bucket=bucket, Key=key, UploadId=upload_id
+        )
+
     def get(self, key, size=None, offset=0):
         bucket, key = self.get_bucket_and_key(key)
         obj = self.s3.Object(bucket, key)
@@ -195,7 +240,7 @@ class S3Store(DataStore):
         obj = self.s3.Object(bucket, key)
         size = obj.content_length
         modified = obj.last_modified
-        return FileStats(size, time.mktime(modified.timetuple()))
+        return FileStats(size, time.mktime(modified.timetuple()), etag=obj.e_tag)
 
     def listdir(self, key):
         bucket, key = self.get_bucket_and_key(key)
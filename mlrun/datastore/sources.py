@@ -21,6 +21,7 @@ from datetime import datetime
 from typing import Optional, Union
 
 import pandas as pd
+import pyarrow
 import semver
 import v3io
 import v3io.dataplane
@@ -424,6 +425,14 @@ class ParquetSource(BaseSourceDriver):
     ):
         reader_args = self.attributes.get("reader_args", {})
         additional_filters = transform_list_filters_to_tuple(additional_filters)
+        if self.is_iterator():
+            return self._to_dataframe_chunks(
+                columns=columns,
+                start_time=start_time or self.start_time,
+                end_time=end_time or self.end_time,
+                time_field=time_field or self.time_field,
+                additional_filters=additional_filters or self.additional_filters,
+            )
         return mlrun.store_manager.object(url=self.path).as_df(
             columns=columns,
             df_module=df_module,
@@ -435,6 +444,75 @@ class ParquetSource(BaseSourceDriver):
             **reader_args,
         )
 
+    def is_iterator(self):
+        return bool(self.attributes.get("chunksize"))
+
+    def _to_dataframe_chunks(
+        self,
+        columns=None,
+        start_time=None,
+        end_time=None,
+        time_field=None,
+        additional_filters=None,
+    ):
+        """iterate the parquet file(s) row groups in chunks of up to `chunksize` rows"""
+        import pyarrow.parquet as pq
+
+        chunksize = int(self.attributes["chunksize"])
+        store, _, url = mlrun.store_manager.get_or_create_store(self.path)
+        filesystem = store.filesystem
+        if filesystem is None:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"chunked reading is not supported for {self.path}, the store has no filesystem "
+                "(unset the chunksize attribute to read it at once)"
+            )
+        if filesystem.isdir(url):
+            paths = sorted(
+                path
+                for path in filesystem.find(url)
+                if path.endswith((".parquet", ".pq"))
+                and not os.path.basename(path).startswith(("_", "."))
+            )
+        else:
+            paths = [url]
+
+        filter_expression = (
+            pq.filters_to_expression(additional_filters) if additional_filters else None
+        )
+        read_columns = None
+        if columns:
+            # the filter columns are read and dropped after filtering
+            filter_columns = [time_field] + [
+                column for column, _, _ in additional_filters or []
+            ]
+            read_columns = list(columns) + [
+                column for column in filter_columns if column and column not in columns
+            ]
+
+        for path in paths:
+            with filesystem.open(path, "rb") as fp:
+                parquet_file = pq.ParquetFile(fp)
+                available_columns = parquet_file.schema_arrow.names
+                for batch in parquet_file.iter_batches(
+                    batch_size=chunksize,
+                    columns=[
+                        column for column in read_columns if column in available_columns
+                    ]
+                    if read_columns
+                    else None,
+                ):
+                    table = pyarrow.Table.from_batches([batch])
+                    if filter_expression is not None:
+                        table = table.filter(filter_expression)
+                    df = table.to_pandas()
+                    if time_field and (start_time or end_time):
+                        df = filter_df_start_end_time(
+                            df, time_field, start_time, end_time
+                        )
+                    if columns:
+                        df = df[[column for column in columns if column in df.columns]]
+                    yield df
+
     def _build_spark_additional_filters(self, column_types: dict):
         if not self.additional_filters:
             return None
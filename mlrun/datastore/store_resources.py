@@ -13,6 +13,10 @@
 # limitations under the License.
 
 # flake8: noqa  - this is until we take care of the F401 violations with respect to __all__ & sphinx
+import concurrent.futures
+import threading
+import time
+from collections import OrderedDict
 
 import mlrun
 import mlrun.artifacts
@@ -50,14 +54,55 @@ def get_store_uri(kind, uri):
     return f"{DB_SCHEMA}://{kind}/{uri}"
 
 
+class _CachedResource:
+    def __init__(self, value, loader=None):
+        self.value = value
+        # resources without a loader were cached explicitly, they never expire or get evicted
+        self.loader = loader
+        self.updated = time.monotonic()
+        self.refreshing = False
+
+
 class ResourceCache:
     """Resource cache for real-time pipeline/serving and storey
-    this cache is basic and doesnt have sync or ttl logic
+
+    resources fetched through resource_getter() expire after ttl seconds, a stale resource is
+    either served while being re-fetched in the background (stale_while_revalidate) or re-fetched
+    before returning, and the least recently used resources are evicted above max_size.
+    storey tables are cached for the life of the graph.
+
+    :param ttl:                    seconds until a cached resource is stale, 0 for no expiration,
+                                   defaults to mlrun.mlconf.feature_store.resource_cache.ttl
+    :param stale_while_revalidate: serve stale resources while re-fetching them in the background
+    :param max_size:               max number of cached resources, 0 for unbounded
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        ttl: float = None,
+        stale_while_revalidate: bool = None,
+        max_size: int = None,
+    ):
+        cache_config = config.feature_store.resource_cache
+        self.ttl = float(cache_config.ttl if ttl is None else ttl)
+        self.stale_while_revalidate = (
+            cache_config.stale_while_revalidate
+            if stale_while_revalidate is None
+            else stale_while_revalidate
+        )
+        self.max_size = int(cache_config.max_size if max_size is None else max_size)
         self._tabels = {}
-        self._resources = {}
+        self._resources = OrderedDict()
+        self._lock = threading.RLock()
+        self._refresh_executor = None
+        self._counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+            "evictions": 0,
+        }
 
     def cache_table(self, uri, value, is_default=False):
         """Cache storey Table objects"""
@@ -116,30 +161,109 @@ class ResourceCache:
 
     def cache_resource(self, uri, value, default=False):
         """cache store resource (artifact/feature-set/feature-vector)"""
-        self._resources[uri] = value
-        if default:
-            self._resources["."] = value
+        with self._lock:
+            self._resources[uri] = _CachedResource(value)
+            if default:
+                self._resources["."] = _CachedResource(value)
 
     def get_resource(self, uri):
         """get resource from cache by uri"""
-        return self._resources[uri]
+        with self._lock:
+            return self._resources[uri].value
+
+    def invalidate(self, uri=None):
+        """remove a resource (or all the fetched resources if uri is not specified) from the cache"""
+        with self._lock:
+            if uri is not None:
+                self._resources.pop(uri, None)
+                return
+            for key in [key for key, entry in self._resources.items() if entry.loader]:
+                del self._resources[key]
+
+    def get_stats(self) -> dict:
+        """return the resource cache counters (hits, stale hits, misses, refreshes, evictions, size)"""
+        with self._lock:
+            return {**self._counters, "size": len(self._resources)}
 
     def resource_getter(self, db=None, secrets=None):
-        """wraps get_store_resource with a simple object cache"""
+        """wraps get_store_resource with an object cache (see ResourceCache for the ttl logic)"""
+
+        def _load(uri):
+            return get_store_resource(uri, db, secrets=secrets)
 
         def _get_store_resource(uri, use_cache=True):
             """get mlrun store resource object
             :param use_cache: indicate if we read from local cache or from DB
             """
-            if (uri == "." or use_cache) and uri in self._resources:
-                return self._resources[uri]
-            resource = get_store_resource(uri, db, secrets=secrets)
+            if uri == "." or use_cache:
+                found, value = self._get_cached(uri)
+                if found:
+                    return value
+            resource = _load(uri)
             if use_cache:
-                self._resources[uri] = resource
+                self._set_cached(uri, resource, _load)
             return resource
 
         return _get_store_resource
 
+    def _get_cached(self, uri):
+        with self._lock:
+            entry = self._resources.get(uri)
+            if entry is None:
+                self._counters["misses"] += 1
+                return False, None
+            self._resources.move_to_end(uri)
+            if not entry.loader or not self._is_stale(entry):
+                self._counters["hits"] += 1
+                return True, entry.value
+            if not self.stale_while_revalidate:
+                self._counters["misses"] += 1
+                return False, None
+            self._counters["stale_hits"] += 1
+            if not entry.refreshing:
+                entry.refreshing = True
+                if not self._refresh_executor:
+                    self._refresh_executor = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="resource-cache"
+                    )
+                self._refresh_executor.submit(self._refresh, uri, entry)
+            return True, entry.value
+
+    def _set_cached(self, uri, value, loader):
+        with self._lock:
+            self._resources[uri] = _CachedResource(value, loader)
+            self._resources.move_to_end(uri)
+            if not self.max_size:
+                return
+            evictable = [key for key, entry in self._resources.items() if entry.loader]
+            for key in evictable[: max(0, len(evictable) - self.max_size)]:
+                del self._resources[key]
+                self._counters["evictions"] += 1
+
+    def _is_stale(self, entry: _CachedResource):
+        return self.ttl > 0 and time.monotonic() - entry.updated > self.ttl
+
+    def _refresh(self, uri, entry: _CachedResource):
+        try:
+            value = entry.loader(uri)
+        except Exception as exc:
+            # keep serving the stale resource, retry on the next access
+            mlrun.utils.logger.warning(
+                "Failed to refresh cached resource",
+                uri=uri,
+                exc=mlrun.errors.err_to_str(exc),
+            )
+            with self._lock:
+                entry.refreshing = False
+                self._counters["refresh_errors"] += 1
+            return
+        with self._lock:
+            entry.refreshing = False
+            self._counters["refreshes"] += 1
+            # the entry may have been invalidated or evicted meanwhile
+            if self._resources.get(uri) is entry:
+                self._resources[uri] = _CachedResource(value, entry.loader)
+
 
 def get_store_resource(
     uri, db=None, secrets=None, project=None, data_store_secrets=None
@@ -0,0 +1,329 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import concurrent.futures
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import typing
+
+import mlrun.config
+import mlrun.errors
+from mlrun.utils import logger
+
+# objects larger than the max parts are transferred with larger chunks (e.g. the S3 limit)
+max_parts = 10000
+
+
+def get_transfer_config(chunk_size: int = None, max_workers: int = None):
+    """return the (chunk_size, max_workers) to use, defaults to mlrun.mlconf.storage.transfer"""
+    transfer_config = mlrun.config.config.storage.transfer
+    chunk_size = int(chunk_size or transfer_config.chunk_size)
+    max_workers = int(max_workers or transfer_config.max_workers)
+    return chunk_size, max_workers
+
+
+def is_resumable(resumable: bool = None) -> bool:
+    """return True if failed transfers should be resumable, defaults to mlrun.mlconf.storage.transfer"""
+    if resumable is None:
+        resumable = mlrun.config.config.storage.transfer.resumable
+    return bool(resumable)
+
+
+def use_chunked_transfer(size: int = None) -> bool:
+    """return True if an object of the given size should be transferred in chunks, without a size return
+    True if chunked transfers are enabled"""
+    transfer_config = mlrun.config.config.storage.transfer
+    threshold = int(transfer_config.threshold)
+    if size is None:
+        return threshold > 0
+    return threshold > 0 and size >= threshold
+
+
+def split_ranges(size: int, chunk_size: int) -> list[tuple[int, int]]:
+    """split an object to (offset, length) ranges"""
+    if size <= 0:
+        return []
+    chunk_size = max(chunk_size, -(-size // max_parts))
+    return [
+        (offset, min(chunk_size, size - offset))
+        for offset in range(0, size, chunk_size)
+    ]
+
+
+def run_parallel(func: typing.Callable, items: list, max_workers: int) -> list:
+    """run func on the items using a thread pool, on the first failure the pending items are
+    cancelled and the error is raised"""
+    if not items:
+        return []
+    if max_workers <= 1 or len(items) == 1:
+        return [func(item) for item in items]
+
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items))
+    )
+    try:
+        futures = [executor.submit(func, item) for item in items]
+        concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+        return [future.result() for future in futures]
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class TransferJournal:
+    """persisted state of a chunked transfer, used to resume a failed transfer
+
+    the journal holds the completed parts (and the multipart upload id), it is discarded when the
+    signature (the object and transfer parameters) changes, e.g. when the source object was modified,
+    the upload id of a discarded journal is kept in stale_upload_id (to abort that upload).
+    a journal which is not persisted (non resumable transfers) is kept in memory only
+    """
+
+    def __init__(self, path: str, signature: dict, persist: bool = True):
+        self.path = path
+        self.signature = signature
+        self.persist = persist
+        self.upload_id = None
+        self.stale_upload_id = None
+        self.parts = {}
+        self._lock = threading.Lock()
+        self.resumed = self._load()
+
+    def _load(self) -> bool:
+        if not os.path.isfile(self.path):
+            return False
+        try:
+            with open(self.path) as fp:
+                state = json.load(fp)
+        except (OSError, ValueError):
+            return False
+        if not self.persist or state.get("signature") != self.signature:
+            self.stale_upload_id = state.get("upload_id")
+            return False
+        self.upload_id = state.get("upload_id")
+        self.parts = {int(index): info for index, info in state["parts"].items()}
+        return True
+
+    def reset(self, upload_id: str = None):
+        with self._lock:
+            self.upload_id = upload_id
+            self.parts = {}
+            self._save()
+
+    def is_completed(self, index: int) -> bool:
+        return index in self.parts
+
+    def mark_completed(self, index: int, info=True):
+        with self._lock:
+            self.parts[index] = info
+            self._save()
+
+    def remove(self):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
+
+    def _save(self):
+        if not self.persist:
+            # drop the journal of a previous (resumable) transfer
+            self.remove()
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as fp:
+            json.dump(
+                {
+                    "signature": self.signature,
+                    "upload_id": self.upload_id,
+                    "parts": self.parts,
+                },
+                fp,
+            )
+        os.replace(temp_path, self.path)
+
+
+def chunked_download(
+    store,
+    key: str,
+    target_path: str,
+    stats=None,
+    chunk_size: int = None,
+    max_workers: int = None,
+    resumable: bool = None,
+):
+    """download an object in concurrent ranges (using store.get(key, size, offset))
+
+    the object is downloaded to <target_path>.partial, a failed download is resumed from the
+    completed ranges on the next call (as long as the object was not modified), non resumable
+    downloads remove the partial file on failure
+    """
+    chunk_size, max_workers = get_transfer_config(chunk_size, max_workers)
+    resumable = is_resumable(resumable)
+    stats = stats or store.stat(key)
+    size = stats.size
+    partial_path = f"{target_path}.partial"
+    journal = TransferJournal(
+        f"{partial_path}.json",
+        signature={
+            "url": store.url + store._join(key),
+            "size": size,
+            "modified": stats.modified,
+            "etag": getattr(stats, "etag", None),
+            "chunk_size": chunk_size,
+        },
+        persist=resumable,
+    )
+    if not journal.resumed or not os.path.isfile(partial_path):
+        with open(partial_path, "wb") as fp:
+            fp.truncate(size)
+        journal.reset()
+
+    ranges = split_ranges(size, chunk_size)
+    pending = [index for index in range(len(ranges)) if not journal.is_completed(index)]
+    if journal.resumed and pending:
+        logger.info(
+            "Resuming download",
+            key=key,
+            completed_parts=len(ranges) - len(pending),
+            total_parts=len(ranges),
+        )
+
+    def download_part(index):
+        offset, length = ranges[index]
+        data = store.get(key, size=length, offset=offset)
+        if len(data) != length:
+            raise mlrun.errors.MLRunRuntimeError(
+                f"Failed to download {key} range {offset}-{offset + length}, "
+                f"got {len(data)} bytes instead of {length}"
+            )
+        with open(partial_path, "r+b") as fp:
+            fp.seek(offset)
+            fp.write(data)
+        journal.mark_completed(index)
+
+    try:
+        run_parallel(download_part, pending, max_workers)
+    except Exception:
+        if not resumable:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(partial_path)
+        raise
+    os.replace(partial_path, target_path)
+    journal.remove()
+
+
+def chunked_upload(
+    store,
+    key: str,
+    src_path: str,
+    chunk_size: int = None,
+    max_workers: int = None,
+    resumable: bool = None,
+):
+    """upload a file in concurrent parts using the store multipart upload
+
+    a failed upload is resumed from the uploaded parts on the next call (as long as the source file
+    was not modified), the journal is kept under <temp dir>/mlrun-transfers. non resumable uploads, and
+    uploads whose journal is discarded, are aborted so the store does not keep their parts
+    """
+    chunk_size, max_workers = get_transfer_config(chunk_size, max_workers)
+    if chunk_size < store.min_multipart_chunk_size:
+        logger.warning(
+            "The chunk size is smaller than the store min part size, using the min part size",
+            chunk_size=chunk_size,
+            min_chunk_size=store.min_multipart_chunk_size,
+        )
+        chunk_size = store.min_multipart_chunk_size
+    resumable = is_resumable(resumable)
+    file_stat = os.stat(src_path)
+    size = file_stat.st_size
+    target_url = store.url + store._join(key)
+    signature = {
+        "url": target_url,
+        "src_path": os.path.abspath(src_path),
+        "size": size,
+        "modified": file_stat.st_mtime,
+        "chunk_size": chunk_size,
+    }
+    journal_name = hashlib.sha256(f"{target_url}|{signature['src_path']}".encode())
+    journal = TransferJournal(
+        os.path.join(
+            tempfile.gettempdir(), "mlrun-transfers", journal_name.hexdigest() + ".json"
+        ),
+        signature=signature,
+        persist=resumable,
+    )
+    if journal.stale_upload_id:
+        _abort_upload(store, key, journal.stale_upload_id)
+    if not journal.resumed or not journal.upload_id:
+        journal.reset(upload_id=store._multipart_upload_start(key))
+
+    ranges = split_ranges(size, chunk_size) or [(0, 0)]
+    pending = [index for index in range(len(ranges)) if not journal.is_completed(index)]
+    if journal.resumed and pending:
+        logger.info(
+            "Resuming upload",
+            key=key,
+            completed_parts=len(ranges) - len(pending),
+            total_parts=len(ranges),
+        )
+
+    def upload_part(index):
+        offset, length = ranges[index]
+        with open(src_path, "rb") as fp:
+            fp.seek(offset)
+            data = fp.read(length)
+        # part numbers start from 1
+        info = store._multipart_upload_part(key, journal.upload_id, index + 1, data)
+        journal.mark_completed(index, info)
+
+    try:
+        run_parallel(upload_part, pending, max_workers)
+        store._multipart_upload_complete(
+            key,
+            journal.upload_id,
+            [(index + 1, journal.parts[index]) for index in range(len(ranges))],
+        )
+    except Exception:
+        if not resumable:
+            _abort_upload(store, key, journal.upload_id)
+        raise
+    journal.remove()
+
+
+def _abort_upload(store, key: str, upload_id: str):
+    try:
+        store._multipart_upload_abort(key, upload_id)
+    except Exception as exc:
+        logger.warning(
+            "Failed to abort multipart upload",
+            key=key,
+            upload_id=upload_id,
+            exc=mlrun.errors.err_to_str(exc),
+        )
+
+
+def bulk_upload(files: list[tuple[str, str]], max_workers: int = None):
+    """upload multiple files concurrently (e.g. the files of a directory artifact)
+
+    :param files:       list of (source path, target url) tuples
+    :param max_workers: max concurrent uploads, defaults to mlrun.mlconf.storage.transfer.max_workers
+    """
+    _, max_workers = get_transfer_config(max_workers=max_workers)
+    run_parallel(
+        lambda item: mlrun.datastore.store_manager.object(url=item[1]).upload(item[0]),
+        files,
+        max_workers,
+    )
@@ -0,0 +1,278 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import enum
+import typing
+from copy import deepcopy
+
+import aiohttp
+import orjson
+
+import mlrun.common.schemas
+import mlrun.errors
+import mlrun.utils
+from mlrun.errors import err_to_str
+
+from ..config import config
+from ..lists import ArtifactList, RunList
+from ..utils import logger
+from .httpdb import HTTPRunDB
+
+
+class AsyncHTTPRunDB:
+    """asyncio client for the MLRun API service, for flows which issue many API calls concurrently (e.g. listing
+    objects of many projects).
+
+    The client keeps a long-lived connection pool per retry policy (the idempotent POST paths of
+    :py:attr:`HTTPRunDB.RETRIABLE_POST_PATHS` are retried, other POST requests are not), and shares the url, auth and
+    request parameters handling with :py:class:`HTTPRunDB`. The client does not sync the configuration from the
+    server, use :py:func:`mlrun.get_run_db` for that.
+
+    Paginated listings prefetch the next page while the current page is processed, and can be consumed as a stream::
+
+        async with AsyncHTTPRunDB(mlrun.mlconf.dbpath) as db:
+            async for run in db.stream_runs(project="iris", states=["error"]):
+                print(run["metadata"]["name"])
+    """
+
+    def __init__(self, url: str):
+        self._run_db = HTTPRunDB(url)
+        self._session: typing.Optional[mlrun.utils.AsyncClientWithRetry] = None
+        self._retriable_post_session: typing.Optional[
+            mlrun.utils.AsyncClientWithRetry
+        ] = None
+
+    @property
+    def base_url(self) -> str:
+        return self._run_db.base_url
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return f"{cls}({self.base_url!r})"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """close the connection pools"""
+        for session in [self._session, self._retriable_post_session]:
+            if session:
+                await session.close()
+        self._session = None
+        self._retriable_post_session = None
+
+    async def api_call(
+        self,
+        method,
+        path,
+        error=None,
+        params=None,
+        body=None,
+        json=None,
+        headers=None,
+        timeout=45,
+        version=None,
+    ) -> typing.Any:
+        """Perform a direct REST API call on the :py:mod:`mlrun` API server, see :py:meth:`HTTPRunDB.api_call`.
+
+        :returns: The parsed JSON response body (None for an empty body)
+        """
+        url = self._run_db.get_base_api_url(path, version)
+        kw = self._run_db._prepare_request_kwargs(body=body, json=json, headers=headers)
+        if params is not None:
+            kw["params"] = self._to_query_params(params)
+        if "auth" in kw:
+            kw["auth"] = aiohttp.BasicAuth(*kw["auth"])
+
+        session = self._get_session(
+            self._run_db._is_retry_on_post_allowed(method, path)
+        )
+        try:
+            async with session.request(
+                method,
+                url,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                ssl=None if config.httpdb.http.verify else False,
+                **kw,
+            ) as response:
+                if not response.ok:
+                    await self._raise_for_status(response, error)
+                content = await response.read()
+        except aiohttp.ClientError as exc:
+            error = f"{err_to_str(exc)}: {error}" if error else err_to_str(exc)
+            raise mlrun.errors.MLRunRuntimeError(error) from exc
+
+        return orjson.loads(content) if content else None
+
+    async def paginated_api_call(
+        self,
+        method,
+        path,
+        error=None,
+        params=None,
+        body=None,
+        json=None,
+        headers=None,
+        timeout=45,
+        version=None,
+    ) -> typing.AsyncGenerator[dict, None]:
+        """
+        Calls the api with pagination, yielding the parsed body of each page.
+        The next page is requested while the current page is processed by the caller.
+        """
+
+        def _api_call(_params):
+            return asyncio.ensure_future(
+                self.api_call(
+                    method=method,
+                    path=path,
+                    error=error,
+                    params=_params,
+                    body=body,
+                    json=json,
+                    headers=headers,
+                    timeout=timeout,
+                    version=version,
+                )
+            )
+
+        first_page_params = deepcopy(params) or {}
+        first_page_params["page"] = 1
+        first_page_params["page-size"] = config.httpdb.pagination.default_page_size
+        next_page = _api_call(first_page_params)
+        first_page = True
+        try:
+            while next_page:
+                try:
+                    response_body = await next_page
+                except mlrun.errors.MLRunNotFoundError:
+                    if first_page:
+                        raise
+                    # pagination token expired
+                    break
+
+                first_page = False
+                page_token = response_body.get("pagination", {}).get("page-token")
+                # Use the page token to get the next page.
+                # No need to supply any other parameters as the token informs the pagination cache
+                # which parameters to use.
+                next_page = (
+                    _api_call({"page-token": page_token}) if page_token else None
+                )
+                yield response_body
+        finally:
+            # the caller stopped consuming the pages
+            if next_page and not next_page.done():
+                next_page.cancel()
+
+    async def stream_runs(self, **kwargs) -> typing.AsyncGenerator[dict, None]:
+        """Stream the runs (as dictionaries) page by page, see :py:meth:`HTTPRunDB.list_runs` for the filters"""
+        path, params = self._run_db._prepare_list_runs_request(**kwargs)
+        async for response_body in self.paginated_api_call(
+            "GET", path, "list runs", params=params
+        ):
+            for run in response_body.get("runs", []):
+                yield run
+
+    async def list_runs(self, **kwargs) -> RunList:
+        """List runs, see :py:meth:`HTTPRunDB.list_runs` for the filters"""
+        return RunList([run async for run in self.stream_runs(**kwargs)])
+
+    async def stream_functions(self, **kwargs) -> typing.AsyncGenerator[dict, None]:
+        """Stream the functions (as dictionaries) page by page, see :py:meth:`HTTPRunDB.list_functions` for the
+        filters"""
+        path, params = self._run_db._prepare_list_functions_request(**kwargs)
+        async for response_body in self.paginated_api_call(
+            "GET", path, "list functions", params=params
+        ):
+            for function in response_body.get("funcs", []):
+                yield function
+
+    async def list_functions(self, **kwargs) -> list[dict]:
+        """List functions, see :py:meth:`HTTPRunDB.list_functions` for the filters"""
+        return [function async for function in self.stream_functions(**kwargs)]
+
+    async def stream_artifacts(self, **kwargs) -> typing.AsyncGenerator[dict, None]:
+        """Stream the artifacts (as dictionaries), see :py:meth:`HTTPRunDB.list_artifacts` for the filters.
+        Note that the artifacts listing is not paginated by the API, so the artifacts are read in a single request."""
+        path, params = self._run_db._prepare_list_artifacts_request(**kwargs)
+        response_body = await self.api_call(
+            "GET", path, "list artifacts", params=params, version="v2"
+        )
+        for artifact in response_body.get("artifacts", []):
+            yield artifact
+
+    async def list_artifacts(self, **kwargs) -> ArtifactList:
+        """List artifacts, see :py:meth:`HTTPRunDB.list_artifacts` for the filters"""
+        artifacts = ArtifactList(
+            [artifact async for artifact in self.stream_artifacts(**kwargs)]
+        )
+        artifacts.tag = kwargs.get("tag")
+        return artifacts
+
+    def _get_session(self, retry_on_post: bool) -> mlrun.utils.AsyncClientWithRetry:
+        if retry_on_post:
+            if not self._retriable_post_session:
+                self._retriable_post_session = self._init_session(
+                    blacklisted_methods=["PUT", "PATCH"]
+                )
+            return self._retriable_post_session
+
+        if not self._session:
+            self._session = self._init_session()
+        return self._session
+
+    @staticmethod
+    def _init_session(
+        blacklisted_methods: typing.Optional[list[str]] = None,
+    ) -> mlrun.utils.AsyncClientWithRetry:
+        return mlrun.utils.AsyncClientWithRetry(
+            retry_on_exception=config.httpdb.retry_api_call_on_exception
+            == mlrun.common.schemas.HTTPSessionRetryMode.enabled.value,
+            # the error details are read from the response body before raising
+            raise_for_status=False,
+            blacklisted_methods=blacklisted_methods,
+        )
+
+    @staticmethod
+    async def _raise_for_status(response: aiohttp.ClientResponse, error=None):
+        try:
+            data = await response.json(content_type=None)
+            error_details = data.get("detail", {})
+            if not error_details:
+                logger.warning("Failed parsing error response body", data=data)
+        except Exception:
+            error_details = ""
+        if error_details:
+            error_details = f"details: {error_details}"
+            error = f"{error} {error_details}" if error else error_details
+        mlrun.errors.raise_for_status(response, error)
+
+    @staticmethod
+    def _to_query_params(params: dict) -> list[tuple[str, str]]:
+        """convert the params to aiohttp query params - drop None values, expand lists and stringify the values
+        (as requests does)"""
+        query_params = []
+        for key, values in params.items():
+            for value in mlrun.utils.helpers.as_list(values):
+                if value is None:
+                    continue
+                if isinstance(value, enum.Enum):
+                    value = value.value
+                query_params.append((key, str(value)))
+        return query_params
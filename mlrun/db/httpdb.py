@@ -28,8 +28,9 @@ from urllib.parse import urlparse
 import pydantic
 import requests
 import semver
-from mlrun_pipelines.utils import compile_pipeline
 
+# mlrun.projects, mlrun.runtimes and mlrun.feature_store are not imported here, they are slow to import and only used
+# by some of the methods - they are imported on first access through the lazy attributes of the mlrun package
 import mlrun
 import mlrun.common.formatters
 import mlrun.common.runtimes
@@ -37,9 +38,6 @@ import mlrun.common.schemas
 import mlrun.common.types
 import mlrun.model_monitoring.model_endpoint
 import mlrun.platforms
-import mlrun.projects
-import mlrun.runtimes.nuclio.api_gateway
-import mlrun.runtimes.nuclio.function
 import mlrun.utils
 from mlrun.alerts.alert import AlertConfig
 from mlrun.db.auth_utils import OAuthClientIDTokenProvider, StaticTokenProvider
@@ -48,9 +46,7 @@ from mlrun.errors import MLRunInvalidArgumentError, err_to_str
 from ..artifacts import Artifact
 from ..config import config
 from ..datastore.datastore_profile import DatastoreProfile2Json
-from ..feature_store import FeatureSet, FeatureVector
 from ..lists import ArtifactList, RunList
-from ..runtimes import BaseRuntime
 from ..utils import (
     datetime_to_iso,
     dict_to_json,
@@ -121,6 +117,9 @@ class HTTPRunDB(RunDBInterface):
     def __init__(self, url):
         self.server_version = ""
         self.session = None
+        # POST requests to the idempotent paths are retried, they are sent with a session of their own so the
+        # pooled connections of both sessions are reused across calls
+        self._retriable_post_session = None
         self._wait_for_project_terminal_state_retry_interval = 3
         self._wait_for_background_task_terminal_state_retry_interval = 3
         self._wait_for_project_deletion_interval = 3
@@ -220,6 +219,51 @@ class HTTPRunDB(RunDBInterface):
         :returns: `requests.Response` HTTP response object
         """
         url = self.get_base_api_url(path, version)
+        kw = self._prepare_request_kwargs(params, body, json, headers)
+
+        if self._is_retry_on_post_allowed(method, path):
+            if not self._retriable_post_session:
+                self._retriable_post_session = self._init_session(retry_on_post=True)
+            session = self._retriable_post_session
+        else:
+            if not self.session:
+                self.session = self._init_session()
+            session = self.session
+
+        try:
+            response = session.request(
+                method,
+                url,
+                timeout=timeout,
+                verify=config.httpdb.http.verify,
+                **kw,
+            )
+        except requests.RequestException as exc:
+            error = f"{err_to_str(exc)}: {error}" if error else err_to_str(exc)
+            raise mlrun.errors.MLRunRuntimeError(error) from exc
+
+        if not response.ok:
+            if response.content:
+                try:
+                    data = response.json()
+                    error_details = data.get("detail", {})
+                    if not error_details:
+                        logger.warning("Failed parsing error response body", data=data)
+                except Exception:
+                    error_details = ""
+                if error_details:
+                    error_details = f"details: {error_details}"
+                    error = f"{error} {error_details}" if error else error_details
+                    mlrun.errors.raise_for_status(response, error)
+
+            mlrun.errors.raise_for_status(response, error)
+
+        return response
+
+    def _prepare_request_kwargs(
+        self, params=None, body=None, json=None, headers=None
+    ) -> dict:
+        """build the request keyword arguments, enriched with the auth and the client version headers"""
         kw = {
             key: value
             for key, value in (
@@ -265,40 +309,7 @@ class HTTPRunDB(RunDBInterface):
                     if isinstance(dict_[key], enum.Enum):
                         dict_[key] = dict_[key].value
 
-        # if the method is POST, we need to update the session with the appropriate retry policy
-        if not self.session or method == "POST":
-            retry_on_post = self._is_retry_on_post_allowed(method, path)
-            self.session = self._init_session(retry_on_post)
-
-        try:
-            response = self.session.request(
-                method,
-                url,
-                timeout=timeout,
-                verify=config.httpdb.http.verify,
-                **kw,
-            )
-        except requests.RequestException as exc:
-            error = f"{err_to_str(exc)}: {error}" if error else err_to_str(exc)
-            raise mlrun.errors.MLRunRuntimeError(error) from exc
-
-        if not response.ok:
-            if response.content:
-                try:
-                    data = response.json()
-                    error_details = data.get("detail", {})
-                    if not error_details:
-                        logger.warning("Failed parsing error response body", data=data)
-                except Exception:
-                    error_details = ""
-                if error_details:
-                    error_details = f"details: {error_details}"
-                    error = f"{error} {error_details}" if error else error_details
-                    mlrun.errors.raise_for_status(response, error)
-
-            mlrun.errors.raise_for_status(response, error)
-
-        return response
+        return kw
 
     def paginated_api_call(
         self,
@@ -315,6 +326,35 @@ class HTTPRunDB(RunDBInterface):
         """
         Calls the api with pagination, yielding each page of the response
         """
+        for response, _ in self._paginated_api_call(
+            method=method,
+            path=path,
+            error=error,
+            params=params,
+            body=body,
+            json=json,
+            headers=headers,
+            timeout=timeout,
+            version=version,
+        ):
+            yield response
+
+    def _paginated_api_call(
+        self,
+        method,
+        path,
+        error=None,
+        params=None,
+        body=None,
+        json=None,
+        headers=None,
+        timeout=45,
+        version=None,
+    ) -> typing.Generator[tuple[requests.Response, dict], None, None]:
+        """
+        Calls the api with pagination, yielding each page response together with its parsed body
+        (so the body is parsed once)
+        """
 
         def _api_call(_params):
             return self.api_call(
@@ -333,9 +373,10 @@ class HTTPRunDB(RunDBInterface):
         first_page_params["page"] = 1
         first_page_params["page-size"] = config.httpdb.pagination.default_page_size
         response = _api_call(first_page_params)
+        response_body = response.json()
 
-        yield response
-        page_token = response.json().get("pagination", {}).get("page-token", None)
+        yield response, response_body
+        page_token = response_body.get("pagination", {}).get("page-token", None)
 
         while page_token:
             try:
@@ -347,8 +388,9 @@ class HTTPRunDB(RunDBInterface):
                 # pagination token expired
                 break
 
-            yield response
-            page_token = response.json().get("pagination", {}).get("page-token", None)
+            response_body = response.json()
+            yield response, response_body
+            page_token = response_body.get("pagination", {}).get("page-token", None)
 
     @staticmethod
     def process_paginated_responses(
@@ -362,6 +404,19 @@ class HTTPRunDB(RunDBInterface):
             data.extend(response.json().get(key, []))
         return data
 
+    def _list_paginated(
+        self, path, error=None, params=None, key: str = "data", version=None
+    ) -> list[typing.Any]:
+        """
+        Lists all the pages of a paginated GET endpoint and returns the combined data
+        """
+        data = []
+        for _, response_body in self._paginated_api_call(
+            "GET", path, error, params=params, version=version
+        ):
+            data.extend(response_body.get(key, []))
+        return data
+
     def _init_session(self, retry_on_post: bool = False):
         return mlrun.utils.HTTPSessionWithRetry(
             retry_on_exception=config.httpdb.retry_api_call_on_exception
@@ -838,6 +893,60 @@ class HTTPRunDB(RunDBInterface):
         :param with_notifications: Return runs with notifications, and join them to the response. Default is `False`.
         """
 
+        path, params = self._prepare_list_runs_request(
+            name=name,
+            uid=uid,
+            project=project,
+            labels=labels,
+            state=state,
+            states=states,
+            sort=sort,
+            last=last,
+            iter=iter,
+            start_time_from=start_time_from,
+            start_time_to=start_time_to,
+            last_update_time_from=last_update_time_from,
+            last_update_time_to=last_update_time_to,
+            partition_by=partition_by,
+            rows_per_partition=rows_per_partition,
+            partition_sort_by=partition_sort_by,
+            partition_order=partition_order,
+            max_partitions=max_partitions,
+            with_notifications=with_notifications,
+        )
+        return RunList(
+            self._list_paginated(path, "list runs", params=params, key="runs")
+        )
+
+    def _prepare_list_runs_request(
+        self,
+        name: Optional[str] = None,
+        uid: Optional[Union[str, list[str]]] = None,
+        project: Optional[str] = None,
+        labels: Optional[Union[str, dict[str, Optional[str]], list[str]]] = None,
+        state: Optional[
+            mlrun.common.runtimes.constants.RunStates
+        ] = None,  # Backward compatibility
+        states: typing.Optional[list[mlrun.common.runtimes.constants.RunStates]] = None,
+        sort: bool = True,
+        last: int = 0,
+        iter: bool = False,
+        start_time_from: Optional[datetime] = None,
+        start_time_to: Optional[datetime] = None,
+        last_update_time_from: Optional[datetime] = None,
+        last_update_time_to: Optional[datetime] = None,
+        partition_by: Optional[
+            Union[mlrun.common.schemas.RunPartitionByField, str]
+        ] = None,
+        rows_per_partition: int = 1,
+        partition_sort_by: Optional[Union[mlrun.common.schemas.SortField, str]] = None,
+        partition_order: Union[
+            mlrun.common.schemas.OrderType, str
+        ] = mlrun.common.schemas.OrderType.desc,
+        max_partitions: int = 0,
+        with_notifications: bool = False,
+    ) -> tuple[str, dict]:
+        """return the path and the query params of a list runs request (see list_runs)"""
         project = project or config.default_project
         if with_notifications:
             logger.warning(
@@ -908,10 +1017,7 @@ class HTTPRunDB(RunDBInterface):
                     max_partitions,
                 )
             )
-        error = "list runs"
-        _path = self._path_of("runs", project)
-        responses = self.paginated_api_call("GET", _path, error, params=params)
-        return RunList(self.process_paginated_responses(responses, "runs"))
+        return self._path_of("runs", project), params
 
     def del_runs(
         self,
@@ -1141,6 +1247,46 @@ class HTTPRunDB(RunDBInterface):
         :param limit:           Maximum number of artifacts to return.
         """
 
+        endpoint_path, params = self._prepare_list_artifacts_request(
+            name=name,
+            project=project,
+            tag=tag,
+            labels=labels,
+            since=since,
+            until=until,
+            iter=iter,
+            best_iteration=best_iteration,
+            kind=kind,
+            category=category,
+            tree=tree,
+            producer_uri=producer_uri,
+            format_=format_,
+            limit=limit,
+        )
+        error = "list artifacts"
+        resp = self.api_call("GET", endpoint_path, error, params=params, version="v2")
+        values = ArtifactList(resp.json()["artifacts"])
+        values.tag = tag
+        return values
+
+    def _prepare_list_artifacts_request(
+        self,
+        name: Optional[str] = None,
+        project: Optional[str] = None,
+        tag: Optional[str] = None,
+        labels: Optional[Union[str, dict[str, Optional[str]], list[str]]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        iter: int = None,
+        best_iteration: bool = False,
+        kind: str = None,
+        category: Union[str, mlrun.common.schemas.ArtifactCategories] = None,
+        tree: str = None,
+        producer_uri: str = None,
+        format_: mlrun.common.formatters.ArtifactFormat = mlrun.common.formatters.ArtifactFormat.full,
+        limit: int = None,
+    ) -> tuple[str, dict]:
+        """return the (v2) path and the query params of a list artifacts request (see list_artifacts)"""
         project = project or config.default_project
         labels = self._parse_labels(labels)
 
@@ -1159,12 +1305,7 @@ class HTTPRunDB(RunDBInterface):
             "since": datetime_to_iso(since),
             "until": datetime_to_iso(until),
         }
-        error = "list artifacts"
-        endpoint_path = f"projects/{project}/artifacts"
-        resp = self.api_call("GET", endpoint_path, error, params=params, version="v2")
-        values = ArtifactList(resp.json()["artifacts"])
-        values.tag = tag
-        return values
+        return f"projects/{project}/artifacts", params
 
     def del_artifacts(
         self,
@@ -1223,7 +1364,7 @@ class HTTPRunDB(RunDBInterface):
 
     def store_function(
         self,
-        function: typing.Union[mlrun.runtimes.BaseRuntime, dict],
+        function: typing.Union["mlrun.runtimes.BaseRuntime", dict],
         name,
         project="",
         tag=None,
@@ -1314,6 +1455,26 @@ class HTTPRunDB(RunDBInterface):
         :param until: Return functions updated before this date (as datetime object).
         :returns: List of function objects (as dictionary).
         """
+        path, params = self._prepare_list_functions_request(
+            name=name,
+            project=project,
+            tag=tag,
+            labels=labels,
+            since=since,
+            until=until,
+        )
+        return self._list_paginated(path, "list functions", params=params, key="funcs")
+
+    def _prepare_list_functions_request(
+        self,
+        name: Optional[str] = None,
+        project: Optional[str] = None,
+        tag: Optional[str] = None,
+        labels: Optional[Union[str, dict[str, Optional[str]], list[str]]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> tuple[str, dict]:
+        """return the path and the query params of a list functions request (see list_functions)"""
         project = project or config.default_project
         labels = self._parse_labels(labels)
         params = {
@@ -1323,10 +1484,7 @@ class HTTPRunDB(RunDBInterface):
             "since": datetime_to_iso(since),
             "until": datetime_to_iso(until),
         }
-        error = "list functions"
-        path = f"projects/{project}/functions"
-        responses = self.paginated_api_call("GET", path, error, params=params)
-        return self.process_paginated_responses(responses, "funcs")
+        return f"projects/{project}/functions", params
 
     def list_runtime_resources(
         self,
@@ -1551,7 +1709,7 @@ class HTTPRunDB(RunDBInterface):
 
     def remote_builder(
         self,
-        func: BaseRuntime,
+        func: "mlrun.runtimes.BaseRuntime",
         with_mlrun: bool,
         mlrun_version_specifier: Optional[str] = None,
         skip_deployed: bool = False,
@@ -1596,7 +1754,7 @@ class HTTPRunDB(RunDBInterface):
 
     def deploy_nuclio_function(
         self,
-        func: mlrun.runtimes.RemoteRuntime,
+        func: "mlrun.runtimes.RemoteRuntime",
         builder_env: Optional[dict] = None,
     ):
         """
@@ -1629,7 +1787,7 @@ class HTTPRunDB(RunDBInterface):
 
     def get_nuclio_deploy_status(
         self,
-        func: mlrun.runtimes.RemoteRuntime,
+        func: "mlrun.runtimes.RemoteRuntime",
         last_log_timestamp: float = 0.0,
         verbose: bool = False,
     ):
@@ -1680,7 +1838,7 @@ class HTTPRunDB(RunDBInterface):
 
     def get_builder_status(
         self,
-        func: BaseRuntime,
+        func: "mlrun.runtimes.BaseRuntime",
         offset: int = 0,
         logs: bool = True,
         last_log_timestamp: float = 0.0,
@@ -1934,6 +2092,9 @@ class HTTPRunDB(RunDBInterface):
         if isinstance(pipeline, str):
             pipe_file = pipeline
         else:
+            # imported here as it imports kfp, which is slow to import and only needed for submitting pipelines
+            from mlrun_pipelines.utils import compile_pipeline
+
             pipe_file = compile_pipeline(
                 artifact_path=artifact_path,
                 cleanup_ttl=cleanup_ttl,
@@ -2072,7 +2233,9 @@ class HTTPRunDB(RunDBInterface):
 
     def create_feature_set(
         self,
-        feature_set: Union[dict, mlrun.common.schemas.FeatureSet, FeatureSet],
+        feature_set: Union[
+            dict, mlrun.common.schemas.FeatureSet, "mlrun.feature_store.FeatureSet"
+        ],
         project="",
         versioned=True,
     ) -> dict:
@@ -2087,7 +2250,7 @@ class HTTPRunDB(RunDBInterface):
         """
         if isinstance(feature_set, mlrun.common.schemas.FeatureSet):
             feature_set = feature_set.dict()
-        elif isinstance(feature_set, FeatureSet):
+        elif isinstance(feature_set, mlrun.feature_store.FeatureSet):
             feature_set = feature_set.to_dict()
 
         project = (
@@ -2111,7 +2274,7 @@ class HTTPRunDB(RunDBInterface):
 
     def get_feature_set(
         self, name: str, project: str = "", tag: str = None, uid: str = None
-    ) -> FeatureSet:
+    ) -> "mlrun.feature_store.FeatureSet":
         """Retrieve a ~mlrun.feature_store.FeatureSet` object. If both ``tag`` and ``uid`` are not specified, then
         the object tagged ``latest`` will be retrieved.
 
@@ -2126,7 +2289,7 @@ class HTTPRunDB(RunDBInterface):
         path = f"projects/{project}/feature-sets/{name}/references/{reference}"
         error_message = f"Failed retrieving feature-set {project}/{name}"
         resp = self.api_call("GET", path, error_message)
-        return FeatureSet.from_dict(resp.json())
+        return mlrun.feature_store.FeatureSet.from_dict(resp.json())
 
     def list_features(
         self,
@@ -2329,7 +2492,7 @@ class HTTPRunDB(RunDBInterface):
         format_: Union[
             str, mlrun.common.formatters.FeatureSetFormat
         ] = mlrun.common.formatters.FeatureSetFormat.full,
-    ) -> list[FeatureSet]:
+    ) -> list["mlrun.feature_store.FeatureSet"]:
         """Retrieve a list of feature-sets matching the criteria provided.
 
         :param project: Project name.
@@ -2388,11 +2551,15 @@ class HTTPRunDB(RunDBInterface):
         resp = self.api_call("GET", path, error_message, params=params)
         feature_sets = resp.json()["feature_sets"]
         if feature_sets:
-            return [FeatureSet.from_dict(obj) for obj in feature_sets]
+            return [
+                mlrun.feature_store.FeatureSet.from_dict(obj) for obj in feature_sets
+            ]
 
     def store_feature_set(
         self,
-        feature_set: Union[dict, mlrun.common.schemas.FeatureSet, FeatureSet],
+        feature_set: Union[
+            dict, mlrun.common.schemas.FeatureSet, "mlrun.feature_store.FeatureSet"
+        ],
         name=None,
         project="",
         tag=None,
@@ -2419,7 +2586,7 @@ class HTTPRunDB(RunDBInterface):
 
         if isinstance(feature_set, mlrun.common.schemas.FeatureSet):
             feature_set = feature_set.dict()
-        elif isinstance(feature_set, FeatureSet):
+        elif isinstance(feature_set, mlrun.feature_store.FeatureSet):
             feature_set = feature_set.to_dict()
 
         name = name or feature_set["metadata"]["name"]
@@ -2494,7 +2661,11 @@ class HTTPRunDB(RunDBInterface):
 
     def create_feature_vector(
         self,
-        feature_vector: Union[dict, mlrun.common.schemas.FeatureVector, FeatureVector],
+        feature_vector: Union[
+            dict,
+            mlrun.common.schemas.FeatureVector,
+            "mlrun.feature_store.FeatureVector",
+        ],
         project="",
         versioned=True,
     ) -> dict:
@@ -2508,7 +2679,7 @@ class HTTPRunDB(RunDBInterface):
         """
         if isinstance(feature_vector, mlrun.common.schemas.FeatureVector):
             feature_vector = feature_vector.dict()
-        elif isinstance(feature_vector, FeatureVector):
+        elif isinstance(feature_vector, mlrun.feature_store.FeatureVector):
             feature_vector = feature_vector.to_dict()
 
         project = (
@@ -2532,7 +2703,7 @@ class HTTPRunDB(RunDBInterface):
 
     def get_feature_vector(
         self, name: str, project: str = "", tag: str = None, uid: str = None
-    ) -> FeatureVector:
+    ) -> "mlrun.feature_store.FeatureVector":
         """Return a specific feature-vector referenced by its tag or uid. If none are provided, ``latest`` tag will
         be used."""
 
@@ -2541,7 +2712,7 @@ class HTTPRunDB(RunDBInterface):
         path = f"projects/{project}/feature-vectors/{name}/references/{reference}"
         error_message = f"Failed retrieving feature-vector {project}/{name}"
         resp = self.api_call("GET", path, error_message)
-        return FeatureVector.from_dict(resp.json())
+        return mlrun.feature_store.FeatureVector.from_dict(resp.json())
 
     def list_feature_vectors(
         self,
@@ -2558,7 +2729,7 @@ class HTTPRunDB(RunDBInterface):
         partition_order: Union[
             mlrun.common.schemas.OrderType, str
         ] = mlrun.common.schemas.OrderType.desc,
-    ) -> list[FeatureVector]:
+    ) -> list["mlrun.feature_store.FeatureVector"]:
         """Retrieve a list of feature-vectors matching the criteria provided.
 
         :param project: Project name.
@@ -2609,11 +2780,18 @@ class HTTPRunDB(RunDBInterface):
         resp = self.api_call("GET", path, error_message, params=params)
         feature_vectors = resp.json()["feature_vectors"]
         if feature_vectors:
-            return [FeatureVector.from_dict(obj) for obj in feature_vectors]
+            return [
+                mlrun.feature_store.FeatureVector.from_dict(obj)
+                for obj in feature_vectors
+            ]
 
     def store_feature_vector(
         self,
-        feature_vector: Union[dict, mlrun.common.schemas.FeatureVector, FeatureVector],
+        feature_vector: Union[
+            dict,
+            mlrun.common.schemas.FeatureVector,
+            "mlrun.feature_store.FeatureVector",
+        ],
         name=None,
         project="",
         tag=None,
@@ -2640,7 +2818,7 @@ class HTTPRunDB(RunDBInterface):
 
         if isinstance(feature_vector, mlrun.common.schemas.FeatureVector):
             feature_vector = feature_vector.dict()
-        elif isinstance(feature_vector, FeatureVector):
+        elif isinstance(feature_vector, mlrun.feature_store.FeatureVector):
             feature_vector = feature_vector.to_dict()
 
         name = name or feature_vector["metadata"]["name"]
@@ -2806,7 +2984,7 @@ class HTTPRunDB(RunDBInterface):
         ] = mlrun.common.formatters.ProjectFormat.name_only,
         labels: Optional[Union[str, dict[str, Optional[str]], list[str]]] = None,
         state: Union[str, mlrun.common.schemas.ProjectState] = None,
-    ) -> list[Union[mlrun.projects.MlrunProject, str]]:
+    ) -> list[Union["mlrun.projects.MlrunProject", str]]:
         """Return a list of the existing projects, potentially filtered by specific criteria.
 
         :param owner: List only projects belonging to this specific owner.
@@ -2847,7 +3025,7 @@ class HTTPRunDB(RunDBInterface):
             for project_dict in response.json()["projects"]
         ]
 
-    def get_project(self, name: str) -> mlrun.projects.MlrunProject:
+    def get_project(self, name: str) -> "mlrun.projects.MlrunProject":
         """Get details for a specific project."""
 
         if not name:
@@ -2908,8 +3086,10 @@ class HTTPRunDB(RunDBInterface):
     def store_project(
         self,
         name: str,
-        project: Union[dict, mlrun.projects.MlrunProject, mlrun.common.schemas.Project],
-    ) -> mlrun.projects.MlrunProject:
+        project: Union[
+            dict, "mlrun.projects.MlrunProject", mlrun.common.schemas.Project
+        ],
+    ) -> "mlrun.projects.MlrunProject":
         """Store a project in the DB. This operation will overwrite existing project of the same name if exists."""
 
         path = f"projects/{name}"
@@ -2935,7 +3115,7 @@ class HTTPRunDB(RunDBInterface):
         patch_mode: Union[
             str, mlrun.common.schemas.PatchMode
         ] = mlrun.common.schemas.PatchMode.replace,
-    ) -> mlrun.projects.MlrunProject:
+    ) -> "mlrun.projects.MlrunProject":
         """Patch an existing project object.
 
         :param name: Name of project to patch.
@@ -2954,8 +3134,10 @@ class HTTPRunDB(RunDBInterface):
 
     def create_project(
         self,
-        project: Union[dict, mlrun.projects.MlrunProject, mlrun.common.schemas.Project],
-    ) -> mlrun.projects.MlrunProject:
+        project: Union[
+            dict, "mlrun.projects.MlrunProject", mlrun.common.schemas.Project
+        ],
+    ) -> "mlrun.projects.MlrunProject":
         """Create a new project. A project with the same name must not exist prior to creation."""
 
         if isinstance(project, mlrun.common.schemas.Project):
@@ -2978,7 +3160,7 @@ class HTTPRunDB(RunDBInterface):
 
     def _wait_for_project_to_reach_terminal_state(
         self, project_name: str
-    ) -> mlrun.projects.MlrunProject:
+    ) -> "mlrun.projects.MlrunProject":
         def _verify_project_in_terminal_state():
             project = self.get_project(project_name)
             if (
@@ -3327,6 +3509,8 @@ class HTTPRunDB(RunDBInterface):
         metrics: Optional[list[str]] = None,
         top_level: bool = False,
         uids: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
     ) -> list[mlrun.model_monitoring.model_endpoint.ModelEndpoint]:
         """
         Returns a list of `ModelEndpoint` objects. Each `ModelEndpoint` object represents the current state of a
@@ -3361,6 +3545,9 @@ class HTTPRunDB(RunDBInterface):
                       `m` = minutes, `h` = hours, `'d'` = days, and `'s'` = seconds), or 0 for the earliest time.
         :param top_level: if true will return only routers and endpoint that are NOT children of any router
         :param uids: if passed will return a list `ModelEndpoint` object with uid in uids
+        :param limit: the max number of model endpoints to return, the endpoints are then ordered by their uid
+        :param after: return only the model endpoints whose uid is greater than this uid - pass the uid of the last
+                      endpoint of the previous page to get the next page
         """
 
         path = f"projects/{project}/model-endpoints"
@@ -3378,6 +3565,8 @@ class HTTPRunDB(RunDBInterface):
                 "metric": metrics or [],
                 "top-level": top_level,
                 "uid": uids,
+                "limit": limit,
+                "after": after,
             },
         )
 
@@ -3971,7 +4160,7 @@ class HTTPRunDB(RunDBInterface):
         self,
         api_gateway: Union[
             mlrun.common.schemas.APIGateway,
-            mlrun.runtimes.nuclio.api_gateway.APIGateway,
+            "mlrun.runtimes.nuclio.api_gateway.APIGateway",
         ],
         project: Optional[str] = None,
     ) -> mlrun.common.schemas.APIGateway:
@@ -4096,7 +4285,7 @@ class HTTPRunDB(RunDBInterface):
         project: str,
         name: str,
         workflow_spec: Union[
-            mlrun.projects.pipelines.WorkflowSpec,
+            "mlrun.projects.pipelines.WorkflowSpec",
             mlrun.common.schemas.WorkflowSpec,
             dict,
         ],
@@ -609,7 +609,7 @@ class NopDB(RunDBInterface):
         self,
         api_gateway: Union[
             mlrun.common.schemas.APIGateway,
-            mlrun.runtimes.nuclio.api_gateway.APIGateway,
+            "mlrun.runtimes.nuclio.api_gateway.APIGateway",
         ],
         project: str = None,
     ) -> mlrun.common.schemas.APIGateway:
@@ -17,6 +17,7 @@ import pathlib
 import sys
 from datetime import datetime
 from typing import Any, Optional, Union
+from urllib.parse import urlparse
 
 import pandas as pd
 from deprecated import deprecated
@@ -25,7 +26,8 @@ import mlrun
 import mlrun.errors
 
 from ..data_types import InferOptions, get_infer_interface
-from ..datastore.sources import BaseSourceDriver, StreamSource
+from ..data_types.infer import ChunkedDFStats
+from ..datastore.sources import BaseSourceDriver, CSVSource, ParquetSource, StreamSource
 from ..datastore.store_resources import parse_store_uri
 from ..datastore.targets import (
     BaseStoreTarget,
@@ -166,6 +168,12 @@ def get_offline_features(
                                     (default False).
     :param engine:                  processing engine kind ("local", "dask", or "spark")
     :param engine_args:             kwargs for the processing engine
+                                    the local engine supports incremental retrieval with
+                                    engine_args={"incremental": True, "incremental_granularity": "day"} (or "hour"),
+                                    the result is computed per time partition, the complete partitions are cached
+                                    next to the parquet target (in <target path>.partitions) and reused by the
+                                    following calls. vectors which join several feature sets are retrieved without
+                                    partitioning, as the "as of" join may match rows from earlier partitions
     :param query:                   The query string used to filter rows on the output
     :param spark_service:           Name of the spark service to be used (when using a remote-spark runtime)
     :param order_by:                Name or list of names to order by. The name or the names in the list can be the
@@ -726,7 +734,7 @@ def _ingest(
         )
 
     if isinstance(source, str):
-        source = mlrun.store_manager.object(url=source).as_df()
+        source = _get_ingestion_source(source, featureset)
 
     schema_options = InferOptions.get_common_options(
         infer_options, InferOptions.schema()
@@ -743,6 +751,18 @@ def _ingest(
     )
     # Check if dataframe is already calculated (for feature set graph):
     calculate_df = return_df or infer_stats != InferOptions.Null
+    # chunked sources are processed chunk by chunk, with stats merged across the chunks (bounded memory)
+    chunked_stats = None
+    if (
+        isinstance(source, BaseSourceDriver)
+        and source.is_iterator()
+        and featureset.spec.engine == "pandas"
+    ):
+        calculate_df = return_df
+        if infer_stats != InferOptions.Null:
+            chunked_stats = ChunkedDFStats(
+                options=_with_index_option(infer_stats, infer_options)
+            )
     featureset.save()
 
     df = init_featureset_graph(
@@ -751,13 +771,16 @@ def _ingest(
         namespace,
         targets=targets_to_ingest,
         return_df=calculate_df,
+        on_chunk=chunked_stats.update if chunked_stats else None,
     )
-    if not InferOptions.get_common_options(
-        infer_stats, InferOptions.Index
-    ) and InferOptions.get_common_options(infer_options, InferOptions.Index):
-        infer_stats += InferOptions.Index
+    infer_stats = _with_index_option(infer_stats, infer_options)
 
-    _infer_from_static_df(df, featureset, options=infer_stats)
+    if chunked_stats:
+        _infer_from_static_df(
+            chunked_stats.sample, featureset, options=infer_stats, stats=chunked_stats
+        )
+    else:
+        _infer_from_static_df(df, featureset, options=infer_stats)
 
     if isinstance(source, DataSource):
         for target in featureset.status.targets:
@@ -1022,6 +1045,19 @@ def _deploy_ingestion_service_v2(
     return function.deploy(), function
 
 
+def _get_ingestion_source(path: str, featureset: FeatureSet):
+    """return the source for an ingested path, a chunked source for large csv/parquet sources
+    ingested with the pandas engine (mlrun.mlconf.feature_store.ingestion_chunksize)"""
+    chunksize = int(mlrun.mlconf.feature_store.ingestion_chunksize or 0)
+    if chunksize and featureset.spec.engine == "pandas":
+        suffix = pathlib.Path(urlparse(path).path).suffix.lower()
+        if suffix == ".csv":
+            return CSVSource(path=path, attributes={"chunksize": chunksize})
+        if suffix in [".parquet", ".pq", ""]:
+            return ParquetSource(path=path, attributes={"chunksize": chunksize})
+    return mlrun.store_manager.object(url=path).as_df()
+
+
 def _ingest_with_spark(
     spark=None,
     featureset: Union[FeatureSet, str] = None,
@@ -1159,14 +1195,26 @@ def _post_ingestion(context, featureset, spark=None):
         context.log_result("featureset", featureset.uri)
 
 
+def _with_index_option(infer_stats, infer_options):
+    if not InferOptions.get_common_options(
+        infer_stats, InferOptions.Index
+    ) and InferOptions.get_common_options(infer_options, InferOptions.Index):
+        infer_stats += InferOptions.Index
+    return infer_stats
+
+
 def _infer_from_static_df(
     df,
     featureset,
     entity_columns=None,
     options: InferOptions = InferOptions.default(),
     sample_size=None,
+    stats: ChunkedDFStats = None,
 ):
-    """infer feature-set schema & stats from static dataframe (without pipeline)"""
+    """infer feature-set schema & stats from static dataframe (without pipeline)
+
+    when stats (accumulated over the dataframe chunks) are provided, the df is a sample of the chunks
+    """
     if hasattr(df, "to_dataframe"):
         if hasattr(df, "time_field"):
             time_field = df.time_field or featureset.spec.timestamp_key
@@ -1188,9 +1236,12 @@ def _infer_from_static_df(
             options=options,
         )
     if InferOptions.get_common_options(options, InferOptions.Stats):
-        featureset.status.stats = inferer.get_stats(
-            df, options, sample_size=sample_size
-        )
+        if stats:
+            featureset.status.stats = stats.get_stats(options)
+        else:
+            featureset.status.stats = inferer.get_stats(
+                df, options, sample_size=sample_size
+            )
     if InferOptions.get_common_options(options, InferOptions.Preview):
         featureset.status.preview = inferer.get_preview(df)
     return df
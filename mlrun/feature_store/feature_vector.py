@@ -13,6 +13,8 @@
 # limitations under the License.
 import collections
 import logging
+import threading
+import time
 import typing
 from copy import copy
 from datetime import datetime
@@ -788,6 +790,12 @@ class FeatureVector(ModelObj):
                                         (default False).
         :param engine:                  processing engine kind ("local", "dask", or "spark")
         :param engine_args:             kwargs for the processing engine
+                                        the local engine supports incremental retrieval with
+                                        engine_args={"incremental": True, "incremental_granularity": "day"} (or "hour"),
+                                        the result is computed per time partition, the complete partitions are cached
+                                        next to the parquet target (in <target path>.partitions) and reused by the
+                                        following calls. vectors which join several feature sets are retrieved without
+                                        partitioning, as the "as of" join may match rows from earlier partitions
         :param query:                   The query string used to filter rows on the output
         :param spark_service:           Name of the spark service to be used (when using a remote-spark runtime)
         :param order_by:                Name or list of names to order by. The name or the names in the list can be the
@@ -996,36 +1004,11 @@ class OnlineVectorService:
         :param as_list:      return a list of list (list input is required by many ML frameworks)
         """
         results = []
-        futures = []
-        if isinstance(entity_rows, dict):
-            entity_rows = [entity_rows]
-
-        # validate we have valid input struct
-        if (
-            not entity_rows
-            or not isinstance(entity_rows, list)
-            or not isinstance(entity_rows[0], (list, dict))
-        ):
-            raise mlrun.errors.MLRunInvalidArgumentError(
-                f"input data is of type {type(entity_rows)}. must be a list of lists or list of dicts"
-            )
-
-        # if list of list, convert to dicts (with the index columns as the dict keys)
-        if isinstance(entity_rows[0], list):
-            if not self._index_columns or len(entity_rows[0]) != len(
-                self._index_columns
-            ):
-                raise mlrun.errors.MLRunInvalidArgumentError(
-                    "input list must be in the same size of the index_keys list"
-                )
-            index_range = range(len(self._index_columns))
-            entity_rows = [
-                {self._index_columns[i]: item[i] for i in index_range}
-                for item in entity_rows
-            ]
-
-        for row in entity_rows:
-            futures.append(self._controller.emit(row, return_awaitable_result=True))
+        entity_rows = self._normalize_entity_rows(entity_rows)
+        futures = [
+            self._controller.emit(row, return_awaitable_result=True)
+            for row in entity_rows
+        ]
 
         for future in futures:
             result = future.await_result()
@@ -1066,11 +1049,241 @@ class OnlineVectorService:
 
         return results
 
+    def get_df(
+        self,
+        entity_rows: Union[list[Union[dict, list]], pd.DataFrame],
+        as_array: bool = False,
+    ) -> Union[pd.DataFrame, np.ndarray]:
+        """get the feature vectors of a list of entities as a DataFrame (or a 2-D array)
+
+        a convenience variant of get() for DataFrame based callers (e.g. model servers), the entities are
+        looked up one by one through the vector graph (like in get()) and the column alignment and imputing
+        are done on the returned DataFrame. rows of entities which were not found are NaN, the DataFrame is
+        indexed by the entity keys when the vector is defined with_indexes.
+
+        example::
+
+            svc = fstore.get_online_feature_service(vector)
+            df = svc.get_df(pd.DataFrame({"name": names}))
+            predictions = model.predict(
+                svc.get_df([[name] for name in names], as_array=True)
+            )
+
+        :param entity_rows:  list of list/dict or a DataFrame with the entity columns
+        :param as_array:     return a 2-D numpy array of the feature values (without the entity keys)
+        """
+        entity_rows = self._normalize_entity_rows(entity_rows)
+        futures = [
+            self._controller.emit(row, return_awaitable_result=True)
+            for row in entity_rows
+        ]
+        bodies = [future.await_result().body or {} for future in futures]
+
+        label_column = self.vector.status.label_column
+        feature_columns = [
+            column for column in self._requested_columns if column != label_column
+        ]
+        df = pd.DataFrame.from_records(
+            bodies, columns=feature_columns, nrows=len(bodies)
+        )
+        # entities which the graph returned without any feature (only the keys) were not found
+        found = np.fromiter(
+            (
+                any(column not in self._index_columns for column in body)
+                for body in bodies
+            ),
+            dtype=bool,
+            count=len(bodies),
+        )
+
+        impute_columns = [
+            column for column in self._impute_values if column in df.columns
+        ]
+        if impute_columns and found.any():
+            imputed = (
+                df.loc[found, impute_columns]
+                .replace([np.inf, -np.inf], np.nan)
+                .fillna({name: self._impute_values[name] for name in impute_columns})
+            )
+            df.loc[found, impute_columns] = imputed.infer_objects()
+        if not found.all():
+            df.loc[~found, :] = np.nan
+
+        if as_array:
+            return df.to_numpy()
+        if self.vector.spec.with_indexes:
+            entity_df = pd.DataFrame.from_records(
+                entity_rows, columns=self._index_columns, nrows=len(entity_rows)
+            )
+            df.index = entity_df.set_index(self._index_columns).index
+        return df
+
+    def _normalize_entity_rows(self, entity_rows) -> list[dict]:
+        """validate the entity rows and convert them to a list of dicts"""
+        if isinstance(entity_rows, pd.DataFrame):
+            return entity_rows.to_dict(orient="records")
+        if isinstance(entity_rows, dict):
+            entity_rows = [entity_rows]
+
+        # validate we have valid input struct
+        if (
+            not entity_rows
+            or not isinstance(entity_rows, list)
+            or not isinstance(entity_rows[0], (list, dict))
+        ):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"input data is of type {type(entity_rows)}. must be a list of lists or list of dicts"
+            )
+
+        # if list of list, convert to dicts (with the index columns as the dict keys)
+        if isinstance(entity_rows[0], list):
+            if not self._index_columns or len(entity_rows[0]) != len(
+                self._index_columns
+            ):
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    "input list must be in the same size of the index_keys list"
+                )
+            index_range = range(len(self._index_columns))
+            entity_rows = [
+                {self._index_columns[i]: item[i] for i in index_range}
+                for item in entity_rows
+            ]
+        return entity_rows
+
     def close(self):
         """terminate the async loop"""
         self._controller.terminate()
 
 
+class CachedOnlineVectorService:
+    """in-process near cache in front of an OnlineVectorService
+
+    the feature vectors are cached per entity key for `ttl` seconds, entities which were not found are
+    cached as well (negative caching) for `negative_ttl` seconds, and the least recently used entries
+    are evicted above `max_entries`. the ttl can be set per feature set ({"<feature-set>": ttl, "*": ttl}),
+    a vector is cached for the shortest ttl of its feature sets.
+
+    example::
+
+        svc = CachedOnlineVectorService(
+            vector.get_online_feature_service(), ttl={"*": 60, "transactions": 5}
+        )
+        resp = svc.get([{"name": "joe"}, {"name": "mike"}])
+        print(svc.get_stats()["hit_ratio"])
+
+    :param service:      the online vector service
+    :param ttl:          cached vectors ttl in seconds, or a dict of ttl per feature set name ("*" for the default)
+    :param max_entries:  max number of cached entities
+    :param negative_ttl: ttl in seconds of not found entities, defaults to the ttl, 0 to disable negative caching
+    """
+
+    def __init__(
+        self,
+        service: OnlineVectorService,
+        ttl: Union[float, dict[str, float]],
+        max_entries: int = 10000,
+        negative_ttl: float = None,
+    ):
+        self.service = service
+        self.vector = service.vector
+        self.ttl = self._resolve_ttl(ttl)
+        self.negative_ttl = self.ttl if negative_ttl is None else float(negative_ttl)
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "negative_hits": 0, "misses": 0, "evictions": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def status(self):
+        return self.service.status
+
+    def _resolve_ttl(self, ttl) -> float:
+        if not isinstance(ttl, dict):
+            return float(ttl)
+        default_ttl = ttl.get("*")
+        ttls = []
+        for feature in self.vector.spec.features:
+            _, feature = parse_project_name_from_feature_string(feature)
+            feature_set, _, _ = parse_feature_string(feature)
+            feature_set = feature_set.split(":")[0]
+            feature_set_ttl = ttl.get(feature_set, default_ttl)
+            if feature_set_ttl is None:
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    f"ttl is not set for feature set {feature_set}, set it or a default ('*') ttl"
+                )
+            ttls.append(float(feature_set_ttl))
+        return min(ttls, default=float(default_ttl or 0))
+
+    def get(self, entity_rows: list[Union[dict, list]], as_list=False):
+        """get feature vectors given the provided entity inputs, see OnlineVectorService.get()"""
+        entity_rows = self.service._normalize_entity_rows(entity_rows)
+        index_columns = self.service._index_columns
+        keys = [
+            (as_list, tuple(row.get(column) for column in index_columns))
+            for row in entity_rows
+        ]
+
+        results = [None] * len(entity_rows)
+        missing = []
+        now = time.monotonic()
+        with self._lock:
+            for i, key in enumerate(keys):
+                entry = self._entries.get(key)
+                if entry is None or entry[0] < now:
+                    self._counters["misses"] += 1
+                    missing.append(i)
+                    continue
+                self._entries.move_to_end(key)
+                if entry[1] is None:
+                    self._counters["negative_hits"] += 1
+                else:
+                    self._counters["hits"] += 1
+                    # return a copy, the caller may modify the vector
+                    results[i] = copy(entry[1])
+
+        if not missing:
+            return results
+
+        fetched = self.service.get([entity_rows[i] for i in missing], as_list=as_list)
+        now = time.monotonic()
+        with self._lock:
+            for i, value in zip(missing, fetched):
+                results[i] = value
+                ttl = self.ttl if value is not None else self.negative_ttl
+                if ttl <= 0:
+                    continue
+                self._entries[keys[i]] = (now + ttl, copy(value))
+                self._entries.move_to_end(keys[i])
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+        return results
+
+    def get_stats(self) -> dict:
+        """return the cache counters (hits, negative hits, misses, evictions), size and hit ratio"""
+        with self._lock:
+            stats = {**self._counters, "size": len(self._entries)}
+        lookups = stats["hits"] + stats["negative_hits"] + stats["misses"]
+        stats["hit_ratio"] = (
+            (stats["hits"] + stats["negative_hits"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+    def invalidate(self):
+        """clear the cached vectors"""
+        with self._lock:
+            self._entries.clear()
+
+    def close(self):
+        self.service.close()
+
+
 class OfflineVectorResponse:
     """get_offline_features response object"""
 
@@ -43,8 +43,14 @@ def init_featureset_graph(
     return_df=True,
     verbose=False,
     rows_limit=None,
+    on_chunk=None,
 ):
-    """create storey ingestion graph/DAG from feature set object"""
+    """create storey ingestion graph/DAG from feature set object
+
+    with the sync (pandas) engine, iterator sources are processed and written chunk by chunk and on_chunk(df) is
+    called with every processed chunk, the ingested df is returned unless return_df is False and the source is an
+    iterator, in which case the chunks are not kept in memory and None is returned
+    """
 
     cache = ResourceCache()
     graph = featureset.spec.graph.copy()
@@ -75,9 +81,11 @@ def init_featureset_graph(
 
     # if the source is a dataframe iterator we load/write it in chunks
     chunk_id = 0
+    keep_chunks = True
     if hasattr(source, "to_dataframe"):
         if source.is_iterator():
             chunk_id = 1
+            keep_chunks = return_df
             chunks = source.to_dataframe()
         else:
             chunks = [source.to_dataframe()]
@@ -112,9 +120,12 @@ def init_featureset_graph(
                 )
                 if size:
                     sizes[i] += size
+            if on_chunk:
+                on_chunk(df)
         chunk_id += 1
-        result_dfs.append(df)
-        total_rows += df.shape[0]
+        if keep_chunks:
+            result_dfs.append(df)
+        total_rows += df.shape[0] if df is not None else 0
         if rows_limit and total_rows >= rows_limit:
             break
 
@@ -123,6 +134,8 @@ def init_featureset_graph(
         if verbose:
             logger.info(f"wrote target: {target_status}")
 
+    if not keep_chunks:
+        return None
     result_df = pd.concat(result_dfs)
     return result_df.head(rows_limit)
 
@@ -13,6 +13,8 @@
 # limitations under the License.
 #
 import abc
+import hashlib
+import json
 import typing
 from datetime import datetime
 
@@ -52,6 +54,10 @@ class BaseMerger(abc.ABC):
         self._alias = dict()
         self._origin_alias = dict()
         self._entity_rows_node_name = "__mlrun__$entity_rows$"
+        self._incremental = engine_args.get("incremental", False)
+        self._incremental_granularity = engine_args.get(
+            "incremental_granularity", "day"
+        )
 
     def _append_drop_column(self, key):
         if key and key not in self._drop_columns:
@@ -125,6 +131,20 @@ class BaseMerger(abc.ABC):
             # if end_time is not specified set it to now()
             end_time = pd.Timestamp.now()
 
+        if self._incremental:
+            return self._generate_incremental_offline_vector(
+                entity_rows,
+                entity_timestamp_column,
+                feature_set_objects=feature_set_objects,
+                feature_set_fields=feature_set_fields,
+                start_time=start_time,
+                end_time=end_time,
+                timestamp_for_filtering=timestamp_for_filtering,
+                query=query,
+                order_by=order_by,
+                additional_filters=additional_filters,
+            )
+
         return self._generate_offline_vector(
             entity_rows,
             entity_timestamp_column,
@@ -367,6 +387,165 @@ class BaseMerger(abc.ABC):
         self._write_to_offline_target(timestamp_key=result_timestamp)
         return OfflineVectorResponse(self)
 
+    def _generate_incremental_offline_vector(
+        self,
+        entity_rows,
+        entity_timestamp_column,
+        feature_set_objects,
+        feature_set_fields,
+        start_time=None,
+        end_time=None,
+        timestamp_for_filtering=None,
+        query=None,
+        order_by=None,
+        additional_filters=None,
+    ):
+        """generate the vector per time partition, reusing the partitions materialized by previous calls
+
+        the partitions are cached as parquet files under <target path>.partitions/<digest>/, where the digest covers
+        the vector spec, the feature set versions and the retrieval parameters. only complete partitions (fully
+        inside the time range and in the past) are cached, the rest are computed on every call. the whole result is
+        written to the target, as in a non incremental retrieval.
+        the features of different feature sets are joined "as of" the entity timestamp, which may match feature rows
+        from earlier partitions, so a vector with more than one feature set is retrieved without partitioning.
+        """
+        if self.engine != "local":
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"incremental retrieval is not supported by the {self.engine} engine"
+            )
+        if entity_rows is not None or order_by:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "incremental retrieval does not support entity_rows or order_by"
+            )
+        if not start_time:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "incremental retrieval requires start_time"
+            )
+        if not isinstance(self._target, ParquetTarget):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "incremental retrieval requires a parquet target"
+            )
+
+        if len(feature_set_objects) > 1:
+            logger.info(
+                "Vector joins several feature sets, retrieving it without partitioning",
+                feature_sets=list(feature_set_objects.keys()),
+            )
+            return self._generate_offline_vector(
+                None,
+                entity_timestamp_column,
+                feature_set_objects=feature_set_objects,
+                feature_set_fields=feature_set_fields,
+                start_time=start_time,
+                end_time=end_time,
+                timestamp_for_filtering=timestamp_for_filtering,
+                query=query,
+                additional_filters=additional_filters,
+            )
+
+        target = self._target
+        target.set_resource(self.vector)
+        target_path = target.get_target_path()
+        if not target_path:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "target path was not specified"
+            )
+        digest = self._get_incremental_digest(
+            feature_set_objects,
+            entity_timestamp_column=entity_timestamp_column,
+            timestamp_for_filtering=timestamp_for_filtering,
+            query=query,
+            additional_filters=additional_filters,
+        )
+        # the cache is kept next to the target (not inside it), so the target holds only the result
+        partitions_path = f"{target_path.rstrip('/')}.partitions/{digest}"
+        manifest_item = mlrun.get_dataitem(f"{partitions_path}/_partitions.json")
+        try:
+            manifest = json.loads(manifest_item.get())
+        except Exception as exc:
+            logger.debug(
+                "No materialized partitions", path=partitions_path, exc=str(exc)
+            )
+            manifest = {}
+        materialized = set(manifest.get("partitions", []))
+        result_timestamp = manifest.get("timestamp_key")
+
+        # the partitions are computed without writing them to the target
+        self._target = None
+        try:
+            dfs = []
+            computed = 0
+            for partition_start, partition_end, complete in _get_time_partitions(
+                start_time, end_time, self._incremental_granularity
+            ):
+                name = f"part-{partition_start:%Y%m%dT%H%M%S}-{partition_end:%Y%m%dT%H%M%S}.parquet"
+                partition_path = f"{partitions_path}/{name}"
+                if name in materialized:
+                    dfs.append(mlrun.get_dataitem(partition_path).as_df())
+                    continue
+
+                self._generate_offline_vector(
+                    None,
+                    entity_timestamp_column,
+                    feature_set_objects=feature_set_objects,
+                    feature_set_fields=feature_set_fields,
+                    start_time=partition_start,
+                    end_time=partition_end,
+                    timestamp_for_filtering=timestamp_for_filtering,
+                    query=query,
+                    additional_filters=additional_filters,
+                )
+                result_timestamp = self.vector.status.timestamp_key
+                dfs.append(self._result_df)
+                computed += 1
+                if complete and partition_end <= pd.Timestamp.now(tz=partition_end.tz):
+                    ParquetTarget(path=partition_path).write_dataframe(self._result_df)
+                    materialized.add(name)
+                    manifest_item.put(
+                        json.dumps(
+                            {
+                                "partitions": sorted(materialized),
+                                "timestamp_key": result_timestamp,
+                            }
+                        )
+                    )
+
+            logger.info(
+                "Generated incremental vector",
+                reused_partitions=len(dfs) - computed,
+                computed_partitions=computed,
+                path=partitions_path,
+            )
+            self._result_df = pd.concat(dfs) if dfs else pd.DataFrame()
+        finally:
+            self._target = target
+
+        self._write_to_offline_target(timestamp_key=result_timestamp)
+        return OfflineVectorResponse(self)
+
+    def _get_incremental_digest(self, feature_set_objects, **retrieval_args) -> str:
+        """digest of the vector spec, feature set versions and retrieval parameters"""
+        join_graph = self.vector.spec.join_graph
+        state = {
+            "features": self.vector.spec.features,
+            "join_graph": join_graph.to_dict() if join_graph else None,
+            "label_column": self.vector.status.label_column,
+            "with_indexes": not self._drop_indexes,
+            "drop_columns": self._drop_columns,
+            "granularity": self._incremental_granularity,
+            "feature_sets": {
+                name: [
+                    feature_set.metadata.uid,
+                    feature_set.spec.timestamp_key,
+                    [feature.name for feature in feature_set.spec.features],
+                ]
+                for name, feature_set in feature_set_objects.items()
+            },
+            **retrieval_args,
+        }
+        state = json.dumps(state, sort_keys=True, default=str)
+        return hashlib.sha256(state.encode()).hexdigest()[:16]
+
     def init_online_vector_service(
         self, entity_keys, fixed_window_type, update_stats=False
     ):
@@ -816,3 +995,30 @@ class BaseMerger(abc.ABC):
 
     def _convert_entity_rows_to_engine_df(self, entity_rows):
         raise NotImplementedError
+
+
+_partition_granularities = {
+    "hour": pd.Timedelta(hours=1),
+    "day": pd.Timedelta(days=1),
+}
+
+
+def _get_time_partitions(start_time, end_time, granularity):
+    """split the (start_time, end_time] range to time partitions
+
+    :return: iterator of (partition start, partition end, is complete partition)
+    """
+    if granularity not in _partition_granularities:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            f"incremental_granularity must be one of {list(_partition_granularities)}"
+        )
+    step = _partition_granularities[granularity]
+    partition_start = start_time.floor(step)
+    while partition_start < end_time:
+        partition_end = partition_start + step
+        yield (
+            max(partition_start, start_time),
+            min(partition_end, end_time),
+            partition_start >= start_time and partition_end <= end_time,
+        )
+        partition_start = partition_end
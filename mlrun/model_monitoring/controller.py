@@ -12,11 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
+import collections
 import concurrent.futures
+import dataclasses
 import datetime
+import hashlib
 import json
 import os
 import re
+import threading
+import time
 from collections.abc import Iterator
 from typing import NamedTuple, Optional, Union, cast
 
@@ -104,6 +110,7 @@ class _BatchWindow:
         return last_analyzed
 
     def _update_last_analyzed(self, last_analyzed: int) -> None:
+        """Update the last analyzed time of the endpoint and application"""
         logger.info(
             "Updating the last analyzed time for this endpoint and application",
             endpoint=self._endpoint,
@@ -119,8 +126,14 @@ class _BatchWindow:
 
     def get_intervals(
         self,
+        update_last_analyzed: bool = True,
     ) -> Iterator[_Interval]:
-        """Generate the batch interval time ranges."""
+        """
+        Generate the batch interval time ranges.
+
+        :param update_last_analyzed: Update the last analyzed time after each interval is consumed. When False, the
+                                     caller updates it, e.g. after the interval events were pushed.
+        """
         if self._start is not None and self._stop is not None:
             entered = False
             # Iterate timestamp from start until timestamp <= stop - step
@@ -137,7 +150,8 @@ class _BatchWindow:
                     timestamp + self._step, tz=datetime.timezone.utc
                 )
                 yield _Interval(start_time, end_time)
-                self._update_last_analyzed(timestamp + self._step)
+                if update_last_analyzed:
+                    self._update_last_analyzed(timestamp + self._step)
             if not entered:
                 logger.info(
                     "All the data is set, but no complete intervals were found. "
@@ -261,6 +275,60 @@ class _BatchWindowGenerator:
         )
 
 
+class _ConsistentHashRing:
+    """
+    Assign model endpoints to controller shards by consistent hashing of the endpoint uid, so changing the
+    number of shards moves only a small part of the endpoints between the shards.
+    """
+
+    def __init__(self, shards_count: int, virtual_nodes: int = 100) -> None:
+        ring = sorted(
+            (self._hash(f"{shard}-{node}"), shard)
+            for shard in range(shards_count)
+            for node in range(virtual_nodes)
+        )
+        self._hashes = [node_hash for node_hash, _ in ring]
+        self._shards = [shard for _, shard in ring]
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], "big")
+
+    def get_shard(self, key: str) -> int:
+        index = bisect.bisect(self._hashes, self._hash(key)) % len(self._hashes)
+        return self._shards[index]
+
+
+@dataclasses.dataclass
+class _TickMetrics:
+    """Counters and timings (in seconds) of a single controller run"""
+
+    shard: Optional[int] = None
+    shards_count: int = 1
+    endpoints: int = 0
+    intervals: int = 0
+    pushed_events: int = 0
+    push_batches: int = 0
+    errors: int = 0
+    list_duration: float = 0.0
+    read_duration: float = 0.0
+    push_duration: float = 0.0
+    total_duration: float = 0.0
+
+
+class _WindowEvents(NamedTuple):
+    application: str
+    endpoint_id: str
+    events: list[dict]
+    last_analyzed: int
+
+
+# the runs of each (project, shard, shards count) are serialized within the process, the controller function runs
+# in a single replica and each of its nuclio triggers has a single worker process (see the controller deployment)
+_shard_locks: dict[tuple, threading.Lock] = {}
+_shard_locks_lock = threading.Lock()
+
+
 class MonitoringApplicationController:
     """
     The main object to handle the monitoring processing job. This object is used to get the required configurations and
@@ -268,8 +336,21 @@ class MonitoringApplicationController:
     Note that the MonitoringApplicationController object requires access keys along with valid project configurations.
     """
 
-    def __init__(self) -> None:
-        """Initialize Monitoring Application Controller"""
+    def __init__(
+        self, shard: Optional[int] = None, shards_count: Optional[int] = None
+    ) -> None:
+        """
+        Initialize Monitoring Application Controller
+
+        :param shard:        The shard of the model endpoints to process, by default all the endpoints are processed.
+        :param shards_count: The number of shards, defaults to
+                             `mlrun.mlconf.model_endpoint_monitoring.controller_shards`.
+        """
+        self.shard = shard
+        self.shards_count = int(
+            shards_count or mlrun.mlconf.model_endpoint_monitoring.controller_shards
+        )
+        self._hash_ring = _ConsistentHashRing(self.shards_count)
         self.project = cast(str, mlrun.mlconf.default_project)
         self.project_obj = mlrun.load_project(name=self.project, url=self.project)
 
@@ -298,23 +379,52 @@ class MonitoringApplicationController:
             access_key = mlrun.mlconf.get_v3io_access_key()
         return access_key
 
-    def run(self) -> None:
+    def run(self) -> Optional[_TickMetrics]:
         """
         Main method for run all the relevant monitoring applications on each endpoint.
         This method handles the following:
-        1. List model endpoints
+        1. List model endpoints (of the controller shard)
         2. List applications
         3. Check model monitoring windows
-        4. Send data to applications
-        5. Delete old parquets
+        4. Read the predictions of the windows intervals (concurrently, in a thread pool)
+        5. Send data to applications (batched per application stream)
+
+        A shard is processed by one run at a time within the process, a run of a shard which is already being
+        processed (e.g. when a run takes longer than the cron interval) is skipped.
+
+        :returns: The run counters and timings, None if there are no endpoints or applications to process, or if the
+                  shard is already being processed.
         """
-        logger.info("Start running monitoring controller")
+        with _shard_locks_lock:
+            shard_lock = _shard_locks.setdefault(
+                (self.project, self.shard, self.shards_count), threading.Lock()
+            )
+        if not shard_lock.acquire(blocking=False):
+            logger.info(
+                "The controller shard is already being processed, skipping the run",
+                shard=self.shard,
+                shards_count=self.shards_count,
+            )
+            return None
+        try:
+            return self._run()
+        finally:
+            shard_lock.release()
+
+    def _run(self) -> Optional[_TickMetrics]:
+        logger.info(
+            "Start running monitoring controller",
+            shard=self.shard,
+            shards_count=self.shards_count,
+        )
+        tick = _TickMetrics(shard=self.shard, shards_count=self.shards_count)
+        start_time = time.monotonic()
         try:
             applications_names = []
-            endpoints = self.db.list_model_endpoints(include_stats=True)
+            endpoints = self.db.list_model_endpoints()
             if not endpoints:
                 logger.info("No model endpoints found", project=self.project)
-                return
+                return None
             monitoring_functions = self.project_obj.list_model_monitoring_functions()
             if monitoring_functions:
                 applications_names = list(
@@ -336,7 +446,7 @@ class MonitoringApplicationController:
             #   )
             if not applications_names:
                 logger.info("No monitoring functions found", project=self.project)
-                return
+                return None
             logger.info(
                 "Starting to iterate over the applications",
                 applications=applications_names,
@@ -347,128 +457,178 @@ class MonitoringApplicationController:
                 "Failed to list endpoints and monitoring applications",
                 exc=err_to_str(e),
             )
-            return
-        # Initialize a process pool that will be used to run each endpoint applications on a dedicated process
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=min(len(endpoints), 10),
-        ) as pool:
-            for endpoint in endpoints:
-                if (
-                    endpoint[mm_constants.EventFieldType.ACTIVE]
-                    and endpoint[mm_constants.EventFieldType.MONITORING_MODE]
-                    == mm_constants.ModelMonitoringMode.enabled.value
-                ):
-                    # Skip router endpoint:
-                    if (
-                        int(endpoint[mm_constants.EventFieldType.ENDPOINT_TYPE])
-                        == mm_constants.EndpointType.ROUTER
-                    ):
-                        # Router endpoint has no feature stats
-                        logger.info(
-                            f"{endpoint[mm_constants.EventFieldType.UID]} is router, skipping"
-                        )
-                        continue
-                    pool.submit(
-                        MonitoringApplicationController.model_endpoint_process,
-                        endpoint=endpoint,
-                        applications_names=applications_names,
-                        batch_window_generator=self._batch_window_generator,
-                        project=self.project,
-                        model_monitoring_access_key=self.model_monitoring_access_key,
-                        tsdb_connector=self.tsdb_connector,
+            return None
+
+        endpoints = [
+            endpoint for endpoint in endpoints if self._should_process(endpoint)
+        ]
+        tick.endpoints = len(endpoints)
+        tick.list_duration = time.monotonic() - start_time
+
+        read_start_time = time.monotonic()
+        windows = self._process_endpoints(
+            endpoints=endpoints, applications_names=applications_names, tick=tick
+        )
+        tick.read_duration = time.monotonic() - read_start_time
+
+        push_start_time = time.monotonic()
+        self._push_to_applications(windows=windows, tick=tick)
+        tick.push_duration = time.monotonic() - push_start_time
+        tick.total_duration = time.monotonic() - start_time
+
+        logger.info(
+            "Finished running monitoring controller", **dataclasses.asdict(tick)
+        )
+        return tick
+
+    def _should_process(self, endpoint: dict) -> bool:
+        if not (
+            endpoint[mm_constants.EventFieldType.ACTIVE]
+            and endpoint[mm_constants.EventFieldType.MONITORING_MODE]
+            == mm_constants.ModelMonitoringMode.enabled.value
+        ):
+            return False
+        if (
+            int(endpoint[mm_constants.EventFieldType.ENDPOINT_TYPE])
+            == mm_constants.EndpointType.ROUTER
+        ):
+            # Router endpoint has no feature stats
+            logger.info(
+                f"{endpoint[mm_constants.EventFieldType.UID]} is router, skipping"
+            )
+            return False
+        return (
+            self.shard is None
+            or self._hash_ring.get_shard(endpoint[mm_constants.EventFieldType.UID])
+            == self.shard
+        )
+
+    def _process_endpoints(
+        self,
+        endpoints: list[dict],
+        applications_names: list[str],
+        tick: _TickMetrics,
+    ) -> list[_WindowEvents]:
+        """
+        Process the endpoints concurrently in a thread pool, the DB and TSDB clients are blocking, so the number of
+        concurrent reads is bounded by the pool size (`controller_max_concurrent_reads`).
+        """
+        max_workers = max(
+            int(mlrun.mlconf.model_endpoint_monitoring.controller_max_concurrent_reads),
+            1,
+        )
+        windows = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._process_endpoint,
+                    endpoint=endpoint,
+                    applications_names=applications_names,
+                )
+                for endpoint in endpoints
+            ]
+            for endpoint, future in zip(endpoints, futures):
+                try:
+                    endpoint_windows, intervals = future.result()
+                except Exception:
+                    tick.errors += 1
+                    logger.exception(
+                        "Encountered an exception",
+                        endpoint_id=endpoint[mm_constants.EventFieldType.UID],
                     )
+                    continue
+                tick.intervals += intervals
+                windows.extend(endpoint_windows)
+        return windows
 
-    @classmethod
-    def model_endpoint_process(
-        cls,
+    def _process_endpoint(
+        self,
         endpoint: dict,
         applications_names: list[str],
-        batch_window_generator: _BatchWindowGenerator,
-        project: str,
-        model_monitoring_access_key: str,
-        tsdb_connector: mlrun.model_monitoring.db.tsdb.TSDBConnector,
-    ) -> None:
+    ) -> tuple[list[_WindowEvents], int]:
         """
-        Process a model endpoint and trigger the monitoring applications. This function running on different process
-        for each endpoint. In addition, this function will generate a parquet file that includes the relevant data
-        for a specific time range.
-
-        :param endpoint:                    (dict) Model endpoint record.
-        :param applications_names:          (list[str]) List of application names to push results to.
-        :param batch_window_generator:      (_BatchWindowGenerator) An object that generates _BatchWindow objects.
-        :param project:                     (str) Project name.
-        :param model_monitoring_access_key: (str) Access key to apply the model monitoring process.
-        :param tsdb_connector:              (mlrun.model_monitoring.db.tsdb.TSDBConnector) TSDB connector
+        Get the windows of a model endpoint per application, and the application events of the windows intervals
+        which have data. The last analyzed time is updated only after the events are pushed.
+
+        :param endpoint:           (dict) Model endpoint record.
+        :param applications_names: (list[str]) List of application names to push results to.
+
+        :returns: The endpoint windows and the number of read intervals.
         """
         endpoint_id = endpoint[mm_constants.EventFieldType.UID]
         # if false the endpoint represent batch infer step.
         has_stream = endpoint[mm_constants.EventFieldType.STREAM_PATH] != ""
-        try:
-            for application in applications_names:
-                batch_window = batch_window_generator.get_batch_window(
-                    project=project,
-                    endpoint=endpoint_id,
-                    application=application,
-                    first_request=endpoint[mm_constants.EventFieldType.FIRST_REQUEST],
-                    last_request=endpoint[mm_constants.EventFieldType.LAST_REQUEST],
-                    has_stream=has_stream,
-                )
+        windows = []
+        intervals = 0
+        for application in applications_names:
+            batch_window = self._batch_window_generator.get_batch_window(
+                project=self.project,
+                endpoint=endpoint_id,
+                application=application,
+                first_request=endpoint[mm_constants.EventFieldType.FIRST_REQUEST],
+                last_request=endpoint[mm_constants.EventFieldType.LAST_REQUEST],
+                has_stream=has_stream,
+            )
 
-                for start_infer_time, end_infer_time in batch_window.get_intervals():
-                    prediction_metric = tsdb_connector.read_predictions(
+            events = []
+            last_analyzed = None
+            for start_infer_time, end_infer_time in batch_window.get_intervals(
+                update_last_analyzed=False
+            ):
+                prediction_metric = self.tsdb_connector.read_predictions(
+                    endpoint_id=endpoint_id,
+                    start=start_infer_time,
+                    end=end_infer_time,
+                )
+                intervals += 1
+                last_analyzed = int(end_infer_time.timestamp())
+                if not prediction_metric.data and has_stream:
+                    logger.info(
+                        "No data found for the given interval",
+                        start=start_infer_time,
+                        end=end_infer_time,
                         endpoint_id=endpoint_id,
+                    )
+                else:
+                    logger.info(
+                        "Data found for the given interval",
                         start=start_infer_time,
                         end=end_infer_time,
+                        endpoint_id=endpoint_id,
                     )
-                    if not prediction_metric.data and has_stream:
-                        logger.info(
-                            "No data found for the given interval",
-                            start=start_infer_time,
-                            end=end_infer_time,
-                            endpoint_id=endpoint_id,
-                        )
-                    else:
-                        logger.info(
-                            "Data found for the given interval",
-                            start=start_infer_time,
-                            end=end_infer_time,
-                            endpoint_id=endpoint_id,
-                        )
-                        cls._push_to_applications(
+                    events.append(
+                        self._get_application_event(
                             start_infer_time=start_infer_time,
                             end_infer_time=end_infer_time,
                             endpoint_id=endpoint_id,
-                            project=project,
-                            applications_names=[application],
-                            model_monitoring_access_key=model_monitoring_access_key,
+                            project=self.project,
+                            application_name=application,
                         )
-        except Exception:
-            logger.exception(
-                "Encountered an exception",
-                endpoint_id=endpoint[mm_constants.EventFieldType.UID],
-            )
+                    )
+            if last_analyzed is not None:
+                windows.append(
+                    _WindowEvents(application, endpoint_id, events, last_analyzed)
+                )
+        return windows, intervals
 
     @staticmethod
-    def _push_to_applications(
+    def _get_application_event(
         start_infer_time: datetime.datetime,
         end_infer_time: datetime.datetime,
         endpoint_id: str,
         project: str,
-        applications_names: list[str],
-        model_monitoring_access_key: str,
-    ):
+        application_name: str,
+    ) -> dict:
         """
-        Pushes data to multiple stream applications.
-
-        :param start_infer_time:            The beginning of the infer interval window.
-        :param end_infer_time:              The end of the infer interval window.
-        :param endpoint_id:                 Identifier for the model endpoint.
-        :param project: mlrun               Project name.
-        :param applications_names:          List of application names to which data will be pushed.
-        :param model_monitoring_access_key: Access key to apply the model monitoring process.
+        Get the application stream event of an endpoint interval.
 
+        :param start_infer_time: The beginning of the infer interval window.
+        :param end_infer_time:   The end of the infer interval window.
+        :param endpoint_id:      Identifier for the model endpoint.
+        :param project:          mlrun Project name.
+        :param application_name: The application to which the event is pushed.
         """
-        data = {
+        return {
             mm_constants.ApplicationEvent.START_INFER_TIME: start_infer_time.isoformat(
                 sep=" ", timespec="microseconds"
             ),
@@ -480,17 +640,85 @@ class MonitoringApplicationController:
                 project=project,
                 function_name=mm_constants.MonitoringFunctionNames.WRITER,
             ),
+            mm_constants.ApplicationEvent.APPLICATION_NAME: application_name,
         }
-        for app_name in applications_names:
-            data.update({mm_constants.ApplicationEvent.APPLICATION_NAME: app_name})
-            stream_uri = get_stream_path(project=project, function_name=app_name)
 
+    def _push_to_applications(
+        self, windows: list[_WindowEvents], tick: _TickMetrics
+    ) -> None:
+        """
+        Push the events to the application streams, in batches per application stream. The last analyzed time of the
+        windows is updated (in bulk per application) once the application events are pushed, so failed pushes are
+        retried on the next run.
+
+        :param windows: The endpoints windows with their application events.
+        :param tick:    The run counters.
+        """
+        batch_size = max(
+            int(mlrun.mlconf.model_endpoint_monitoring.controller_push_batch_size), 1
+        )
+        windows_per_application = collections.defaultdict(list)
+        for window in windows:
+            windows_per_application[window.application].append(window)
+
+        for app_name, app_windows in windows_per_application.items():
+            events = [event for window in app_windows for event in window.events]
+            stream_uri = get_stream_path(project=self.project, function_name=app_name)
+            try:
+                if events:
+                    logger.info(
+                        "Pushing events to application stream",
+                        application=app_name,
+                        stream_uri=stream_uri,
+                        events=len(events),
+                    )
+                    pusher = get_stream_pusher(
+                        stream_uri, access_key=self.model_monitoring_access_key
+                    )
+                    for index in range(0, len(events), batch_size):
+                        pusher.push(events[index : index + batch_size])
+                        tick.push_batches += 1
+                    tick.pushed_events += len(events)
+            except Exception:
+                tick.errors += 1
+                logger.exception(
+                    "Failed to push events to application stream",
+                    application=app_name,
+                    stream_uri=stream_uri,
+                )
+                continue
+
+            last_analyzed = {
+                (window.endpoint_id, app_name): window.last_analyzed
+                for window in app_windows
+            }
             logger.info(
-                f"push endpoint_id {endpoint_id} to {app_name} by stream :{stream_uri}"
-            )
-            get_stream_pusher(stream_uri, access_key=model_monitoring_access_key).push(
-                [data]
+                "Updating the last analyzed time of the application windows",
+                application=app_name,
+                windows=len(last_analyzed),
             )
+            try:
+                self.db.update_last_analyzed_bulk(last_analyzed)
+            except Exception:
+                tick.errors += 1
+                logger.exception(
+                    "Failed to update the last analyzed time",
+                    application=app_name,
+                    windows=len(last_analyzed),
+                )
+
+
+def _get_event_shard(event: nuclio.Event) -> tuple[Optional[int], Optional[int]]:
+    """Get the (shard, shards count) from the trigger event body, the cron trigger of each shard sets them"""
+    body = event.body
+    if isinstance(body, (bytes, str)):
+        try:
+            body = json.loads(body or "{}")
+        except ValueError:
+            return None, None
+    if not isinstance(body, dict):
+        return None, None
+    return body.get("shard"), body.get("shards_count")
 
 
 def handler(context: nuclio.Context, event: nuclio.Event) -> None:
@@ -500,4 +728,5 @@ def handler(context: nuclio.Context, event: nuclio.Event) -> None:
     :param context: the Nuclio context
     :param event:   trigger event
     """
-    MonitoringApplicationController().run()
+    shard, shards_count = _get_event_shard(event)
+    MonitoringApplicationController(shard=shard, shards_count=shards_count).run()
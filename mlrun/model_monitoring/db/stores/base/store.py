@@ -96,11 +96,15 @@ class StoreBase(ABC):
         top_level: bool = None,
         uids: list = None,
         include_stats: bool = None,
+        limit: typing.Optional[int] = None,
+        after: typing.Optional[str] = None,
     ) -> list[dict[str, typing.Any]]:
         """
         Returns a list of model endpoint dictionaries, supports filtering by model, function, labels or top level.
         By default, when no filters are applied, all available model endpoints for the given project will
         be listed.
+        For keyset pagination, provide `limit` and pass the uid of the last endpoint of a page as the `after` of the
+        next page - the paginated endpoints are ordered by their uid.
 
         :param model:           The name of the model to filter by.
         :param function:        The name of the function to filter by.
@@ -110,6 +114,8 @@ class StoreBase(ABC):
         :param top_level:       If True will return only routers and endpoint that are NOT children of any router.
         :param uids:             List of model endpoint unique ids to include in the result.
         :param include_stats:   If True, will include model endpoint statistics in the result.
+        :param limit:           The max number of model endpoints to return.
+        :param after:           Return only the model endpoints whose uid is greater than this uid.
 
         :return: A list of model endpoint dictionaries.
         """
@@ -130,6 +136,19 @@ class StoreBase(ABC):
         :param kind: The type of the event, can be either "result" or "metric".
         """
 
+    def write_application_events(
+        self,
+        events: list[tuple[dict[str, typing.Any], mm_schemas.WriterEventKind]],
+    ) -> None:
+        """
+        Write a batch of application events in the target tables. The default implementation writes the events one
+        by one, stores that support bulk writes should override it.
+
+        :param events: List of (event, kind) tuples, see :py:meth:`write_application_event`.
+        """
+        for event, kind in events:
+            self.write_application_event(event=event, kind=kind)
+
     @abstractmethod
     def get_last_analyzed(self, endpoint_id: str, application_name: str) -> int:
         """
@@ -161,6 +180,20 @@ class StoreBase(ABC):
         """
         pass
 
+    def update_last_analyzed_bulk(self, last_analyzed: dict[tuple[str, str], int]):
+        """
+        Update the last analyzed time of many model endpoints and applications. The default implementation updates
+        the records one by one, stores that support bulk updates should override it.
+
+        :param last_analyzed: Dictionary of the last analyzed time (Unix time) per (endpoint id, application name).
+        """
+        for (endpoint_id, application_name), value in last_analyzed.items():
+            self.update_last_analyzed(
+                endpoint_id=endpoint_id,
+                application_name=application_name,
+                last_analyzed=value,
+            )
+
     @abstractmethod
     def get_model_endpoint_metrics(
         self, endpoint_id: str, type: mm_schemas.ModelEndpointMonitoringMetricType
@@ -196,18 +229,31 @@ class StoreBase(ABC):
             endpoint_dict.get(mm_schemas.EventFieldType.LABELS)
         )
 
+        for key, value in StoreBase._parse_labels(labels):
+            if key not in endpoint_labels:
+                return False
+            if value is not None and str(endpoint_labels[key]) != value:
+                return False
+
+        return True
+
+    @staticmethod
+    def _parse_labels(labels: list[str]) -> list[tuple[str, typing.Optional[str]]]:
+        """
+        Parse the label filters into (key, value) tuples, where the value is None for a key only filter.
+
+        :param labels: List of label filters, either 'key=value' pairs or keys (e.g. ['label_1=value_1', 'label_2']).
+
+        :return: List of (key, value) tuples.
+        """
+        parsed_labels = []
         for label in labels:
-            # Case 1 - label is a key=value pair
             if "=" in label:
-                lbl, value = list(map(lambda x: x.strip(), label.split("=")))
-                if lbl not in endpoint_labels or str(endpoint_labels[lbl]) != value:
-                    return False
-            # Case 2 - label is just a key
+                key, value = (part.strip() for part in label.split("=", 1))
+                parsed_labels.append((key, value))
             else:
-                if label not in endpoint_labels:
-                    return False
-
-        return True
+                parsed_labels.append((label.strip(), None))
+        return parsed_labels
 
     def create_tables(self):
         pass
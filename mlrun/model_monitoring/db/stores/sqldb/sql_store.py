@@ -16,8 +16,10 @@ import datetime
 import typing
 import uuid
 
-import pandas as pd
 import sqlalchemy
+import sqlalchemy.dialects.mysql
+import sqlalchemy.dialects.postgresql
+import sqlalchemy.dialects.sqlite
 import sqlalchemy.exc
 import sqlalchemy.orm
 from sqlalchemy.engine import Engine, make_url
@@ -31,6 +33,9 @@ from mlrun.common.db.sql_session import create_session, get_engine
 from mlrun.model_monitoring.db import StoreBase
 from mlrun.utils import datetime_now, logger
 
+# The default max number of host parameters in a single SQLite statement
+_MAX_STATEMENT_PARAMETERS = 999
+
 
 class SQLStoreBase(StoreBase):
     type: typing.ClassVar[str] = mm_schemas.ModelEndpointTarget.SQL
@@ -122,10 +127,68 @@ class SQLStoreBase(StoreBase):
         :param table_name: Target table name.
         :param event:      Event dictionary that will be written into the DB.
         """
-        with self.engine.connect() as connection:
-            # Convert the result into a pandas Dataframe and write it into the database
-            event_df = pd.DataFrame([event])
-            event_df.to_sql(table_name, con=connection, index=False, if_exists="append")
+        with self.engine.begin() as connection:
+            connection.execute(self._tables[table_name].__table__.insert(), [event])
+
+    def _upsert(
+        self,
+        table: sqlalchemy.orm.decl_api.DeclarativeMeta,
+        records: list[dict[str, typing.Any]],
+    ) -> None:
+        """
+        Insert new records or update the existing ones (by the `uid` primary key) in a single transaction, using
+        multi-row ``INSERT ... ON DUPLICATE KEY UPDATE`` (MySQL) or ``INSERT ... ON CONFLICT DO UPDATE`` (SQLite and
+        PostgreSQL) statements. For other dialects, the existing records are deleted and the records are inserted.
+
+        :param table:   SQLAlchemy declarative table.
+        :param records: List of the records to write, each record must include the `uid` of the table.
+        """
+        uid = mm_schemas.EventFieldType.UID
+        # The last record of each uid wins, as in consecutive single writes
+        records = list({record[uid]: record for record in records}.values())
+
+        # A multi-row statement requires the same columns in all the rows
+        records_by_columns: dict[tuple[str, ...], list[dict[str, typing.Any]]] = {}
+        for record in records:
+            records_by_columns.setdefault(tuple(sorted(record)), []).append(record)
+
+        sql_table = table.__table__
+        dialect = self.engine.dialect.name
+        with self.engine.begin() as connection:
+            for columns, columns_records in records_by_columns.items():
+                update_columns = [column for column in columns if column != uid]
+                # Keep the statement parameters below the SQLite default limit
+                chunk_size = max(_MAX_STATEMENT_PARAMETERS // len(columns), 1)
+                for i in range(0, len(columns_records), chunk_size):
+                    chunk = columns_records[i : i + chunk_size]
+                    if dialect == "mysql":
+                        statement = sqlalchemy.dialects.mysql.insert(sql_table).values(
+                            chunk
+                        )
+                        statement = statement.on_duplicate_key_update(
+                            {
+                                column: statement.inserted[column]
+                                for column in update_columns
+                            }
+                        )
+                    elif dialect in ["sqlite", "postgresql"]:
+                        dialect_module = getattr(sqlalchemy.dialects, dialect)
+                        statement = dialect_module.insert(sql_table).values(chunk)
+                        statement = statement.on_conflict_do_update(
+                            index_elements=[uid],
+                            set_={
+                                column: statement.excluded[column]
+                                for column in update_columns
+                            },
+                        )
+                    else:
+                        connection.execute(
+                            sql_table.delete().where(
+                                sql_table.c[uid].in_([record[uid] for record in chunk])
+                            )
+                        )
+                        statement = sql_table.insert().values(chunk)
+                    connection.execute(statement)
 
     def _update(
         self,
@@ -278,9 +341,21 @@ class SQLStoreBase(StoreBase):
         top_level: bool = None,
         uids: list = None,
         include_stats: bool = None,
+        limit: typing.Optional[int] = None,
+        after: typing.Optional[str] = None,
     ) -> list[dict[str, typing.Any]]:
         # Generate an empty model endpoints that will be filled afterwards with model endpoint dictionaries
         endpoint_list = []
+        # Exclude these fields when listing model endpoints to avoid returning too much data (ML-6594)
+        # TODO: Remove stats from table schema (ML-7196)
+        excluded_columns = (
+            []
+            if include_stats
+            else [
+                mm_schemas.EventFieldType.FEATURE_STATS,
+                mm_schemas.EventFieldType.CURRENT_STATS,
+            ]
+        )
 
         model_endpoints_table = (
             self.model_endpoints_table.__table__  # pyright: ignore[reportAttributeAccessIssue]
@@ -328,23 +403,26 @@ class SQLStoreBase(StoreBase):
                     filtered_values=endpoint_types,
                     combined=False,
                 )
-            # Convert the results from the DB into a ModelEndpoint object and append it to the model endpoints list
-            for endpoint_record in query.all():
-                endpoint_dict = endpoint_record.to_dict()
-
-                # Filter labels
-                if labels and not self._validate_labels(
-                    endpoint_dict=endpoint_dict, labels=labels
-                ):
-                    continue
-
-                if not include_stats:
-                    # Exclude these fields when listing model endpoints to avoid returning too much data (ML-6594)
-                    # TODO: Remove stats from table schema (ML-7196)
-                    endpoint_dict.pop(mm_schemas.EventFieldType.FEATURE_STATS)
-                    endpoint_dict.pop(mm_schemas.EventFieldType.CURRENT_STATS)
+            if labels:
+                query = self._filter_labels(query=query, labels=labels)
+            if after is not None:
+                query = query.filter(self.model_endpoints_table.uid > after)
+            if limit is not None or after is not None:
+                query = query.order_by(self.model_endpoints_table.uid)
+            if limit is not None:
+                query = query.limit(limit)
+
+            # Don't select the stats columns unless they are requested
+            query = query.options(
+                *[
+                    sqlalchemy.orm.defer(getattr(self.model_endpoints_table, column))
+                    for column in excluded_columns
+                ]
+            )
 
-                endpoint_list.append(endpoint_dict)
+            # Convert the results from the DB into a ModelEndpoint object and append it to the model endpoints list
+            for endpoint_record in query:
+                endpoint_list.append(endpoint_record.to_dict(exclude=excluded_columns))
 
         return endpoint_list
 
@@ -361,33 +439,42 @@ class SQLStoreBase(StoreBase):
                       :py:class:`~mm_constants.constants.WriterEvent` object.
         :param kind: The type of the event, can be either "result" or "metric".
         """
+        self.write_application_events(events=[(event, kind)])
 
-        if kind == mm_schemas.WriterEventKind.METRIC:
-            table = self.application_metrics_table
-            table_name = mm_schemas.FileTargetKind.APP_METRICS
-        elif kind == mm_schemas.WriterEventKind.RESULT:
-            table = self.application_results_table
-            table_name = mm_schemas.FileTargetKind.APP_RESULTS
-        else:
-            raise ValueError(f"Invalid {kind = }")
-
-        application_result_uid = self._generate_application_result_uid(event, kind=kind)
-        criteria = [table.uid == application_result_uid]
+    def write_application_events(
+        self,
+        events: list[tuple[dict[str, typing.Any], mm_schemas.WriterEventKind]],
+    ) -> None:
+        """
+        Write a batch of application events in the target tables. The events are upserted by their application
+        result uid, with a multi-row statement per table.
 
-        application_record = self._get(table=table, criteria=criteria)
-        if application_record:
+        :param events: List of (event, kind) tuples, see :py:meth:`write_application_event`.
+        """
+        records_by_kind = {
+            mm_schemas.WriterEventKind.RESULT: [],
+            mm_schemas.WriterEventKind.METRIC: [],
+        }
+        for event, kind in events:
+            if kind not in records_by_kind:
+                raise ValueError(f"Invalid {kind = }")
             self._convert_to_datetime(
                 event=event, key=mm_schemas.WriterEvent.START_INFER_TIME
             )
             self._convert_to_datetime(
                 event=event, key=mm_schemas.WriterEvent.END_INFER_TIME
             )
-            # Update an existing application result
-            self._update(attributes=event, table=table, criteria=criteria)
-        else:
-            # Write a new application result
-            event[mm_schemas.EventFieldType.UID] = application_result_uid
-            self._write(table_name=table_name, event=event)
+            event[mm_schemas.EventFieldType.UID] = (
+                self._generate_application_result_uid(event, kind=kind)
+            )
+            records_by_kind[kind].append(event)
+
+        for kind, table in [
+            (mm_schemas.WriterEventKind.RESULT, self.application_results_table),
+            (mm_schemas.WriterEventKind.METRIC, self.application_metrics_table),
+        ]:
+            if records_by_kind[kind]:
+                self._upsert(table=table, records=records_by_kind[kind])
 
     @staticmethod
     def _convert_to_datetime(event: dict[str, typing.Any], key: str) -> None:
@@ -465,31 +552,54 @@ class SQLStoreBase(StoreBase):
         :param last_analyzed:    Timestamp as a Unix time that represents the last analyzed time of a certain
                                  application and model endpoint.
         """
-        criteria = self._get_filter_criteria(
-            table=self.MonitoringSchedulesTable,
-            endpoint_id=endpoint_id,
-            application_name=application_name,
-        )
-        monitoring_schedule_record = self._get(
-            table=self.MonitoringSchedulesTable, criteria=criteria
-        )
-        if not monitoring_schedule_record:
-            # Add a new record with last analyzed value
-            self._write(
-                table_name=mm_schemas.FileTargetKind.MONITORING_SCHEDULES,
-                event={
-                    mm_schemas.SchedulingKeys.UID: uuid.uuid4().hex,
-                    mm_schemas.SchedulingKeys.APPLICATION_NAME: application_name,
-                    mm_schemas.SchedulingKeys.ENDPOINT_ID: endpoint_id,
-                    mm_schemas.SchedulingKeys.LAST_ANALYZED: last_analyzed,
-                },
-            )
+        self.update_last_analyzed_bulk({(endpoint_id, application_name): last_analyzed})
 
-        self._update(
-            attributes={mm_schemas.SchedulingKeys.LAST_ANALYZED: last_analyzed},
-            table=self.MonitoringSchedulesTable,
-            criteria=criteria,
-        )
+    def update_last_analyzed_bulk(self, last_analyzed: dict[tuple[str, str], int]):
+        """
+        Update the last analyzed time of many model endpoints and applications in a single transaction. The missing
+        records are created.
+
+        :param last_analyzed: Dictionary of the last analyzed time (Unix time) per (endpoint id, application name).
+        """
+        if not last_analyzed:
+            return
+        table = self.MonitoringSchedulesTable
+        endpoint_ids = {endpoint_id for endpoint_id, _ in last_analyzed}
+        with create_session(dsn=self._sql_connection_string) as session:
+            # The table has no unique key on (endpoint_id, application_name), so the existing records are matched
+            # by their uid rather than upserted
+            existing_uids = {
+                (record.endpoint_id, record.application_name): record.uid
+                for record in session.query(
+                    table.uid, table.endpoint_id, table.application_name
+                ).filter(table.endpoint_id.in_(endpoint_ids))
+                if (record.endpoint_id, record.application_name) in last_analyzed
+            }
+            updates, inserts = [], []
+            for (endpoint_id, application_name), value in last_analyzed.items():
+                if (endpoint_id, application_name) in existing_uids:
+                    updates.append(
+                        {
+                            mm_schemas.SchedulingKeys.UID: existing_uids[
+                                (endpoint_id, application_name)
+                            ],
+                            mm_schemas.SchedulingKeys.LAST_ANALYZED: value,
+                        }
+                    )
+                else:
+                    inserts.append(
+                        {
+                            mm_schemas.SchedulingKeys.UID: uuid.uuid4().hex,
+                            mm_schemas.SchedulingKeys.APPLICATION_NAME: application_name,
+                            mm_schemas.SchedulingKeys.ENDPOINT_ID: endpoint_id,
+                            mm_schemas.SchedulingKeys.LAST_ANALYZED: value,
+                        }
+                    )
+            if updates:
+                session.bulk_update_mappings(table, updates)
+            if inserts:
+                session.bulk_insert_mappings(table, inserts)
+            session.commit()
 
     def _delete_last_analyzed(
         self, endpoint_id: str, application_name: typing.Optional[str] = None
@@ -536,6 +646,47 @@ class SQLStoreBase(StoreBase):
             else:
                 logger.info(f"Table {table} already exists on {db_name} db.")
 
+    def _filter_labels(
+        self, query: sqlalchemy.orm.query.Query, labels: list[str]
+    ) -> sqlalchemy.orm.query.Query:
+        """
+        Filter the model endpoints query by the labels, using the JSON functions of the database on the labels column.
+        See :py:meth:`~StoreBase.list_model_endpoints` for the label filters format.
+
+        :param query:  SQLAlchemy ORM query object of the model endpoints table.
+        :param labels: List of label filters.
+
+        :return: SQLAlchemy ORM query object that represents the updated query with the label filters.
+        """
+        labels_column = self.model_endpoints_table.labels
+        is_mysql = self.engine.dialect.name == "mysql"
+        # Both SQLite and MySQL raise an error on malformed JSON values, skip the endpoints with such labels
+        query = query.filter(sqlalchemy.func.json_valid(labels_column) == 1)
+
+        for key, value in self._parse_labels(labels):
+            path = f'$."{key}"'
+            if value is None:
+                condition = (
+                    sqlalchemy.func.json_contains_path(labels_column, "one", path) == 1
+                    if is_mysql
+                    else sqlalchemy.func.json_type(labels_column, path).isnot(None)
+                )
+            else:
+                # Compare the label values as strings, as the labels of the endpoints may have numeric values
+                label_value = (
+                    sqlalchemy.func.json_unquote(
+                        sqlalchemy.func.json_extract(labels_column, path)
+                    )
+                    if is_mysql
+                    else sqlalchemy.cast(
+                        sqlalchemy.func.json_extract(labels_column, path),
+                        sqlalchemy.Text,
+                    )
+                )
+                condition = label_value == value
+            query = query.filter(condition)
+        return query
+
     @staticmethod
     def _filter_values(
         query: sqlalchemy.orm.query.Query,
@@ -11,8 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import heapq
 import http
 import json
+import operator
 import typing
 from dataclasses import dataclass
 from http import HTTPStatus
@@ -34,6 +36,18 @@ fields_to_encode_decode = [
     mm_schemas.EventFieldType.CURRENT_STATS,
 ]
 
+# The model endpoint attributes to retrieve when listing the model endpoints without their stats
+_LIST_ATTRIBUTES_WITHOUT_STATS: list[str] = sorted(
+    (
+        set(mm_schemas.ModelEndpointMetadata.__fields__)
+        | set(mm_schemas.ModelEndpointSpec.__fields__)
+        | set(mm_schemas.ModelEndpointStatus.__fields__)
+        # This is kept for backwards compatibility - in old versions the key column named endpoint_id
+        | {mm_schemas.EventFieldType.ENDPOINT_ID}
+    )
+    - set(fields_to_encode_decode)
+)
+
 _METRIC_FIELDS: list[str] = [
     mm_schemas.WriterEvent.APPLICATION_NAME.value,
     mm_schemas.MetricData.METRIC_NAME.value,
@@ -233,20 +247,26 @@ class KVStoreBase(StoreBase):
         top_level: bool = None,
         uids: list = None,
         include_stats: bool = None,
+        limit: typing.Optional[int] = None,
+        after: typing.Optional[str] = None,
     ) -> list[dict[str, typing.Any]]:
         # # Initialize an empty model endpoints list
         endpoint_list = []
 
-        # Retrieve the raw data from the KV table and get the endpoint ids
+        # Retrieve the model endpoints from the KV table in a single scan, without the stats unless they are requested
         try:
             cursor = self.client.kv.new_cursor(
                 container=self.container,
                 table_path=self.path,
+                attribute_names="*"
+                if include_stats
+                else _LIST_ATTRIBUTES_WITHOUT_STATS,
                 filter_expression=self._build_kv_cursor_filter_expression(
                     self.project,
                     function,
                     model,
                     top_level,
+                    after=after,
                 ),
                 raise_for_status=v3io.dataplane.RaiseForStatus.never,
             )
@@ -258,26 +278,23 @@ class KVStoreBase(StoreBase):
                 exc=mlrun.errors.err_to_str(exc),
             )
             return endpoint_list
-        # Create a list of model endpoints unique ids
-        if uids is None:
-            uids = []
-            for item in items:
-                if mm_schemas.EventFieldType.UID not in item:
-                    # This is kept for backwards compatibility - in old versions the key column named endpoint_id
-                    uids.append(item[mm_schemas.EventFieldType.ENDPOINT_ID])
-                else:
-                    uids.append(item[mm_schemas.EventFieldType.UID])
-
-        # Add each relevant model endpoint to the model endpoints list
-        for endpoint_id in uids:
-            endpoint_dict = self.get_model_endpoint(
-                endpoint_id=endpoint_id,
-            )
-            if not include_stats:
-                # Exclude these fields when listing model endpoints to avoid returning too much data (ML-6594)
-                endpoint_dict.pop(mm_schemas.EventFieldType.FEATURE_STATS)
-                endpoint_dict.pop(mm_schemas.EventFieldType.CURRENT_STATS)
 
+        uids = set(uids) if uids is not None else None
+        for endpoint_dict in items:
+            if include_stats:
+                for field in fields_to_encode_decode:
+                    if field in endpoint_dict:
+                        # Decode binary data
+                        endpoint_dict[field] = self._decode_field(endpoint_dict[field])
+
+            # For backwards compatability: replace null values for `error_count` and `metrics`, and set the `uid`
+            self.validate_old_schema_fields(endpoint=endpoint_dict)
+            endpoint_id = endpoint_dict[mm_schemas.EventFieldType.UID]
+
+            if uids is not None and endpoint_id not in uids:
+                continue
+            if after is not None and endpoint_id <= after:
+                continue
             if labels and not self._validate_labels(
                 endpoint_dict=endpoint_dict, labels=labels
             ):
@@ -285,6 +302,16 @@ class KVStoreBase(StoreBase):
 
             endpoint_list.append(endpoint_dict)
 
+        if limit is not None or after is not None:
+            # The KV scan is not ordered, order the endpoints for the keyset pagination. The endpoints of the
+            # previous pages are filtered in the scan, and only the first `limit` endpoints are kept
+            sort_key = operator.itemgetter(mm_schemas.EventFieldType.UID)
+            endpoint_list = (
+                sorted(endpoint_list, key=sort_key)
+                if limit is None
+                else heapq.nsmallest(limit, endpoint_list, key=sort_key)
+            )
+
         return endpoint_list
 
     def delete_model_endpoints_resources(self):
@@ -527,6 +554,7 @@ class KVStoreBase(StoreBase):
         function: str = None,
         model: str = None,
         top_level: bool = False,
+        after: typing.Optional[str] = None,
     ) -> str:
         """
         Convert the provided filters into a valid filter expression. The expected filter expression includes different
@@ -536,6 +564,7 @@ class KVStoreBase(StoreBase):
         :param model:           The name of the model to filter by.
         :param function:        The name of the function to filter by.
         :param top_level:       If True will return only routers and endpoint that are NOT children of any router.
+        :param after:           If set, will return only the endpoints with a greater uid (the item key).
 
         :return: A valid filter expression as a string.
 
@@ -565,6 +594,10 @@ class KVStoreBase(StoreBase):
                 f"OR  endpoint_type=='{str(mm_schemas.EndpointType.ROUTER.value)}')"
             )
 
+        # Keyset pagination, the endpoints are keyed by their uid
+        if after is not None:
+            filter_expression.append(f"__name>'{after}'")
+
         return " AND ".join(filter_expression)
 
     @staticmethod
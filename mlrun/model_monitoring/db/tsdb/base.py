@@ -48,7 +48,7 @@ class TSDBConnector(ABC):
         self.project = project
 
     @abstractmethod
-    def apply_monitoring_stream_steps(self, graph) -> None:
+    def apply_monitoring_stream_steps(self, graph, columnar: bool = False) -> None:
         """
         Apply TSDB steps on the provided monitoring graph. Throughout these steps, the graph stores live data of
         different key metric dictionaries. This data is being used by the monitoring dashboards in
@@ -57,6 +57,10 @@ class TSDBConnector(ABC):
         - base_metrics (average latency and predictions over time)
         - endpoint_features (Prediction and feature names and values)
         - custom_metrics (user-defined metrics)
+
+        :param graph:    The monitoring serving graph.
+        :param columnar: Whether the graph is of the columnar stream processing mode, where each event is a model
+                         invocation with its named features and predictions as DataFrames.
         """
         pass
 
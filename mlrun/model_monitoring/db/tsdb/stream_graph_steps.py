@@ -0,0 +1,89 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+
+import mlrun.feature_store.steps
+from mlrun.common.schemas.model_monitoring import EventFieldType
+
+
+class UnpackPredictions(mlrun.feature_store.steps.MapClass):
+    def __init__(self, fields: list[str], **kwargs):
+        """
+        Unpack a model invocation event of the columnar stream processing mode into a list of events, one per
+        prediction, that includes only the provided fields of the invocation. The list should be flattened by
+        a following storey.FlatMap step, before a target that expects an event per prediction.
+
+        :param fields: The invocation fields to keep in each prediction event.
+
+        :returns: List of prediction events.
+        """
+        super().__init__(**kwargs)
+        self.fields = fields
+
+    def do(self, event):
+        prediction_event = {field: event[field] for field in self.fields}
+        return [
+            dict(prediction_event)
+            for _ in range(len(event[EventFieldType.NAMED_PREDICTIONS]))
+        ]
+
+
+class SamplePredictions(mlrun.feature_store.steps.MapClass):
+    def __init__(self, window_size: int, **kwargs):
+        """
+        The columnar stream processing mode counterpart of storey.steps.SampleWindow - sample the first prediction
+        of each window of `window_size` predictions of the endpoint. Each sampled prediction is an event with the
+        invocation fields, where the named features and predictions are dictionaries (as in the rows mode). The
+        returned list should be flattened by a following storey.FlatMap step.
+
+        :param window_size: The number of predictions in each sampling window.
+
+        :returns: List of the sampled prediction events.
+        """
+        super().__init__(**kwargs)
+        self.window_size = window_size
+
+        # Number of predictions (value) per endpoint (key)
+        self._predictions_count: dict[str, int] = collections.defaultdict(int)
+
+    def do(self, event):
+        endpoint_id = event[EventFieldType.ENDPOINT_ID]
+        named_features = event[EventFieldType.NAMED_FEATURES]
+        named_predictions = event[EventFieldType.NAMED_PREDICTIONS]
+
+        predictions_count = self._predictions_count[endpoint_id]
+        self._predictions_count[endpoint_id] += len(named_predictions)
+
+        invocation = {
+            key: value
+            for key, value in event.items()
+            if key
+            not in [EventFieldType.NAMED_FEATURES, EventFieldType.NAMED_PREDICTIONS]
+        }
+        # The first sampled prediction is the one that opens the next window of the endpoint
+        return [
+            {
+                **invocation,
+                EventFieldType.NAMED_FEATURES: named_features.iloc[position].to_dict(),
+                EventFieldType.NAMED_PREDICTIONS: named_predictions.iloc[
+                    position
+                ].to_dict(),
+            }
+            for position in range(
+                -predictions_count % self.window_size,
+                len(named_predictions),
+                self.window_size,
+            )
+        ]
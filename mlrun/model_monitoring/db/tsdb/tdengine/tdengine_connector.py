@@ -152,13 +152,14 @@ class TDEngineConnector(TSDBConnector):
     def _convert_to_datetime(val: typing.Union[str, datetime]) -> datetime:
         return datetime.fromisoformat(val) if isinstance(val, str) else val
 
-    def apply_monitoring_stream_steps(self, graph):
+    def apply_monitoring_stream_steps(self, graph, columnar: bool = False):
         """
         Apply TSDB steps on the provided monitoring graph. Throughout these steps, the graph stores live data of
         different key metric dictionaries. This data is being used by the monitoring dashboards in
         grafana. At the moment, we store two types of data:
         - prediction latency.
         - custom metrics.
+        In the columnar mode, the model invocation is unpacked to a row per prediction before the TDEngine target.
         """
 
         def apply_process_before_tsdb():
@@ -190,10 +191,33 @@ class TDEngineConnector(TSDBConnector):
                 flush_after_seconds=30,
             )
 
+        def apply_unpack_predictions():
+            graph.add_step(
+                "mlrun.model_monitoring.db.tsdb.stream_graph_steps.UnpackPredictions",
+                name="UnpackPredictions",
+                after="ProcessBeforeTDEngine",
+                fields=[
+                    mm_schemas.EventFieldType.PROJECT,
+                    mm_schemas.EventFieldType.ENDPOINT_ID,
+                    mm_schemas.EventFieldType.TIME,
+                    mm_schemas.EventFieldType.LATENCY,
+                    mm_schemas.EventKeyMetrics.CUSTOM_METRICS,
+                    mm_schemas.EventFieldType.TABLE_COLUMN,
+                ],
+            )
+            graph.add_step(
+                "storey.FlatMap",
+                "flatten_predictions",
+                _fn="(event)",
+                after="UnpackPredictions",
+            )
+
         apply_process_before_tsdb()
+        if columnar:
+            apply_unpack_predictions()
         apply_tdengine_target(
             name="TDEngineTarget",
-            after="ProcessBeforeTDEngine",
+            after="flatten_predictions" if columnar else "ProcessBeforeTDEngine",
         )
 
     def handle_model_error(self, graph, **kwargs) -> None:
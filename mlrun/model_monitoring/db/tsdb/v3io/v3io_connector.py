@@ -168,6 +168,7 @@ class V3IOTSDBConnector(TSDBConnector):
         tsdb_batching_max_events: int = 1000,
         tsdb_batching_timeout_secs: int = 30,
         sample_window: int = 10,
+        columnar: bool = False,
     ):
         """
         Apply TSDB steps on the provided monitoring graph. Throughout these steps, the graph stores live data of
@@ -177,13 +178,34 @@ class V3IOTSDBConnector(TSDBConnector):
         - base_metrics (average latency and predictions over time)
         - endpoint_features (Prediction and feature names and values)
         - custom_metrics (user-defined metrics)
+        In the columnar mode, the model invocation is unpacked to a row per prediction before the predictions
+        TSDB target, and only the sampled predictions are unpacked for the events TSDB targets.
         """
 
+        if columnar:
+            graph.add_step(
+                "mlrun.model_monitoring.db.tsdb.stream_graph_steps.UnpackPredictions",
+                name="UnpackPredictions",
+                after="MapFeatureNames",
+                fields=[
+                    mm_schemas.EventFieldType.TIMESTAMP,
+                    mm_schemas.EventFieldType.ENDPOINT_ID,
+                    mm_schemas.EventFieldType.LATENCY,
+                    mm_schemas.EventFieldType.LAST_REQUEST_TIMESTAMP,
+                ],
+            )
+            graph.add_step(
+                "storey.FlatMap",
+                "flatten_predictions",
+                _fn="(event)",
+                after="UnpackPredictions",
+            )
+
         # Write latency per prediction, labeled by endpoint ID only
         graph.add_step(
             "storey.TSDBTarget",
             name="tsdb_predictions",
-            after="MapFeatureNames",
+            after="flatten_predictions" if columnar else "MapFeatureNames",
             path=f"{self.container}/{self.tables[mm_schemas.FileTargetKind.PREDICTIONS]}",
             rate="1/s",
             time_col=mm_schemas.EventFieldType.TIMESTAMP,
@@ -204,13 +226,24 @@ class V3IOTSDBConnector(TSDBConnector):
         )
 
         # Emits the event in window size of events based on sample_window size (10 by default)
-        graph.add_step(
-            "storey.steps.SampleWindow",
-            name="sample",
-            after="Rename",
-            window_size=sample_window,
-            key=EventFieldType.ENDPOINT_ID,
-        )
+        if columnar:
+            graph.add_step(
+                "mlrun.model_monitoring.db.tsdb.stream_graph_steps.SamplePredictions",
+                name="SamplePredictions",
+                after="Rename",
+                window_size=sample_window,
+            )
+            graph.add_step(
+                "storey.FlatMap", "sample", _fn="(event)", after="SamplePredictions"
+            )
+        else:
+            graph.add_step(
+                "storey.steps.SampleWindow",
+                name="sample",
+                after="Rename",
+                window_size=sample_window,
+                key=EventFieldType.ENDPOINT_ID,
+            )
 
         # Before writing data to TSDB, create dictionary of 2-3 dictionaries that contains
         # stats and details about the events
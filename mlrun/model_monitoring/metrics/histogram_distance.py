@@ -14,6 +14,7 @@
 
 import abc
 import dataclasses
+from collections.abc import Iterable
 from typing import ClassVar, Optional
 
 import numpy as np
@@ -44,6 +45,29 @@ class HistogramDistanceMetric(abc.ABC):
     def compute(self) -> float:
         raise NotImplementedError
 
+    @classmethod
+    def compute_batch(
+        cls, distrib_t: np.ndarray, distrib_u: np.ndarray, **kwargs
+    ) -> np.ndarray:
+        """
+        Compute the metric for many pairs of distributions at once, e.g. for all the features of a model.
+        Subclasses override this method with a vectorized implementation, the default computes the
+        distributions one by one.
+
+        :param distrib_t: 2-D array with a distribution t per row.
+        :param distrib_u: 2-D array with a distribution u per row, of the same shape as `distrib_t`.
+        :param kwargs:    Passed to `compute`.
+
+        :returns: 1-D array with the metric value per row.
+        """
+        return np.array(
+            [
+                cls(distrib_t=row_t, distrib_u=row_u).compute(**kwargs)
+                for row_t, row_u in zip(distrib_t, distrib_u)
+            ],
+            dtype=float,
+        )
+
 
 class TotalVarianceDistance(HistogramDistanceMetric, metric_name="tvd"):
     """
@@ -60,6 +84,12 @@ class TotalVarianceDistance(HistogramDistanceMetric, metric_name="tvd"):
         """
         return np.sum(np.abs(self.distrib_t - self.distrib_u)) / 2
 
+    @classmethod
+    def compute_batch(
+        cls, distrib_t: np.ndarray, distrib_u: np.ndarray, **kwargs
+    ) -> np.ndarray:
+        return np.sum(np.abs(distrib_t - distrib_u), axis=1) / 2
+
 
 class HellingerDistance(HistogramDistanceMetric, metric_name="hellinger"):
     """
@@ -83,6 +113,14 @@ class HellingerDistance(HistogramDistanceMetric, metric_name="hellinger"):
             )
         )
 
+    @classmethod
+    def compute_batch(
+        cls, distrib_t: np.ndarray, distrib_u: np.ndarray, **kwargs
+    ) -> np.ndarray:
+        return np.sqrt(
+            np.maximum(1 - np.sum(np.sqrt(distrib_u * distrib_t), axis=1), 0)
+        )
+
 
 class KullbackLeiblerDivergence(HistogramDistanceMetric, metric_name="kld"):
     """
@@ -125,3 +163,61 @@ class KullbackLeiblerDivergence(HistogramDistanceMetric, metric_name="kld"):
         if capping and result == float("inf"):
             return capping
         return result
+
+    @staticmethod
+    def _calc_kl_div_batch(
+        actual_dist: np.ndarray, expected_dist: np.ndarray, zero_scaling: float
+    ) -> np.ndarray:
+        """Return the asymmetric KL divergence per row"""
+        # We take 0*log(0) == 0 for this calculation
+        mask = actual_dist != 0
+        with np.errstate(over="ignore"):
+            relative_prob = np.divide(
+                actual_dist,
+                np.where(expected_dist != 0, expected_dist, zero_scaling),
+                out=np.ones_like(actual_dist, dtype=float),
+                where=mask,
+            )
+        return np.sum(actual_dist * np.log(relative_prob), axis=1)
+
+    @classmethod
+    def compute_batch(
+        cls,
+        distrib_t: np.ndarray,
+        distrib_u: np.ndarray,
+        capping: Optional[float] = None,
+        zero_scaling: float = 1e-4,
+    ) -> np.ndarray:
+        t_u = cls._calc_kl_div_batch(distrib_t, distrib_u, zero_scaling)
+        u_t = cls._calc_kl_div_batch(distrib_u, distrib_t, zero_scaling)
+        result = t_u + u_t
+        if capping:
+            result[np.isposinf(result)] = capping
+        return result
+
+
+def compute_metrics_batch(
+    metrics: Iterable[type[HistogramDistanceMetric]],
+    distrib_t: np.ndarray,
+    distrib_u: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """
+    Compute the histogram distance metrics over stacked distributions, e.g. the histograms of all the features.
+
+    :param metrics:   The metric classes to compute.
+    :param distrib_t: 2-D array with a distribution t per row (usually the latest dataset histogram per feature).
+    :param distrib_u: 2-D array with a distribution u per row (usually the sample dataset histogram per feature).
+
+    :returns: A dictionary of metric name to a 1-D array with the metric value per row.
+    """
+    distrib_t = np.asarray(distrib_t, dtype=float)
+    distrib_u = np.asarray(distrib_u, dtype=float)
+    if distrib_t.shape != distrib_u.shape or distrib_t.ndim != 2:
+        raise ValueError(
+            "The distributions must be 2-D arrays of the same shape, "
+            f"got {distrib_t.shape} and {distrib_u.shape}"
+        )
+    return {
+        metric.NAME: metric.compute_batch(distrib_t=distrib_t, distrib_u=distrib_u)
+        for metric in metrics
+    }
@@ -17,7 +17,9 @@ import datetime
 import json
 import os
 import typing
+import uuid
 
+import pandas as pd
 import storey
 
 import mlrun
@@ -52,11 +54,15 @@ class EventStreamProcessor:
         aggregate_windows: typing.Optional[list[str]] = None,
         aggregate_period: str = "5m",
         model_monitoring_access_key: str = None,
+        columnar: bool = False,
     ):
         # General configurations, mainly used for the storey steps in the future serving graph
         self.project = project
         self.aggregate_windows = aggregate_windows or ["5m", "1h"]
         self.aggregate_period = aggregate_period
+        # Whether to keep the predictions of each model invocation together (as DataFrames) through the graph,
+        # instead of splitting the invocation into an event per prediction
+        self.columnar = columnar
 
         # Parquet path and configurations
         self.parquet_path = parquet_target
@@ -67,6 +73,7 @@ class EventStreamProcessor:
             "Initializing model monitoring event stream processor",
             parquet_path=self.parquet_path,
             parquet_batching_max_events=self.parquet_batching_max_events,
+            columnar=self.columnar,
         )
 
         self.storage_options = None
@@ -159,6 +166,8 @@ class EventStreamProcessor:
            the parquet target path can be found under mlrun.mlconf.model_endpoint_monitoring.offline. Otherwise,
            the default parquet path is under mlrun.mlconf.model_endpoint_monitoring.user_space. Note that if you are
            using CE, the parquet target path is based on the defined MLRun artifact path.
+        In the columnar mode, each model invocation is processed as a single event that holds its named features and
+        predictions as DataFrames, and is split into predictions only where a target requires so.
 
         :param fn: A serving function.
         :param tsdb_connector: Time series database connector.
@@ -201,6 +210,7 @@ class EventStreamProcessor:
                 after="extract_endpoint",  # TODO: change this to FilterError in ML-7456
                 full_event=True,
                 project=self.project,
+                columnar=self.columnar,
             )
 
         apply_process_endpoint_event()
@@ -215,10 +225,14 @@ class EventStreamProcessor:
                 after="ProcessEndpointEvent",
             )
 
-            # flatten the events
-            graph.add_step(
-                "storey.FlatMap", "flatten_events", _fn="(event)", after="filter_none"
-            )
+            # flatten the events (in the columnar mode the model invocation is kept as a single event)
+            if not self.columnar:
+                graph.add_step(
+                    "storey.FlatMap",
+                    "flatten_events",
+                    _fn="(event)",
+                    after="filter_none",
+                )
 
         apply_storey_filter_and_flatmap()
 
@@ -229,7 +243,8 @@ class EventStreamProcessor:
                 name="MapFeatureNames",
                 infer_columns_from_data=True,
                 project=self.project,
-                after="flatten_events",
+                columnar=self.columnar,
+                after="filter_none" if self.columnar else "flatten_events",
             )
 
         apply_map_feature_names()
@@ -237,23 +252,32 @@ class EventStreamProcessor:
         # Calculate number of predictions and average latency
         def apply_storey_aggregations():
             # Calculate number of predictions for each window (5 min and 1 hour by default)
-            graph.add_step(
-                class_name="storey.AggregateByKey",
-                aggregates=[
-                    {
-                        "name": EventFieldType.LATENCY,
-                        "column": EventFieldType.LATENCY,
-                        "operations": ["count", "avg"],
-                        "windows": self.aggregate_windows,
-                        "period": self.aggregate_period,
-                    }
-                ],
-                name=EventFieldType.LATENCY,
-                after="MapFeatureNames",
-                step_name="Aggregates",
-                table=".",
-                key_field=EventFieldType.ENDPOINT_ID,
-            )
+            if self.columnar:
+                graph.add_step(
+                    "AggregateLatency",
+                    name=EventFieldType.LATENCY,
+                    after="MapFeatureNames",
+                    windows=self.aggregate_windows,
+                    period=self.aggregate_period,
+                )
+            else:
+                graph.add_step(
+                    class_name="storey.AggregateByKey",
+                    aggregates=[
+                        {
+                            "name": EventFieldType.LATENCY,
+                            "column": EventFieldType.LATENCY,
+                            "operations": ["count", "avg"],
+                            "windows": self.aggregate_windows,
+                            "period": self.aggregate_period,
+                        }
+                    ],
+                    name=EventFieldType.LATENCY,
+                    after="MapFeatureNames",
+                    step_name="Aggregates",
+                    table=".",
+                    key_field=EventFieldType.ENDPOINT_ID,
+                )
             # Calculate average latency time for each window (5 min and 1 hour by default)
             graph.add_step(
                 class_name="storey.Rename",
@@ -305,7 +329,9 @@ class EventStreamProcessor:
         if endpoint_store.type == ModelEndpointTarget.V3IO_NOSQL:
             apply_infer_schema()
 
-        tsdb_connector.apply_monitoring_stream_steps(graph=graph)
+        tsdb_connector.apply_monitoring_stream_steps(
+            graph=graph, columnar=self.columnar
+        )
 
         # Parquet branch
         # Filter and validate different keys before writing the data to Parquet target
@@ -314,11 +340,31 @@ class EventStreamProcessor:
                 "ProcessBeforeParquet",
                 name="ProcessBeforeParquet",
                 after="MapFeatureNames",
+                columnar=self.columnar,
                 _fn="(event)",
             )
 
         apply_process_before_parquet()
 
+        # Write the batches of model invocations to the Parquet target, with the same partitioning
+        # as the storey Parquet target
+        def apply_parquet_batch_writer():
+            graph.add_step(
+                "storey.Batch",
+                name="ParquetBatch",
+                after="ProcessBeforeParquet",
+                max_events=self.parquet_batching_max_events,
+                flush_after_seconds=self.parquet_batching_timeout_secs,
+            )
+            graph.add_step(
+                "WriteParquetBatch",
+                name="ParquetTarget",
+                after="ParquetBatch",
+                graph_shape="cylinder",
+                path=self.parquet_path,
+                storage_options=self.storage_options,
+            )
+
         # Write the Parquet target file, partitioned by key (endpoint_id) and time.
         def apply_parquet_target():
             graph.add_step(
@@ -338,7 +384,10 @@ class EventStreamProcessor:
                 partition_cols=["$key", "$year", "$month", "$day", "$hour"],
             )
 
-        apply_parquet_target()
+        if self.columnar:
+            apply_parquet_batch_writer()
+        else:
+            apply_parquet_target()
 
 
 class ProcessBeforeEndpointUpdate(mlrun.feature_store.steps.MapClass):
@@ -427,18 +476,57 @@ class ExtractEndpointID(mlrun.feature_store.steps.MapClass):
 
 
 class ProcessBeforeParquet(mlrun.feature_store.steps.MapClass):
-    def __init__(self, **kwargs):
+    def __init__(self, columnar: bool = False, **kwargs):
         """
         Process the data before writing to Parquet file. In this step, unnecessary keys will be removed while possible
         missing keys values will be set to None.
 
-        :returns: Event dictionary with filtered data for the Parquet target.
+        :param columnar: Whether the event is a model invocation of the columnar stream processing mode. In that case,
+                         the invocation is converted to a DataFrame with a row per prediction.
+
+        :returns: Event dictionary with filtered data for the Parquet target, or a DataFrame in the columnar mode.
 
         """
         super().__init__(**kwargs)
+        self.columnar = columnar
 
     def do(self, event):
+        if self.columnar:
+            return self._do_columnar(event)
         logger.info("ProcessBeforeParquet1", event=event)
+        event = self._filter_event(event)
+        logger.info("ProcessBeforeParquet2", event=event)
+        return event
+
+    def _do_columnar(self, event: dict) -> pd.DataFrame:
+        named_features = event[EventFieldType.NAMED_FEATURES].reset_index(drop=True)
+        named_predictions = event[EventFieldType.NAMED_PREDICTIONS].reset_index(
+            drop=True
+        )
+        endpoint_type = event.pop(EventFieldType.ENDPOINT_TYPE)
+        event = self._filter_event(event)
+
+        # Broadcast the invocation fields to all of its predictions, the columns are ordered as the keys of
+        # the rows mode event
+        predictions_count = len(named_predictions)
+        predictions = pd.concat(
+            [
+                pd.DataFrame(
+                    {key: [value] * predictions_count for key, value in event.items()}
+                ),
+                named_features,
+                named_predictions,
+                pd.DataFrame(
+                    {EventFieldType.ENDPOINT_TYPE: [endpoint_type] * predictions_count}
+                ),
+            ],
+            axis=1,
+        )
+        # Feature and label names override the event fields of the same name, as in the rows mode event
+        return predictions.loc[:, ~predictions.columns.duplicated(keep="last")]
+
+    @staticmethod
+    def _filter_event(event: dict) -> dict:
         # Remove the following keys from the event
         for key in [
             EventFieldType.FEATURES,
@@ -461,14 +549,63 @@ class ProcessBeforeParquet(mlrun.feature_store.steps.MapClass):
         ]:
             if not event.get(key):
                 event[key] = None
-        logger.info("ProcessBeforeParquet2", event=event)
         return event
 
 
+class WriteParquetBatch(mlrun.feature_store.steps.MapClass):
+    def __init__(
+        self,
+        path: str,
+        storage_options: typing.Optional[dict] = None,
+        **kwargs,
+    ):
+        """
+        Write a batch of model invocations of the columnar stream processing mode (DataFrames that were generated by
+        ProcessBeforeParquet) to the Parquet target. The predictions are written in a file per endpoint and hour,
+        in the partitioning layout of the storey Parquet target of the rows mode (key=/year=/month=/day=/hour=).
+
+        :param path:            Parquet target path.
+        :param storage_options: Storage options of the Parquet target file system.
+
+        :returns: The batch (without any changes).
+        """
+        super().__init__(**kwargs)
+        self._file_system, self._path = storey.utils.url_to_file_system(
+            path, storage_options
+        )
+
+    def do(self, event: list[pd.DataFrame]):
+        predictions = pd.concat(event, ignore_index=True)
+        hours = predictions[EventFieldType.TIMESTAMP].dt.floor("h")
+        for (endpoint_id, hour), endpoint_predictions in predictions.groupby(
+            [predictions[EventFieldType.ENDPOINT_ID], hours], sort=False
+        ):
+            self._write(
+                endpoint_id=endpoint_id, hour=hour, predictions=endpoint_predictions
+            )
+        return event
+
+    def _write(self, endpoint_id: str, hour: pd.Timestamp, predictions: pd.DataFrame):
+        dir_path = (
+            f"{self._path}/key={endpoint_id}/year={hour.year:02}/month={hour.month:02}"
+            f"/day={hour.day:02}/hour={hour.hour:02}/"
+        )
+        self._file_system.makedirs(dir_path, exist_ok=True)
+
+        predictions = predictions.set_index(EventFieldType.ENDPOINT_ID)
+        for name in predictions.columns:
+            # Reduce the timestamps granularity, as the storey Parquet target does
+            if str(predictions[name].dtype) == "datetime64[ns]":
+                predictions[name] = predictions[name].astype("datetime64[us]")
+        with self._file_system.open(f"{dir_path}{uuid.uuid4()}.parquet", "wb") as file:
+            predictions.to_parquet(path=file, index=True, version="2.4")
+
+
 class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
     def __init__(
         self,
         project: str,
+        columnar: bool = False,
         **kwargs,
     ):
         """
@@ -476,7 +613,9 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         Adding important details to the event such as endpoint_id, handling errors coming from the stream, validation
         of event data such as inputs and outputs, and splitting model event into sub-events.
 
-        :param project: Project name.
+        :param project:  Project name.
+        :param columnar: If true, the model event is not split - the event includes the rows of features and
+                         predictions of the whole model invocation.
 
         :returns: A Storey event object which is the basic unit of data in Storey. Note that the next steps of
                   the monitoring serving graph are based on Storey operations.
@@ -485,6 +624,7 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         super().__init__(**kwargs)
 
         self.project: str = project
+        self.columnar = columnar
 
         # First and last requests timestamps (value) of each endpoint (key)
         self.first_request: dict[str, str] = dict()
@@ -597,38 +737,53 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
                 else [predictions]
             )
 
-        events = []
-        for i, (feature, prediction) in enumerate(zip(features, predictions)):
-            if not isinstance(prediction, list):
-                prediction = [prediction]
-
-            if not isinstance(feature, list):
-                feature = [feature]
-
-            events.append(
-                {
-                    EventFieldType.FUNCTION_URI: function_uri,
-                    EventFieldType.MODEL: versioned_model,
-                    EventFieldType.MODEL_CLASS: model_class,
-                    EventFieldType.TIMESTAMP: timestamp,
-                    EventFieldType.ENDPOINT_ID: endpoint_id,
-                    EventFieldType.REQUEST_ID: request_id,
-                    EventFieldType.LATENCY: latency,
-                    EventFieldType.FEATURES: feature,
-                    EventFieldType.PREDICTION: prediction,
-                    EventFieldType.FIRST_REQUEST: self.first_request[endpoint_id],
-                    EventFieldType.LAST_REQUEST: self.last_request[endpoint_id],
-                    EventFieldType.LAST_REQUEST_TIMESTAMP: mlrun.utils.enrich_datetime_with_tz_info(
-                        self.last_request[endpoint_id]
-                    ).timestamp(),
-                    EventFieldType.ERROR_COUNT: self.error_count[endpoint_id],
-                    EventFieldType.LABELS: event.get(EventFieldType.LABELS, {}),
-                    EventFieldType.METRICS: event.get(EventFieldType.METRICS, {}),
-                    EventFieldType.ENTITIES: event.get("request", {}).get(
-                        EventFieldType.ENTITIES, {}
-                    ),
-                }
+        features = [
+            feature if isinstance(feature, list) else [feature] for feature in features
+        ]
+        predictions = [
+            prediction if isinstance(prediction, list) else [prediction]
+            for prediction in predictions
+        ]
+        last_request_timestamp = mlrun.utils.enrich_datetime_with_tz_info(
+            self.last_request[endpoint_id]
+        ).timestamp()
+
+        def create_event(feature: list, prediction: list) -> dict:
+            return {
+                EventFieldType.FUNCTION_URI: function_uri,
+                EventFieldType.MODEL: versioned_model,
+                EventFieldType.MODEL_CLASS: model_class,
+                EventFieldType.TIMESTAMP: timestamp,
+                EventFieldType.ENDPOINT_ID: endpoint_id,
+                EventFieldType.REQUEST_ID: request_id,
+                EventFieldType.LATENCY: latency,
+                EventFieldType.FEATURES: feature,
+                EventFieldType.PREDICTION: prediction,
+                EventFieldType.FIRST_REQUEST: self.first_request[endpoint_id],
+                EventFieldType.LAST_REQUEST: self.last_request[endpoint_id],
+                EventFieldType.LAST_REQUEST_TIMESTAMP: last_request_timestamp,
+                EventFieldType.ERROR_COUNT: self.error_count[endpoint_id],
+                EventFieldType.LABELS: event.get(EventFieldType.LABELS, {}),
+                EventFieldType.METRICS: event.get(EventFieldType.METRICS, {}),
+                EventFieldType.ENTITIES: event.get("request", {}).get(
+                    EventFieldType.ENTITIES, {}
+                ),
+            }
+
+        if self.columnar:
+            # Keep the model invocation as a single event with the rows of features and predictions
+            predictions_count = min(len(features), len(predictions))
+            if not predictions_count:
+                return None
+            events = create_event(
+                feature=features[:predictions_count],
+                prediction=predictions[:predictions_count],
             )
+        else:
+            events = [
+                create_event(feature=feature, prediction=prediction)
+                for feature, prediction in zip(features, predictions)
+            ]
 
         # Create a storey event object with list of events, based on endpoint_id which will be used
         # in the upcoming steps
@@ -710,6 +865,7 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
         self,
         project: str,
         infer_columns_from_data: bool = False,
+        columnar: bool = False,
         **kwargs,
     ):
         """
@@ -721,6 +877,9 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
                                         retrieve them from data that was stored in the previous events of
                                         the current process. This data can be found under self.feature_names and
                                         self.label_columns.
+        :param columnar:                If true, the event includes the rows of features and predictions of a
+                                        whole model invocation, which are mapped to DataFrames with the feature and
+                                        label names as columns.
 
 
         :returns: A single event as a dictionary that includes metadata (endpoint_id, model_class, etc.) and also
@@ -730,6 +889,7 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
 
         self._infer_columns_from_data = infer_columns_from_data
         self.project = project
+        self.columnar = columnar
 
         # Dictionaries that will be used in case features names
         # and labels columns were not found in the current event
@@ -739,23 +899,22 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
         # Dictionary to manage the model endpoint types - important for the V3IO TSDB
         self.endpoint_type = {}
 
-    def _infer_feature_names_from_data(self, event):
+    def _infer_feature_names_from_data(self, feature_values: list):
         for endpoint_id in self.feature_names:
-            if len(self.feature_names[endpoint_id]) >= len(
-                event[EventFieldType.FEATURES]
-            ):
+            if len(self.feature_names[endpoint_id]) >= len(feature_values):
                 return self.feature_names[endpoint_id]
         return None
 
-    def _infer_label_columns_from_data(self, event):
+    def _infer_label_columns_from_data(self, label_values: list):
         for endpoint_id in self.label_columns:
-            if len(self.label_columns[endpoint_id]) >= len(
-                event[EventFieldType.PREDICTION]
-            ):
+            if len(self.label_columns[endpoint_id]) >= len(label_values):
                 return self.label_columns[endpoint_id]
         return None
 
     def do(self, event: dict):
+        if self.columnar:
+            return self._do_columnar(event)
+
         endpoint_id = event[EventFieldType.ENDPOINT_ID]
 
         feature_values = event[EventFieldType.FEATURES]
@@ -768,83 +927,12 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
 
         # Get feature names and label columns
         if endpoint_id not in self.feature_names:
-            endpoint_record = mlrun.model_monitoring.helpers.get_endpoint_record(
-                project=self.project,
+            self._init_endpoint_names(
                 endpoint_id=endpoint_id,
-            )
-            feature_names = endpoint_record.get(EventFieldType.FEATURE_NAMES)
-            feature_names = json.loads(feature_names) if feature_names else None
-
-            label_columns = endpoint_record.get(EventFieldType.LABEL_NAMES)
-            label_columns = json.loads(label_columns) if label_columns else None
-
-            # If feature names were not found,
-            # try to retrieve them from the previous events of the current process
-            if not feature_names and self._infer_columns_from_data:
-                feature_names = self._infer_feature_names_from_data(event)
-
-            if not feature_names:
-                logger.warn(
-                    "Feature names are not initialized, they will be automatically generated",
-                    endpoint_id=endpoint_id,
-                )
-                feature_names = [
-                    f"f{i}" for i, _ in enumerate(event[EventFieldType.FEATURES])
-                ]
-
-                # Update the endpoint record with the generated features
-                update_endpoint_record(
-                    project=self.project,
-                    endpoint_id=endpoint_id,
-                    attributes={
-                        EventFieldType.FEATURE_NAMES: json.dumps(feature_names)
-                    },
-                )
-
-                update_monitoring_feature_set(
-                    endpoint_record=endpoint_record,
-                    feature_names=feature_names,
-                    feature_values=feature_values,
-                )
-
-            # Similar process with label columns
-            if not label_columns and self._infer_columns_from_data:
-                label_columns = self._infer_label_columns_from_data(event)
-
-            if not label_columns:
-                logger.warn(
-                    "label column names are not initialized, they will be automatically generated",
-                    endpoint_id=endpoint_id,
-                )
-                label_columns = [
-                    f"p{i}" for i, _ in enumerate(event[EventFieldType.PREDICTION])
-                ]
-
-                update_endpoint_record(
-                    project=self.project,
-                    endpoint_id=endpoint_id,
-                    attributes={EventFieldType.LABEL_NAMES: json.dumps(label_columns)},
-                )
-                update_monitoring_feature_set(
-                    endpoint_record=endpoint_record,
-                    feature_names=label_columns,
-                    feature_values=label_values,
-                )
-
-            self.label_columns[endpoint_id] = label_columns
-            self.feature_names[endpoint_id] = feature_names
-
-            logger.info(
-                "Label columns", endpoint_id=endpoint_id, label_columns=label_columns
-            )
-            logger.info(
-                "Feature names", endpoint_id=endpoint_id, feature_names=feature_names
+                feature_values=feature_values,
+                label_values=label_values,
             )
 
-            # Update the endpoint type within the endpoint types dictionary
-            endpoint_type = int(endpoint_record.get(EventFieldType.ENDPOINT_TYPE))
-            self.endpoint_type[endpoint_id] = endpoint_type
-
         # Add feature_name:value pairs along with a mapping dictionary of all of these pairs
         feature_names = self.feature_names[endpoint_id]
         self._map_dictionary_values(
@@ -869,6 +957,117 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
         logger.info("Mapped event", event=event)
         return event
 
+    def _do_columnar(self, event: dict) -> dict:
+        endpoint_id = event[EventFieldType.ENDPOINT_ID]
+
+        features = pd.DataFrame(event.pop(EventFieldType.FEATURES))
+        predictions = pd.DataFrame(event.pop(EventFieldType.PREDICTION))
+
+        int_columns = features.select_dtypes(include="integer").columns
+        features[int_columns] = features[int_columns].astype(float)
+
+        # Get feature names and label columns, based on the first prediction of the invocation
+        if endpoint_id not in self.feature_names:
+            self._init_endpoint_names(
+                endpoint_id=endpoint_id,
+                feature_values=features.iloc[0].tolist(),
+                label_values=predictions.iloc[0].tolist(),
+            )
+
+        # Name the features and predictions columns, values without a name are dropped as in the rows mode
+        event[EventFieldType.NAMED_FEATURES] = self._name_columns(
+            values=features, names=self.feature_names[endpoint_id]
+        )
+        event[EventFieldType.NAMED_PREDICTIONS] = self._name_columns(
+            values=predictions, names=self.label_columns[endpoint_id]
+        )
+
+        # Add endpoint type to the event
+        event[EventFieldType.ENDPOINT_TYPE] = self.endpoint_type[endpoint_id]
+        return event
+
+    @staticmethod
+    def _name_columns(values: pd.DataFrame, names: list[str]) -> pd.DataFrame:
+        values = values.iloc[:, : len(names)]
+        values.columns = names[: values.shape[1]]
+        return values
+
+    def _init_endpoint_names(
+        self, endpoint_id: str, feature_values: list, label_values: list
+    ):
+        """Get the feature names and label columns of the endpoint from its record, or generate them (and update the
+        endpoint record) if they are missing"""
+        endpoint_record = mlrun.model_monitoring.helpers.get_endpoint_record(
+            project=self.project,
+            endpoint_id=endpoint_id,
+        )
+        feature_names = endpoint_record.get(EventFieldType.FEATURE_NAMES)
+        feature_names = json.loads(feature_names) if feature_names else None
+
+        label_columns = endpoint_record.get(EventFieldType.LABEL_NAMES)
+        label_columns = json.loads(label_columns) if label_columns else None
+
+        # If feature names were not found,
+        # try to retrieve them from the previous events of the current process
+        if not feature_names and self._infer_columns_from_data:
+            feature_names = self._infer_feature_names_from_data(feature_values)
+
+        if not feature_names:
+            logger.warn(
+                "Feature names are not initialized, they will be automatically generated",
+                endpoint_id=endpoint_id,
+            )
+            feature_names = [f"f{i}" for i, _ in enumerate(feature_values)]
+
+            # Update the endpoint record with the generated features
+            update_endpoint_record(
+                project=self.project,
+                endpoint_id=endpoint_id,
+                attributes={EventFieldType.FEATURE_NAMES: json.dumps(feature_names)},
+            )
+
+            update_monitoring_feature_set(
+                endpoint_record=endpoint_record,
+                feature_names=feature_names,
+                feature_values=feature_values,
+            )
+
+        # Similar process with label columns
+        if not label_columns and self._infer_columns_from_data:
+            label_columns = self._infer_label_columns_from_data(label_values)
+
+        if not label_columns:
+            logger.warn(
+                "label column names are not initialized, they will be automatically generated",
+                endpoint_id=endpoint_id,
+            )
+            label_columns = [f"p{i}" for i, _ in enumerate(label_values)]
+
+            update_endpoint_record(
+                project=self.project,
+                endpoint_id=endpoint_id,
+                attributes={EventFieldType.LABEL_NAMES: json.dumps(label_columns)},
+            )
+            update_monitoring_feature_set(
+                endpoint_record=endpoint_record,
+                feature_names=label_columns,
+                feature_values=label_values,
+            )
+
+        self.label_columns[endpoint_id] = label_columns
+        self.feature_names[endpoint_id] = feature_names
+
+        logger.info(
+            "Label columns", endpoint_id=endpoint_id, label_columns=label_columns
+        )
+        logger.info(
+            "Feature names", endpoint_id=endpoint_id, feature_names=feature_names
+        )
+
+        # Update the endpoint type within the endpoint types dictionary
+        endpoint_type = int(endpoint_record.get(EventFieldType.ENDPOINT_TYPE))
+        self.endpoint_type[endpoint_id] = endpoint_type
+
     @staticmethod
     def _map_dictionary_values(
         event: dict,
@@ -895,6 +1094,59 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
             event[mapping_dictionary][name] = value
 
 
+class AggregateLatency(mlrun.feature_store.steps.MapClass):
+    def __init__(self, windows: list[str], period: str, **kwargs):
+        """
+        The columnar stream processing mode counterpart of the latency storey.AggregateByKey step - calculate the
+        number of predictions and the average latency of the endpoint over sliding windows. Each window is made of
+        `period` long buckets, and all the predictions of a model invocation (which share its latency) are added to
+        the bucket of the processing time at once (as in the storey aggregation).
+
+        :param windows: List of the aggregation windows, e.g. ["5m", "1h"].
+        :param period:  The period of the windows buckets, e.g. "5m".
+
+        :returns: Event as a dictionary with the `latency_count_<window>` and `latency_avg_<window>` aggregations.
+        """
+        super().__init__(**kwargs)
+        self.windows = windows
+        self._windows_millis = [
+            storey.utils.parse_duration(window) for window in windows
+        ]
+        self._period_millis = storey.utils.parse_duration(period)
+
+        # Predictions count and latency sum (value) of each bucket start time (key) per endpoint (key)
+        self._buckets: dict[str, dict[int, list]] = collections.defaultdict(dict)
+
+    def do(self, event: dict):
+        buckets = self._buckets[event[EventFieldType.ENDPOINT_ID]]
+        predictions_count = len(event[EventFieldType.NAMED_PREDICTIONS])
+
+        processing_time = int(
+            datetime.datetime.now(tz=datetime.timezone.utc).timestamp() * 1000
+        )
+        bucket_time = processing_time - processing_time % self._period_millis
+        bucket = buckets.setdefault(bucket_time, [0, 0.0])
+        bucket[0] += predictions_count
+        bucket[1] += predictions_count * event[EventFieldType.LATENCY]
+
+        # Drop the buckets that are out of the longest window
+        oldest_bucket_time = bucket_time - max(self._windows_millis)
+        for start_time in [
+            start_time for start_time in buckets if start_time <= oldest_bucket_time
+        ]:
+            del buckets[start_time]
+
+        for window, window_millis in zip(self.windows, self._windows_millis):
+            count, latency_sum = 0, 0.0
+            for start_time, (bucket_count, bucket_latency_sum) in buckets.items():
+                if bucket_time - window_millis < start_time <= bucket_time:
+                    count += bucket_count
+                    latency_sum += bucket_latency_sum
+            event[f"{EventFieldType.LATENCY}_count_{window}"] = count
+            event[f"{EventFieldType.LATENCY}_avg_{window}"] = latency_sum / count
+        return event
+
+
 class UpdateEndpoint(mlrun.feature_store.steps.MapClass):
     def __init__(self, project: str, **kwargs):
         """
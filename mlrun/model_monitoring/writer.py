@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
 import json
-from typing import Any, Callable, NewType
+import threading
+from typing import Any, Callable, NewType, Optional
 
 import mlrun.common.model_monitoring
 import mlrun.common.schemas
@@ -23,6 +25,7 @@ from mlrun.common.schemas.model_monitoring.constants import (
     EventFieldType,
     HistogramDataDriftApplicationConstants,
     MetricData,
+    ModelEndpointTarget,
     ResultData,
     ResultKindApp,
     ResultStatusApp,
@@ -30,6 +33,7 @@ from mlrun.common.schemas.model_monitoring.constants import (
     WriterEventKind,
 )
 from mlrun.common.schemas.notification import NotificationKind, NotificationSeverity
+from mlrun.model_monitoring.db import StoreBase
 from mlrun.model_monitoring.helpers import get_result_instance_fqn
 from mlrun.serving.utils import StepToDict
 from mlrun.utils import logger
@@ -95,6 +99,84 @@ Extra data: `{self._event[ResultData.RESULT_EXTRA_DATA]}`\
         logger.debug("A notification should have been sent")
 
 
+class _StoreWriteBuffer:
+    """
+    Buffer the application events and write them to the store in bulk, once `max_events` events are buffered or
+    `timeout` seconds after the first event of the batch was buffered (whichever comes first).
+    Events of a failed write are kept in the buffer and written with the next batch, up to `max_buffered_events`
+    events are kept (the oldest events are dropped and logged beyond it).
+    The buffer is flushed when the process exits, events which are still buffered when the worker is killed are lost
+    (their stream offsets may already be committed).
+    """
+
+    def __init__(
+        self,
+        store: StoreBase,
+        max_events: int,
+        timeout: float,
+        max_buffered_events: Optional[int] = None,
+    ) -> None:
+        self._store = store
+        self._max_events = max(max_events, 1)
+        self._timeout = timeout
+        self._max_buffered_events = max(
+            max_buffered_events or 10 * self._max_events, self._max_events
+        )
+        self._events: list[tuple[_AppResultEvent, WriterEventKind]] = []
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        atexit.register(self._flush_on_exit)
+
+    def add(self, event: _AppResultEvent, kind: WriterEventKind) -> None:
+        with self._lock:
+            self._events.append((event, kind))
+            if len(self._events) >= self._max_events:
+                self.flush()
+            elif not self._timer:
+                self._timer = threading.Timer(self._timeout, self._flush_on_timeout)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+            events, self._events = self._events, []
+            if not events:
+                return
+            try:
+                self._store.write_application_events(events=events)
+            except Exception:
+                events = events + self._events
+                dropped = len(events) - self._max_buffered_events
+                if dropped > 0:
+                    logger.error(
+                        "The application events buffer is full, dropping the oldest events",
+                        dropped=dropped,
+                        max_buffered_events=self._max_buffered_events,
+                    )
+                    events = events[dropped:]
+                self._events = events
+                raise
+            logger.info("Wrote the buffered application events", events=len(events))
+
+    def _flush_on_timeout(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Failed to write the buffered application events")
+
+    def _flush_on_exit(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            logger.exception(
+                "Failed to write the buffered application events on exit",
+                events=len(self._events),
+            )
+
+
 class ModelMonitoringWriter(StepToDict):
     """
     Write monitoring application results to the target databases
@@ -121,6 +203,18 @@ class ModelMonitoringWriter(StepToDict):
             project=self.project, secret_provider=secret_provider
         )
         self._endpoints_records = {}
+        # The SQL store writes the application events in bulk
+        self._app_result_store_buffer = None
+        if self._app_result_store.type == ModelEndpointTarget.SQL:
+            self._app_result_store_buffer = _StoreWriteBuffer(
+                store=self._app_result_store,
+                max_events=int(
+                    mlrun.mlconf.model_endpoint_monitoring.writer_batching_max_events
+                ),
+                timeout=float(
+                    mlrun.mlconf.model_endpoint_monitoring.writer_batching_timeout_secs
+                ),
+            )
 
     def _generate_event_on_drift(
         self,
@@ -207,7 +301,12 @@ class ModelMonitoringWriter(StepToDict):
         event, kind = self._reconstruct_event(event)
         logger.info("Starting to write event", event=event)
         self._tsdb_connector.write_application_event(event=event.copy(), kind=kind)
-        self._app_result_store.write_application_event(event=event.copy(), kind=kind)
+        if self._app_result_store_buffer:
+            self._app_result_store_buffer.add(event=event.copy(), kind=kind)
+        else:
+            self._app_result_store.write_application_event(
+                event=event.copy(), kind=kind
+            )
 
         logger.info("Completed event DB writes")
 
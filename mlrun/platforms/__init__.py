@@ -13,22 +13,13 @@
 # limitations under the License.
 
 # flake8: noqa  - this is until we take care of the F401 violations with respect to __all__ & sphinx
+import importlib
 import json
+import typing
 from pprint import pprint
 from time import sleep
 
 from mlrun_pipelines.common.mounts import VolumeMount
-from mlrun_pipelines.mounts import (
-    auto_mount,
-    mount_configmap,
-    mount_hostpath,
-    mount_pvc,
-    mount_s3,
-    mount_secret,
-    mount_v3io,
-    set_env_variables,
-    v3io_cred,
-)
 
 from .iguazio import (
     V3ioStreamClient,
@@ -36,6 +27,44 @@ from .iguazio import (
     is_iguazio_session_cookie,
 )
 
+if typing.TYPE_CHECKING:
+    from mlrun_pipelines.mounts import (
+        auto_mount,
+        mount_configmap,
+        mount_hostpath,
+        mount_pvc,
+        mount_s3,
+        mount_secret,
+        mount_v3io,
+        set_env_variables,
+        v3io_cred,
+    )
+
+# The mounts of the pipelines adapters import kfp, which is slow to import, they are imported on first access (PEP 562)
+_lazy_mounts = [
+    "auto_mount",
+    "mount_configmap",
+    "mount_hostpath",
+    "mount_pvc",
+    "mount_s3",
+    "mount_secret",
+    "mount_v3io",
+    "set_env_variables",
+    "v3io_cred",
+]
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in _lazy_mounts:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("mlrun_pipelines.mounts"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy_mounts))
+
 
 def watch_stream(
     url,
@@ -320,6 +320,9 @@ class ServingRuntime(RemoteRuntime):
         :param stream_path:         Path/url of the tracking stream e.g. v3io:///users/mike/mystream
                                     you can use the "dummy://" path for test/simulation.
         :param batch:               Micro batch size (send micro batches of N records at a time).
+                                    The records are pushed from a background thread, a partial batch is
+                                    pushed after the max linger time (see
+                                    mlrun.mlconf.model_endpoint_monitoring.serving_log_stream).
         :param sample:              Sample size (send only one of N records).
         :param stream_args:         Stream initialization parameters, e.g. shards, retention_in_hours, ..
         :param enable_tracking:     Enabled/Disable model-monitoring tracking.
@@ -14,10 +14,16 @@
 #
 import asyncio
 import json
+import threading
+import time
+import typing
+from urllib.parse import urlparse
 
 import aiohttp
 import requests
+import requests.adapters
 import storey
+import urllib3
 from storey.flow import _ConcurrentJobExecution
 
 import mlrun
@@ -27,6 +33,7 @@ from mlrun.utils import logger
 
 from .utils import (
     _extract_input_data,
+    _MicroBatcher,
     _update_result_body,
     event_id_key,
     event_path_key,
@@ -36,6 +43,108 @@ default_retries = 6
 default_backoff_factor = 1
 
 
+class _EndpointConnectionPool:
+    """HTTP keep-alive connection pool shared by all the sync RemoteSteps (and worker threads)
+    which call the same endpoint with the same connections limit and retry policy, the number of concurrent requests
+    is bounded by max_connections (extra requests wait in queue)"""
+
+    def __init__(
+        self, endpoint: str, max_connections: int, retries: int, backoff_factor: float
+    ):
+        self.endpoint = endpoint
+        self.max_connections = max_connections
+        max_retries = 0
+        if retries > 0:
+            # only the error statuses are retried (as before), connection and read errors are not retried
+            # since the requests (e.g. POST) may not be idempotent
+            max_retries = urllib3.util.retry.Retry(
+                total=retries,
+                connect=0,
+                read=0,
+                backoff_factor=backoff_factor,
+                status_forcelist=mlrun.mlconf.http_retry_defaults.status_codes,
+                allowed_methods=urllib3.util.retry.Retry.DEFAULT_ALLOWED_METHODS
+                | {"PATCH", "POST"},
+                # return the last response, the errors are raised by the step
+                raise_on_status=False,
+            )
+        # keep up to max_connections idle keep-alive connections to the endpoint
+        self._adapter = requests.adapters.HTTPAdapter(
+            max_retries=max_retries, pool_maxsize=max_connections
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+        self._semaphore = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiting = 0
+        self._requests = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def request(self, method, url, **kwargs):
+        start = time.monotonic()
+        with self._lock:
+            self._waiting += 1
+        self._semaphore.acquire()
+        wait_time = time.monotonic() - start
+        with self._lock:
+            self._waiting -= 1
+            self._in_flight += 1
+            self._requests += 1
+            self._total_wait += wait_time
+            self._max_wait = max(self._max_wait, wait_time)
+        try:
+            return self.session.request(method, url, **kwargs)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._semaphore.release()
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "max_connections": self.max_connections,
+                "in_flight": self._in_flight,
+                "queued": self._waiting,
+                "requests": self._requests,
+                "avg_queue_wait": self._total_wait / self._requests
+                if self._requests
+                else 0.0,
+                "max_queue_wait": self._max_wait,
+            }
+
+
+_connection_pools: dict[tuple, _EndpointConnectionPool] = {}
+_connection_pools_lock = threading.Lock()
+
+
+def _get_connection_pool(
+    url: str, max_connections: int, retries: int, backoff_factor: float
+) -> _EndpointConnectionPool:
+    parsed_url = urlparse(url)
+    endpoint = f"{parsed_url.scheme}://{parsed_url.netloc}"
+    key = (endpoint, max_connections, retries, backoff_factor)
+    with _connection_pools_lock:
+        if key not in _connection_pools:
+            _connection_pools[key] = _EndpointConnectionPool(
+                endpoint, max_connections, retries, backoff_factor
+            )
+        return _connection_pools[key]
+
+
+def get_connection_pools_metrics() -> dict[str, list[dict]]:
+    """return the metrics (in-flight requests, queue wait time, ..) of the shared
+    RemoteStep connection pools, per endpoint"""
+    metrics = {}
+    with _connection_pools_lock:
+        pools = list(_connection_pools.values())
+    for pool in pools:
+        metrics.setdefault(pool.endpoint, []).append(pool.metrics())
+    return metrics
+
+
 class RemoteStep(storey.SendToHttp):
     def __init__(
         self,
@@ -52,6 +161,8 @@ class RemoteStep(storey.SendToHttp):
         retries=None,
         backoff_factor=None,
         timeout=None,
+        batch_size: int = None,
+        batch_wait: float = None,
         **kwargs,
     ):
         """class for calling remote endpoints
@@ -85,6 +196,14 @@ class RemoteStep(storey.SendToHttp):
         :param retries:     number of retries (in exponential backoff)
         :param backoff_factor: A backoff factor in seconds to apply between attempts after the second try
         :param timeout:     How long to wait for the server to send data before giving up, float in seconds
+        :param batch_size:  (sync engine) send up to batch_size concurrent events as a single request with a list
+                            body, the endpoint must accept a list and return a list with one result per event
+        :param batch_wait:  (sync engine) max time in seconds to wait for the batch to fill up, default 0.01
+
+        in the sync engine, steps which call the same endpoint (with the same max_in_flight and retry policy)
+        share a bounded keep-alive connection pool (of up to max_in_flight connections, default to
+        mlrun.mlconf.serving.remote_max_connections), every target host (e.g. when using url_expression) has
+        its own pool, the pool metrics can be read using `context.get_remote_pools_metrics()`
         """
         # init retry args for storey
         retries = default_retries if retries is None else retries
@@ -107,10 +226,13 @@ class RemoteStep(storey.SendToHttp):
         self.subpath = subpath
 
         self.timeout = timeout
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
 
         self._append_event_path = False
         self._endpoint = ""
-        self._session = None
+        self._sessions: dict[str, _EndpointConnectionPool] = {}
+        self._batcher: typing.Optional[_MicroBatcher] = None
         self._url_function_handler = None
         self._body_function_handler = None
 
@@ -118,6 +240,16 @@ class RemoteStep(storey.SendToHttp):
         self._endpoint = self.url
         if self.url and self.context:
             self._endpoint = self.context.get_remote_endpoint(self.url).strip("/")
+        if self.batch_size and self.batch_size > 1:
+            if self.url_expression or self.subpath == "$path":
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    "batch_size cannot be used with url_expression or subpath='$path'"
+                )
+            self._batcher = _MicroBatcher(
+                self._send_batch,
+                max_batch_size=self.batch_size,
+                max_wait=0.01 if self.batch_wait is None else self.batch_wait,
+            )
         if self.body_expression:
             # init lambda function for calculating url from event
             self._body_function_handler = eval(
@@ -167,21 +299,24 @@ class RemoteStep(storey.SendToHttp):
         new_event = self._user_fn_output_to_event(event, body)
         await self._do_downstream(new_event)
 
-    def do_event(self, event):
-        # sync implementation (without storey)
-        if not self._session:
-            self._session = mlrun.utils.HTTPSessionWithRetry(
+    def _get_session(self, url) -> _EndpointConnectionPool:
+        # the pool is resolved per target host, the url may be calculated per event (url_expression)
+        parsed_url = urlparse(url)
+        endpoint = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        session = self._sessions.get(endpoint)
+        if session is None:
+            session = _get_connection_pool(
+                endpoint,
+                self.max_in_flight or int(mlrun.mlconf.serving.remote_max_connections),
                 self.retries,
                 self.backoff_factor or mlrun.mlconf.http_retry_defaults.backoff_factor,
-                retry_on_exception=False,
-                retry_on_status=self.retries > 0,
-                retry_on_post=True,
             )
+            self._sessions[endpoint] = session
+        return session
 
-        body = _extract_input_data(self._input_path, event.body)
-        method, url, headers, body = self._generate_request(event, body)
+    def _send(self, method, url, headers, body):
         try:
-            resp = self._session.request(
+            resp = self._get_session(url).request(
                 method,
                 url,
                 verify=mlrun.mlconf.httpdb.http.verify,
@@ -198,7 +333,31 @@ class RemoteStep(storey.SendToHttp):
         if not resp.ok:
             raise RuntimeError(f"bad http response {resp.status_code}: {resp.text}")
 
-        result = self._get_data(resp.content, resp.headers)
+        return self._get_data(resp.content, resp.headers)
+
+    def _send_batch(self, events: list) -> list:
+        bodies = [_extract_input_data(self._input_path, event.body) for event in events]
+        if self._body_function_handler:
+            bodies = [self._body_function_handler(body) for body in bodies]
+        method = self.method or events[0].method or "POST"
+        headers = dict(self.headers or {})
+        headers["Content-Type"] = "application/json"
+        results = self._send(method, self._endpoint, headers, json.dumps(bodies))
+        if not isinstance(results, list) or len(results) != len(events):
+            raise RuntimeError(
+                f"RemoteStep {self.name} expected a list with {len(events)} results from {self._endpoint}"
+            )
+        return results
+
+    def do_event(self, event):
+        # sync implementation (without storey)
+        if self._batcher:
+            with self._batcher.caller():
+                result = self._batcher.submit(event)
+        else:
+            body = _extract_input_data(self._input_path, event.body)
+            method, url, headers, body = self._generate_request(event, body)
+            result = self._send(method, url, headers, body)
         event.body = _update_result_body(self._result_path, event.body, result)
         return event
 
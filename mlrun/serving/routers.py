@@ -12,14 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import concurrent
 import concurrent.futures
 import copy
 import json
+import multiprocessing
+import pickle
+import threading
 import traceback
 import typing
 from enum import Enum
 from io import BytesIO
+from multiprocessing import resource_tracker, shared_memory
 from typing import Union
 
 import numpy
@@ -38,6 +43,8 @@ from .v2_serving import _ModelLogPusher
 
 # Used by `ParallelRun` in process mode, so it can be accessed from different processes.
 local_routes = {}
+# the default number of events processed at once by the asyncio mode of ParallelRun
+_default_max_concurrent_events = 16
 
 
 class BaseModelRouter(RouterToDict):
@@ -217,6 +224,8 @@ class ParallelRunnerModes(str, Enum):
     array = "array"  # running one by one
     process = "process"  # running in separated processes
     thread = "thread"  # running in separated threads
+    worker = "worker"  # running each route in a dedicated long-lived process
+    asyncio = "asyncio"  # running the routes as asyncio tasks
 
     @staticmethod
     def all():
@@ -224,6 +233,8 @@ class ParallelRunnerModes(str, Enum):
             ParallelRunnerModes.thread,
             ParallelRunnerModes.process,
             ParallelRunnerModes.array,
+            ParallelRunnerModes.worker,
+            ParallelRunnerModes.asyncio,
         ]
 
 
@@ -256,6 +267,8 @@ class ParallelRun(BaseModelRouter):
         health_prefix: str = None,
         extend_event=None,
         executor_type: Union[ParallelRunnerModes, str] = ParallelRunnerModes.thread,
+        route_timeout: float = None,
+        max_concurrent_events: int = None,
         **kwargs,
     ):
         """Process multiple steps (child routes) in parallel and merge the results
@@ -292,8 +305,22 @@ class ParallelRun(BaseModelRouter):
                               * array - running one by one
                               * process - running in separated process
                               * thread - running in separated threads
+                              * worker - running each route in a dedicated warm process, the event
+                                is serialized once and passed to the workers through shared memory,
+                                the events are processed one at a time (suits large payloads)
+                              * asyncio - running the routes as asyncio tasks (using `asyncio.gather`),
+                                in async flows the event loop is not blocked while waiting for the routes
                               by default `threads`
         :param extend_event:  True will add the event body to the result
+        :param route_timeout: max time in seconds to wait for each route (asyncio mode only), results of
+                              routes which did not complete in time are dropped from the merged results.
+                              routes with an async handler (`do_event_async`) run on the event loop and are
+                              cancelled on timeout, other routes (with their step error handling and input/result
+                              paths) run in a thread which cannot be cancelled, so they keep their thread until
+                              they complete (the thread pool is sized for that, see `max_concurrent_events`)
+        :param max_concurrent_events: expected number of events processed at once (asyncio mode only), the
+                              routes without an async handler run in a thread pool of
+                              max_concurrent_events * <number of routes> threads, default 16
         :param kwargs:        extra arguments
         """
         super().__init__(
@@ -308,10 +335,15 @@ class ParallelRun(BaseModelRouter):
         self.name = name or "ParallelRun"
         self.extend_event = extend_event
         self.executor_type = ParallelRunnerModes(executor_type)
+        self.route_timeout = route_timeout
+        self.max_concurrent_events = max_concurrent_events
+        self._loop: typing.Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: typing.Optional[threading.Thread] = None
         self._pool: typing.Optional[
             Union[
                 concurrent.futures.ProcessPoolExecutor,
                 concurrent.futures.ThreadPoolExecutor,
+                _RouteWorkersPool,
             ]
         ] = None
 
@@ -338,6 +370,32 @@ class ParallelRun(BaseModelRouter):
         return body
 
     def do_event(self, event, *args, **kwargs):
+        processor = self._process_event(event)
+        try:
+            event = next(processor)
+            while True:
+                event = processor.send(self._parallel_run(event))
+        except StopIteration as stop:
+            return stop.value
+
+    async def do_event_async(self, event, *args, **kwargs):
+        """handle incoming events in async (storey) flows, in asyncio mode the event loop
+        is not blocked while waiting for the child routes"""
+        processor = self._process_event(event)
+        try:
+            event = next(processor)
+            while True:
+                if self.executor_type == ParallelRunnerModes.asyncio:
+                    results = await self._async_parallel_run(event)
+                else:
+                    results = self._parallel_run(event)
+                event = processor.send(results)
+        except StopIteration as stop:
+            return stop.value
+
+    def _process_event(self, event):
+        """event processing flow, yields the event when the child routes results are needed
+        and expects to get the results dict back (see do_event)"""
         # Handle and verify the request
         original_body = event.body
         event.body = _extract_input_data(self._input_path, event.body)
@@ -353,7 +411,7 @@ class ParallelRun(BaseModelRouter):
             return event
 
         response = copy.copy(event)
-        results = self._parallel_run(event)
+        results = yield event
         self._apply_logic(results, response)
         response = self.postprocess(response)
 
@@ -365,7 +423,9 @@ class ParallelRun(BaseModelRouter):
     def _init_pool(
         self,
     ) -> Union[
-        concurrent.futures.ProcessPoolExecutor, concurrent.futures.ThreadPoolExecutor
+        concurrent.futures.ProcessPoolExecutor,
+        concurrent.futures.ThreadPoolExecutor,
+        "_RouteWorkersPool",
     ]:
         """
 
@@ -375,7 +435,10 @@ class ParallelRun(BaseModelRouter):
         :return: The tasks pool
         """
         if self._pool is None:
-            if self.executor_type == ParallelRunnerModes.process:
+            if self.executor_type in [
+                ParallelRunnerModes.process,
+                ParallelRunnerModes.worker,
+            ]:
                 # init the context and route on the worker side (cannot be pickeled)
                 server = self.context.server.to_dict()
                 routes = {}
@@ -388,6 +451,9 @@ class ParallelRun(BaseModelRouter):
                         if hasattr(step._object, "_kwargs"):
                             step._object._kwargs["graph_step"] = None
                     routes[key] = step
+                if self.executor_type == ParallelRunnerModes.worker:
+                    self._pool = _RouteWorkersPool(server, routes)
+                    return self._pool
                 executor_class = concurrent.futures.ProcessPoolExecutor
                 self._pool = executor_class(
                     max_workers=len(self.routes),
@@ -397,6 +463,16 @@ class ParallelRun(BaseModelRouter):
             elif self.executor_type == ParallelRunnerModes.thread:
                 executor_class = concurrent.futures.ThreadPoolExecutor
                 self._pool = executor_class(max_workers=len(self.routes))
+            elif self.executor_type == ParallelRunnerModes.asyncio:
+                # the sync routes of all the events in flight share the pool, and a timed out route keeps
+                # its thread until it completes, so the pool is sized for the concurrent events
+                max_concurrent_events = (
+                    self.max_concurrent_events or _default_max_concurrent_events
+                )
+                self._pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=len(self.routes) * max_concurrent_events,
+                    thread_name_prefix=f"{self.name}-routes",
+                )
 
         return self._pool
 
@@ -410,6 +486,74 @@ class ParallelRun(BaseModelRouter):
                 del local_routes
             self._pool.shutdown()
             self._pool = None
+        if self._loop is not None:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not threading.current_thread():
+                thread.join(timeout=5)
+            if not loop.is_running():
+                loop.close()
+
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """get the event loop used to run the routes (asyncio mode) from a sync context"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever,
+                name=f"{self.name}-event-loop",
+                daemon=True,
+            )
+            self._loop_thread.start()
+        return self._loop
+
+    async def _async_run_route(self, step, event):
+        """run the route step on the event loop if its class has a non-blocking handler (see
+        TaskStep.run_async), else in the routes thread pool"""
+        if step._is_local_function(self.context) and step._get_async_handler():
+            return await step.run_async(event)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._init_pool(), step.run, event
+        )
+
+    async def _async_parallel_run(self, event):
+        """
+        Execute the routes as asyncio tasks, routes which fail or don't complete
+        within the route timeout are omitted from the results
+
+        :param event: event to run in parallel
+
+        :return: The results of the completed runs
+        """
+        names = list(self.routes.keys())
+        responses = await asyncio.gather(
+            *[
+                asyncio.wait_for(
+                    self._async_run_route(self.routes[name], copy.copy(event)),
+                    timeout=self.route_timeout,
+                )
+                for name in names
+            ],
+            return_exceptions=True,
+        )
+        results = {}
+        for name, response in zip(names, responses):
+            if isinstance(response, asyncio.TimeoutError):
+                logger.warning(
+                    "Child route timed out, ignoring its result",
+                    route=name,
+                    timeout=self.route_timeout,
+                )
+            elif isinstance(response, Exception):
+                logger.error(
+                    "Child route generated an exception",
+                    route=name,
+                    exc=err_to_str(response),
+                )
+            else:
+                results[name] = response.body if response else None
+        self.context.logger.debug(f"Collected results from children: {results}")
+        return results
 
     def _parallel_run(self, event: dict):
         """
@@ -426,6 +570,14 @@ class ParallelRun(BaseModelRouter):
                 for model_name, model in self.routes.items()
             }
             return results
+        if self.executor_type == ParallelRunnerModes.asyncio:
+            return asyncio.run_coroutine_threadsafe(
+                self._async_parallel_run(event), self._get_event_loop()
+            ).result()
+        if self.executor_type == ParallelRunnerModes.worker:
+            results = self._init_pool().run(event)
+            self.context.logger.debug(f"Collected results from children: {results}")
+            return results
         futures = []
         executor = self._init_pool()
         for route in self.routes.keys():
@@ -477,6 +629,97 @@ class ParallelRun(BaseModelRouter):
         return route, handler(event)
 
 
+class _RouteWorkersPool:
+    """a set of warm worker processes, each process owns a single route
+
+    the event is pickled once per request into a shared memory block, the workers get only
+    the shared memory name (instead of a pickled copy of the event per route). this saves the
+    pickling and the pipe transfer per route, but every worker still unpickles the whole event
+    from the shared memory (routes read different parts of the event, and the event object is
+    rebuilt in each process).
+
+    each worker serves one request at a time over its pipe, so the requests are serialized by a
+    single lock, concurrent events wait for the previous event routes to complete (use the thread
+    or asyncio modes for many small concurrent events)
+    """
+
+    def __init__(self, server_spec: dict, routes: dict):
+        mp_context = multiprocessing.get_context()
+        self._lock = threading.Lock()
+        self._workers = {}
+        for name, route in routes.items():
+            parent_conn, child_conn = mp_context.Pipe()
+            process = mp_context.Process(
+                target=_RouteWorkersPool._worker_loop,
+                args=(server_spec, name, route, child_conn),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._workers[name] = (process, parent_conn)
+
+    def run(self, event) -> dict:
+        payload = pickle.dumps(copy.copy(event), protocol=pickle.HIGHEST_PROTOCOL)
+        shm = shared_memory.SharedMemory(create=True, size=max(len(payload), 1))
+        results = {}
+        try:
+            shm.buf[: len(payload)] = payload
+            # requests are serialized since each worker owns a single connection (see the class docstring)
+            with self._lock:
+                for _, conn in self._workers.values():
+                    conn.send((shm.name, len(payload)))
+                for route, (_, conn) in self._workers.items():
+                    status, result = conn.recv()
+                    if status == "ok":
+                        results[route] = result
+                    else:
+                        logger.error(result)
+                        print(f"child route generated an exception: {result}")
+        finally:
+            shm.close()
+            shm.unlink()
+        return results
+
+    def shutdown(self):
+        with self._lock:
+            for process, conn in self._workers.values():
+                try:
+                    conn.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+                conn.close()
+            for process, _ in self._workers.values():
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+            self._workers = {}
+
+    @staticmethod
+    def _worker_loop(server_spec, name, route, conn):
+        ParallelRun.init_pool(server_spec, {name: route})
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:
+                break
+            if message is None:
+                break
+            shm_name, size = message
+            try:
+                shm = shared_memory.SharedMemory(name=shm_name)
+                # the block is owned (and unlinked) by the parent process
+                resource_tracker.unregister(shm._name, "shared_memory")
+                try:
+                    with shm.buf[:size] as payload:
+                        event = pickle.loads(payload)
+                finally:
+                    shm.close()
+                result = local_routes[name].run(event)
+                conn.send(("ok", result.body if result else None))
+            except Exception as exc:
+                conn.send(("error", f"{err_to_str(exc)}\n{traceback.format_exc()}"))
+
+
 class VotingEnsemble(ParallelRun):
     def __init__(
         self,
@@ -491,6 +734,7 @@ class VotingEnsemble(ParallelRun):
         executor_type: Union[ParallelRunnerModes, str] = ParallelRunnerModes.thread,
         format_response_with_col_name_flag: bool = False,
         prediction_col_name: str = "prediction",
+        route_timeout: float = None,
         **kwargs,
     ):
         """Voting Ensemble
@@ -580,6 +824,9 @@ class VotingEnsemble(ParallelRun):
                               `{id: <id>, model_name: <name>, outputs: {..., prediction: [<predictions>], ...}}`
                               the prediction_col_name should be `prediction`.
                               by default, `prediction`
+        :param route_timeout: max time in seconds to wait for each model (asyncio executor only), the vote
+                              is applied on the predictions of the models which responded in time (see
+                              `ParallelRun` for the timeout semantics and `max_concurrent_events`)
         :param kwargs:        extra arguments
         """
         super().__init__(
@@ -590,6 +837,7 @@ class VotingEnsemble(ParallelRun):
             url_prefix=url_prefix,
             health_prefix=health_prefix,
             executor_type=executor_type,
+            route_timeout=route_timeout,
             **kwargs,
         )
         self.name = name or "VotingEnsemble"
@@ -806,10 +1054,13 @@ class VotingEnsemble(ParallelRun):
                 )
             )
         ).T
-        weights = [self._weights[model_name] for model_name in results.keys()]
-        return self.logic(flattened_predictions, np.array(weights))
+        weights = np.array([self._weights[model_name] for model_name in results.keys()])
+        if len(results) < len(self.routes) and weights.sum() > 0:
+            # vote on partial results (e.g. some models timed out)
+            weights = weights / weights.sum()
+        return self.logic(flattened_predictions, weights)
 
-    def do_event(self, event, *args, **kwargs):
+    def _process_event(self, event):
         """Handles incoming requests.
 
         Parameters
@@ -863,7 +1114,7 @@ class VotingEnsemble(ParallelRun):
 
             # If this is a Router Operation
             if name == self.name and event.method != "GET":
-                predictions = self._parallel_run(event)
+                predictions = yield event
                 votes = self._apply_logic(predictions)
                 # Format the prediction response like the regular
                 # model's responses
@@ -1128,6 +1379,9 @@ class EnrichmentModelRouter(ModelRouter):
         health_prefix: str = None,
         feature_vector_uri: str = "",
         impute_policy: dict = None,
+        cache_ttl: Union[float, dict] = None,
+        cache_max_entries: int = 10000,
+        cache_negative_ttl: float = None,
         **kwargs,
     ):
         """Model router with feature enrichment (from the feature store)
@@ -1146,6 +1400,10 @@ class EnrichmentModelRouter(ModelRouter):
                               constants or $mean, $max, $min, $std, $count for statistical values.
                               “*” is used to specify the default for all features, example:
                               impute_policy={"*": "$mean", "age": 33}
+        :param cache_ttl:     enable an in-process cache of the feature vectors (per entity), the ttl in seconds or
+                              a dict of ttl per feature set name ("*" for the default), e.g. {"*": 60, "clicks": 5}
+        :param cache_max_entries: max number of cached entities (least recently used are evicted)
+        :param cache_negative_ttl: ttl in seconds for entities which were not found, defaults to the cache_ttl
         :param context:       for internal use (passed in init)
         :param name:          step name
         :param routes:        for internal use (routes passed in init)
@@ -1173,18 +1431,20 @@ class EnrichmentModelRouter(ModelRouter):
 
         self.feature_vector_uri = feature_vector_uri
         self.impute_policy = impute_policy or {}
+        self.cache_ttl = cache_ttl
+        self.cache_max_entries = cache_max_entries
+        self.cache_negative_ttl = cache_negative_ttl
 
         self._feature_service = None
 
     def post_init(self, mode="sync"):
-        from ..feature_store import get_feature_vector
-
         super().post_init(mode)
-        self._feature_service = get_feature_vector(
-            self.feature_vector_uri
-        ).get_online_feature_service(
-            impute_policy=self.impute_policy,
-        )
+        self._feature_service = _get_online_feature_service(self)
+
+    def get_feature_cache_stats(self) -> typing.Optional[dict]:
+        """return the feature vector cache stats (hits, misses, hit ratio, ..), None if the cache is disabled"""
+        if hasattr(self._feature_service, "get_stats"):
+            return self._feature_service.get_stats()
 
     def preprocess(self, event):
         """Turn an entity identifier (source) to a Feature Vector"""
@@ -1212,6 +1472,9 @@ class EnrichmentVotingEnsemble(VotingEnsemble):
         prediction_col_name: str = None,
         feature_vector_uri: str = "",
         impute_policy: dict = None,
+        cache_ttl: Union[float, dict] = None,
+        cache_max_entries: int = 10000,
+        cache_negative_ttl: float = None,
         **kwargs,
     ):
         """Voting Ensemble with feature enrichment (from the feature store)
@@ -1285,6 +1548,10 @@ class EnrichmentVotingEnsemble(VotingEnsemble):
                               the replaced value can be fixed number for constants or $mean, $max, $min, $std, $count
                               for statistical values. “*” is used to specify the default for all features, example:
                               impute_policy={"*": "$mean", "age": 33}
+        :param cache_ttl:     enable an in-process cache of the feature vectors (per entity), the ttl in seconds or
+                              a dict of ttl per feature set name ("*" for the default), e.g. {"*": 60, "clicks": 5}
+        :param cache_max_entries: max number of cached entities (least recently used are evicted)
+        :param cache_negative_ttl: ttl in seconds for entities which were not found, defaults to the cache_ttl
         :param input_path:    when specified selects the key/path in the event to use as body
                               this require that the event body will behave like a dict, example:
                               event: {"data": {"a": 5, "b": 7}}, input_path="data.b" means request body will be 7
@@ -1319,18 +1586,20 @@ class EnrichmentVotingEnsemble(VotingEnsemble):
 
         self.feature_vector_uri = feature_vector_uri
         self.impute_policy = impute_policy or {}
+        self.cache_ttl = cache_ttl
+        self.cache_max_entries = cache_max_entries
+        self.cache_negative_ttl = cache_negative_ttl
 
         self._feature_service = None
 
     def post_init(self, mode="sync"):
-        from ..feature_store import get_feature_vector
-
         super().post_init(mode)
-        self._feature_service = get_feature_vector(
-            self.feature_vector_uri
-        ).get_online_feature_service(
-            impute_policy=self.impute_policy,
-        )
+        self._feature_service = _get_online_feature_service(self)
+
+    def get_feature_cache_stats(self) -> typing.Optional[dict]:
+        """return the feature vector cache stats (hits, misses, hit ratio, ..), None if the cache is disabled"""
+        if hasattr(self._feature_service, "get_stats"):
+            return self._feature_service.get_stats()
 
     def preprocess(self, event):
         """Turn an entity identifier (source) to a Feature Vector"""
@@ -1340,3 +1609,23 @@ class EnrichmentVotingEnsemble(VotingEnsemble):
             event.body["inputs"], as_list=True
         )
         return event
+
+
+def _get_online_feature_service(router):
+    """return the router online feature service, wrapped with a near cache when cache_ttl is set"""
+    from ..feature_store import get_feature_vector
+    from ..feature_store.feature_vector import CachedOnlineVectorService
+
+    feature_service = get_feature_vector(
+        router.feature_vector_uri
+    ).get_online_feature_service(
+        impute_policy=router.impute_policy,
+    )
+    if router.cache_ttl:
+        feature_service = CachedOnlineVectorService(
+            feature_service,
+            ttl=router.cache_ttl,
+            max_entries=router.cache_max_entries,
+            negative_ttl=router.cache_negative_ttl,
+        )
+    return feature_service
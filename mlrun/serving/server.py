@@ -42,7 +42,7 @@ from ..errors import MLRunInvalidArgumentError
 from ..model import ModelObj
 from ..utils import get_caller_globals
 from .states import RootFlowStep, RouterStep, get_function, graph_root_setter
-from .utils import event_id_key, event_path_key
+from .utils import _BackgroundSender, event_id_key, event_path_key
 
 
 class _StreamContext:
@@ -64,6 +64,8 @@ class _StreamContext:
         self.function_uri = function_uri
         self.output_stream = None
         self.stream_uri = None
+        self._parameters = parameters
+        self._senders: list[_BackgroundSender] = []
         log_stream = parameters.get(FileTargetKind.LOG_STREAM, "")
 
         if (enabled or log_stream) and function_uri:
@@ -82,6 +84,45 @@ class _StreamContext:
 
             self.output_stream = get_stream_pusher(self.stream_uri, **stream_args)
 
+    def create_sender(
+        self, send, batch_size: int = None, name: str = "log-stream-sender"
+    ) -> Optional[_BackgroundSender]:
+        """return a background sender which calls send() with batches of queued events, or None when
+        background sending is disabled (the events should be pushed on the request path)
+
+        :param send:       function which gets a list of events and pushes them to the stream
+        :param batch_size: max events per send() call, default to the configured max_push_size
+        :param name:       sender (thread) name
+        """
+        sender_config = config.model_endpoint_monitoring.serving_log_stream
+        parameters = self._parameters
+        if not parameters.get("log_stream_background", sender_config.background):
+            return None
+        sender = _BackgroundSender(
+            send,
+            batch_size=batch_size or sender_config.max_push_size,
+            max_linger=parameters.get("log_stream_linger", sender_config.max_linger),
+            max_queue_size=parameters.get(
+                "log_stream_queue_size", sender_config.max_queue_size
+            ),
+            policy=parameters.get(
+                "log_stream_policy", sender_config.backpressure_policy
+            ),
+            sample_every=sender_config.sample_every,
+            name=name,
+        )
+        self._senders.append(sender)
+        return sender
+
+    def flush(self, timeout: float = None):
+        """push the events which are queued in the background senders"""
+        for sender in self._senders:
+            sender.flush(timeout)
+
+    def get_stats(self) -> dict:
+        """return the queue depth and the sent/dropped counters per background sender"""
+        return {sender.name: sender.get_stats() for sender in self._senders}
+
 
 class GraphServer(ModelObj):
     kind = "server"
@@ -245,6 +286,9 @@ class GraphServer(ModelObj):
             time=time,
         )
         resp = self.run(event, get_body=get_body)
+        if not asyncio.iscoroutine(resp):
+            # push the queued monitoring events, so they are visible once test() returns
+            self._flush_stream()
         if hasattr(resp, "status_code") and resp.status_code >= 300 and not silent:
             raise RuntimeError(f"failed ({resp.status_code}): {resp.body}")
         return resp
@@ -309,7 +353,14 @@ class GraphServer(ModelObj):
 
     def wait_for_completion(self):
         """wait for async operation to complete"""
-        return self.graph.wait_for_completion()
+        result = self.graph.wait_for_completion()
+        self._flush_stream()
+        return result
+
+    def _flush_stream(self):
+        stream = getattr(self.context, "stream", None)
+        if stream:
+            stream.flush()
 
 
 def v2_serving_init(context, namespace=None):
@@ -564,6 +615,13 @@ class GraphContext:
             return self._server._secrets.get(key)
         return None
 
+    def get_remote_pools_metrics(self) -> dict:
+        """return the metrics of the shared (sync) RemoteStep connection pools, per endpoint
+        (max connections, in-flight and queued requests, avg/max queue wait time in seconds)"""
+        from mlrun.serving.remote import get_connection_pools_metrics
+
+        return get_connection_pools_metrics()
+
     def get_remote_endpoint(self, name, external=True):
         """return the remote nuclio/serving function http(s) endpoint given its name
 
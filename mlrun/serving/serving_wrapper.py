@@ -13,11 +13,13 @@
 # limitations under the License.
 #
 # serving runtime hooks, used in empty serving functions
-from mlrun.runtimes import nuclio_init_hook
+# the serving graph is initialized directly (rather than through mlrun.runtimes.nuclio_init_hook) to avoid importing
+# the runtimes, which are slow to import and not needed by the serving function
+from mlrun.serving.server import v2_serving_init
 
 
 def init_context(context):
-    nuclio_init_hook(context, globals(), "serving_v2")
+    v2_serving_init(context, globals())
 
 
 def handler(context, event):
@@ -24,9 +24,10 @@ import os
 import pathlib
 import traceback
 from copy import copy, deepcopy
-from inspect import getfullargspec, signature
+from inspect import getfullargspec, iscoroutinefunction, signature
 from typing import Any, Union
 
+import storey.flow
 import storey.utils
 
 import mlrun
@@ -482,6 +483,9 @@ class TaskStep(BaseStep):
                 if hasattr(self._object, "do_event"):
                     handler = "do_event"
                     self._call_with_event = True
+                    if self._is_async_flow_step() and self._get_async_handler():
+                        # use the non-blocking handler when running in an async (storey) flow
+                        handler = "do_event_async"
                 elif hasattr(self._object, "do"):
                     handler = "do"
             if handler:
@@ -526,6 +530,24 @@ class TaskStep(BaseStep):
                 class_object = get_class(class_name or self._default_class, namespace)
         return class_object, class_name
 
+    def _get_async_handler(self):
+        """return the non-blocking class handler (do_event_async) if the class has one and enables it,
+        classes can disable it with a false `async_handler_enabled` attribute"""
+        if not self._call_with_event or not getattr(
+            self._object, "async_handler_enabled", True
+        ):
+            return None
+        return getattr(self._object, "do_event_async", None)
+
+    def _is_async_flow_step(self):
+        """is this step run directly by an async (storey) flow"""
+        parent = self._parent
+        while isinstance(parent, FlowStep):
+            if isinstance(parent, RootFlowStep):
+                return parent.engine != "sync"
+            parent = parent._parent
+        return False
+
     def _is_local_function(self, context):
         # detect if the class is local (and should be initialized)
         current_function = get_current_function(context)
@@ -598,6 +620,34 @@ class TaskStep(BaseStep):
                 raise exc
         return event
 
+    async def run_async(self, event, *args, **kwargs):
+        """run this step from an event loop, with the non-blocking class handler (see
+        _get_async_handler), steps without one are run with run() and block the loop"""
+        handler = None
+        if self._is_local_function(self.context):
+            handler = self._get_async_handler()
+        if not handler:
+            return self.run(event, *args, **kwargs)
+
+        if self.context.verbose:
+            self.context.logger.info(f"step {self.name} got event {event.body}")
+
+        if self._inject_context:
+            kwargs["context"] = self.context
+        elif kwargs and "context" in kwargs:
+            del kwargs["context"]
+
+        try:
+            return await handler(event, *args, **kwargs)
+        except Exception as exc:
+            if self._on_error_handler:
+                self._log_error(event, exc)
+                result = self._call_error_handler(event, exc)
+                event.body = _update_result_body(self.result_path, event.body, result)
+            else:
+                raise exc
+        return event
+
 
 class MonitoringApplicationStep(TaskStep):
     """monitoring application execution step, runs users class code"""
@@ -1619,6 +1669,21 @@ def params_to_step(
     return name, step
 
 
+class _ConcurrentHandlerStep(storey.flow._ConcurrentJobExecution):
+    """storey step which runs an async step handler on up to max_in_flight events concurrently
+    (storey.Map awaits each event before handling the next one), the results keep the events order"""
+
+    def __init__(self, handler, **kwargs):
+        super().__init__(**kwargs)
+        self._handler = handler
+
+    async def _process_event(self, event):
+        return await self._handler(self._get_event_or_body(event))
+
+    async def _handle_completed(self, event, response):
+        await self._do_downstream(self._user_fn_output_to_event(event, response))
+
+
 def _init_async_objects(context, steps):
     try:
         import storey
@@ -1675,6 +1740,22 @@ def _init_async_objects(context, steps):
                 else:
                     step._async_object = storey.Map(lambda x: x)
 
+            elif (
+                not step.async_object or not hasattr(step.async_object, "_outlets")
+            ) and (
+                getattr(step.async_object, "max_in_flight", None)
+                and iscoroutinefunction(step._handler)
+            ):
+                # async handler which benefits from concurrent events (e.g. batching)
+                step._async_object = _ConcurrentHandlerStep(
+                    step._handler,
+                    max_in_flight=step.async_object.max_in_flight,
+                    full_event=step.full_event or step._call_with_event,
+                    input_path=step.input_path,
+                    result_path=step.result_path,
+                    name=step.name,
+                    context=context,
+                )
             elif not step.async_object or not hasattr(step.async_object, "_outlets"):
                 # if regular class, wrap with storey Map
                 step._async_object = storey.Map(
@@ -12,9 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
+import atexit
+import collections
+import contextlib
 import inspect
+import threading
+import time
+import typing
 
-from mlrun.utils import get_in, update_in
+from mlrun.utils import get_in, logger, update_in
 
 # headers keys with underscore are getting ignored by werkzeug https://github.com/pallets/werkzeug/pull/2622
 # to avoid conflicts with WGSI which converts all header keys to uppercase with underscores.
@@ -43,6 +50,361 @@ def _update_result_body(result_path, event_body, result):
     return event_body
 
 
+class _BatchEntry:
+    def __init__(self, item):
+        self.item = item
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class _MicroBatcher:
+    """collect items from concurrent callers and process them in a single call
+
+    the first item which arrives to an empty batch makes its caller the batch leader, the leader waits
+    up to max_wait seconds (or until max_batch_size items were collected), calls process_batch() with
+    the list of items and hands each caller its own result. process_batch() must return a list with
+    one result per item, an exception raised by it is raised to all the callers in the batch.
+
+    sync callers (threads) should wrap their whole event handling with caller(), the leader stops waiting
+    once no other caller is about to submit an item and no other batch is processed, so a single threaded
+    server never waits for max_wait (the batches are formed from the requests which arrive while the
+    previous batch is processed).
+    async callers (submit_async) are batched on the event loop, the batch is processed once no new item
+    joined it during a loop iteration (or when it is full or max_wait passed), process_batch() runs in
+    the loop's default executor so the loop keeps accepting events while the batch is processed.
+    """
+
+    def __init__(
+        self,
+        process_batch: typing.Callable[[list], list],
+        max_batch_size: int,
+        max_wait: float,
+    ):
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._batch_changed = threading.Condition(self._lock)
+        self._batch: list[_BatchEntry] = []
+        self._pending_callers = 0
+        self._running_batches = 0
+        self._local = threading.local()
+        self._async_batch: list[tuple[typing.Any, asyncio.Future]] = []
+        self._async_deadline = 0.0
+
+    @contextlib.contextmanager
+    def caller(self):
+        """mark the current thread as a caller which is about to submit an item (until it submits or exits)"""
+        with self._lock:
+            self._pending_callers += 1
+        self._local.pending = True
+        try:
+            yield
+        finally:
+            with self._lock:
+                if self._local.pending:
+                    self._pending_callers -= 1
+                    self._batch_changed.notify_all()
+            self._local.pending = False
+
+    def submit(self, item):
+        entry = _BatchEntry(item)
+        with self._lock:
+            batch = self._batch
+            batch.append(entry)
+            if getattr(self._local, "pending", False):
+                self._pending_callers -= 1
+                self._local.pending = False
+            is_leader = len(batch) == 1
+            if len(batch) >= self.max_batch_size:
+                # close the batch, next items will open a new one
+                self._batch = []
+            self._batch_changed.notify_all()
+
+        if not is_leader:
+            entry.done.wait()
+        else:
+            with self._lock:
+                self._batch_changed.wait_for(
+                    lambda: batch is not self._batch
+                    or not (self._pending_callers or self._running_batches),
+                    timeout=self.max_wait,
+                )
+                if batch is self._batch:
+                    self._batch = []
+                self._running_batches += 1
+            try:
+                self._run_batch(batch)
+            finally:
+                with self._lock:
+                    self._running_batches -= 1
+                    self._batch_changed.notify_all()
+
+        if entry.error:
+            raise entry.error
+        return entry.result
+
+    def _run_batch(self, batch: list[_BatchEntry]):
+        try:
+            results = self.process_batch([entry.item for entry in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"expected {len(batch)} batch results, got {len(results)}"
+                )
+            for entry, result in zip(batch, results):
+                entry.result = result
+        except Exception as exc:
+            for entry in batch:
+                entry.error = exc
+        finally:
+            for entry in batch:
+                entry.done.set()
+
+    async def submit_async(self, item):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._async_batch
+        batch.append((item, future))
+        if len(batch) >= self.max_batch_size:
+            self._flush_async(loop)
+        elif len(batch) == 1:
+            self._async_deadline = loop.time() + self.max_wait
+            loop.call_soon(self._flush_async_when_idle, loop, batch, 1)
+        return await future
+
+    def _flush_async_when_idle(
+        self, loop: asyncio.AbstractEventLoop, batch: list, size: int
+    ):
+        if batch is not self._async_batch:
+            # the batch was already flushed (it filled up)
+            return
+        if len(batch) > size and loop.time() < self._async_deadline:
+            # items are still joining, give the other events another loop iteration
+            loop.call_soon(self._flush_async_when_idle, loop, batch, len(batch))
+            return
+        self._flush_async(loop)
+
+    def _flush_async(self, loop: asyncio.AbstractEventLoop):
+        batch, self._async_batch = self._async_batch, []
+        loop.create_task(self._run_async_batch(loop, batch))
+
+    async def _run_async_batch(self, loop: asyncio.AbstractEventLoop, batch: list):
+        try:
+            results = await loop.run_in_executor(
+                None, self.process_batch, [item for item, _ in batch]
+            )
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"expected {len(batch)} batch results, got {len(results)}"
+                )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class _BackgroundSender:
+    """send items from a background thread in batches, keeps the sending off the caller (request) path
+
+    put() adds an item to a bounded queue and returns immediately, the sender thread calls send() with
+    up to batch_size items once a full batch is queued or the oldest queued item waited max_linger seconds.
+    the policy decides what happens to new items under backpressure:
+    "drop" - drop new items while the queue is full, "block" - wait for room in the queue,
+    "sample" - once the queue is half full keep only one of every sample_every items (drop when full).
+    a failed send() is logged and its items are counted as dropped. items dropped or sampled out by the
+    policy are logged as a warning with the counters, at most once every drop_log_interval seconds.
+    """
+
+    policies = ["drop", "sample", "block"]
+    drop_log_interval = 60.0
+
+    def __init__(
+        self,
+        send: typing.Callable[[list], None],
+        batch_size: int = 100,
+        max_linger: float = 1.0,
+        max_queue_size: int = 10000,
+        policy: str = "block",
+        sample_every: int = 10,
+        name: str = "background-sender",
+    ):
+        if policy not in self.policies:
+            raise ValueError(
+                f"unsupported backpressure policy {policy}, use one of {self.policies}"
+            )
+        self.send = send
+        self.batch_size = max(1, int(batch_size))
+        self.max_linger = float(max_linger)
+        self.max_queue_size = max(self.batch_size, int(max_queue_size))
+        self.policy = policy
+        self.sample_every = max(1, int(sample_every))
+        self.name = name
+        # queued (enqueue time, item) tuples
+        self._queue = collections.deque()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._thread = None
+        self._closed = False
+        self._flushing = 0
+        self._in_flight = 0
+        self._sample_iter = 0
+        self._sent = 0
+        self._dropped = 0
+        self._sampled_out = 0
+        self._send_errors = 0
+        self._drops_logged_at = None
+
+    def put(self, item, sample: bool = True) -> bool:
+        """queue an item, return False if it was dropped by the backpressure policy
+
+        :param item:   item to send
+        :param sample: False to never sample out the item (e.g. errors), it can still be dropped
+                       when the queue is full
+        """
+        with self._lock:
+            if self.policy == "block":
+                self._changed.wait_for(
+                    lambda: len(self._queue) < self.max_queue_size or self._closed
+                )
+            if self._closed or len(self._queue) >= self.max_queue_size:
+                self._dropped += 1
+                self._log_drops("queue is full" if not self._closed else "closed")
+                return False
+            if (
+                sample
+                and self.policy == "sample"
+                and len(self._queue) >= self.max_queue_size // 2
+            ):
+                self._sample_iter = (self._sample_iter + 1) % self.sample_every
+                if self._sample_iter:
+                    self._sampled_out += 1
+                    self._log_drops("queue is half full, sampling")
+                    return False
+
+            self._queue.append((time.monotonic(), item))
+            if self._thread is None:
+                self._start()
+            elif len(self._queue) == 1 or len(self._queue) >= self.batch_size:
+                # wake the sender to set the linger deadline or to send a full batch
+                self._changed.notify_all()
+        return True
+
+    def flush(self, timeout: float = None) -> bool:
+        """send all the queued items, return False if the timeout expired before they were sent"""
+        with self._lock:
+            self._flushing += 1
+            self._changed.notify_all()
+            try:
+                return self._changed.wait_for(
+                    lambda: not self._queue and not self._in_flight, timeout=timeout
+                )
+            finally:
+                self._flushing -= 1
+
+    def close(self, timeout: float = None):
+        """send the queued items and stop the sender thread"""
+        self.flush(timeout)
+        with self._lock:
+            self._closed = True
+            self._changed.notify_all()
+            thread = self._thread
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def get_stats(self) -> dict:
+        """return the queue depth and the sent/dropped item counters"""
+        with self._lock:
+            return {
+                "queue_depth": len(self._queue),
+                "in_flight": self._in_flight,
+                "sent": self._sent,
+                "dropped": self._dropped,
+                "sampled_out": self._sampled_out,
+                "send_errors": self._send_errors,
+            }
+
+    def _log_drops(self, reason: str):
+        """warn about dropped items, at most once every drop_log_interval seconds (called with the lock held)"""
+        now = time.monotonic()
+        if (
+            self._drops_logged_at is not None
+            and now - self._drops_logged_at < self.drop_log_interval
+        ):
+            return
+        self._drops_logged_at = now
+        logger.warning(
+            "Background sender is dropping items",
+            sender=self.name,
+            reason=reason,
+            policy=self.policy,
+            queue_depth=len(self._queue),
+            dropped=self._dropped,
+            sampled_out=self._sampled_out,
+            send_errors=self._send_errors,
+        )
+
+    def _start(self):
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        # send the leftovers when the process exits
+        atexit.register(self.close, timeout=self.max_linger + 5)
+
+    def _next_batch(self) -> typing.Optional[list]:
+        with self._lock:
+            while True:
+                if self._queue and (
+                    len(self._queue) >= self.batch_size
+                    or self._flushing
+                    or self._closed
+                ):
+                    break
+                if not self._queue:
+                    if self._closed:
+                        return None
+                    self._changed.wait()
+                    continue
+                linger = self._queue[0][0] + self.max_linger - time.monotonic()
+                if linger <= 0:
+                    break
+                self._changed.wait(linger)
+
+            count = min(self.batch_size, len(self._queue))
+            batch = [self._queue.popleft()[1] for _ in range(count)]
+            self._in_flight = count
+            # there is room in the queue for blocked callers
+            self._changed.notify_all()
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                self.send(batch)
+                sent, failed = len(batch), 0
+            except Exception as exc:
+                sent, failed = 0, len(batch)
+                logger.warning(
+                    "Failed to send batch, dropping its items",
+                    sender=self.name,
+                    items=len(batch),
+                    error=str(exc),
+                    dropped=self._dropped + len(batch),
+                )
+            with self._lock:
+                self._sent += sent
+                self._dropped += failed
+                self._send_errors += 1 if failed else 0
+                self._in_flight = 0
+                self._changed.notify_all()
+
+
 class StepToDict:
     """auto serialization of graph steps to a python dictionary"""
 
@@ -26,7 +26,12 @@ from mlrun.utils import logger, now_date
 
 from ..common.helpers import parse_versioned_object_uri
 from .server import GraphServer
-from .utils import StepToDict, _extract_input_data, _update_result_body
+from .utils import (
+    StepToDict,
+    _extract_input_data,
+    _MicroBatcher,
+    _update_result_body,
+)
 
 
 class V2ModelServer(StepToDict):
@@ -91,7 +96,14 @@ class V2ModelServer(StepToDict):
                               this require that the event body will behave like a dict, example:
                               event: {"x": 5} , result_path="resp" means the returned response will be written
                               to event["y"] resulting in {"x": 5, "resp": <result>}
-        :param kwargs:     extra arguments (can be accessed using self.get_param(key))
+        :param kwargs:     extra arguments (can be accessed using self.get_param(key)),
+                           the following keys enable adaptive micro-batching of predict calls:
+                           max_batch_size - max number of concurrent requests merged into one predict()
+                           call (default 1 = batching disabled), max_batch_wait - max time in seconds
+                           to wait for the batch to fill up (default 0.01), max_in_flight - max events
+                           processed concurrently in async flows (default 2 * max_batch_size).
+                           in sync flows requests are batched across the server threads, in async flows
+                           across the concurrent events, the wait is skipped when no other request can join
         """
         self.name = name
         self.version = ""
@@ -113,6 +125,17 @@ class V2ModelServer(StepToDict):
             else None
         )
 
+        self._batcher = None
+        max_batch_size = int(kwargs.get("max_batch_size", 1) or 1)
+        if max_batch_size > 1:
+            self._batcher = _MicroBatcher(
+                self._predict_batch,
+                max_batch_size=max_batch_size,
+                max_wait=float(kwargs.get("max_batch_wait", 0.01)),
+            )
+            # max concurrent events in async flows, allows the events to join the same batch
+            self.max_in_flight = int(kwargs.get("max_in_flight", 2 * max_batch_size))
+
         self.metrics = {}
         self.labels = {}
         self.model = None
@@ -225,8 +248,57 @@ class V2ModelServer(StepToDict):
         request = self.preprocess(event_body, op)
         return self.validate(request, op)
 
+    @property
+    def async_handler_enabled(self) -> bool:
+        """use do_event_async in async flows, only when batching is enabled (to batch the concurrent
+        events) and do_event is not overridden by the model class (so the override is always called)"""
+        return (
+            self._batcher is not None and type(self).do_event is V2ModelServer.do_event
+        )
+
     def do_event(self, event, *args, **kwargs):
         """main model event handler method"""
+        if not self._batcher:
+            return self._run_processor(self._process_event(event), self.predict)
+        with self._batcher.caller():
+            return self._run_processor(self._process_event(event), self._batcher.submit)
+
+    async def do_event_async(self, event, *args, **kwargs):
+        """model event handler for async (storey) flows when batching is enabled (see async_handler_enabled),
+        the predict requests of the concurrent events are batched on the loop without blocking it"""
+        if not self.async_handler_enabled:
+            return self.do_event(event, *args, **kwargs)
+        processor = self._process_event(event)
+        try:
+            request = next(processor)
+            while True:
+                try:
+                    outputs = await self._batcher.submit_async(request)
+                except Exception as exc:
+                    request = processor.throw(exc)
+                else:
+                    request = processor.send(outputs)
+        except StopIteration as stop:
+            return stop.value
+
+    @staticmethod
+    def _run_processor(processor, predict):
+        """run the event processing flow (see _process_event) with the given predict function"""
+        try:
+            request = next(processor)
+            while True:
+                try:
+                    outputs = predict(request)
+                except Exception as exc:
+                    request = processor.throw(exc)
+                else:
+                    request = processor.send(outputs)
+        except StopIteration as stop:
+            return stop.value
+
+    def _process_event(self, event):
+        """event processing flow, yields the predict request when the model outputs are needed
+        and expects to get the outputs back (or the predict error thrown in), see do_event"""
         start = now_date()
         original_body = event.body
         event_body = _extract_input_data(self._input_path, event.body)
@@ -247,7 +319,7 @@ class V2ModelServer(StepToDict):
             # predict operation
             request = self._pre_event_processing_actions(event, event_body, op)
             try:
-                outputs = self.predict(request)
+                outputs = yield request
             except Exception as exc:
                 request["id"] = event_id
                 if self._model_logger:
@@ -341,6 +413,28 @@ class V2ModelServer(StepToDict):
         event.body = _update_result_body(self._result_path, original_body, response)
         return event
 
+    def _predict_batch(self, requests: list[dict]) -> list:
+        """run a single predict() call over the inputs of multiple requests (micro-batching)"""
+        if len(requests) == 1:
+            return [self.predict(requests[0])]
+
+        request = dict(requests[0])
+        request["inputs"] = [item for req in requests for item in req["inputs"]]
+        outputs = self.predict(request)
+        if hasattr(outputs, "tolist"):
+            outputs = outputs.tolist()
+        if not isinstance(outputs, list) or len(outputs) != len(request["inputs"]):
+            raise mlrun.errors.MLRunRuntimeError(
+                f"model {self.name} predict() must return one output per input "
+                "when batching is enabled (max_batch_size > 1)"
+            )
+        results = []
+        offset = 0
+        for req in requests:
+            results.append(outputs[offset : offset + len(req["inputs"])])
+            offset += len(req["inputs"])
+        return results
+
     def logged_results(self, request: dict, response: dict, op: str):
         """hook for controlling which results are tracked by the model monitoring
 
@@ -427,6 +521,15 @@ class V2ModelServer(StepToDict):
 
 
 class _ModelLogPusher:
+    """push the model events to the log (monitoring) stream
+
+    the events are queued to a background sender which pushes them in batches, so the stream writes
+    are kept off the request latency path (unless the log_stream_background parameter is False).
+    with log_stream_batch > 1 the events are pushed as micro batches of N rows (headers + values).
+    """
+
+    headers = ["request", "op", "resp", "when", "microsec", "metrics"]
+
     def __init__(self, model, context, output_stream=None):
         self.model = model
         self.verbose = context.verbose
@@ -438,8 +541,14 @@ class _ModelLogPusher:
         self.output_stream = output_stream or context.stream.output_stream
         self._worker = context.worker_id
         self._sample_iter = 0
-        self._batch_iter = 0
         self._batch = []
+        self._sender = None
+        if self.output_stream:
+            self._sender = context.stream.create_sender(
+                self._send,
+                batch_size=self.stream_batch if self.stream_batch > 1 else None,
+                name=f"log-stream-{model.name}",
+            )
 
     def base_data(self):
         base_data = {
@@ -454,6 +563,10 @@ class _ModelLogPusher:
             base_data["labels"] = self.model.labels
         return base_data
 
+    def get_stats(self) -> dict:
+        """return the background sender queue depth and sent/dropped counters"""
+        return self._sender.get_stats() if self._sender else {}
+
     def push(self, start, request, resp=None, op=None, error=None):
         start_str = start.isoformat(sep=" ", timespec="microseconds")
         if error:
@@ -465,7 +578,8 @@ class _ModelLogPusher:
             if self.verbose:
                 message = f"{message}\n{traceback.format_exc()}"
             data["error"] = message
-            self.output_stream.push([data])
+            # errors are never sampled out
+            self._put(data, sample=False)
             return
 
         self._sample_iter = (self._sample_iter + 1) % self.stream_sample
@@ -473,25 +587,7 @@ class _ModelLogPusher:
             microsec = (now_date() - start).microseconds
 
             if self.stream_batch > 1:
-                if self._batch_iter == 0:
-                    self._batch = []
-                self._batch.append(
-                    [request, op, resp, str(start), microsec, self.model.metrics]
-                )
-                self._batch_iter = (self._batch_iter + 1) % self.stream_batch
-
-                if self._batch_iter == 0:
-                    data = self.base_data()
-                    data["headers"] = [
-                        "request",
-                        "op",
-                        "resp",
-                        "when",
-                        "microsec",
-                        "metrics",
-                    ]
-                    data["values"] = self._batch
-                    self.output_stream.push([data])
+                self._put([request, op, resp, str(start), microsec, self.model.metrics])
             else:
                 data = self.base_data()
                 data["request"] = request
@@ -501,7 +597,31 @@ class _ModelLogPusher:
                 data["microsec"] = microsec
                 if getattr(self.model, "metrics", None):
                     data["metrics"] = self.model.metrics
-                self.output_stream.push([data])
+                self._put(data)
+
+    def _put(self, item, sample=True):
+        if self._sender:
+            self._sender.put(item, sample=sample)
+        elif isinstance(item, dict):
+            self._send([item])
+        else:
+            # no background sender, push the micro batch once it is full
+            self._batch.append(item)
+            if len(self._batch) >= self.stream_batch:
+                batch, self._batch = self._batch, []
+                self._send(batch)
+
+    def _send(self, items: list):
+        # items are event records (dict) or micro batch rows (list)
+        records = [item for item in items if isinstance(item, dict)]
+        rows = [item for item in items if not isinstance(item, dict)]
+        for i in range(0, len(rows), self.stream_batch):
+            data = self.base_data()
+            data["headers"] = list(self.headers)
+            data["values"] = rows[i : i + self.stream_batch]
+            records.append(data)
+        if records:
+            self.output_stream.push(records)
 
 
 def _init_endpoint_record(
@@ -14,10 +14,145 @@
 #
 import abc
 import pickle
+import typing
 from datetime import datetime
 
+import orjson
 from sqlalchemy.orm import class_mapper
 
+import mlrun.config
+import mlrun.errors
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class BodyCodec(abc.ABC):
+    """serialization format of the DB object bodies (e.g. run, function and artifact structs)
+
+    encoded bodies start with the codec version byte, bodies which do not start with a registered version byte
+    are legacy pickled bodies (pickle protocols >= 2 start with 0x80, older protocols with a printable opcode).
+    encode() must raise TypeError or ValueError when the value type isn't supported by the codec,
+    the value is pickled instead.
+    """
+
+    name: str = None
+    version: int = None
+
+    @abc.abstractmethod
+    def encode(self, value) -> bytes:
+        pass
+
+    @abc.abstractmethod
+    def decode(self, data: memoryview):
+        pass
+
+
+def _not_json_serializable(value):
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class JSONBodyCodec(BodyCodec):
+    name = "orjson"
+    version = 1
+
+    # datetime, dataclass and str/int/dict/list subclass values are not json types, they are passed to the
+    # default function which rejects them (so the body is pickled and keeps its types). enum members are
+    # stored as their values. the bodies are not verified by decoding them back, tuples are stored as lists
+    # and nan/inf as null (as in the JSON API requests the bodies come from)
+    _options = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+    def encode(self, value) -> bytes:
+        return orjson.dumps(value, default=_not_json_serializable, option=self._options)
+
+    def decode(self, data: memoryview):
+        return orjson.loads(data)
+
+
+class ZstdJSONBodyCodec(JSONBodyCodec):
+    name = "orjson-zstd"
+    version = 2
+
+    def encode(self, value) -> bytes:
+        return self._zstandard().ZstdCompressor(level=3).compress(super().encode(value))
+
+    def decode(self, data: memoryview):
+        return super().decode(self._zstandard().ZstdDecompressor().decompress(data))
+
+    @staticmethod
+    def _zstandard():
+        if zstandard is None:
+            raise mlrun.errors.MLRunMissingDependencyError(
+                "The orjson-zstd body codec requires the zstandard package, "
+                "use `pip install zstandard` to install it"
+            )
+        return zstandard
+
+
+_body_codecs: dict[str, BodyCodec] = {}
+_body_codecs_by_version: dict[int, BodyCodec] = {}
+
+
+def register_body_codec(codec: BodyCodec):
+    """register a DB body codec, it can be selected with mlrun.mlconf.httpdb.db.body_codec"""
+    if codec.version in (None, 0x80) or not 0 < codec.version < 256:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            f"Invalid body codec version {codec.version}, must be a byte other than 0x80"
+        )
+    registered = _body_codecs_by_version.get(codec.version)
+    if registered and registered.name != codec.name:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            f"Body codec version {codec.version} is already used by {registered.name}"
+        )
+    _body_codecs[codec.name] = codec
+    _body_codecs_by_version[codec.version] = codec
+
+
+register_body_codec(JSONBodyCodec())
+register_body_codec(ZstdJSONBodyCodec())
+
+
+def get_body_codec_name(body: typing.Optional[bytes]) -> typing.Optional[str]:
+    """return the name of the codec which encoded the body ("pickle" for legacy bodies), None for empty bodies"""
+    if not body:
+        return None
+    codec = _body_codecs_by_version.get(body[0])
+    return codec.name if codec else "pickle"
+
+
+def encode_body(value, codec: str = None) -> bytes:
+    """encode a DB object body
+
+    :param value: the body (struct) to encode
+    :param codec: codec name, "pickle" or one of the registered codecs, default to mlrun.mlconf.httpdb.db.body_codec
+    """
+    codec = codec or mlrun.config.config.httpdb.db.body_codec
+    if codec == "pickle":
+        return pickle.dumps(value)
+    if codec not in _body_codecs:
+        raise mlrun.errors.MLRunInvalidArgumentError(
+            f"Unknown body codec {codec}, use pickle or one of {list(_body_codecs.keys())}"
+        )
+    try:
+        data = _body_codecs[codec].encode(value)
+    except (TypeError, ValueError):
+        return pickle.dumps(value)
+    return bytes([_body_codecs[codec].version]) + data
+
+
+def decode_body(body: bytes):
+    """decode a DB object body, in any of the registered formats or a legacy pickled body"""
+    codec = _body_codecs_by_version.get(body[0]) if body else None
+    if codec is None:
+        return pickle.loads(body)
+    return codec.decode(memoryview(body)[1:])
+
 
 class BaseModel:
     def to_dict(self, exclude=None, strip: bool = False):
@@ -49,11 +184,15 @@ class BaseModel:
 class HasStruct(BaseModel):
     @property
     def struct(self):
-        return pickle.loads(self.body)
+        return self.body_to_struct(self.body)
+
+    @staticmethod
+    def body_to_struct(body):
+        return decode_body(body)
 
     @struct.setter
     def struct(self, value):
-        self.body = pickle.dumps(value)
+        self.body = encode_body(value)
 
     def to_dict(self, exclude=None, strip: bool = False):
         """
@@ -40,7 +40,6 @@ import pandas
 import semver
 import yaml
 from dateutil import parser
-from mlrun_pipelines.models import PipelineRun
 from pandas import Timedelta, Timestamp
 from yaml.representer import RepresenterError
 
@@ -62,6 +61,10 @@ from .retryer import (  # noqa: F401
     create_step_backoff,
 )
 
+if typing.TYPE_CHECKING:
+    # importing the pipeline adapters imports kfp, which is slow to import
+    from mlrun_pipelines.models import PipelineRun
+
 yaml.Dumper.ignore_aliases = lambda *args: True
 _missing = object()
 
@@ -1348,7 +1351,7 @@ def is_link_artifact(artifact):
         return artifact.kind == mlrun.common.schemas.ArtifactCategories.link.value
 
 
-def format_run(run: PipelineRun, with_project=False) -> dict:
+def format_run(run: "PipelineRun", with_project=False) -> dict:
     fields = [
         "id",
         "name",
@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
+import copy
 import logging
+import logging.handlers
 import os
+import queue
 import typing
 from enum import Enum
 from functools import cached_property
@@ -154,6 +158,70 @@ class HumanReadableExtendedFormatter(HumanReadableFormatter):
         return stdout.isatty()
 
 
+class QueueDropPolicy(Enum):
+    # drop the new log records while the queue is full
+    DROP_NEW = "drop_new"
+    # drop the oldest queued log record to make room for the new one
+    DROP_OLDEST = "drop_oldest"
+    # block the caller until there is room in the queue
+    BLOCK = "block"
+
+
+class _BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hand the log records to a bounded queue, the records are formatted and written by the handlers of a
+    :py:class:`_QueueListener` on a background thread. When the queue is full the drop policy is applied.
+    """
+
+    def __init__(
+        self,
+        queue_: queue.Queue,
+        drop_policy: QueueDropPolicy,
+        listener: "_QueueListener",
+    ):
+        super().__init__(queue_)
+        self.drop_policy = drop_policy
+        self.listener = listener
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike the base QueueHandler, don't format the record on the caller's thread - only merge the message
+        # arguments, the formatters of the listener handlers format the "with" payload and the exception info
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.drop_policy == QueueDropPolicy.BLOCK:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            if self.drop_policy == QueueDropPolicy.DROP_NEW:
+                self.dropped += 1
+                return
+
+        # Drop the oldest record, the listener may have emptied the queue in the meantime
+        try:
+            self.queue.get_nowait()
+            self.dropped += 1
+        except queue.Empty:
+            pass
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # The queue may be full, wait for room rather than failing to stop the listener
+        self.queue.put(self._sentinel)
+
+
 class Logger:
     def __init__(
         self,
@@ -181,10 +249,9 @@ class Logger:
         self, handler_name: str, file: IO[str], formatter: logging.Formatter
     ):
         # check if there's a handler by this name
-        for handler in self._logger.handlers:
-            if handler.name == handler_name:
-                self._logger.removeHandler(handler)
-                break
+        handlers = [
+            handler for handler in self._get_handlers() if handler.name != handler_name
+        ]
 
         # create a stream handler from the file
         stream_handler = logging.StreamHandler(file)
@@ -194,7 +261,68 @@ class Logger:
         stream_handler.setFormatter(formatter)
 
         # add the handler to the logger
-        self._logger.addHandler(stream_handler)
+        handlers.append(stream_handler)
+        self._set_handlers(handlers)
+
+    def enable_queue_mode(
+        self,
+        max_queue_size: int = 10000,
+        drop_policy: Union[str, QueueDropPolicy] = QueueDropPolicy.DROP_NEW,
+    ) -> None:
+        """
+        Write the log records from a background thread - the logging calls hand the records to a bounded queue and
+        return, and the handlers of the logger format and write them on the thread of a queue listener.
+        Note that the "with" values of the records are serialized on the listener thread, so they should not be
+        mutated after the logging call.
+
+        :param max_queue_size: The max number of queued log records.
+        :param drop_policy:    What to do when the queue is full, see :py:class:`QueueDropPolicy`.
+        """
+        self.disable_queue_mode()
+
+        queue_ = queue.Queue(maxsize=max_queue_size)
+        handlers = self._logger.handlers[:]
+        for handler in handlers:
+            self._logger.removeHandler(handler)
+
+        listener = _QueueListener(queue_, *handlers, respect_handler_level=True)
+        queue_handler = _BoundedQueueHandler(
+            queue_, QueueDropPolicy(drop_policy), listener
+        )
+        queue_handler.name = "queue"
+        self._logger.addHandler(queue_handler)
+        listener.start()
+        # write the queued records before the process exits
+        atexit.register(self.disable_queue_mode)
+
+    def disable_queue_mode(self) -> None:
+        """Write the queued log records and go back to writing the records on the caller's thread"""
+        queue_handler = self._queue_handler
+        if not queue_handler:
+            return
+        atexit.unregister(self.disable_queue_mode)
+        self._logger.removeHandler(queue_handler)
+        queue_handler.listener.stop()
+        for handler in queue_handler.listener.handlers:
+            self._logger.addHandler(handler)
+
+    @property
+    def queue_mode(self) -> bool:
+        return self._queue_handler is not None
+
+    @property
+    def dropped_records(self) -> int:
+        """The number of log records dropped since the queue mode was enabled"""
+        queue_handler = self._queue_handler
+        return queue_handler.dropped if queue_handler else 0
+
+    @property
+    def _queue_handler(self) -> Optional[_BoundedQueueHandler]:
+        # the queue handler is kept on the underlying logger, which is shared by the loggers of the same name
+        for handler in self._logger.handlers:
+            if isinstance(handler, _BoundedQueueHandler):
+                return handler
+        return None
 
     def get_child(self, suffix):
         """
@@ -226,11 +354,27 @@ class Logger:
         self.get_handler(handler_name).stream = file
 
     def get_handler(self, name: str) -> logging.Handler:
-        for handler in self._logger.handlers:
+        for handler in self._get_handlers():
             if handler.name == name:
                 return handler
         raise ValueError(f"Logger does not have a handler named '{name}'")
 
+    def _get_handlers(self) -> list[logging.Handler]:
+        """The handlers that write the records (in queue mode, the handlers of the queue listener)"""
+        if queue_handler := self._queue_handler:
+            return list(queue_handler.listener.handlers)
+        return self._logger.handlers[:]
+
+    def _set_handlers(self, handlers: list[logging.Handler]) -> None:
+        if queue_handler := self._queue_handler:
+            # the listener reads its handlers for each record, replacing the tuple is thread safe
+            queue_handler.listener.handlers = tuple(handlers)
+            return
+        for handler in self._logger.handlers[:]:
+            self._logger.removeHandler(handler)
+        for handler in handlers:
+            self._logger.addHandler(handler)
+
     def debug(self, message, *args, **kw_args):
         self._update_bound_vars_and_log(logging.DEBUG, message, *args, **kw_args)
 
@@ -257,6 +401,10 @@ class Logger:
     def _update_bound_vars_and_log(
         self, level, message, *args, exc_info=None, **kw_args
     ):
+        # check the level before merging the bound variables and building the record
+        if not self._logger.isEnabledFor(level):
+            return
+
         kw_args.update(self._bound_variables)
 
         if kw_args:
@@ -300,6 +448,7 @@ def create_logger(
     formatter_kind: str = FormatterKinds.HUMAN.name,
     name: str = "mlrun",
     stream: IO[str] = stdout,
+    queue_mode: Optional[bool] = None,
 ) -> Logger:
     level = level or config.log_level or "info"
 
@@ -316,4 +465,12 @@ def create_logger(
     # set handler
     logger_instance.set_handler("default", stream or stdout, formatter_instance())
 
+    if queue_mode is None:
+        queue_mode = config.log_queue.enabled
+    if queue_mode:
+        logger_instance.enable_queue_mode(
+            max_queue_size=int(config.log_queue.max_size),
+            drop_policy=config.log_queue.drop_policy,
+        )
+
     return logger_instance
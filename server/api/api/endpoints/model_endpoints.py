@@ -188,6 +188,8 @@ async def list_model_endpoints(
     metrics: list[str] = Query([], alias="metric"),
     top_level: bool = Query(False, alias="top-level"),
     uids: list[str] = Query(None, alias="uid"),
+    limit: Optional[int] = Query(None, gt=0),
+    after: Optional[str] = Query(None),
     auth_info: schemas.AuthInfo = Depends(server.api.api.deps.authenticate_request),
 ) -> schemas.ModelEndpointList:
     """
@@ -209,6 +211,9 @@ async def list_model_endpoints(
     api/projects/{project}/model-endpoints/?label=mylabel=1,myotherlabel=2
     Top level: if true will return only routers and endpoint that are NOT children of any router
 
+    The endpoints can be paginated by their uid, the next page starts after the uid of the last endpoint of the page:
+    api/projects/{project}/model-endpoints/?limit=100&after=<last-uid>
+
     :param auth_info: The auth info of the request.
     :param project:   The name of the project.
     :param model:     The name of the model to filter by.
@@ -227,6 +232,8 @@ async def list_model_endpoints(
                       `m` = minutes, `h` = hours, `'d'` = days, and `'s'` = seconds), or 0 for the earliest time.
     :param top_level: If True will return only routers and endpoint that are NOT children of any router.
     :param uids:      Will return `ModelEndpointList` of endpoints with uid in uids.
+    :param limit:     The max number of endpoints to return, the endpoints are then ordered by their uid.
+    :param after:     Return only the endpoints whose uid is greater than this uid.
 
     :return: An object of `ModelEndpointList` which is literally a list of model endpoints along with some metadata. To
              get a standard list of model endpoints use ModelEndpointList.endpoints.
@@ -249,6 +256,8 @@ async def list_model_endpoints(
         end=end,
         top_level=top_level,
         uids=uids,
+        limit=limit,
+        after=after,
     )
     allowed_endpoints = await server.api.utils.auth.verifier.AuthVerifier().filter_project_resources_by_permissions(
         schemas.AuthorizationResourceTypes.model_endpoint,
@@ -220,6 +220,7 @@ async def list_runs(
     page: int = Query(None, gt=0),
     page_size: int = Query(None, alias="page-size", gt=0),
     page_token: str = Query(None, alias="page-token"),
+    fields: list[str] = Query([], alias="field"),
     auth_info: mlrun.common.schemas.AuthInfo = Depends(deps.authenticate_request),
     db_session: Session = Depends(deps.get_db_session),
 ):
@@ -230,6 +231,10 @@ async def list_runs(
             auth_info,
         )
 
+    if fields:
+        # the project and uid are required for the permissions filtering
+        fields = fields + [field for field in ["project", "uid"] if field not in fields]
+
     paginator = server.api.utils.pagination.Paginator()
 
     async def _filter_runs(_runs):
@@ -269,6 +274,7 @@ async def list_runs(
         partition_order=partition_order,
         max_partitions=max_partitions,
         with_notifications=with_notifications,
+        fields=fields or None,
     )
     return {
         "runs": runs,
@@ -183,6 +183,10 @@ class MonitoringDeployment:
         Deploy model monitoring application controller function.
         The main goal of the controller function is to handle the monitoring processing and triggering applications.
         The controller is self triggered by a cron. It also has the default HTTP trigger.
+        When `mlrun.mlconf.model_endpoint_monitoring.controller_shards` is larger than 1, the controller has a cron
+        trigger per shard and each trigger processes its shard of the model endpoints. Nuclio cron triggers fire in
+        every replica, so the controller runs in a single replica (the shards run concurrently within it). Every
+        trigger has a single worker (a nuclio worker is a process), so the cron runs of a shard never overlap.
 
         :param base_period:                 The time period in minutes in which the model monitoring controller function
                                             triggers. By default, the base period is 10 minutes.
@@ -215,10 +219,28 @@ class MonitoringDeployment:
                 json.dumps(batch_dict),
             )
 
-            fn.add_trigger(
-                "cron_interval",
-                spec=nuclio.CronTrigger(interval=f"{base_period}m"),
-            )
+            shards_count = int(mlrun.mlconf.model_endpoint_monitoring.controller_shards)
+            if shards_count > 1:
+                # a cron trigger per shard, each shard processes part of the model endpoints. the function
+                # is limited to a single replica, otherwise each replica would process all the shards
+                fn.spec.min_replicas = fn.spec.max_replicas = 1
+                for shard in range(shards_count):
+                    fn.add_trigger(
+                        f"cron_interval_{shard}",
+                        spec=self._get_controller_cron_trigger(
+                            base_period,
+                            body=json.dumps(
+                                {"shard": shard, "shards_count": shards_count}
+                            ),
+                        ),
+                    )
+            else:
+                fn.add_trigger(
+                    "cron_interval",
+                    spec=self._get_controller_cron_trigger(base_period),
+                )
+            # the manual (HTTP) runs are handled by a single worker as well
+            fn.with_http(workers=1)
             fn, ready = server.api.utils.functions.build_function(
                 db_session=self.db_session, auth_info=self.auth_info, function=fn
             )
@@ -229,6 +251,16 @@ class MonitoringDeployment:
                 controller_ready=ready,
             )
 
+    @staticmethod
+    def _get_controller_cron_trigger(
+        base_period: int, body: typing.Optional[str] = None
+    ) -> nuclio.CronTrigger:
+        """cron trigger of the controller with a single worker, the runs of the shard are serialized by the
+        controller within the worker process (a nuclio worker is a process, the lock is not shared)"""
+        trigger = nuclio.CronTrigger(interval=f"{base_period}m", body=body)
+        trigger._struct["maxWorkers"] = 1
+        return trigger
+
     def deploy_model_monitoring_writer_application(
         self, writer_image: str = "mlrun/mlrun", overwrite: bool = False
     ) -> None:
@@ -359,6 +391,8 @@ class MonitoringDeployment:
                 parquet_batching_timeout_secs=self._max_parquet_save_interval,
                 parquet_target=parquet_target,
                 model_monitoring_access_key=self.model_monitoring_access_key,
+                columnar=mlrun.mlconf.model_endpoint_monitoring.stream_processing_mode
+                == mm_constants.StreamProcessingMode.COLUMNAR,
             )
         )
 
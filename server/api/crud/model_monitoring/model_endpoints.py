@@ -401,6 +401,8 @@ class ModelEndpoints:
         end: str = "now",
         top_level: bool = False,
         uids: list[str] = None,
+        limit: typing.Optional[int] = None,
+        after: typing.Optional[str] = None,
     ) -> mlrun.common.schemas.ModelEndpointList:
         """
         Returns a list of `ModelEndpoint` objects, wrapped in `ModelEndpointList` object. Each `ModelEndpoint`
@@ -434,6 +436,8 @@ class ModelEndpoints:
                           = minutes, `h` = hours, and `'d'` = days), or 0 for the earliest time.
         :param top_level: If True, return only routers and endpoints that are NOT children of any router.
         :param uids:      List of model endpoint unique ids to include in the result.
+        :param limit:     The max number of endpoints to return, the endpoints are then ordered by their uid.
+        :param after:     Return only the endpoints whose uid is greater than this uid (keyset pagination).
 
         :return: An object of `ModelEndpointList` which is literally a list of model endpoints along with some metadata.
                  To get a standard list of model endpoints use `ModelEndpointList.endpoints`.
@@ -450,6 +454,8 @@ class ModelEndpoints:
             end=end,
             top_level=top_level,
             uids=uids,
+            limit=limit,
+            after=after,
         )
 
         # Initialize an empty model endpoints list
@@ -462,6 +468,8 @@ class ModelEndpoints:
                 labels=labels,
                 top_level=top_level,
                 uids=uids,
+                limit=limit,
+                after=after,
             )
         else:
             endpoint_dictionary_list = []
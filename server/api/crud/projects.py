@@ -36,6 +36,7 @@ import server.api.utils.events.events_factory as events_factory
 import server.api.utils.projects.remotes.follower as project_follower
 import server.api.utils.singletons.db
 import server.api.utils.singletons.scheduler
+import server.api.utils.time_window_tracker
 from mlrun.utils import logger, retry_until_successful
 from server.api.utils.singletons.k8s import get_k8s_helper
 
@@ -360,14 +361,33 @@ class Projects(
     async def refresh_project_resources_counters_cache(
         self, session: sqlalchemy.orm.Session
     ):
-        projects_output = await fastapi.concurrency.run_in_threadpool(
-            self.list_projects,
-            session,
-            format_=mlrun.common.formatters.ProjectFormat.name_only,
-        )
+        """
+        Refresh the project summaries. Only the summaries of the projects which changed since the last refresh (or
+        their recent counters are due to change) are recalculated, all of them are recalculated once per
+        mlrun.mlconf.monitoring.projects.summaries.full_reconcile_interval.
+        The pipelines counters are not tracked in the DB and are refreshed for all the projects.
+        """
+        db = server.api.utils.singletons.db.get_db()
+        calculation_started = datetime.datetime.now(datetime.timezone.utc)
+        full_reconcile = await fastapi.concurrency.run_in_threadpool(
+            self._is_project_summaries_reconcile_due, session, calculation_started
+        )
+        if full_reconcile:
+            projects_output = await fastapi.concurrency.run_in_threadpool(
+                self.list_projects,
+                session,
+                format_=mlrun.common.formatters.ProjectFormat.name_only,
+            )
+            recalculated_projects = projects_output.projects
+        else:
+            recalculated_projects = await fastapi.concurrency.run_in_threadpool(
+                db.list_outdated_project_summaries, session, calculation_started
+            )
 
         project_counters, pipeline_counters = await asyncio.gather(
-            server.api.utils.singletons.db.get_db().get_project_resources_counters(),
+            self._calculate_project_resources_counters(
+                None if full_reconcile else recalculated_projects
+            ),
             self._calculate_pipelines_counters(),
         )
         (
@@ -388,7 +408,7 @@ class Projects(
         ) = pipeline_counters
 
         project_summaries = []
-        for project_name in projects_output.projects:
+        for project_name in recalculated_projects:
             project_summaries.append(
                 mlrun.common.schemas.ProjectSummary(
                     name=project_name,
@@ -428,11 +448,99 @@ class Projects(
                     ],
                 )
             )
+
+        if not full_reconcile:
+            project_summaries += await fastapi.concurrency.run_in_threadpool(
+                self._list_project_summaries_with_changed_pipelines,
+                session,
+                recalculated_projects,
+                pipeline_counters,
+            )
+
         await fastapi.concurrency.run_in_threadpool(
-            server.api.utils.singletons.db.get_db().refresh_project_summaries,
+            db.refresh_project_summaries,
             session,
             project_summaries,
+            recalculated_projects,
+            calculation_started,
+        )
+        if full_reconcile:
+            await fastapi.concurrency.run_in_threadpool(
+                server.api.utils.time_window_tracker.TimeWindowTracker(
+                    key=server.api.utils.time_window_tracker.TimeWindowTrackerKeys.project_summaries_reconcile,
+                ).update_window,
+                session,
+                calculation_started,
+            )
+
+    @staticmethod
+    def _is_project_summaries_reconcile_due(
+        session: sqlalchemy.orm.Session, now: datetime.datetime
+    ) -> bool:
+        interval = int(
+            mlrun.mlconf.monitoring.projects.summaries.full_reconcile_interval
+        )
+        if interval <= 0:
+            return True
+        reconcile_tracker = server.api.utils.time_window_tracker.TimeWindowTracker(
+            key=server.api.utils.time_window_tracker.TimeWindowTrackerKeys.project_summaries_reconcile,
         )
+        try:
+            last_reconcile = reconcile_tracker.get_window(session)
+        except mlrun.errors.MLRunNotFoundError:
+            return True
+        return now - last_reconcile >= datetime.timedelta(seconds=interval)
+
+    @staticmethod
+    async def _calculate_project_resources_counters(
+        projects: typing.Optional[list[str]],
+    ) -> tuple[dict[str, int], ...]:
+        # projects=None calculates the counters of all the projects
+        if projects is not None and not projects:
+            return tuple({} for _ in range(9))
+        return await server.api.utils.singletons.db.get_db().get_project_resources_counters(
+            projects
+        )
+
+    @staticmethod
+    def _list_project_summaries_with_changed_pipelines(
+        session: sqlalchemy.orm.Session,
+        recalculated_projects: list[str],
+        pipeline_counters: tuple[dict, dict, dict],
+    ) -> list[mlrun.common.schemas.ProjectSummary]:
+        """
+        List the summaries (of the projects which were not recalculated) which their pipelines counters changed
+        """
+        (
+            project_to_recent_completed_pipelines_count,
+            project_to_recent_failed_pipelines_count,
+            project_to_running_pipelines_count,
+        ) = pipeline_counters
+        project_summaries = []
+        for (
+            project_summary
+        ) in server.api.utils.singletons.db.get_db().list_project_summaries(session):
+            if project_summary.name in recalculated_projects:
+                continue
+            pipelines_counters = {
+                "pipelines_completed_recent_count": project_to_recent_completed_pipelines_count[
+                    project_summary.name
+                ],
+                "pipelines_failed_recent_count": project_to_recent_failed_pipelines_count[
+                    project_summary.name
+                ],
+                "pipelines_running_count": project_to_running_pipelines_count[
+                    project_summary.name
+                ],
+            }
+            if any(
+                getattr(project_summary, key) != value
+                for key, value in pipelines_counters.items()
+            ):
+                project_summaries.append(
+                    project_summary.copy(update={**pipelines_counters, "updated": None})
+                )
+        return project_summaries
 
     @staticmethod
     def _list_pipelines(
@@ -172,7 +172,8 @@ class Runs(
         with_notifications: bool = False,
         page: typing.Optional[int] = None,
         page_size: typing.Optional[int] = None,
-    ) -> mlrun.lists.RunList:
+        fields: typing.Optional[list[str]] = None,
+    ) -> typing.Union[mlrun.lists.RunList, list[dict]]:
         project = project or mlrun.mlconf.default_project
         if (
             not name
@@ -235,6 +236,7 @@ class Runs(
             with_notifications=with_notifications,
             page=page,
             page_size=page_size,
+            fields=fields,
         )
 
     async def delete_run(
@@ -132,7 +132,30 @@ class DBInterface(ABC):
         with_notifications: bool = False,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
-    ) -> mlrun.lists.RunList:
+        fields: Optional[list[str]] = None,
+    ) -> Union[mlrun.lists.RunList, list[dict]]:
+        pass
+
+    @abstractmethod
+    def iterate_runs(
+        self,
+        session,
+        name: Optional[str] = None,
+        uid: Optional[Union[str, list[str]]] = None,
+        project: str = "",
+        labels: Optional[Union[str, list[str]]] = None,
+        states: Optional[list[str]] = None,
+        sort: bool = True,
+        last: int = 0,
+        iter: bool = False,
+        start_time_from: datetime.datetime = None,
+        start_time_to: datetime.datetime = None,
+        last_update_time_from: datetime.datetime = None,
+        last_update_time_to: datetime.datetime = None,
+        requested_logs: bool = None,
+        fields: Optional[list[str]] = None,
+        batch_size: Optional[int] = None,
+    ):
         pass
 
     @abstractmethod
@@ -499,6 +522,7 @@ class DBInterface(ABC):
     @abstractmethod
     async def get_project_resources_counters(
         self,
+        projects: Optional[list[str]] = None,
     ) -> tuple[
         dict[str, int],
         dict[str, int],
@@ -556,8 +580,17 @@ class DBInterface(ABC):
     ):
         pass
 
+    def list_outdated_project_summaries(
+        self, session, now: Optional[datetime.datetime] = None
+    ) -> list[str]:
+        pass
+
     def refresh_project_summaries(
-        self, session, project_summaries: list[mlrun.common.schemas.ProjectSummary]
+        self,
+        session,
+        project_summaries: list[mlrun.common.schemas.ProjectSummary],
+        recalculated_projects: Optional[list[str]] = None,
+        calculation_started: Optional[datetime.datetime] = None,
     ):
         pass
 
@@ -18,6 +18,7 @@ import functools
 import hashlib
 import pathlib
 import re
+import threading
 import typing
 import urllib.parse
 from copy import deepcopy
@@ -27,7 +28,19 @@ from typing import Any
 import fastapi.concurrency
 import mergedeep
 import pytz
-from sqlalchemy import MetaData, and_, case, delete, distinct, func, or_, select, text
+from sqlalchemy import (
+    MetaData,
+    and_,
+    case,
+    delete,
+    distinct,
+    event,
+    func,
+    or_,
+    select,
+    text,
+    true,
+)
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import Session, aliased
@@ -41,6 +54,7 @@ import mlrun.common.types
 import mlrun.errors
 import mlrun.k8s_utils
 import mlrun.model
+import mlrun.utils.db
 import server.api.crud
 import server.api.db.session
 import server.api.utils.helpers
@@ -71,8 +85,11 @@ from server.api.db.sqldb.helpers import (
     generate_query_predicate_for_name,
     label_set,
     run_labels,
+    run_projection_fields,
     run_start_time,
     run_state,
+    run_summary,
+    run_summary_fields,
     update_labels,
 )
 from server.api.db.sqldb.models import (
@@ -161,9 +178,21 @@ def retry_on_conflict(function):
 
 
 class SQLDB(DBInterface):
+    # the object bodies which are encoded with mlrun.utils.db.encode_body, mapped to their column attribute
+    _encoded_body_attributes = {
+        Run: "body",
+        Function: "body",
+        ArtifactV2: "_full_object",
+        Project: "_full_object",
+        Schedule: "struct",
+    }
+
     def __init__(self, dsn=""):
         self.dsn = dsn
         self._name_with_iter_regex = re.compile("^[0-9]+-.+$")
+        # the last time each project summary was marked as changed by this instance (see _mark_project_summary_changed)
+        self._project_summary_marks: dict[str, datetime] = {}
+        self._project_summary_marks_lock = threading.Lock()
 
     def initialize(self, session):
         if self.dsn and self.dsn.startswith("sqlite:///"):
@@ -216,6 +245,7 @@ class SQLDB(DBInterface):
         )
         # Do not lock run as it may cause deadlocks
         run = self._get_run(session, uid, project, iter)
+        previous_state = run.state if run else None
         now = datetime.now(timezone.utc)
         if not run:
             run = Run(
@@ -228,6 +258,8 @@ class SQLDB(DBInterface):
                 requested_logs=False,
             )
         self._enrich_run_model(now, run, run_data)
+        if run.state != previous_state:
+            self._mark_project_summary_changed(session, project)
         self._upsert(session, [run], ignore=True)
 
     def create_or_get_run(
@@ -262,6 +294,7 @@ class SQLDB(DBInterface):
             requested_logs=False,
         )
         self._enrich_run_model(now, run, run_data)
+        self._mark_project_summary_changed(session, project)
         try:
             self._upsert(session, [run], silent=True)
         except mlrun.errors.MLRunConflictError:
@@ -279,6 +312,7 @@ class SQLDB(DBInterface):
         for key, val in updates.items():
             update_in(struct, key, val)
         self._ensure_run_name_on_update(run, struct)
+        previous_state = run.state
         self._update_run_state(run, struct)
         start_time = run_start_time(struct)
         if start_time:
@@ -288,7 +322,9 @@ class SQLDB(DBInterface):
         if run_labels(updates):
             update_labels(run, run_labels(struct))
         self._update_run_updated_time(run, struct)
-        run.struct = struct
+        self._set_run_struct(run, struct)
+        if run.state != previous_state:
+            self._mark_project_summary_changed(session, project)
         self._upsert(session, [run])
         self._delete_empty_labels(session, Run.Label)
         return run.struct
@@ -416,7 +452,130 @@ class SQLDB(DBInterface):
         with_notifications: bool = False,
         page: typing.Optional[int] = None,
         page_size: typing.Optional[int] = None,
-    ) -> RunList:
+        fields: typing.Optional[list[str]] = None,
+    ) -> typing.Union[RunList, list[dict]]:
+        """
+        List runs
+
+        :param fields: Optional list of run fields to return (see helpers.run_projection_fields), e.g.
+                       ["name", "uid", "state", "start_time", "labels", "results"]. When given, partial run
+                       structs with only these fields are returned, they are read from the runs table columns
+                       without loading the run bodies. Not supported with with_notifications.
+        """
+        if fields and with_notifications:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Listing runs with specific fields does not support with_notifications"
+            )
+        query = self._list_runs_query(
+            session,
+            name=name,
+            uid=uid,
+            project=project,
+            labels=labels,
+            states=states,
+            sort=sort,
+            last=last,
+            iter=iter,
+            start_time_from=start_time_from,
+            start_time_to=start_time_to,
+            last_update_time_from=last_update_time_from,
+            last_update_time_to=last_update_time_to,
+            partition_by=partition_by,
+            rows_per_partition=rows_per_partition,
+            partition_sort_by=partition_sort_by,
+            partition_order=partition_order,
+            max_partitions=max_partitions,
+            requested_logs=requested_logs,
+            with_notifications=with_notifications,
+        )
+        query = self._paginate_query(query, page, page_size)
+
+        if fields:
+            return list(self._iterate_run_projections(query, fields))
+
+        if not return_as_run_structs:
+            return query.all()
+
+        runs = RunList()
+        for run in query:
+            run_struct = run.struct
+            if with_notifications:
+                self._fill_run_struct_with_notifications(run.notifications, run_struct)
+            runs.append(run_struct)
+
+        return runs
+
+    def iterate_runs(
+        self,
+        session,
+        name: typing.Optional[str] = None,
+        uid: typing.Optional[typing.Union[str, list[str]]] = None,
+        project: str = "",
+        labels: typing.Optional[typing.Union[str, list[str]]] = None,
+        states: typing.Optional[list[mlrun.common.runtimes.constants.RunStates]] = None,
+        sort: bool = True,
+        last: int = 0,
+        iter: bool = False,
+        start_time_from: datetime = None,
+        start_time_to: datetime = None,
+        last_update_time_from: datetime = None,
+        last_update_time_to: datetime = None,
+        requested_logs: bool = None,
+        fields: typing.Optional[list[str]] = None,
+        batch_size: typing.Optional[int] = None,
+    ) -> typing.Iterator[dict]:
+        """
+        Same as list_runs, but yields the runs while they are fetched from a server side cursor in batches of
+        batch_size rows (defaults to mlrun.mlconf.httpdb.db.runs_stream_batch_size), so listing many runs does not
+        hold all of them in memory. Note that the session is used until the iteration completes.
+        """
+        batch_size = batch_size or int(config.httpdb.db.runs_stream_batch_size)
+        query = self._list_runs_query(
+            session,
+            name=name,
+            uid=uid,
+            project=project,
+            labels=labels,
+            states=states,
+            sort=sort,
+            last=last,
+            iter=iter,
+            start_time_from=start_time_from,
+            start_time_to=start_time_to,
+            last_update_time_from=last_update_time_from,
+            last_update_time_to=last_update_time_to,
+            requested_logs=requested_logs,
+        )
+        if fields:
+            yield from self._iterate_run_projections(query, fields, batch_size)
+            return
+
+        for run in query.yield_per(batch_size):
+            yield run.struct
+
+    def _list_runs_query(
+        self,
+        session,
+        name: typing.Optional[str] = None,
+        uid: typing.Optional[typing.Union[str, list[str]]] = None,
+        project: str = "",
+        labels: typing.Optional[typing.Union[str, list[str]]] = None,
+        states: typing.Optional[list[mlrun.common.runtimes.constants.RunStates]] = None,
+        sort: bool = True,
+        last: int = 0,
+        iter: bool = False,
+        start_time_from: datetime = None,
+        start_time_to: datetime = None,
+        last_update_time_from: datetime = None,
+        last_update_time_to: datetime = None,
+        partition_by: mlrun.common.schemas.RunPartitionByField = None,
+        rows_per_partition: int = 1,
+        partition_sort_by: mlrun.common.schemas.SortField = None,
+        partition_order: mlrun.common.schemas.OrderType = mlrun.common.schemas.OrderType.desc,
+        max_partitions: int = 0,
+        requested_logs: bool = None,
+        with_notifications: bool = False,
+    ):
         project = project or config.default_project
         query = self._find_runs(session, uid, project, labels)
         if name is not None:
@@ -462,23 +621,69 @@ class SQLDB(DBInterface):
                 partition_order,
                 max_partitions,
             )
+        return query
 
-        query = self._paginate_query(query, page, page_size)
-
-        if not return_as_run_structs:
-            return query.all()
-
-        runs = RunList()
-        for run in query:
-            run_struct = run.struct
-            if with_notifications:
-                self._fill_run_struct_with_notifications(run.notifications, run_struct)
-            runs.append(run_struct)
-
-        return runs
+    def _iterate_run_projections(
+        self, query, fields: list[str], batch_size: int = None
+    ) -> typing.Iterator[dict]:
+        unknown_fields = set(fields) - run_projection_fields.keys()
+        if unknown_fields:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"Unsupported run fields {sorted(unknown_fields)}, "
+                f"supported fields are {list(run_projection_fields.keys())}"
+            )
+        column_fields = [field for field in fields if field not in run_summary_fields]
+        summary_fields = [field for field in fields if field in run_summary_fields]
+        columns = {
+            "name": Run.name,
+            "uid": Run.uid,
+            "project": Run.project,
+            "iteration": Run.iteration,
+            "state": Run.state,
+            "start_time": Run.start_time,
+            "last_update": Run.updated,
+        }
+        # the body is fetched only for runs which were stored before the summary column was added (and were
+        # not migrated yet), the summary is computed from their body
+        legacy_body = case((Run.summary.is_(None), Run.body), else_=None)
+        query = query.with_entities(
+            Run.summary, legacy_body, *[columns[field] for field in column_fields]
+        )
+        if batch_size:
+            query = query.yield_per(batch_size)
+        for summary, body, *values in query:
+            if summary is None and summary_fields:
+                summary = run_summary(Run.body_to_struct(body)) if body else {}
+            run_struct = {}
+            for field, value in zip(column_fields, values):
+                if isinstance(value, datetime):
+                    value = self._add_utc_timezone(value).isoformat()
+                update_in(run_struct, run_projection_fields[field], value)
+            for field in summary_fields:
+                update_in(run_struct, run_projection_fields[field], summary.get(field))
+            yield run_struct
+
+    def align_run_summaries(self, session, batch_size: int = 1000):
+        """fill the summary column of runs which were stored before it was added"""
+        last_id = 0
+        while True:
+            runs = (
+                self._query(session, Run)
+                .filter(Run.summary.is_(None), Run.id > last_id)
+                .order_by(Run.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not runs:
+                return
+            for run in runs:
+                run.summary = run_summary(run.struct)
+            self._upsert(session, runs)
+            last_id = runs[-1].id
 
     def del_run(self, session, uid, project=None, iter=0):
         project = project or config.default_project
+        self._mark_project_summary_changed(session, project)
         # We currently delete *all* iterations
         self._delete(session, Run, uid=uid, project=project)
 
@@ -496,6 +701,7 @@ class SQLDB(DBInterface):
             query = query.filter(Run.state == state)
         for run in query:  # Can not use query.delete with join
             session.delete(run)
+        self._mark_project_summary_changed(session, project)
         session.commit()
 
     def _fill_run_struct_with_notifications(self, notifications, run_struct):
@@ -526,7 +732,12 @@ class SQLDB(DBInterface):
         run_data.setdefault("status", {})["start_time"] = start_time.isoformat()
         run.start_time = start_time
         self._update_run_updated_time(run, run_data, now=now)
+        self._set_run_struct(run, run_data)
+
+    @staticmethod
+    def _set_run_struct(run: Run, run_data: dict):
         run.struct = run_data
+        run.summary = run_summary(run_data)
 
     def _add_run_name_query(self, query, name):
         exact_name = self._escape_characters_for_like_query(name)
@@ -707,6 +918,7 @@ class SQLDB(DBInterface):
             producer_id,
         )
 
+        self._mark_project_summary_changed(session, project)
         self._upsert(session, [db_artifact])
         if tag:
             validate_tag_name(tag, "artifact.metadata.tag")
@@ -903,6 +1115,7 @@ class SQLDB(DBInterface):
         self, session, key, tag="", project="", uid=None, producer_id=None, iter=None
     ):
         project = project or config.default_project
+        self._mark_project_summary_changed(session, project)
         self._delete_tagged_object(
             session,
             ArtifactV2,
@@ -955,6 +1168,7 @@ class SQLDB(DBInterface):
                 artifact_column_identifier, []
             ).append(column_value)
 
+        self._mark_project_summary_changed(session, project)
         failed_deletions_count = 0
         for (
             artifact_column_identifier,
@@ -2244,6 +2458,7 @@ class SQLDB(DBInterface):
             concurrency_limit=schedule_record.concurrency_limit,
             next_run_time=schedule_record.next_run_time,
         )
+        self._mark_project_summary_changed(session, project)
         self._upsert(session, [schedule_record])
 
         schedule = self._transform_schedule_record_to_scheme(schedule_record)
@@ -2316,6 +2531,7 @@ class SQLDB(DBInterface):
             concurrency_limit=concurrency_limit,
             next_run_time=next_run_time,
         )
+        self._mark_project_summary_changed(session, project)
         self._upsert(session, [schedule])
 
     @staticmethod
@@ -2393,6 +2609,7 @@ class SQLDB(DBInterface):
         self._delete_class_labels(
             session, Schedule, project=project, name=name, commit=False
         )
+        self._mark_project_summary_changed(session, project)
         self._delete(session, Schedule, project=project, name=name)
 
     def delete_project_schedules(self, session: Session, project: str):
@@ -2410,6 +2627,7 @@ class SQLDB(DBInterface):
         self, session: Session, project: str, names: typing.Union[str, list[str]]
     ) -> None:
         logger.debug("Removing schedules from db", project=project, name=names)
+        self._mark_project_summary_changed(session, project)
         self._delete_multi_objects(
             session=session,
             main_table=Schedule,
@@ -2805,15 +3023,36 @@ class SQLDB(DBInterface):
 
         return project_summaries_results
 
+    def list_outdated_project_summaries(
+        self, session: Session, now: typing.Optional[datetime] = None
+    ) -> list[str]:
+        """
+        List the projects which their summary should be recalculated - an object counted in the summary changed, or
+        the time windowed counters (e.g. recent runs) are due to change.
+        """
+        now = now or datetime.now(timezone.utc)
+        query = session.query(ProjectSummary.project).filter(
+            or_(
+                ProjectSummary.changed.is_not(None),
+                ProjectSummary.recalculate_at <= now,
+            )
+        )
+        return [project for (project,) in query]
+
     def refresh_project_summaries(
         self,
         session: Session,
         project_summaries: list[mlrun.common.schemas.ProjectSummary],
+        recalculated_projects: typing.Optional[list[str]] = None,
+        calculation_started: typing.Optional[datetime] = None,
     ):
         """
         This method updates the summaries of projects that have associated projects in the database
         and removes project summaries that no longer have associated projects.
+        The summaries of the recalculated projects (defaults to all the given summaries) are marked as up-to-date,
+        unless they changed after the calculation started.
         """
+        calculation_started = calculation_started or datetime.now(timezone.utc)
 
         summary_dicts = {summary.name: summary.dict() for summary in project_summaries}
 
@@ -2830,10 +3069,23 @@ class SQLDB(DBInterface):
 
         orphaned_summaries = existing_summaries_query.filter(Project.id.is_(None)).all()
 
+        if recalculated_projects is None:
+            recalculated_projects = list(summary_dicts.keys())
+        self._clear_project_summaries_changes(
+            session, recalculated_projects, calculation_started
+        )
+        recalculation_times = self._calculate_project_summaries_recalculation_times(
+            session, recalculated_projects
+        )
+
         # Update the summaries of projects that have associated projects
         for project_summary in associated_summaries:
             project_summary.summary = summary_dicts.get(project_summary.project)
             project_summary.updated = datetime.now(timezone.utc)
+            if project_summary.project in recalculated_projects:
+                project_summary.recalculate_at = recalculation_times.get(
+                    project_summary.project
+                )
             session.add(project_summary)
 
         # To avoid race conditions where a project might be deleted after its summary is queried
@@ -2851,6 +3103,87 @@ class SQLDB(DBInterface):
 
         self._commit(session, associated_summaries + orphaned_summaries)
 
+    def _clear_project_summaries_changes(
+        self, session: Session, projects: list[str], calculation_started: datetime
+    ):
+        # a change which was marked after the calculation started may not be counted, so it is kept for the next
+        # refresh. changes are marked once per resolution (see _mark_project_summary_changed), therefore a mark
+        # within the last resolution before the calculation started might stand for a later change as well
+        if not projects:
+            return
+        resolution = timedelta(
+            seconds=int(config.monitoring.projects.summaries.changes_resolution)
+        )
+        with self._project_summary_marks_lock:
+            for project in projects:
+                self._project_summary_marks.pop(project, None)
+        session.query(ProjectSummary).filter(
+            ProjectSummary.project.in_(projects),
+            ProjectSummary.changed <= calculation_started - resolution,
+        ).update({ProjectSummary.changed: None}, synchronize_session=False)
+
+    @staticmethod
+    def _calculate_project_summaries_recalculation_times(
+        session: Session, projects: list[str]
+    ) -> dict[str, datetime]:
+        """
+        The recent runs and pending schedules counters are calculated over a sliding 24 hours window, so they change
+        when a counted run leaves the window or a schedule enters/leaves it, without any object change.
+        Calculate the earliest time that happens at, per project.
+        """
+        window = timedelta(hours=24)
+        recalculation_times = {}
+
+        def _update_recalculation_time(project_name: str, recalculation_time):
+            recalculation_time = SQLDB._add_utc_timezone(recalculation_time)
+            if project_name in recalculation_times:
+                recalculation_time = min(
+                    recalculation_time, recalculation_times[project_name]
+                )
+            recalculation_times[project_name] = recalculation_time
+
+        if not projects:
+            return recalculation_times
+
+        # the earliest counted recent run leaves the window 24 hours after it started (same window as the counters)
+        one_day_ago = datetime.now() - window
+        earliest_recent_runs = (
+            session.query(Run.project, func.min(Run.start_time))
+            .filter(Run.project.in_(projects))
+            .filter(
+                Run.state.in_(
+                    [
+                        mlrun.common.runtimes.constants.RunStates.completed,
+                        mlrun.common.runtimes.constants.RunStates.error,
+                        mlrun.common.runtimes.constants.RunStates.aborted,
+                    ]
+                )
+            )
+            .filter(Run.start_time >= one_day_ago)
+            .group_by(Run.project)
+        )
+        for project_name, start_time in earliest_recent_runs:
+            _update_recalculation_time(project_name, start_time + window)
+
+        # pending schedules leave the window when they are due, later schedules enter it 24 hours before they are due
+        now = datetime.now(timezone.utc)
+        next_day = now + window
+        for window_filter, offset in [
+            (Schedule.next_run_time < next_day, timedelta()),
+            (Schedule.next_run_time >= next_day, window),
+        ]:
+            earliest_schedules = (
+                session.query(Schedule.project, func.min(Schedule.next_run_time))
+                .filter(Schedule.project.in_(projects))
+                .filter(Schedule.next_run_time >= now)
+                .filter(window_filter)
+                .group_by(Schedule.project)
+            )
+            for project_name, next_run_time in earliest_schedules:
+                _update_recalculation_time(project_name, next_run_time - offset)
+
+        return recalculation_times
+
     def _delete_project_summary(
         self,
         session: Session,
@@ -2859,8 +3192,58 @@ class SQLDB(DBInterface):
         logger.debug("Deleting project summary from DB", name=name)
         self._delete(session, ProjectSummary, project=name)
 
+    def _mark_project_summary_changed(self, session: Session, project: str):
+        """
+        Mark the project summary as changed, so the next summaries refresh recalculates the project counters.
+        To avoid writing the summary record on every change, the mark is only updated once per changes resolution
+        (see refresh_project_summaries for the matching clearing condition). An instance which wrote the project mark
+        within the last resolution skips the update, as that mark is cleared only by a refresh which started at least
+        a resolution after it, and therefore counts the current change as well.
+        The mark is committed by the caller with the change itself, so it must be called before the caller commits.
+        """
+        if not project:
+            return
+        now = datetime.now(timezone.utc)
+        resolution = timedelta(
+            seconds=int(config.monitoring.projects.summaries.changes_resolution)
+        )
+        with self._project_summary_marks_lock:
+            last_mark = self._project_summary_marks.get(project)
+        if last_mark and last_mark > now - resolution:
+            return
+        query = session.query(ProjectSummary).filter(
+            or_(
+                ProjectSummary.changed.is_(None),
+                ProjectSummary.changed < now - resolution,
+            )
+        )
+        if project != "*":
+            query = query.filter(ProjectSummary.project == project)
+        updated = query.update({ProjectSummary.changed: now}, synchronize_session=False)
+        session.flush()
+        if updated and project != "*":
+            self._record_project_summary_mark_on_commit(session, project, now)
+
+    def _record_project_summary_mark_on_commit(
+        self, session: Session, project: str, mark: datetime
+    ):
+        """record the project mark of this instance when the caller's transaction is committed (a rolled back mark
+        is not recorded, so the next change writes it again)"""
+
+        def _on_commit(_):
+            with self._project_summary_marks_lock:
+                self._project_summary_marks[project] = mark
+
+        def _on_transaction_end(*_):
+            # the transaction was committed (after_commit was already called), rolled back or closed
+            event.remove(session, "after_commit", _on_commit)
+
+        event.listen(session, "after_commit", _on_commit, once=True)
+        event.listen(session, "after_transaction_end", _on_transaction_end, once=True)
+
     async def get_project_resources_counters(
         self,
+        projects: typing.Optional[list[str]] = None,
     ) -> tuple[
         dict[str, int],
         dict[str, int],
@@ -2876,22 +3259,27 @@ class SQLDB(DBInterface):
             fastapi.concurrency.run_in_threadpool(
                 server.api.db.session.run_function_with_new_db_session,
                 self._calculate_files_counters,
+                projects,
             ),
             fastapi.concurrency.run_in_threadpool(
                 server.api.db.session.run_function_with_new_db_session,
                 self._calculate_schedules_counters,
+                projects,
             ),
             fastapi.concurrency.run_in_threadpool(
                 server.api.db.session.run_function_with_new_db_session,
                 self._calculate_feature_sets_counters,
+                projects,
             ),
             fastapi.concurrency.run_in_threadpool(
                 server.api.db.session.run_function_with_new_db_session,
                 self._calculate_models_counters,
+                projects,
             ),
             fastapi.concurrency.run_in_threadpool(
                 server.api.db.session.run_function_with_new_db_session,
                 self._calculate_runs_counters,
+                projects,
             ),
         )
         (
@@ -2921,6 +3309,15 @@ class SQLDB(DBInterface):
             project_to_running_runs_count,
         )
 
+    @staticmethod
+    def _projects_filter(model, projects: typing.Optional[list[str]] = None):
+        """
+        Filter the model records by the given projects, None doesn't filter (all projects)
+        """
+        if projects is None:
+            return true()
+        return model.project.in_(projects)
+
     @staticmethod
     def _calculate_functions_counters(session) -> dict[str, int]:
         functions_count_per_project = (
@@ -2936,9 +3333,11 @@ class SQLDB(DBInterface):
     @staticmethod
     def _calculate_schedules_counters(
         session,
+        projects: typing.Optional[list[str]] = None,
     ) -> [dict[str, int], dict[str, int], dict[str, int]]:
         schedules_count_per_project = (
             session.query(Schedule.project, func.count(distinct(Schedule.name)))
+            .filter(SQLDB._projects_filter(Schedule, projects))
             .group_by(Schedule.project)
             .all()
         )
@@ -2986,6 +3385,7 @@ class SQLDB(DBInterface):
                 ).label("preferred_label_value"),
             )
             .join(Schedule.Label, Schedule.Label.parent == Schedule.id)
+            .filter(SQLDB._projects_filter(Schedule, projects))
             .filter(Schedule.next_run_time < next_day)
             .filter(Schedule.next_run_time >= datetime.now(timezone.utc))
             .filter(
@@ -3017,9 +3417,12 @@ class SQLDB(DBInterface):
         )
 
     @staticmethod
-    def _calculate_feature_sets_counters(session) -> dict[str, int]:
+    def _calculate_feature_sets_counters(
+        session, projects: typing.Optional[list[str]] = None
+    ) -> dict[str, int]:
         feature_sets_count_per_project = (
             session.query(FeatureSet.project, func.count(distinct(FeatureSet.name)))
+            .filter(SQLDB._projects_filter(FeatureSet, projects))
             .group_by(FeatureSet.project)
             .all()
         )
@@ -3028,37 +3431,46 @@ class SQLDB(DBInterface):
         }
         return project_to_feature_set_count
 
-    def _calculate_models_counters(self, session) -> dict[str, int]:
-        # We're using the "most_recent" which gives us only one version of each artifact key, which is what we want to
-        # count (artifact count, not artifact versions count)
-        model_artifacts = self._find_artifacts(
-            session,
-            None,
-            kind=mlrun.common.schemas.ArtifactCategories.model,
-            most_recent=True,
-        )
+    def _calculate_models_counters(
+        self, session, projects: typing.Optional[list[str]] = None
+    ) -> dict[str, int]:
         project_to_models_count = collections.defaultdict(int)
-        for model_artifact in model_artifacts:
-            project_to_models_count[model_artifact.project] += 1
+        # None counts across all projects
+        for project in projects if projects is not None else [None]:
+            # We're using the "most_recent" which gives us only one version of each artifact key, which is what we
+            # want to count (artifact count, not artifact versions count)
+            model_artifacts = self._find_artifacts(
+                session,
+                project,
+                kind=mlrun.common.schemas.ArtifactCategories.model,
+                most_recent=True,
+            )
+            for model_artifact in model_artifacts:
+                project_to_models_count[model_artifact.project] += 1
         return project_to_models_count
 
-    def _calculate_files_counters(self, session) -> dict[str, int]:
-        # We're using the "most_recent" flag which gives us only one version of each artifact key, which is what we
-        # want to count (artifact count, not artifact versions count)
-        file_artifacts = self._find_artifacts(
-            session,
-            None,
-            category=mlrun.common.schemas.ArtifactCategories.other,
-            most_recent=True,
-        )
+    def _calculate_files_counters(
+        self, session, projects: typing.Optional[list[str]] = None
+    ) -> dict[str, int]:
         project_to_files_count = collections.defaultdict(int)
-        for file_artifact in file_artifacts:
-            project_to_files_count[file_artifact.project] += 1
+        # None counts across all projects
+        for project in projects if projects is not None else [None]:
+            # We're using the "most_recent" flag which gives us only one version of each artifact key, which is what
+            # we want to count (artifact count, not artifact versions count)
+            file_artifacts = self._find_artifacts(
+                session,
+                project,
+                category=mlrun.common.schemas.ArtifactCategories.other,
+                most_recent=True,
+            )
+            for file_artifact in file_artifacts:
+                project_to_files_count[file_artifact.project] += 1
         return project_to_files_count
 
     @staticmethod
     def _calculate_runs_counters(
         session,
+        projects: typing.Optional[list[str]] = None,
     ) -> tuple[
         dict[str, int],
         dict[str, int],
@@ -3066,6 +3478,7 @@ class SQLDB(DBInterface):
     ]:
         running_runs_count_per_project = (
             session.query(Run.project, func.count(distinct(Run.name)))
+            .filter(SQLDB._projects_filter(Run, projects))
             .filter(
                 Run.state.in_(
                     mlrun.common.runtimes.constants.RunStates.non_terminal_states()
@@ -3081,6 +3494,7 @@ class SQLDB(DBInterface):
         one_day_ago = datetime.now() - timedelta(hours=24)
         recent_failed_runs_count_per_project = (
             session.query(Run.project, func.count(distinct(Run.name)))
+            .filter(SQLDB._projects_filter(Run, projects))
             .filter(
                 Run.state.in_(
                     [
@@ -3099,6 +3513,7 @@ class SQLDB(DBInterface):
 
         recent_completed_runs_count_per_project = (
             session.query(Run.project, func.count(distinct(Run.name)))
+            .filter(SQLDB._projects_filter(Run, projects))
             .filter(
                 Run.state.in_(
                     [
@@ -3299,6 +3714,7 @@ class SQLDB(DBInterface):
         self._update_db_record_from_object_dict(db_feature_set, feature_set_dict, uid)
         self._update_feature_set_spec(db_feature_set, feature_set_dict)
 
+        self._mark_project_summary_changed(session, project)
         self._upsert(session, [db_feature_set])
         self.tag_objects_v2(session, [db_feature_set], project, tag)
 
@@ -4150,6 +4566,7 @@ class SQLDB(DBInterface):
         )
         if cls == FeatureSet:
             self._update_feature_set_spec(db_tagged_object, tagged_object_dict)
+            self._mark_project_summary_changed(session, project)
 
         self._upsert(session, [db_tagged_object])
         self.tag_objects_v2(session, [db_tagged_object], project, tag)
@@ -4235,6 +4652,7 @@ class SQLDB(DBInterface):
         ]
 
     def delete_feature_set(self, session, project, name, tag=None, uid=None):
+        self._mark_project_summary_changed(session, project)
         self._delete_tagged_object(
             session,
             FeatureSet,
@@ -4630,6 +5048,69 @@ class SQLDB(DBInterface):
         session.query(cls).filter(cls.parent == NULL).delete()
         session.commit()
 
+    def reencode_bodies(
+        self, session, after_ids: dict[str, int], batch_size: int = 500
+    ) -> bool:
+        """
+        Re-encode the next batch of bodies of each table with the configured body codec
+        (see mlrun.mlconf.httpdb.db.body_codec), the bodies are readable in any format so this can run in the
+        background. A row which was updated since it was read is skipped (it was already re-encoded by the update).
+
+        :param after_ids:  Per table name, the id of the last processed row, updated in place
+        :param batch_size: Max rows to process per table
+        :return: True when there are no more rows to process
+        """
+        codec = config.httpdb.db.body_codec
+        done = True
+        for cls, attribute in self._encoded_body_attributes.items():
+            table_name = cls.__tablename__
+            column = getattr(cls, attribute)
+            rows = (
+                session.query(cls.id, column)
+                .filter(cls.id > after_ids.get(table_name, 0))
+                .order_by(cls.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                continue
+
+            done = False
+            reencoded = 0
+            for row_id, body in rows:
+                if not body or mlrun.utils.db.get_body_codec_name(body) == codec:
+                    continue
+                try:
+                    new_body = mlrun.utils.db.encode_body(
+                        mlrun.utils.db.decode_body(body), codec
+                    )
+                except Exception as exc:
+                    logger.warning(
+                        "Failed to re-encode body, skipping",
+                        table=table_name,
+                        id=row_id,
+                        exc=err_to_str(exc),
+                    )
+                    continue
+                # keep bodies which can't be encoded with the codec (e.g. with non json values) as they are
+                if mlrun.utils.db.get_body_codec_name(new_body) != codec:
+                    continue
+                reencoded += (
+                    session.query(cls)
+                    .filter(cls.id == row_id, column == body)
+                    .update({column: new_body}, synchronize_session=False)
+                )
+            session.commit()
+            after_ids[table_name] = rows[-1][0]
+            logger.debug(
+                "Re-encoded bodies",
+                table=table_name,
+                processed=len(rows),
+                reencoded=reencoded,
+                last_id=after_ids[table_name],
+            )
+        return done
+
     def _upsert(self, session, objects, ignore=False, silent=False):
         if not objects:
             return
@@ -49,6 +49,38 @@ def run_state(run):
     )
 
 
+# run fields which can be listed without loading (unpickling) the run body, mapped to their run struct path
+run_projection_fields = {
+    "name": "metadata.name",
+    "uid": "metadata.uid",
+    "project": "metadata.project",
+    "iteration": "metadata.iteration",
+    "labels": "metadata.labels",
+    "state": "status.state",
+    "start_time": "status.start_time",
+    "last_update": "status.last_update",
+    "results": "status.results",
+    "error": "status.error",
+}
+
+# projection fields which are kept in the runs summary (JSON) column, the rest are table columns
+run_summary_fields = ["labels", "results", "error"]
+
+
+def run_summary(run) -> dict:
+    """the denormalized run fields (labels, scalar results and error) kept next to the run body"""
+    results = get_in(run, "status.results", {}) or {}
+    return {
+        "labels": run_labels(run),
+        "results": {
+            key: value
+            for key, value in results.items()
+            if value is None or isinstance(value, (str, int, float, bool))
+        },
+        "error": get_in(run, "status.error"),
+    }
+
+
 def update_labels(obj, labels: dict):
     old = {label.name: label for label in obj.labels}
     obj.labels.clear()
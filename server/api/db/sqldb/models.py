@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import json
-import pickle
 import warnings
 from datetime import datetime, timezone
 
@@ -259,11 +258,11 @@ with warnings.catch_warnings():
         @property
         def full_object(self):
             if self._full_object:
-                return pickle.loads(self._full_object)
+                return mlrun.utils.db.decode_body(self._full_object)
 
         @full_object.setter
         def full_object(self, value):
-            self._full_object = pickle.dumps(value)
+            self._full_object = mlrun.utils.db.encode_body(value)
 
         def get_identifier_string(self) -> str:
             return f"{self.project}/{self.key}/{self.uid}"
@@ -331,6 +330,8 @@ with warnings.catch_warnings():
         # False - logs were not requested for this run
         # True - logs were requested for this run
         requested_logs = Column(BOOLEAN, default=False, index=True)
+        # denormalized body fields (labels, results, error) used to list runs without unpickling the body
+        summary = Column(JSON(none_as_null=True))
 
         labels = relationship(Label, cascade="all, delete-orphan")
         tags = relationship(Tag, cascade="all, delete-orphan")
@@ -393,11 +394,11 @@ with warnings.catch_warnings():
 
         @property
         def scheduled_object(self):
-            return pickle.loads(self.struct)
+            return mlrun.utils.db.decode_body(self.struct)
 
         @scheduled_object.setter
         def scheduled_object(self, value):
-            self.struct = pickle.dumps(value)
+            self.struct = mlrun.utils.db.encode_body(value)
 
         @property
         def cron_trigger(self) -> mlrun.common.schemas.ScheduleCronTrigger:
@@ -454,11 +455,11 @@ with warnings.catch_warnings():
         @property
         def full_object(self):
             if self._full_object:
-                return pickle.loads(self._full_object)
+                return mlrun.utils.db.decode_body(self._full_object)
 
         @full_object.setter
         def full_object(self, value):
-            self._full_object = pickle.dumps(value)
+            self._full_object = mlrun.utils.db.encode_body(value)
 
     class Feature(Base, mlrun.utils.db.BaseModel):
         __tablename__ = "features"
@@ -753,6 +754,10 @@ with warnings.catch_warnings():
         )
         updated = Column(SQLTypesUtil.datetime())
         summary = Column(JSON)
+        # set when an object counted in the summary changes, cleared once the summary is recalculated
+        changed = Column(SQLTypesUtil.datetime())
+        # when the time windowed counters (e.g. recent runs) change, even if no counted object changes
+        recalculate_at = Column(SQLTypesUtil.datetime())
 
         def get_identifier_string(self) -> str:
             return f"{self.project}"
@@ -140,7 +140,7 @@ def init_data(
 data_version_prior_to_table_addition = 1
 
 # NOTE: Bump this number when adding a new data migration
-latest_data_version = 8
+latest_data_version = 9
 
 
 def update_default_configuration_data():
@@ -248,6 +248,8 @@ def _perform_data_migrations(db_session: sqlalchemy.orm.Session):
                 _perform_version_7_data_migrations(db, db_session)
             if current_data_version < 8:
                 _perform_version_8_data_migrations(db, db_session)
+            if current_data_version < 9:
+                _perform_version_9_data_migrations(db, db_session)
 
             db.create_data_version(db_session, str(latest_data_version))
 
@@ -300,7 +302,7 @@ def _align_runs_table(
                 run_dict.get("status", {}).get("last_update")
             )
         db._update_run_updated_time(run, run_dict, updated)
-        run.struct = run_dict
+        db._set_run_struct(run, run_dict)
         db._upsert(db_session, [run], ignore=True)
 
 
@@ -886,6 +888,13 @@ def _perform_version_8_data_migrations(
     db.align_schedule_labels(session=db_session)
 
 
+def _perform_version_9_data_migrations(
+    db: server.api.db.sqldb.db.SQLDB, db_session: sqlalchemy.orm.Session
+):
+    logger.info("Filling runs summary column")
+    db.align_run_summaries(db_session)
+
+
 def _create_project_summaries(db, db_session):
     # Create a project summary record for all projects.
     # We need to create them manually because a summary record is created only when a new
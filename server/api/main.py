@@ -57,7 +57,11 @@ from server.api.utils.periodic import (
     run_function_periodically,
 )
 from server.api.utils.singletons.db import get_db, initialize_db
-from server.api.utils.singletons.k8s import get_k8s_helper
+from server.api.utils.singletons.k8s import (
+    get_k8s_helper,
+    start_runtime_resources_informer,
+    stop_runtime_resources_informer,
+)
 from server.api.utils.singletons.logs_dir import initialize_logs_dir
 from server.api.utils.singletons.project_member import (
     get_project_member,
@@ -78,6 +82,9 @@ V2_API_PREFIX = f"{API_PREFIX}/v2"
 # that keep failing start logs requests.
 _run_uid_start_log_request_counters: collections.Counter = collections.Counter()
 
+# The id of the last re-encoded row per table, see _reencode_db_bodies
+_db_bodies_reencoding_progress: dict[str, int] = {}
+
 
 # https://fastapi.tiangolo.com/advanced/events/
 @contextlib.asynccontextmanager
@@ -209,6 +216,7 @@ async def teardown_api():
     if get_project_member():
         get_project_member().shutdown()
     cancel_all_periodic_functions()
+    stop_runtime_resources_informer()
     if get_scheduler():
         await get_scheduler().stop()
 
@@ -239,8 +247,15 @@ async def move_api_to_online():
         == mlrun.common.schemas.ClusterizationRole.chief
     ):
         server.api.initial_data.update_default_configuration_data()
+        _start_periodic_db_bodies_reencoding()
         # runs cleanup/monitoring is not needed if we're not inside kubernetes cluster
         if get_k8s_helper(silent=True).is_running_inside_kubernetes_cluster():
+            if (
+                config.httpdb.clusterization.chief.feature_gates.runtime_resources_informer
+                == "enabled"
+            ):
+                # started before the cleanup/monitoring so they can read the runtime resources from its cache
+                start_runtime_resources_informer()
             if config.httpdb.clusterization.chief.feature_gates.cleanup == "enabled":
                 _start_periodic_cleanup()
             if (
@@ -605,6 +620,32 @@ def _start_periodic_cleanup():
         )
 
 
+def _start_periodic_db_bodies_reencoding():
+    interval = int(config.httpdb.db.body_reencoding.interval)
+    if interval > 0:
+        logger.info(
+            "Starting periodic DB bodies re-encoding",
+            interval=interval,
+            codec=config.httpdb.db.body_codec,
+        )
+        run_function_periodically(
+            interval, _reencode_db_bodies.__name__, False, _reencode_db_bodies
+        )
+
+
+async def _reencode_db_bodies():
+    """re-encode a batch of the DB object bodies with the configured body codec, stops once all are re-encoded"""
+    done = await fastapi.concurrency.run_in_threadpool(
+        server.api.db.session.run_function_with_new_db_session,
+        get_db().reencode_bodies,
+        _db_bodies_reencoding_progress,
+        int(config.httpdb.db.body_reencoding.batch_size),
+    )
+    if done:
+        logger.info("Finished re-encoding the DB bodies")
+        cancel_periodic_function(_reencode_db_bodies.__name__)
+
+
 def _start_periodic_runs_monitoring():
     interval = int(config.monitoring.runs.interval)
     if interval > 0:
@@ -821,20 +821,42 @@ class BaseRuntimeHandler(ABC):
         :param label_selector:  Labels to filter by
         :return: List of pod dictionaries
         """
-        pods = server.api.utils.singletons.k8s.get_k8s_helper().list_pods(
-            namespace, selector=label_selector
-        )
+        pods = self._list_cached_pods(namespace, label_selector)
+        if pods is None:
+            pods = server.api.utils.singletons.k8s.get_k8s_helper().list_pods(
+                namespace, selector=label_selector
+            )
         # when we work with custom objects (list_namespaced_custom_object) it's always a dict, to be able to generalize
         # code working on runtime resource (either a custom object or a pod) we're transforming to dicts
         pods = [pod.to_dict() for pod in pods]
         return pods
 
     def _list_pods_paginated(self, namespace: str, label_selector: str = None) -> list:
-        for pod in server.api.utils.singletons.k8s.get_k8s_helper().list_pods_paginated(
-            namespace, selector=label_selector
-        ):
+        for pod in self._list_pod_objects_paginated(namespace, label_selector):
             yield pod.to_dict()
 
+    def _list_pod_objects_paginated(self, namespace: str, label_selector: str = None):
+        pods = self._list_cached_pods(namespace, label_selector)
+        if pods is not None:
+            yield from pods
+            return
+        yield from server.api.utils.singletons.k8s.get_k8s_helper().list_pods_paginated(
+            namespace, selector=label_selector
+        )
+
+    @staticmethod
+    def _list_cached_pods(
+        namespace: str, label_selector: str = None
+    ) -> Optional[list[k8s_client.V1Pod]]:
+        """
+        List the pods from the runtime resources informer cache
+        :return: List of pods, None if the informer is not running or can't serve the request
+        """
+        informer = server.api.utils.singletons.k8s.get_runtime_resources_informer()
+        if not informer:
+            return None
+        return informer.list_pods(namespace, label_selector or "")
+
     def _list_crd_objects(self, namespace: str, label_selector: str = None) -> list:
         """
         Warning! Use only with precise label selection. Otherwise, it may return a large list of resources and
@@ -846,6 +868,11 @@ class BaseRuntimeHandler(ABC):
         crd_group, crd_version, crd_plural = self._get_crd_info()
         crd_objects = []
         if crd_group and crd_version and crd_plural:
+            cached_crd_objects = self._list_cached_crd_objects(
+                namespace, label_selector
+            )
+            if cached_crd_objects is not None:
+                return cached_crd_objects
             try:
                 crd_objects = server.api.utils.singletons.k8s.get_k8s_helper().crdapi.list_namespaced_custom_object(
                     crd_group,
@@ -865,11 +892,30 @@ class BaseRuntimeHandler(ABC):
     def _list_crd_objects_paginated(
         self, namespace: str, label_selector: str = None
     ) -> list:
+        crd_objects = self._list_cached_crd_objects(namespace, label_selector)
+        if crd_objects is not None:
+            yield from crd_objects
+            return
         crd_group, crd_version, crd_plural = self._get_crd_info()
         yield from server.api.utils.singletons.k8s.get_k8s_helper().list_crds_paginated(
             crd_group, crd_version, crd_plural, namespace, selector=label_selector
         )
 
+    def _list_cached_crd_objects(
+        self, namespace: str, label_selector: str = None
+    ) -> Optional[list[dict]]:
+        """
+        List the crd objects from the runtime resources informer cache
+        :return: List of crd object dictionaries, None if the informer is not running or can't serve the request
+        """
+        informer = server.api.utils.singletons.k8s.get_runtime_resources_informer()
+        if not informer:
+            return None
+        crd_group, crd_version, crd_plural = self._get_crd_info()
+        return informer.list_crd_objects(
+            crd_group, crd_version, crd_plural, namespace, label_selector or ""
+        )
+
     def _wait_for_pods_deletion(
         self,
         namespace: str,
@@ -880,11 +926,7 @@ class BaseRuntimeHandler(ABC):
 
         def _verify_pods_removed():
             still_in_deletion_pods = []
-            for (
-                pod
-            ) in server.api.utils.singletons.k8s.get_k8s_helper().list_pods_paginated(
-                namespace, selector=label_selector
-            ):
+            for pod in self._list_pod_objects_paginated(namespace, label_selector):
                 if pod.metadata.name in deleted_pod_names:
                     still_in_deletion_pods.append(pod.metadata.name)
             if still_in_deletion_pods:
@@ -1026,9 +1068,7 @@ class BaseRuntimeHandler(ABC):
         resource_deletion_grace_period: typing.Optional[int] = None,
     ) -> list[dict]:
         deleted_pods = []
-        for pod in server.api.utils.singletons.k8s.get_k8s_helper().list_pods_paginated(
-            namespace, selector=label_selector
-        ):
+        for pod in self._list_pod_objects_paginated(namespace, label_selector):
             pod_dict = pod.to_dict()
 
             # best effort - don't let one failure in pod deletion to cut the whole operation
@@ -1091,82 +1131,69 @@ class BaseRuntimeHandler(ABC):
     ) -> list[dict]:
         crd_group, crd_version, crd_plural = self._get_crd_info()
         deleted_crds = []
-        try:
-            crd_objects = server.api.utils.singletons.k8s.get_k8s_helper().crdapi.list_namespaced_custom_object(
-                crd_group,
-                crd_version,
-                namespace,
-                crd_plural,
-                label_selector=label_selector,
-            )
-        except ApiException as exc:
-            # ignore error if crd is not defined
-            if exc.status != 404:
-                raise
-        else:
-            for crd_object in crd_objects["items"]:
-                # best effort - don't let one failure in pod deletion to cut the whole operation
-                try:
-                    (
-                        in_terminal_state,
-                        last_update,
-                        desired_run_state,
-                    ) = self._resolve_crd_object_status_info(crd_object)
+        crd_objects = self._list_crd_objects(namespace, label_selector)
+        for crd_object in crd_objects:
+            # best effort - don't let one failure in pod deletion to cut the whole operation
+            try:
+                (
+                    in_terminal_state,
+                    last_update,
+                    desired_run_state,
+                ) = self._resolve_crd_object_status_info(crd_object)
 
-                    if not desired_run_state and not force:
-                        logger.warning(
-                            "Could not resolve run state from CRD object. Skipping deletion",
-                            crd_object_name=crd_object["metadata"]["name"],
-                        )
-                        continue
+                if not desired_run_state and not force:
+                    logger.warning(
+                        "Could not resolve run state from CRD object. Skipping deletion",
+                        crd_object_name=crd_object["metadata"]["name"],
+                    )
+                    continue
 
-                    if not force:
-                        if not in_terminal_state:
-                            continue
+                if not force:
+                    if not in_terminal_state:
+                        continue
 
-                        # give some grace period if we have last update time
-                        now = datetime.now(timezone.utc)
-                        if (
-                            last_update is not None
-                            and last_update + timedelta(seconds=float(grace_period))
-                            > now
-                        ):
-                            continue
+                    # give some grace period if we have last update time
+                    now = datetime.now(timezone.utc)
+                    if (
+                        last_update is not None
+                        and last_update + timedelta(seconds=float(grace_period)) > now
+                    ):
+                        continue
 
-                    # if resources are tightly coupled to the run object - we want to perform some actions on the run
-                    # object before deleting them
-                    if self.are_resources_coupled_to_run_object():
-                        try:
-                            self._pre_deletion_runtime_resource_run_actions(
-                                db,
-                                db_session,
-                                crd_object,
-                                desired_run_state,
-                            )
-                        except Exception as exc:
-                            # Don't prevent the deletion for failure in the pre deletion run actions
-                            logger.warning(
-                                "Failure in crd object run pre-deletion actions. Continuing",
-                                exc=err_to_str(exc),
-                                crd_object_name=crd_object["metadata"]["name"],
-                            )
+                # if resources are tightly coupled to the run object - we want to perform some actions on the run
+                # object before deleting them
+                if self.are_resources_coupled_to_run_object():
+                    try:
+                        self._pre_deletion_runtime_resource_run_actions(
+                            db,
+                            db_session,
+                            crd_object,
+                            desired_run_state,
+                        )
+                    except Exception as exc:
+                        # Don't prevent the deletion for failure in the pre deletion run actions
+                        logger.warning(
+                            "Failure in crd object run pre-deletion actions. Continuing",
+                            exc=err_to_str(exc),
+                            crd_object_name=crd_object["metadata"]["name"],
+                        )
 
-                    server.api.utils.singletons.k8s.get_k8s_helper().delete_crd(
-                        crd_object["metadata"]["name"],
-                        crd_group,
-                        crd_version,
-                        crd_plural,
-                        namespace,
-                        resource_deletion_grace_period,
-                    )
-                    deleted_crds.append(crd_object)
-                except Exception as exc:
-                    crd_object_name = crd_object["metadata"]["name"]
-                    logger.warning(
-                        "Cleanup failed processing CRD object",
-                        crd_name=crd_object_name,
-                        exc=err_to_str(exc),
-                    )
+                server.api.utils.singletons.k8s.get_k8s_helper().delete_crd(
+                    crd_object["metadata"]["name"],
+                    crd_group,
+                    crd_version,
+                    crd_plural,
+                    namespace,
+                    resource_deletion_grace_period,
+                )
+                deleted_crds.append(crd_object)
+            except Exception as exc:
+                crd_object_name = crd_object["metadata"]["name"]
+                logger.warning(
+                    "Cleanup failed processing CRD object",
+                    crd_name=crd_object_name,
+                    exc=err_to_str(exc),
+                )
         self._wait_for_crds_underlying_pods_deletion(
             deleted_crds, namespace, label_selector
         )
@@ -12,15 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import base64
+import copy
 import hashlib
 import random
+import re
 import string
+import threading
 import time
 import typing
 
 import kubernetes.client.rest as k8s_client_rest
 import kubernetes.dynamic.exceptions as k8s_dynamic_exceptions
-from kubernetes import client, config
+from kubernetes import client, config, watch
 
 import mlrun
 import mlrun.common.constants as mlrun_constants
@@ -37,6 +40,7 @@ from mlrun.utils import logger
 from mlrun.utils.helpers import run_with_retry, to_non_empty_values_dict
 
 _k8s = None
+_runtime_resources_informer = None
 
 
 def get_k8s_helper(namespace=None, silent=True, log=False) -> "K8sHelper":
@@ -942,6 +946,409 @@ class K8sHelper(mlsecrets.SecretProviderInterface):
         )
 
 
+def get_runtime_resources_informer() -> typing.Optional["RuntimeResourcesInformer"]:
+    """
+    Get the runtime resources informer singleton, None if it wasn't started (e.g. not on the chief)
+    """
+    return _runtime_resources_informer
+
+
+def start_runtime_resources_informer(namespace=None) -> "RuntimeResourcesInformer":
+    """
+    Start the runtime resources informer singleton, which caches the mlrun runtime resources of the namespace
+    :param namespace: the namespace to watch, if not specified will use the namespace configured in mlrun config
+    """
+    global _runtime_resources_informer
+    if not _runtime_resources_informer:
+        _runtime_resources_informer = RuntimeResourcesInformer(
+            get_k8s_helper(), namespace
+        )
+        _runtime_resources_informer.start()
+    return _runtime_resources_informer
+
+
+def stop_runtime_resources_informer():
+    global _runtime_resources_informer
+    if _runtime_resources_informer:
+        _runtime_resources_informer.stop()
+        _runtime_resources_informer = None
+
+
+class ResourceInformer:
+    """
+    In-memory cache of the k8s resources (of a single kind) matching a label selector.
+    The resources are listed once and then kept up to date by the watch events, a full re-list (resync) is done
+    periodically and whenever the watch fails (e.g. 410 Gone), to recover from missed events.
+    Pods are cached as the k8s client models (as returned by the list API) and custom objects as dicts.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        list_func: typing.Callable,
+        list_args: tuple,
+        namespace: str,
+        label_selector: str,
+        resync_interval: typing.Optional[float] = None,
+        watch_timeout: typing.Optional[float] = None,
+        retry_interval: typing.Optional[float] = None,
+        watch_factory: typing.Callable = watch.Watch,
+    ):
+        """
+        :param name:            Name of the cached resource (for logging)
+        :param list_func:       The k8s API list function, e.g. CoreV1Api.list_namespaced_pod
+        :param list_args:       Positional arguments of the list function (e.g. the namespace)
+        :param namespace:       The namespace the list function is scoped to
+        :param label_selector:  Label selector of the cached resources
+        :param resync_interval: Seconds between full re-lists, defaults to mlconf.kubernetes.informer.resync_interval
+        :param watch_timeout:   Server side timeout of a single watch request, defaults to
+                                mlconf.kubernetes.informer.watch_timeout
+        :param retry_interval:  Seconds to wait after a failed list/watch, defaults to
+                                mlconf.kubernetes.informer.retry_interval
+        :param watch_factory:   Creates the watch object, the stream(func, *args, **kwargs) of which yields the events
+        """
+        informer_config = mlrun.mlconf.kubernetes.informer
+        self.name = name
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self.resync_interval = float(resync_interval or informer_config.resync_interval)
+        self.watch_timeout = float(watch_timeout or informer_config.watch_timeout)
+        self.retry_interval = float(retry_interval or informer_config.retry_interval)
+        self._list_func = list_func
+        self._list_args = list_args
+        self._watch_factory = watch_factory
+        self._watch = None
+        self._requirements = _parse_label_selector(label_selector)
+
+        # resource name -> resource
+        self._resources = {}
+        self._resource_version = None
+        self._last_sync = 0.0
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def synced(self) -> bool:
+        return self._synced.is_set()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"{self.name}-informer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: typing.Optional[float] = None):
+        self._stop_event.set()
+        if self._watch:
+            self._watch.stop()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        self._synced.clear()
+
+    def wait_for_sync(self, timeout: typing.Optional[float] = None) -> bool:
+        return self._synced.wait(timeout)
+
+    def covers(self, namespace: str, label_selector: str = "") -> bool:
+        """
+        Whether the cache holds all the resources of the namespace which match the label selector, i.e. the cache
+        is synced and the label selector requires the label (key) which the cache is filtered by
+        """
+        if not self.synced or namespace != self.namespace:
+            return False
+        try:
+            requirements = _parse_label_selector(label_selector)
+        except ValueError:
+            return False
+        required_keys = {
+            key
+            for key, operator, _ in requirements
+            if operator in ("=", "in", "exists")
+        }
+        return all(
+            key in required_keys
+            for key, operator, _ in self._requirements
+            if operator == "exists"
+        )
+
+    def list(self, label_selector: str = "") -> list:
+        """
+        List the cached resources matching the label selector
+        """
+        requirements = _parse_label_selector(label_selector)
+        with self._lock:
+            resources = list(self._resources.values())
+        return [
+            resource
+            for resource in resources
+            if _match_label_selector(_get_resource_labels(resource), requirements)
+        ]
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                if (
+                    self._resource_version is None
+                    or time.monotonic() - self._last_sync >= self.resync_interval
+                ):
+                    self._relist()
+                if self._resource_version is None:
+                    # the resource is not defined (e.g. the crd is not installed), nothing to watch
+                    self._stop_event.wait(self.resync_interval)
+                    continue
+                self._watch_resources()
+            except k8s_client_rest.ApiException as exc:
+                if exc.status == 410:
+                    logger.debug(
+                        "Informer watch expired, re-listing", resource=self.name
+                    )
+                else:
+                    self._handle_failure(exc)
+                self._resource_version = None
+            except Exception as exc:
+                self._handle_failure(exc)
+                self._resource_version = None
+
+    def _handle_failure(self, exc: Exception):
+        logger.warning(
+            "Informer failed listing/watching resources, retrying",
+            resource=self.name,
+            namespace=self.namespace,
+            exc=mlrun.errors.err_to_str(exc),
+        )
+        self._stop_event.wait(self.retry_interval)
+
+    def _relist(self):
+        resources = {}
+        resource_version = None
+        try:
+            response = self._list_func(
+                *self._list_args, label_selector=self.label_selector, watch=False
+            )
+        except k8s_client_rest.ApiException as exc:
+            # the resource is not defined (e.g. the crd is not installed)
+            if exc.status != 404:
+                raise
+        else:
+            if isinstance(response, dict):
+                items = response["items"]
+                resource_version = response["metadata"]["resourceVersion"]
+            else:
+                items = response.items
+                resource_version = response.metadata.resource_version
+            for resource in items:
+                resources[_get_resource_name(resource)] = resource
+
+        with self._lock:
+            self._resources = resources
+        self._resource_version = resource_version
+        self._last_sync = time.monotonic()
+        self._synced.set()
+
+    def _watch_resources(self):
+        time_to_resync = self.resync_interval - (time.monotonic() - self._last_sync)
+        self._watch = self._watch_factory()
+        for event in self._watch.stream(
+            self._list_func,
+            *self._list_args,
+            label_selector=self.label_selector,
+            resource_version=self._resource_version,
+            timeout_seconds=max(int(min(self.watch_timeout, time_to_resync)), 1),
+        ):
+            if self._stop_event.is_set():
+                break
+            self._handle_event(event)
+
+    def _handle_event(self, event: dict):
+        event_type = event["type"]
+        resource = event["object"]
+        if event_type == "ERROR":
+            status = resource.get("code") if isinstance(resource, dict) else None
+            raise k8s_client_rest.ApiException(status=status, reason=str(resource))
+
+        if event_type in ("ADDED", "MODIFIED"):
+            with self._lock:
+                self._resources[_get_resource_name(resource)] = resource
+        elif event_type == "DELETED":
+            with self._lock:
+                self._resources.pop(_get_resource_name(resource), None)
+
+        # bookmark events carry only the resource version
+        self._resource_version = (
+            _get_resource_metadata(resource, "resource_version")
+            or self._resource_version
+        )
+
+
+class RuntimeResourcesInformer:
+    """
+    Shared informers of the mlrun runtime resources (the pods and custom objects labeled with mlrun/class),
+    used by the runtime handlers to list the runtime resources from memory instead of the k8s API.
+    The custom objects informers are created on their first use (per crd), until an informer is synced the
+    listing returns None and the caller should fall back to the k8s API.
+    """
+
+    def __init__(
+        self,
+        k8s_helper: K8sHelper,
+        namespace: str = None,
+        watch_factory: typing.Callable = watch.Watch,
+    ):
+        self.namespace = k8s_helper.resolve_namespace(namespace)
+        self._k8s_helper = k8s_helper
+        self._watch_factory = watch_factory
+        self._label_selector = mlrun_constants.MLRunInternalLabels.mlrun_class
+        self._pods_informer = ResourceInformer(
+            "pods",
+            k8s_helper.v1api.list_namespaced_pod,
+            (self.namespace,),
+            self.namespace,
+            self._label_selector,
+            watch_factory=watch_factory,
+        )
+        # (crd group, crd version, crd plural) -> informer
+        self._crd_informers = {}
+        self._lock = threading.Lock()
+        self._started = False
+
+    def start(self):
+        logger.info("Starting runtime resources informer", namespace=self.namespace)
+        with self._lock:
+            self._started = True
+            self._pods_informer.start()
+            for informer in self._crd_informers.values():
+                informer.start()
+
+    def stop(self):
+        with self._lock:
+            self._started = False
+            informers = [self._pods_informer, *self._crd_informers.values()]
+        for informer in informers:
+            informer.stop(timeout=1)
+
+    def list_pods(
+        self, namespace: str = None, label_selector: str = ""
+    ) -> typing.Optional[list[client.V1Pod]]:
+        """
+        List the cached pods, None if the cache can't serve the request (not synced, other namespace, or a label
+        selector which doesn't require the mlrun/class label)
+        """
+        namespace = self._k8s_helper.resolve_namespace(namespace)
+        if not self._pods_informer.covers(namespace, label_selector):
+            return None
+        return self._pods_informer.list(label_selector)
+
+    def list_crd_objects(
+        self,
+        crd_group: str,
+        crd_version: str,
+        crd_plural: str,
+        namespace: str = None,
+        label_selector: str = "",
+    ) -> typing.Optional[list[dict]]:
+        """
+        List the cached custom objects (as dicts), None if the cache can't serve the request (see list_pods)
+        """
+        namespace = self._k8s_helper.resolve_namespace(namespace)
+        informer = self._get_crd_informer(crd_group, crd_version, crd_plural)
+        if not informer.covers(namespace, label_selector):
+            return None
+        # the cached dicts are shared, callers get their own copy
+        return copy.deepcopy(informer.list(label_selector))
+
+    def _get_crd_informer(
+        self, crd_group: str, crd_version: str, crd_plural: str
+    ) -> ResourceInformer:
+        crd_info = (crd_group, crd_version, crd_plural)
+        with self._lock:
+            informer = self._crd_informers.get(crd_info)
+            if not informer:
+                informer = ResourceInformer(
+                    crd_plural,
+                    self._k8s_helper.crdapi.list_namespaced_custom_object,
+                    (crd_group, crd_version, self.namespace, crd_plural),
+                    self.namespace,
+                    self._label_selector,
+                    watch_factory=self._watch_factory,
+                )
+                self._crd_informers[crd_info] = informer
+                if self._started:
+                    informer.start()
+        return informer
+
+
+_camel_case_metadata_fields = {"resource_version": "resourceVersion"}
+
+
+def _get_resource_metadata(resource, field: str):
+    """
+    Get a metadata field of a resource, either a k8s client model (snake case attributes) or a dict (camel case keys)
+    """
+    if isinstance(resource, dict):
+        key = _camel_case_metadata_fields.get(field, field)
+        return (resource.get("metadata") or {}).get(key)
+    return getattr(resource.metadata, field, None) if resource.metadata else None
+
+
+def _get_resource_name(resource) -> str:
+    return _get_resource_metadata(resource, "name")
+
+
+def _get_resource_labels(resource) -> dict:
+    return _get_resource_metadata(resource, "labels") or {}
+
+
+def _parse_label_selector(label_selector: str) -> list[tuple[str, str, set]]:
+    """
+    Parse a k8s label selector to (key, operator, values) requirements, the operator is one of
+    =, !=, in, notin, exists and !exists
+    """
+    requirements = []
+    # split on commas which are not inside the parentheses of a set based requirement
+    for requirement in re.split(r",(?![^()]*\))", label_selector or ""):
+        requirement = requirement.strip()
+        if not requirement:
+            continue
+        set_based_match = re.fullmatch(r"(\S+)\s+(in|notin)\s+\((.*)\)", requirement)
+        if set_based_match:
+            key, operator, values = set_based_match.groups()
+            values = {value.strip() for value in values.split(",") if value.strip()}
+            requirements.append((key, operator, values))
+            continue
+        equality_match = re.fullmatch(r"([^=!\s]+)\s*(!=|==|=)\s*(\S*)", requirement)
+        if equality_match:
+            key, operator, value = equality_match.groups()
+            operator = "!=" if operator == "!=" else "="
+            requirements.append((key, operator, {value}))
+        elif re.fullmatch(r"!\s*[^=!\s]+", requirement):
+            requirements.append((requirement[1:].strip(), "!exists", set()))
+        elif re.fullmatch(r"[^=!\s]+", requirement):
+            requirements.append((requirement, "exists", set()))
+        else:
+            raise ValueError(f"Invalid label selector requirement: {requirement}")
+    return requirements
+
+
+def _match_label_selector(
+    labels: dict, requirements: list[tuple[str, str, set]]
+) -> bool:
+    for key, operator, values in requirements:
+        if operator in ("=", "in") and labels.get(key) not in values:
+            return False
+        if operator in ("!=", "notin") and labels.get(key) in values:
+            return False
+        if operator == "exists" and key not in labels:
+            return False
+        if operator == "!exists" and key in labels:
+            return False
+    return True
+
+
 class BasePod:
     def __init__(
         self,
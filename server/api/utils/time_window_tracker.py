@@ -24,6 +24,7 @@ import server.api.utils.singletons.db
 class TimeWindowTrackerKeys(mlrun.common.types.StrEnum):
     run_monitoring = "run_monitoring"
     log_collection = "log_collection"
+    project_summaries_reconcile = "project_summaries_reconcile"
 
 
 class TimeWindowTracker:
@@ -67,6 +67,11 @@ def test_build_kv_cursor_filter_expression():
     )
     assert filter_expression == expected
 
+    filter_expression = endpoint_store._build_kv_cursor_filter_expression(
+        project=TEST_PROJECT, after="abc"
+    )
+    assert filter_expression == f"project=='{TEST_PROJECT}' AND __name>'abc'"
+
 
 def test_get_access_key():
     key = server.api.crud.model_monitoring.helpers.get_access_key(
@@ -20,6 +20,7 @@ import pytest
 import sqlalchemy.orm
 
 import mlrun.common.formatters
+import mlrun.common.runtimes.constants
 import mlrun.common.schemas
 import mlrun.config
 import mlrun.errors
@@ -359,6 +360,75 @@ def test_refresh_project_summaries(db: DBInterface, db_session: sqlalchemy.orm.S
     assert deleted_summary.project == "project-summary-2"
 
 
+def test_refresh_project_summaries_incrementally(
+    db: DBInterface, db_session: sqlalchemy.orm.Session
+):
+    project_names = ["project-1", "project-2"]
+    for project_name in project_names:
+        db.create_project(db_session, _generate_project(project_name))
+    assert db.list_outdated_project_summaries(db_session) == []
+
+    # changes in the counted objects mark the project summary as outdated
+    db.store_run(
+        db_session,
+        {
+            "metadata": {"name": "run-name", "uid": "uid", "project": "project-1"},
+            "status": {
+                "state": mlrun.common.runtimes.constants.RunStates.completed,
+            },
+        },
+        "uid",
+        project="project-1",
+    )
+    assert db.list_outdated_project_summaries(db_session) == ["project-1"]
+
+    # a refresh which started after the change clears the mark and sets the time the recent runs
+    # counters are due to change
+    calculation_started = datetime.datetime.now(
+        datetime.timezone.utc
+    ) + datetime.timedelta(
+        seconds=mlrun.config.config.monitoring.projects.summaries.changes_resolution
+    )
+    db.refresh_project_summaries(
+        db_session,
+        [mlrun.common.schemas.ProjectSummary(name="project-1")],
+        recalculated_projects=["project-1"],
+        calculation_started=calculation_started,
+    )
+    assert db.list_outdated_project_summaries(db_session) == []
+    assert db.list_outdated_project_summaries(
+        db_session, now=calculation_started + datetime.timedelta(days=1)
+    ) == ["project-1"]
+
+    # a change after the refresh started is kept for the next refresh
+    db.del_run(db_session, "uid", project="project-1")
+    db.refresh_project_summaries(
+        db_session,
+        [mlrun.common.schemas.ProjectSummary(name="project-1")],
+        recalculated_projects=["project-1"],
+    )
+    assert db.list_outdated_project_summaries(db_session) == ["project-1"]
+
+
+def test_mark_project_summary_changed_once_per_resolution(
+    db: DBInterface, db_session: sqlalchemy.orm.Session
+):
+    db.create_project(db_session, _generate_project("project-1"))
+
+    # the mark is committed (and recorded) with the caller's transaction, a rolled back mark is written again
+    db._mark_project_summary_changed(db_session, "project-1")
+    db_session.rollback()
+    assert db.list_outdated_project_summaries(db_session) == []
+    db._mark_project_summary_changed(db_session, "project-1")
+    db_session.commit()
+    assert db.list_outdated_project_summaries(db_session) == ["project-1"]
+
+    # the mark was written within the resolution, the next changes skip the update
+    with unittest.mock.patch.object(db_session, "flush") as flush:
+        db._mark_project_summary_changed(db_session, "project-1")
+    assert flush.call_count == 0
+
+
 def _generate_and_insert_pre_060_record(
     db_session: sqlalchemy.orm.Session, project_name: str
 ):
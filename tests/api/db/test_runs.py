@@ -466,6 +466,107 @@ def test_list_runs_with_same_names(db: DBInterface, db_session: Session):
     assert len(runs) == 4
 
 
+def test_list_runs_fields_projection(db: DBInterface, db_session: Session):
+    project = "project"
+    run = {
+        "metadata": {"name": "run-name", "labels": {"kind": "job"}},
+        "status": {
+            "state": mlrun.common.runtimes.constants.RunStates.error,
+            "results": {"accuracy": 0.9, "model": {"nested": "value"}},
+            "error": "some error",
+        },
+    }
+    db.store_run(db_session, run, "uid-1", project)
+    stored_run = db.read_run(db_session, "uid-1", project)
+
+    runs = db.list_runs(
+        db_session,
+        project=project,
+        fields=["name", "uid", "state", "start_time", "labels", "results", "error"],
+    )
+    assert runs == [
+        {
+            "metadata": {"name": "run-name", "uid": "uid-1", "labels": {"kind": "job"}},
+            "status": {
+                "state": mlrun.common.runtimes.constants.RunStates.error,
+                "start_time": stored_run["status"]["start_time"],
+                # only scalar results are kept in the summary
+                "results": {"accuracy": 0.9},
+                "error": "some error",
+            },
+        }
+    ]
+
+    with pytest.raises(
+        mlrun.errors.MLRunInvalidArgumentError, match="Unsupported run fields"
+    ):
+        db.list_runs(db_session, project=project, fields=["name", "spec"])
+    with pytest.raises(
+        mlrun.errors.MLRunInvalidArgumentError, match="with_notifications"
+    ):
+        db.list_runs(
+            db_session, project=project, fields=["name"], with_notifications=True
+        )
+
+
+def test_list_runs_fields_projection_without_summary(
+    db: DBInterface, db_session: Session
+):
+    project = "project"
+    for index in range(3):
+        run = {
+            "metadata": {"name": f"run-{index}", "labels": {"index": str(index)}},
+            "status": {"results": {"loss": index}},
+        }
+        db.store_run(db_session, run, f"uid-{index}", project)
+
+    # runs which were stored before the summary column was added
+    run_records = db._find_runs(db_session, None, project, None).all()
+    for run_record in run_records:
+        run_record.summary = None
+    db._upsert(db_session, run_records)
+
+    def _list_summaries():
+        runs = db.list_runs(db_session, project=project, fields=["labels", "results"])
+        return sorted(
+            ((run["metadata"]["labels"], run["status"]["results"]) for run in runs),
+            key=lambda summary: summary[0]["index"],
+        )
+
+    expected = [({"index": str(index)}, {"loss": index}) for index in range(3)]
+    assert _list_summaries() == expected
+
+    server.api.initial_data._perform_version_9_data_migrations(db, db_session)
+    run_records = db._find_runs(db_session, None, project, None).all()
+    assert all(run_record.summary is not None for run_record in run_records)
+    assert _list_summaries() == expected
+
+
+def test_iterate_runs(db: DBInterface, db_session: Session):
+    project = "project"
+    for index in range(5):
+        _create_new_run(
+            db, db_session, project, name=f"run-{index}", uid=f"uid-{index}"
+        )
+
+    runs = db.list_runs(db_session, project=project)
+    streamed_runs = list(db.iterate_runs(db_session, project=project, batch_size=2))
+    assert streamed_runs == list(runs)
+
+    streamed_runs = list(
+        db.iterate_runs(
+            db_session, project=project, fields=["name", "state"], batch_size=2
+        )
+    )
+    assert streamed_runs == [
+        {
+            "metadata": {"name": run["metadata"]["name"]},
+            "status": {"state": run["status"]["state"]},
+        }
+        for run in runs
+    ]
+
+
 def _change_run_record_to_before_align_runs_migration(run, time_before_creation):
     run_dict = run.struct
 
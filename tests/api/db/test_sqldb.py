@@ -26,10 +26,11 @@ from sqlalchemy.orm import Session
 import mlrun.artifacts
 import mlrun.common.formatters
 import mlrun.common.schemas
+import mlrun.utils.db
 import server.api.db.sqldb.models
 from mlrun.lists import ArtifactList
 from server.api.db.sqldb.db import SQLDB
-from server.api.db.sqldb.models import ArtifactV2
+from server.api.db.sqldb.models import ArtifactV2, Run
 from tests.conftest import new_run
 
 
@@ -318,6 +319,51 @@ def test_commit_failures(db: SQLDB, error_message: str, expected_exception: Exce
         db._commit(session, objects)
 
 
+def test_reencode_bodies(db: SQLDB, db_session: Session, monkeypatch):
+    project = "project"
+    monkeypatch.setattr(mlrun.mlconf.httpdb.db, "body_codec", "pickle")
+    for index in range(5):
+        db.store_run(
+            db_session,
+            new_run("completed", {"index": str(index)}),
+            f"uid-{index}",
+            project,
+        )
+    # a run body with a value that can't be encoded to json without changing it
+    db.store_run(
+        db_session, new_run("completed", {}, results=(1, 2)), "uid-tuple", project
+    )
+    db.store_function(
+        db_session, {"metadata": {"name": "fn"}, "kind": "job"}, "fn", project
+    )
+    runs = db.list_runs(db_session, project=project)
+    function = db.get_function(db_session, "fn", project)
+
+    def _body_codecs(cls, attribute):
+        return {
+            mlrun.utils.db.get_body_codec_name(body)
+            for (body,) in db_session.query(getattr(cls, attribute))
+        }
+
+    assert _body_codecs(Run, "body") == {"pickle"}
+
+    monkeypatch.setattr(mlrun.mlconf.httpdb.db, "body_codec", "orjson")
+    progress = {}
+    while not db.reencode_bodies(db_session, progress, batch_size=2):
+        pass
+
+    assert progress["runs"] > 0
+    assert _body_codecs(Run, "body") == {"orjson", "pickle"}
+    assert len(db_session.query(Run).all()) == 6
+    for run in db_session.query(Run):
+        expected_codec = "pickle" if run.uid == "uid-tuple" else "orjson"
+        assert mlrun.utils.db.get_body_codec_name(run.body) == expected_codec
+    # function bodies keep the update time as a datetime, they stay pickled
+    assert _body_codecs(server.api.db.sqldb.models.Function, "body") == {"pickle"}
+    assert db.list_runs(db_session, project=project) == runs
+    assert db.get_function(db_session, "fn", project) == function
+
+
 # def test_function_latest(db: SQLDB, db_session: Session):
 #     fn1, t1 = {'x': 1}, 'u83'
 #     fn2, t2 = {'x': 2}, 'u23'
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+import time
 import unittest.mock
 from contextlib import nullcontext as does_not_raise
 
@@ -23,6 +25,7 @@ import mlrun.common.constants as mlrun_constants
 import mlrun.common.runtimes
 import mlrun.common.schemas
 import mlrun.runtimes
+import server.api.runtime_handlers
 import server.api.runtime_handlers.mpijob
 import server.api.utils.singletons.k8s
 
@@ -264,3 +267,259 @@ def test_list_paginated_crds_retry(
         result = list(k8s_helper.list_crds_paginated("group", "v1", "objects", "my-ns"))
         if expected_result is not None:
             assert result == expected_result
+
+
+class FakeWatch:
+    """
+    Replaces kubernetes.watch.Watch, every stream() call yields the next batch of events and then blocks until the
+    watch is stopped (like a real watch with no further changes)
+    """
+
+    def __init__(self, event_batches: list):
+        self.event_batches = event_batches
+        self.stream_calls = []
+        self._stopped = threading.Event()
+
+    def __call__(self):
+        self._stopped.clear()
+        return self
+
+    def stream(self, func, *args, **kwargs):
+        self.stream_calls.append(kwargs)
+        if self.event_batches:
+            events = self.event_batches.pop(0)
+            if isinstance(events, Exception):
+                raise events
+            yield from events
+        self._stopped.wait(5)
+
+    def stop(self):
+        self._stopped.set()
+
+
+def _generate_pod(name: str, labels: dict, resource_version: str = "1"):
+    return k8s_client.V1Pod(
+        metadata=k8s_client.V1ObjectMeta(
+            name=name, labels=labels, resource_version=resource_version
+        )
+    )
+
+
+def _wait_for(condition, timeout: float = 5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out waiting for condition"
+        time.sleep(0.01)
+
+
+def test_resource_informer_watch_events():
+    job_pod = _generate_pod("job-pod", {"mlrun/class": "job", "mlrun/project": "p1"})
+    spark_pod = _generate_pod("spark-pod", {"mlrun/class": "spark"})
+    list_func = unittest.mock.Mock(
+        return_value=k8s_client.V1PodList(
+            items=[job_pod, spark_pod],
+            metadata=k8s_client.V1ListMeta(resource_version="10"),
+        )
+    )
+    fake_watch = FakeWatch(
+        [
+            [
+                {
+                    "type": "ADDED",
+                    "object": _generate_pod(
+                        "new-job-pod", {"mlrun/class": "job"}, "11"
+                    ),
+                },
+                {
+                    "type": "MODIFIED",
+                    "object": _generate_pod(
+                        "job-pod", {"mlrun/class": "job", "mlrun/project": "p2"}, "12"
+                    ),
+                },
+                {"type": "DELETED", "object": _generate_pod("spark-pod", {}, "13")},
+                {
+                    "type": "BOOKMARK",
+                    "object": _generate_pod(None, None, "14"),
+                },
+            ]
+        ]
+    )
+    informer = server.api.utils.singletons.k8s.ResourceInformer(
+        "pods",
+        list_func,
+        ("my-ns",),
+        "my-ns",
+        "mlrun/class",
+        watch_factory=fake_watch,
+    )
+    informer.start()
+    try:
+        assert informer.wait_for_sync(5)
+        _wait_for(lambda: informer._resource_version == "14")
+        assert sorted(pod.metadata.name for pod in informer.list()) == [
+            "job-pod",
+            "new-job-pod",
+        ]
+        assert [
+            pod.metadata.name
+            for pod in informer.list("mlrun/class=job,mlrun/project=p2")
+        ] == ["job-pod"]
+        assert informer.list("mlrun/class=spark") == []
+
+        # listed once and watched from the listed resource version
+        list_func.assert_called_once_with(
+            "my-ns", label_selector="mlrun/class", watch=False
+        )
+        assert fake_watch.stream_calls[0]["resource_version"] == "10"
+    finally:
+        informer.stop(timeout=5)
+    assert not informer.synced
+
+
+def test_resource_informer_relist_on_expired_watch():
+    list_func = unittest.mock.Mock(
+        side_effect=[
+            {"items": [], "metadata": {"resourceVersion": "1"}},
+            {
+                "items": [
+                    {
+                        "metadata": {
+                            "name": "mpijob",
+                            "labels": {"mlrun/class": "mpijob"},
+                        }
+                    }
+                ],
+                "metadata": {"resourceVersion": "5"},
+            },
+            {"items": [], "metadata": {"resourceVersion": "6"}},
+        ]
+    )
+    fake_watch = FakeWatch([ApiException(status=410)])
+    informer = server.api.utils.singletons.k8s.ResourceInformer(
+        "mpijobs",
+        list_func,
+        ("group", "v1", "my-ns", "mpijobs"),
+        "my-ns",
+        "mlrun/class",
+        retry_interval=0.01,
+        watch_factory=fake_watch,
+    )
+    informer.start()
+    try:
+        _wait_for(lambda: len(fake_watch.stream_calls) == 2)
+        assert list_func.call_count == 2
+        assert fake_watch.stream_calls[1]["resource_version"] == "5"
+        assert [crd["metadata"]["name"] for crd in informer.list()] == ["mpijob"]
+    finally:
+        informer.stop(timeout=5)
+
+
+def test_resource_informer_undefined_crd():
+    list_func = unittest.mock.Mock(side_effect=ApiException(status=404))
+    fake_watch = FakeWatch([])
+    informer = server.api.utils.singletons.k8s.ResourceInformer(
+        "mpijobs",
+        list_func,
+        ("group", "v1", "my-ns", "mpijobs"),
+        "my-ns",
+        "mlrun/class",
+        watch_factory=fake_watch,
+    )
+    informer.start()
+    try:
+        assert informer.wait_for_sync(5)
+        assert informer.list() == []
+        # nothing to watch until the next resync
+        assert fake_watch.stream_calls == []
+    finally:
+        informer.stop(timeout=5)
+
+
+@pytest.mark.parametrize(
+    "namespace, label_selector, expected_names",
+    [
+        ("my-ns", "mlrun/class=job", ["job-pod"]),
+        ("my-ns", "mlrun/class in (job, spark),mlrun/project=p1", ["job-pod"]),
+        ("my-ns", "mlrun/class notin (job),mlrun/class", ["spark-pod"]),
+        ("my-ns", "mlrun/class,!mlrun/project", ["spark-pod"]),
+        ("my-ns", "mlrun/class,mlrun/project!=p1", ["spark-pod"]),
+        # can't be served from the cache
+        ("my-ns", "mlrun/project=p1", None),
+        ("my-ns", "", None),
+        ("other-ns", "mlrun/class=job", None),
+    ],
+)
+def test_runtime_resources_informer_list_pods(
+    k8s_helper, namespace, label_selector, expected_names
+):
+    k8s_helper.v1api.list_namespaced_pod.return_value = k8s_client.V1PodList(
+        items=[
+            _generate_pod("job-pod", {"mlrun/class": "job", "mlrun/project": "p1"}),
+            _generate_pod("spark-pod", {"mlrun/class": "spark"}),
+        ],
+        metadata=k8s_client.V1ListMeta(resource_version="1"),
+    )
+    informer = server.api.utils.singletons.k8s.RuntimeResourcesInformer(
+        k8s_helper, "my-ns", watch_factory=FakeWatch([])
+    )
+    informer.start()
+    try:
+        assert informer._pods_informer.wait_for_sync(5)
+        pods = informer.list_pods(namespace, label_selector)
+        if expected_names is None:
+            assert pods is None
+        else:
+            assert sorted(pod.metadata.name for pod in pods) == expected_names
+    finally:
+        informer.stop()
+
+
+def test_runtime_handler_lists_from_informer(k8s_helper, monkeypatch):
+    k8s_helper.v1api.list_namespaced_pod.return_value = k8s_client.V1PodList(
+        items=[_generate_pod("job-pod", {"mlrun/class": "job"})],
+        metadata=k8s_client.V1ListMeta(resource_version="1"),
+    )
+    k8s_helper.crdapi.list_namespaced_custom_object.return_value = {
+        "items": [
+            {"metadata": {"name": "mpijob", "labels": {"mlrun/class": "mpijob"}}}
+        ],
+        "metadata": {"resourceVersion": "1"},
+    }
+    monkeypatch.setattr(server.api.utils.singletons.k8s, "_k8s", k8s_helper)
+    informer = server.api.utils.singletons.k8s.RuntimeResourcesInformer(
+        k8s_helper, watch_factory=FakeWatch([])
+    )
+    monkeypatch.setattr(
+        server.api.utils.singletons.k8s, "_runtime_resources_informer", informer
+    )
+    informer.start()
+    try:
+        assert informer._pods_informer.wait_for_sync(5)
+        job_handler = server.api.runtime_handlers.get_runtime_handler(
+            mlrun.runtimes.RuntimeKinds.job
+        )
+        label_selector = job_handler._get_default_label_selector()
+        pods = list(
+            job_handler._list_pods_paginated(k8s_helper.namespace, label_selector)
+        )
+        assert [pod["metadata"]["name"] for pod in pods] == ["job-pod"]
+
+        mpijob_handler = server.api.runtime_handlers.get_runtime_handler(
+            mlrun.runtimes.RuntimeKinds.mpijob
+        )
+        label_selector = mpijob_handler._get_default_label_selector()
+        # the crd informer is created on first use, until it's synced the k8s API is used
+        mpijob_handler._list_crd_objects(k8s_helper.namespace, label_selector)
+        crd_informer = list(informer._crd_informers.values())[0]
+        assert crd_informer.wait_for_sync(5)
+        k8s_helper.crdapi.list_namespaced_custom_object.reset_mock()
+        crd_objects = mpijob_handler._list_crd_objects(
+            k8s_helper.namespace, label_selector
+        )
+        assert [crd["metadata"]["name"] for crd in crd_objects] == ["mpijob"]
+
+        # listed once by each informer, the handlers read from the cache
+        k8s_helper.v1api.list_namespaced_pod.assert_called_once()
+        k8s_helper.crdapi.list_namespaced_custom_object.assert_not_called()
+    finally:
+        informer.stop()
@@ -0,0 +1,155 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import concurrent.futures
+import os
+import time
+
+import pandas as pd
+
+import mlrun
+import mlrun.datastore.file_cache
+from mlrun.datastore.base import FileStats
+from mlrun.datastore.file_cache import LocalFileCache
+
+
+class _Downloader:
+    def __init__(self, body=b"data"):
+        self.body = body
+        self.calls = 0
+
+    def __call__(self, target_path):
+        self.calls += 1
+        time.sleep(0.05)
+        with open(target_path, "wb") as fp:
+            fp.write(self.body)
+
+
+def test_local_cache_single_download(tmp_path):
+    cache = LocalFileCache(str(tmp_path), max_size=1024)
+    download = _Downloader()
+    stats = FileStats(4, 1700000000.0, etag='"abc"')
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        paths = list(
+            executor.map(
+                lambda _: cache.get("s3://bucket/obj.csv", stats, download, ".csv"),
+                range(8),
+            )
+        )
+
+    assert download.calls == 1
+    assert len(set(paths)) == 1
+    assert paths[0].endswith(".csv")
+    with open(paths[0], "rb") as fp:
+        assert fp.read() == b"data"
+
+
+def test_local_cache_invalidation(tmp_path):
+    cache = LocalFileCache(str(tmp_path), max_size=1024)
+    download = _Downloader()
+    url = "s3://bucket/obj"
+
+    first = cache.get(url, FileStats(4, 1700000000.0), download)
+    assert cache.get(url, FileStats(4, 1700000000.0), download) == first
+    assert download.calls == 1
+
+    # a modified object is a new version
+    second = cache.get(url, FileStats(4, 1700000100.0), download)
+    assert second != first
+    assert download.calls == 2
+
+    # objects without version info are not cached
+    assert cache.get(url, FileStats(4, None), download) is None
+    assert download.calls == 2
+
+
+def test_local_cache_lru_eviction(tmp_path):
+    cache = LocalFileCache(str(tmp_path), max_size=10)
+    download = _Downloader(b"12345")
+
+    first = cache.get("s3://bucket/a", FileStats(5, 1.0), download)
+    second = cache.get("s3://bucket/b", FileStats(5, 1.0), download)
+    os.utime(first, (1, 1))
+    os.utime(second, (2, 2))
+
+    # access the first object so the second is the least recently used
+    cache.get("s3://bucket/a", FileStats(5, 1.0), download)
+    third = cache.get("s3://bucket/c", FileStats(5, 1.0), download)
+
+    assert os.path.isfile(first)
+    assert not os.path.isfile(second)
+    assert os.path.isfile(third)
+    assert cache.size() == 10
+
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_data_item_local_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        mlrun.mlconf.storage.local_cache, "enabled", True, raising=False
+    )
+    monkeypatch.setattr(
+        mlrun.mlconf.storage.local_cache, "path", str(tmp_path / "cache"), raising=False
+    )
+    monkeypatch.setattr(mlrun.datastore.file_cache, "_local_cache", None)
+
+    url = "memory://cached.csv"
+    mlrun.datastore.store_manager.object(url).put("a,b\n1,2\n")
+    data_item = mlrun.get_dataitem(url)
+    store = data_item.store
+
+    # the memory store is not cached, simulate a remote store
+    monkeypatch.setattr(store, "kind", "remote")
+    stats = []
+    monkeypatch.setattr(
+        store,
+        "stat",
+        lambda key: stats.append(key) or FileStats(8, 1700000000.0, etag="v1"),
+    )
+    downloads = []
+    original_download = store.download
+    monkeypatch.setattr(
+        store,
+        "download",
+        lambda key, target: downloads.append(key) or original_download(key, target),
+    )
+
+    local_path = data_item.local()
+    assert local_path.startswith(str(tmp_path / "cache"))
+    data_item.remove_local()
+    assert os.path.isfile(local_path)
+
+    other_data_item = mlrun.get_dataitem(url)
+    assert other_data_item.local() == local_path
+    assert len(downloads) == 1
+
+    df = data_item.as_df()
+    pd.testing.assert_frame_equal(df, pd.DataFrame({"a": [1], "b": [2]}))
+    # the object version is checked on the object which is downloaded
+    assert set(stats) == set(downloads)
+
+    # a file which was evicted after local() returned it is downloaded again
+    cache = mlrun.datastore.file_cache.get_local_cache()
+    cache.clear()
+    assert not os.path.isfile(local_path)
+    assert other_data_item.local() == local_path
+    assert os.path.isfile(local_path)
+    assert len(downloads) == 2
+
+    # the cache follows the max size configuration
+    monkeypatch.setattr(mlrun.mlconf.storage.local_cache, "max_size", 1)
+    assert mlrun.datastore.file_cache.get_local_cache() is cache
+    assert cache.max_size == 1
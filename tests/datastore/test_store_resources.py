@@ -0,0 +1,116 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import time
+
+import pytest
+
+import mlrun.datastore.store_resources
+from mlrun.datastore.store_resources import ResourceCache
+
+
+class _VersionedGetter:
+    def __init__(self):
+        self.version = 1
+        self.calls = []
+
+    def __call__(self, uri, db=None, secrets=None):
+        self.calls.append(uri)
+        return f"{uri}:v{self.version}"
+
+
+@pytest.fixture
+def versioned_getter(monkeypatch):
+    getter = _VersionedGetter()
+    monkeypatch.setattr(mlrun.datastore.store_resources, "get_store_resource", getter)
+    return getter
+
+
+def _wait_for(condition, timeout=5):
+    start = time.monotonic()
+    while not condition():
+        assert time.monotonic() - start < timeout, "timeout waiting for condition"
+        time.sleep(0.01)
+
+
+def test_resource_cache_ttl_stale_while_revalidate(versioned_getter):
+    cache = ResourceCache(ttl=0.1, stale_while_revalidate=True)
+    get_resource = cache.resource_getter()
+
+    assert (
+        get_resource("store://feature-sets/proj/fs")
+        == "store://feature-sets/proj/fs:v1"
+    )
+    assert (
+        get_resource("store://feature-sets/proj/fs")
+        == "store://feature-sets/proj/fs:v1"
+    )
+    assert len(versioned_getter.calls) == 1
+
+    versioned_getter.version = 2
+    time.sleep(0.15)
+    # the stale resource is served while being refreshed in the background
+    assert (
+        get_resource("store://feature-sets/proj/fs")
+        == "store://feature-sets/proj/fs:v1"
+    )
+    _wait_for(lambda: cache.get_stats()["refreshes"] == 1)
+    assert (
+        get_resource("store://feature-sets/proj/fs")
+        == "store://feature-sets/proj/fs:v2"
+    )
+
+    stats = cache.get_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+    assert stats["stale_hits"] == 1
+    assert stats["size"] == 1
+
+
+def test_resource_cache_ttl_sync_refresh(versioned_getter):
+    cache = ResourceCache(ttl=0.05, stale_while_revalidate=False)
+    get_resource = cache.resource_getter()
+
+    assert get_resource("fs") == "fs:v1"
+    versioned_getter.version = 2
+    time.sleep(0.1)
+    assert get_resource("fs") == "fs:v2"
+    assert len(versioned_getter.calls) == 2
+
+
+def test_resource_cache_lru_and_invalidation(versioned_getter):
+    cache = ResourceCache(ttl=0, max_size=2)
+    cache.cache_resource("pinned", "pinned-value", default=True)
+    get_resource = cache.resource_getter()
+
+    get_resource("a")
+    get_resource("b")
+    # touch "a" so "b" is the least recently used
+    get_resource("a")
+    get_resource("c")
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.get_resource("pinned") == "pinned-value"
+    assert get_resource(".") == "pinned-value"
+
+    get_resource("b")
+    assert versioned_getter.calls == ["a", "b", "c", "b"]
+
+    # uncached reads always go to the db
+    get_resource("a", use_cache=False)
+    assert versioned_getter.calls[-1] == "a"
+
+    cache.invalidate()
+    assert cache.get_stats()["size"] == 2
+    with pytest.raises(KeyError):
+        cache.get_resource("a")
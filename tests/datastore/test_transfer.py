@@ -0,0 +1,255 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import threading
+
+import pytest
+
+import mlrun.datastore
+import mlrun.datastore.transfer
+from mlrun.datastore.base import get_range
+from mlrun.datastore.transfer import split_ranges
+
+chunk_size = 1000
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    src_path = tmp_path / "model.bin"
+    src_path.write_bytes(os.urandom(10 * chunk_size + 123))
+    return str(src_path)
+
+
+def _get_store(path):
+    store, subpath, _ = mlrun.datastore.store_manager.get_or_create_store(path)
+    return store, subpath
+
+
+def test_split_ranges():
+    assert split_ranges(0, 10) == []
+    assert split_ranges(25, 10) == [(0, 10), (10, 10), (20, 5)]
+    # the chunk size grows so the number of parts is bounded
+    ranges = split_ranges(10**6, 10)
+    assert len(ranges) == mlrun.datastore.transfer.max_parts
+    assert sum(length for _, length in ranges) == 10**6
+
+
+def test_get_range():
+    # http ranges are inclusive
+    assert get_range(10, 0) == "bytes=0-9"
+    assert get_range(10, 20) == "bytes=20-29"
+    assert get_range(None, 20) == "bytes=20-"
+
+
+def test_chunked_download_resume(source_file, tmp_path, monkeypatch):
+    store, subpath = _get_store(source_file)
+    target_path = str(tmp_path / "downloaded.bin")
+
+    original_get = store.get
+    calls = []
+    lock = threading.Lock()
+
+    def failing_get(key, size=None, offset=0):
+        with lock:
+            calls.append(offset)
+        if offset == 5 * chunk_size:
+            raise ConnectionError("connection reset")
+        return original_get(key, size=size, offset=offset)
+
+    monkeypatch.setattr(store, "get", failing_get)
+    with pytest.raises(ConnectionError):
+        store.chunked_download(
+            subpath, target_path, chunk_size=chunk_size, max_workers=1
+        )
+    assert not os.path.exists(target_path)
+    assert os.path.exists(target_path + ".partial.json")
+
+    # resume, only the failed and the pending ranges are downloaded
+    def counting_get(key, size=None, offset=0):
+        with lock:
+            calls.append(offset)
+        return original_get(key, size=size, offset=offset)
+
+    calls.clear()
+    monkeypatch.setattr(store, "get", counting_get)
+    store.chunked_download(subpath, target_path, chunk_size=chunk_size, max_workers=4)
+    assert sorted(calls) == [offset * chunk_size for offset in range(5, 11)]
+
+    with open(source_file, "rb") as src, open(target_path, "rb") as target:
+        assert src.read() == target.read()
+    assert not os.path.exists(target_path + ".partial")
+    assert not os.path.exists(target_path + ".partial.json")
+
+
+def test_chunked_upload_resume(source_file, tmp_path, monkeypatch):
+    target_path = str(tmp_path / "target" / "model.bin")
+    os.makedirs(os.path.dirname(target_path))
+    store, subpath = _get_store(target_path)
+
+    original_upload_part = store._multipart_upload_part
+    uploaded_parts = []
+    failures = []
+
+    def failing_upload_part(key, upload_id, part_number, data):
+        if part_number == 3 and not failures:
+            failures.append(part_number)
+            raise ConnectionError("connection reset")
+        uploaded_parts.append(part_number)
+        return original_upload_part(key, upload_id, part_number, data)
+
+    monkeypatch.setattr(store, "_multipart_upload_part", failing_upload_part)
+    with pytest.raises(ConnectionError):
+        store.chunked_upload(subpath, source_file, chunk_size=chunk_size, max_workers=1)
+    assert not os.path.exists(target_path)
+
+    uploaded_parts.clear()
+    store.chunked_upload(subpath, source_file, chunk_size=chunk_size, max_workers=4)
+    assert sorted(uploaded_parts) == list(range(3, 12))
+
+    with open(source_file, "rb") as src, open(target_path, "rb") as target:
+        assert src.read() == target.read()
+    assert os.listdir(os.path.dirname(target_path)) == ["model.bin"]
+
+
+def test_chunked_upload_min_chunk_size(source_file, tmp_path, monkeypatch):
+    target_path = str(tmp_path / "target" / "model.bin")
+    os.makedirs(os.path.dirname(target_path))
+    store, subpath = _get_store(target_path)
+    monkeypatch.setattr(store, "min_multipart_chunk_size", 4 * chunk_size)
+
+    original_upload_part = store._multipart_upload_part
+    part_sizes = []
+
+    def counting_upload_part(key, upload_id, part_number, data):
+        part_sizes.append(len(data))
+        return original_upload_part(key, upload_id, part_number, data)
+
+    monkeypatch.setattr(store, "_multipart_upload_part", counting_upload_part)
+    store.chunked_upload(subpath, source_file, chunk_size=chunk_size, max_workers=1)
+    # the chunks are enlarged to the store min part size
+    assert part_sizes == [4 * chunk_size, 4 * chunk_size, 2 * chunk_size + 123]
+    with open(source_file, "rb") as src, open(target_path, "rb") as target:
+        assert src.read() == target.read()
+
+
+def _fail_upload_part(store, monkeypatch, part_number=3):
+    original_upload_part = store._multipart_upload_part
+
+    def failing_upload_part(key, upload_id, number, data):
+        if number == part_number:
+            raise ConnectionError("connection reset")
+        return original_upload_part(key, upload_id, number, data)
+
+    monkeypatch.setattr(store, "_multipart_upload_part", failing_upload_part)
+    return original_upload_part
+
+
+def test_chunked_upload_aborts_discarded_upload(source_file, tmp_path, monkeypatch):
+    target_path = str(tmp_path / "target" / "model.bin")
+    os.makedirs(os.path.dirname(target_path))
+    store, subpath = _get_store(target_path)
+    original_upload_part = _fail_upload_part(store, monkeypatch)
+    with pytest.raises(ConnectionError):
+        store.chunked_upload(subpath, source_file, chunk_size=chunk_size, max_workers=1)
+    # the parts of the failed upload are kept for resuming
+    assert len(os.listdir(os.path.dirname(target_path))) == 1
+
+    # the source was modified, the journal is discarded and its upload is aborted
+    with open(source_file, "ab") as fp:
+        fp.write(b"more data")
+    monkeypatch.setattr(store, "_multipart_upload_part", original_upload_part)
+    store.chunked_upload(subpath, source_file, chunk_size=chunk_size, max_workers=4)
+    assert os.listdir(os.path.dirname(target_path)) == ["model.bin"]
+    with open(source_file, "rb") as src, open(target_path, "rb") as target:
+        assert src.read() == target.read()
+
+
+def test_non_resumable_transfers_are_discarded(source_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.storage.transfer, "resumable", False)
+    target_path = str(tmp_path / "target" / "model.bin")
+    os.makedirs(os.path.dirname(target_path))
+    store, subpath = _get_store(target_path)
+    _fail_upload_part(store, monkeypatch)
+    with pytest.raises(ConnectionError):
+        store.chunked_upload(subpath, source_file, chunk_size=chunk_size, max_workers=1)
+    # the upload was aborted
+    assert os.listdir(os.path.dirname(target_path)) == []
+
+    store, subpath = _get_store(source_file)
+    download_path = str(tmp_path / "downloaded.bin")
+
+    def failing_get(key, size=None, offset=0):
+        raise ConnectionError("connection reset")
+
+    monkeypatch.setattr(store, "get", failing_get)
+    with pytest.raises(ConnectionError):
+        store.chunked_download(
+            subpath, download_path, chunk_size=chunk_size, max_workers=1
+        )
+    assert not os.path.exists(download_path + ".partial")
+    assert not os.path.exists(download_path + ".partial.json")
+
+
+def test_download_uses_given_stats(source_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.storage.transfer, "threshold", chunk_size)
+    store, subpath = _get_store(source_file)
+    stats = store.stat(subpath)
+    stat_calls = []
+    monkeypatch.setattr(store, "stat", lambda key: stat_calls.append(key))
+    chunked_calls = []
+    monkeypatch.setattr(
+        store,
+        "chunked_download",
+        lambda *args, **kwargs: chunked_calls.append(kwargs["stats"]),
+    )
+
+    mlrun.datastore.base.DataStore.download(
+        store, subpath, str(tmp_path / "target.bin"), stats=stats
+    )
+    assert chunked_calls == [stats]
+    assert stat_calls == []
+
+
+def test_download_uses_chunks_above_threshold(source_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.storage.transfer, "threshold", chunk_size)
+    monkeypatch.setattr(mlrun.mlconf.storage.transfer, "chunk_size", chunk_size)
+    store, subpath = _get_store(source_file)
+    chunked_calls = []
+    monkeypatch.setattr(
+        store,
+        "chunked_download",
+        lambda *args, **kwargs: chunked_calls.append(args),
+    )
+
+    # the file store download is a local copy, use the base (remote) download logic
+    mlrun.datastore.base.DataStore.download(
+        store, subpath, str(tmp_path / "target.bin")
+    )
+    assert len(chunked_calls) == 1
+
+
+def test_bulk_upload(tmp_path):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    files = []
+    for index in range(5):
+        (src_dir / f"{index}.txt").write_text(str(index))
+        files.append(
+            (str(src_dir / f"{index}.txt"), str(tmp_path / "target" / f"{index}.txt"))
+        )
+
+    mlrun.datastore.transfer.bulk_upload(files, max_workers=3)
+    for index in range(5):
+        assert (tmp_path / "target" / f"{index}.txt").read_text() == str(index)
@@ -17,9 +17,25 @@
 from datetime import datetime
 from unittest import mock
 
+import numpy as np
+import pandas as pd
+import pytest
+import storey
+
+from mlrun.datastore.store_resources import ResourceCache
+from mlrun.datastore.targets import ParquetTarget
+from mlrun.feature_store import FeatureSet
 from mlrun.feature_store.common import RunConfig
-from mlrun.feature_store.feature_vector import FeatureVector, FixedWindowType
+from mlrun.feature_store.feature_vector import (
+    CachedOnlineVectorService,
+    FeatureVector,
+    FixedWindowType,
+    OnlineVectorService,
+)
+from mlrun.feature_store.retrieval.local_merger import LocalFeatureMerger
 from mlrun.model import DataTargetBase
+from mlrun.serving.server import create_graph_server
+from mlrun.serving.states import RootFlowStep
 
 
 @mock.patch("mlrun.feature_store.api._get_online_feature_service")
@@ -109,3 +125,193 @@ def test_get_offline_features(mock_get_offline_features):
         test_timestamp_for_filtering,
         additional_filters,
     )
+
+
+class _FakeController:
+    """returns the features of known entities, like the online vector graph"""
+
+    def __init__(self, features: dict):
+        self.features = features
+        self.emitted = []
+
+    def emit(self, row, return_awaitable_result=False):
+        self.emitted.append(row["id"])
+        body = dict(row)
+        body.update(self.features.get(row["id"], {}))
+        return mock.Mock(await_result=mock.Mock(return_value=mock.Mock(body=body)))
+
+
+def _new_in_memory_online_service(
+    vector: FeatureVector, features: dict, requested_columns: list[str]
+) -> OnlineVectorService:
+    """online vector service which queries an in-memory table through a vector graph
+    (the same graph init_online_vector_service() builds for a single feature set)"""
+    table_uri = "store://feature-sets/default/stocks"
+    table = storey.Table("", storey.Driver())
+    for key, values in features.items():
+        table[str(key)] = values
+    cache = ResourceCache()
+    cache.cache_table(table_uri, table)
+
+    graph = RootFlowStep()
+    graph.to(
+        "storey.QueryByKey",
+        "query-stocks",
+        features=requested_columns,
+        table=table_uri,
+        key_field=["id"],
+    ).respond()
+    graph.set_flow_source(storey.SyncEmitSource())
+    server = create_graph_server(graph=graph, parameters={})
+    server.init_states(context=None, namespace=None, resource_cache=cache)
+    server.init_object(None)
+    return OnlineVectorService(
+        vector, graph, ["id"], requested_columns=requested_columns
+    )
+
+
+def test_online_vector_service_get_df():
+    vector = FeatureVector()
+    vector.spec.with_indexes = True
+    vector.status.label_column = "label"
+    service = _new_in_memory_online_service(
+        vector,
+        {
+            1: {"x": 1.0, "y": "a", "label": 0},
+            2: {"x": float("inf")},
+            3: {"x": float("nan"), "y": "c"},
+        },
+        requested_columns=["x", "y", "label"],
+    )
+    service._impute_values = {"x": -1.0, "y": "missing"}
+
+    with service:
+        df = service.get_df(pd.DataFrame({"id": [1, 2, 3, 4]}))
+        expected = pd.DataFrame(
+            {"x": [1.0, -1.0, -1.0, np.nan], "y": ["a", "missing", "c", np.nan]},
+            index=pd.Index([1, 2, 3, 4], name="id"),
+        )
+        pd.testing.assert_frame_equal(df, expected)
+
+        # the DataFrame matches get() for the found entities
+        rows = service.get([[1], [2], [3], [4]], as_list=True)
+        assert rows[:3] == [[1.0, "a"], [-1.0, "missing"], [-1.0, "c"]]
+        assert rows[3] is None
+
+        values = service.get_df([{"id": 1}, {"id": 4}], as_array=True)
+        assert values.shape == (2, 2)
+        assert values[0].tolist() == [1.0, "a"]
+
+
+def test_cached_online_vector_service():
+    vector = FeatureVector(features=["stocks.*", "proj/quotes:latest.bid"])
+    vector.status.index_keys = ["id"]
+    controller = _FakeController({1: {"x": 1.0}, 2: {"x": 2.0}, 3: {"x": 3.0}})
+    service = OnlineVectorService(
+        vector, mock.Mock(controller=controller), ["id"], requested_columns=["x"]
+    )
+
+    # the vector ttl is the shortest feature set ttl
+    cached = CachedOnlineVectorService(
+        service, ttl={"*": 60, "quotes": 30}, max_entries=2
+    )
+    assert cached.ttl == 30
+    assert cached.negative_ttl == 30
+
+    assert cached.get([[1], [9]], as_list=True) == [[1.0], None]
+    assert cached.get([[1], [9]], as_list=True) == [[1.0], None]
+    # only the first lookup reached the online store, including the missing key
+    assert controller.emitted == [1, 9]
+
+    cached.get([[2]], as_list=True)
+    stats = cached.get_stats()
+    assert stats["hits"] == 1
+    assert stats["negative_hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["evictions"] == 1
+    assert stats["size"] == 2
+    assert stats["hit_ratio"] == 0.4
+
+    # entry 1 was evicted (least recently used)
+    cached.get([[1]], as_list=True)
+    assert controller.emitted == [1, 9, 2, 1]
+
+
+@pytest.mark.parametrize("feature_set_names", [["fs1"], ["fs1", "fs2"]])
+def test_incremental_offline_vector(
+    rundb_mock, tmp_path, monkeypatch, feature_set_names
+):
+    # the fs1 rows after the day boundary are joined "as of" their timestamp with fs2 rows of the previous day
+    data = {
+        "fs1": pd.DataFrame(
+            {
+                "id": [1, 2, 1, 2],
+                "x": [1, 2, 3, 4],
+                "t": pd.to_datetime(
+                    [
+                        "2024-01-01 10:00",
+                        "2024-01-01 23:30",
+                        "2024-01-02 00:30",
+                        "2024-01-02 12:00",
+                    ]
+                ),
+            }
+        ),
+        "fs2": pd.DataFrame(
+            {
+                "id": [1, 2],
+                "y": [10, 20],
+                "t": pd.to_datetime(["2024-01-01 09:00", "2024-01-01 23:00"]),
+            }
+        ),
+    }
+    feature_set_objects = {}
+    for name in feature_set_names:
+        feature_set = FeatureSet(
+            name, entities=["id"], timestamp_key="t", engine="pandas"
+        )
+        feature_set._run_db = rundb_mock
+        feature_set.save = mock.Mock()
+        feature_set.purge_targets = mock.Mock()
+        feature_set.ingest(
+            data[name],
+            targets=[ParquetTarget(path=str(tmp_path / f"{name}.parquet"))],
+            return_df=False,
+        )
+        feature_set_objects[name] = feature_set
+    feature_set_fields = {"fs1": [("x", None)], "fs2": [("y", None)]}
+
+    vector = FeatureVector(features=[f"{name}.*" for name in feature_set_names])
+    vector.save = mock.Mock()
+    monkeypatch.setattr(
+        vector,
+        "parse_features",
+        lambda **kwargs: (
+            feature_set_objects,
+            {name: feature_set_fields[name] for name in feature_set_names},
+        ),
+    )
+
+    def get_offline_features(incremental, target_path):
+        merger = LocalFeatureMerger(vector, incremental=incremental)
+        return merger.start(
+            target=ParquetTarget(path=target_path),
+            start_time="2024-01-01",
+            end_time="2024-01-03",
+        ).to_dataframe()
+
+    def sort(df):
+        return df.sort_values("x").reset_index(drop=True)
+
+    expected = sort(get_offline_features(False, str(tmp_path / "full.parquet")))
+    assert expected["x"].tolist() == [1, 2, 3, 4]
+
+    incremental_target_path = str(tmp_path / "incremental.parquet")
+    # the second call reuses the partitions materialized by the first
+    for _ in range(2):
+        df = sort(get_offline_features(True, incremental_target_path))
+        pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+
+        # the target holds the whole result
+        written = sort(pd.read_parquet(incremental_target_path))
+        pd.testing.assert_frame_equal(written, expected, check_dtype=False)
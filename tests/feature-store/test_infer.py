@@ -14,12 +14,16 @@
 #
 import unittest.mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
 import mlrun
+import mlrun.data_types.infer
 import mlrun.feature_store as fstore
 from mlrun.data_types import InferOptions
+from mlrun.data_types.infer import get_df_sketch_stats, get_df_stats
+from mlrun.data_types.sketches import DataFrameSketch
 from mlrun.datastore.targets import ParquetTarget
 from mlrun.feature_store import Entity
 from mlrun.feature_store.api import _infer_from_static_df
@@ -158,3 +162,88 @@ def test_check_timestamp_key_is_entity():
         fstore.FeatureSet(
             "imp1", entities=[Entity("time_stamp")], timestamp_key="time_stamp"
         )
+
+
+def test_sketch_stats_small_df_is_exact():
+    df = pd.DataFrame(
+        {
+            "time": pd.date_range("2024-01-01", periods=7, freq="D"),
+            "int": [1, 5, 2, 9, 2, 7, 3],
+            "float": [1.5, 4.0, 2.0, 0.5, 8.25, 3.0, 3.0],
+            "bool": [True, False, True, True, False, True, True],
+            "str": ["a", "b", "a", None, "c", "a", "b"],
+        }
+    )
+    options = InferOptions.all_stats()
+    expected = get_df_stats(df, options)
+
+    # every partition is sketched separately and the sketches are merged
+    stats = get_df_sketch_stats(df, options, partition_rows=2, max_workers=2)
+    assert stats.keys() == expected.keys()
+    for column, column_stats in stats.items():
+        assert column_stats.keys() == expected[column].keys()
+        for key, value in column_stats.items():
+            if isinstance(value, float):
+                assert value == pytest.approx(expected[column][key])
+            else:
+                assert value == expected[column][key]
+
+
+def test_sketch_stats_merge_partitions():
+    rng = np.random.default_rng(42)
+    rows = 200000
+    df = pd.DataFrame(
+        {
+            "normal": rng.normal(10, 2, rows),
+            "discrete": rng.integers(0, 50, rows),
+            "category": rng.integers(0, 30000, rows).astype(str),
+        }
+    )
+    options = InferOptions.all_stats()
+    expected = get_df_stats(df, options)
+    stats = get_df_sketch_stats(df, options, partition_rows=20000)
+
+    normal = stats["normal"]
+    for key in ["count", "mean", "std", "min", "max"]:
+        assert normal[key] == pytest.approx(expected["normal"][key])
+    for key in ["25%", "50%", "75%"]:
+        assert normal[key] == pytest.approx(expected["normal"][key], abs=0.02)
+    assert normal["hist"][1] == pytest.approx(expected["normal"]["hist"][1])
+    assert sum(normal["hist"][0]) == rows
+    assert np.allclose(
+        normal["hist"][0], expected["normal"]["hist"][0], atol=rows * 0.001
+    )
+
+    # the discrete values are on the histogram bins boundaries
+    assert stats["discrete"]["hist"] == expected["discrete"]["hist"]
+
+    # more distinct values than tracked, unique is estimated
+    category = stats["category"]
+    assert category["count"] == rows
+    assert category["unique"] == pytest.approx(expected["category"]["unique"], rel=0.03)
+
+
+def test_get_df_stats_uses_sketches(monkeypatch):
+    df = pd.DataFrame({"x": [float(i) for i in range(100)]})
+    monkeypatch.setattr(mlrun.mlconf.feature_store, "stats_sketch_min_rows", 50)
+    sketch_stats = unittest.mock.Mock(wraps=mlrun.data_types.infer.get_df_sketch_stats)
+    monkeypatch.setattr(mlrun.data_types.infer, "get_df_sketch_stats", sketch_stats)
+
+    stats = get_df_stats(df, InferOptions.all_stats())
+    assert sketch_stats.call_count == 1
+    assert stats["x"]["count"] == 100
+    assert stats["x"]["50%"] == 49.5
+
+
+def test_sketch_stats_column_type_change():
+    numbers = pd.DataFrame({"x": [1, 2, 2, 3]})
+    strings = pd.DataFrame({"x": ["a", "b", "a", "2"]})
+
+    # the column is numeric in one partition and strings in another, it falls back to categorical
+    merged = DataFrameSketch().update(numbers).merge(DataFrameSketch().update(strings))
+    updated = DataFrameSketch().update(numbers).update(strings)
+    for sketch in [merged, updated]:
+        stats = sketch.get_stats(num_bins=20)["x"]
+        assert stats["count"] == 8
+        assert stats["unique"] == 6
+        assert stats["freq"] == 2
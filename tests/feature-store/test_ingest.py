@@ -19,7 +19,7 @@ import pytest
 
 import mlrun
 import mlrun.feature_store as fstore
-from mlrun.datastore.targets import DFTarget
+from mlrun.datastore.targets import DFTarget, ParquetTarget
 
 
 def test_columns_with_illegal_characters(rundb_mock):
@@ -121,3 +121,56 @@ def test_return_df(rundb_mock):
     result_df = fset.ingest(df, targets=[DFTarget()])
 
     assert isinstance(result_df, pd.DataFrame)
+
+
+def test_chunked_parquet_ingestion(rundb_mock, tmp_path, monkeypatch):
+    df = pd.DataFrame(
+        {
+            "ticker": [f"T{i}" for i in range(1000)],
+            "bid": [float(i) for i in range(1000)],
+        }
+    )
+    source_path = str(tmp_path / "source.parquet")
+    # multiple row groups
+    df.to_parquet(source_path, row_group_size=100)
+    monkeypatch.setattr(mlrun.mlconf.feature_store, "ingestion_chunksize", 128)
+
+    fset = fstore.FeatureSet(
+        "myset", entities=[fstore.Entity("ticker")], engine="pandas"
+    )
+    fset._run_db = rundb_mock
+    fset.save = unittest.mock.Mock()
+    fset.purge_targets = unittest.mock.Mock()
+
+    chunk_sizes = []
+    original_init_graph = fstore.api.init_featureset_graph
+
+    def init_featureset_graph(*args, on_chunk=None, **kwargs):
+        def record_chunk(chunk):
+            chunk_sizes.append(len(chunk))
+            on_chunk(chunk)
+
+        return original_init_graph(*args, on_chunk=record_chunk, **kwargs)
+
+    monkeypatch.setattr(fstore.api, "init_featureset_graph", init_featureset_graph)
+
+    target_path = str(tmp_path / "target/")
+    result = fset.ingest(
+        source_path,
+        targets=[ParquetTarget(path=target_path)],
+        return_df=False,
+    )
+
+    # the source was processed in bounded chunks and the stats were merged across the chunks
+    assert result is None
+    assert max(chunk_sizes) <= 128
+    assert sum(chunk_sizes) == 1000
+    stats = fset.status.stats["bid"]
+    assert stats["count"] == 1000
+    assert stats["min"] == 0.0
+    assert stats["max"] == 999.0
+    assert stats["mean"] == pytest.approx(499.5)
+    assert stats["std"] == pytest.approx(df["bid"].std())
+
+    written = pd.read_parquet(target_path)
+    assert sorted(written["bid"].tolist()) == df["bid"].tolist()
@@ -0,0 +1,227 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import json
+import threading
+from collections.abc import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+
+import mlrun
+import mlrun.common.schemas.model_monitoring.constants as mm_constants
+from mlrun.model_monitoring.controller import (
+    MonitoringApplicationController,
+    _ConsistentHashRing,
+    _get_event_shard,
+    _Interval,
+    _shard_locks,
+)
+
+
+def test_hash_ring_shards():
+    endpoint_ids = [f"endpoint-{i}" for i in range(1000)]
+    ring = _ConsistentHashRing(4)
+    shards = [ring.get_shard(endpoint_id) for endpoint_id in endpoint_ids]
+    assert set(shards) == {0, 1, 2, 3}
+    assert min(shards.count(shard) for shard in range(4)) > 150
+
+    # adding a shard only moves endpoints to the new shard
+    new_shards = [_ConsistentHashRing(5).get_shard(key) for key in endpoint_ids]
+    moved = [(old, new) for old, new in zip(shards, new_shards) if old != new]
+    assert all(new == 4 for _, new in moved)
+    assert len(moved) < len(endpoint_ids) / 3
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        (b"", (None, None)),
+        (json.dumps({"shard": 1, "shards_count": 3}).encode(), (1, 3)),
+        ({"shard": 0, "shards_count": 2}, (0, 2)),
+        ("not-json", (None, None)),
+    ],
+)
+def test_get_event_shard(body, expected):
+    assert _get_event_shard(Mock(body=body)) == expected
+
+
+class _FakeBatchWindow:
+    def __init__(self, intervals: int):
+        start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        step = datetime.timedelta(minutes=10)
+        self.intervals = [
+            _Interval(start + i * step, start + (i + 1) * step)
+            for i in range(intervals)
+        ]
+
+    def get_intervals(self, update_last_analyzed: bool = True):
+        assert not update_last_analyzed
+        yield from self.intervals
+
+
+def _endpoint(uid: str, endpoint_type=mm_constants.EndpointType.NODE_EP) -> dict:
+    return {
+        mm_constants.EventFieldType.UID: uid,
+        mm_constants.EventFieldType.ACTIVE: True,
+        mm_constants.EventFieldType.MONITORING_MODE: mm_constants.ModelMonitoringMode.enabled.value,
+        mm_constants.EventFieldType.ENDPOINT_TYPE: endpoint_type,
+        mm_constants.EventFieldType.STREAM_PATH: "stream",
+        mm_constants.EventFieldType.FIRST_REQUEST: "2024-01-01 00:00:00+00:00",
+        mm_constants.EventFieldType.LAST_REQUEST: "2024-01-01 01:00:00+00:00",
+    }
+
+
+class TestController:
+    applications = ["app1", "app2"]
+
+    @pytest.fixture
+    def endpoints(self) -> list[dict]:
+        return [_endpoint(f"ep-{i}") for i in range(20)] + [
+            _endpoint("router", mm_constants.EndpointType.ROUTER)
+        ]
+
+    @pytest.fixture
+    def windows(self) -> dict:
+        return {}
+
+    @pytest.fixture
+    def pusher(self) -> Mock:
+        return Mock()
+
+    @pytest.fixture
+    def store(self, endpoints: list[dict]) -> Mock:
+        store = Mock()
+        store.list_model_endpoints.return_value = endpoints
+        return store
+
+    @pytest.fixture
+    def controller_factory(
+        self, store: Mock, windows: dict, pusher: Mock, monkeypatch
+    ) -> Iterator:
+        monkeypatch.setenv(
+            mm_constants.EventFieldType.BATCH_INTERVALS_DICT,
+            json.dumps({"minutes": 10, "hours": 0, "days": 0}),
+        )
+        monkeypatch.setattr(
+            mlrun.mlconf.model_endpoint_monitoring, "controller_push_batch_size", 7
+        )
+        project = Mock()
+        monitoring_functions = []
+        for name in self.applications:
+            function = Mock()
+            # "name" is a Mock constructor argument, set it as an attribute
+            function.metadata.name = name
+            monitoring_functions.append(function)
+        project.list_model_monitoring_functions.return_value = monitoring_functions
+        tsdb = Mock()
+        # the even intervals have no data
+        tsdb.read_predictions.side_effect = lambda start, **kwargs: Mock(
+            data=start.minute % 20 == 0
+        )
+
+        def get_batch_window(endpoint, application, **kwargs):
+            windows[(endpoint, application)] = _FakeBatchWindow(intervals=6)
+            return windows[(endpoint, application)]
+
+        with (
+            patch("mlrun.load_project", return_value=project),
+            patch("mlrun.model_monitoring.get_store_object", return_value=store),
+            patch("mlrun.model_monitoring.get_tsdb_connector", return_value=tsdb),
+            patch(
+                "mlrun.model_monitoring.controller.get_stream_pusher",
+                return_value=pusher,
+            ),
+            patch(
+                "mlrun.model_monitoring.controller.get_stream_path",
+                side_effect=lambda project, function_name: f"stream-{function_name}",
+            ),
+        ):
+
+            def factory(**kwargs) -> MonitoringApplicationController:
+                controller = MonitoringApplicationController(**kwargs)
+                monkeypatch.setattr(
+                    controller._batch_window_generator,
+                    "get_batch_window",
+                    get_batch_window,
+                )
+                return controller
+
+            yield factory
+
+    def test_run(self, controller_factory, windows: dict, pusher: Mock, store: Mock):
+        tick = controller_factory().run()
+
+        # the router endpoint is skipped
+        assert tick.endpoints == 20
+        assert tick.errors == 0
+        assert tick.intervals == 20 * 2 * 6
+        # 3 of the 6 intervals have data
+        assert tick.pushed_events == 20 * 2 * 3
+        # 60 events per application stream, in batches of 7
+        assert tick.push_batches == 2 * 9
+        for call in pusher.push.call_args_list:
+            events = call.args[0]
+            assert len(events) <= 7
+            assert (
+                len(
+                    {
+                        event[mm_constants.ApplicationEvent.APPLICATION_NAME]
+                        for event in events
+                    }
+                )
+                == 1
+            )
+        assert tick.total_duration >= tick.read_duration
+
+        # the last analyzed time is updated after the push, in bulk per application
+        assert store.update_last_analyzed_bulk.call_count == len(self.applications)
+        last_analyzed = {}
+        for call in store.update_last_analyzed_bulk.call_args_list:
+            last_analyzed.update(call.args[0])
+        assert last_analyzed == {
+            key: int(window.intervals[-1].end.timestamp())
+            for key, window in windows.items()
+        }
+
+    def test_failed_push_does_not_update_last_analyzed(
+        self, controller_factory, pusher: Mock, store: Mock
+    ):
+        pusher.push.side_effect = RuntimeError("stream is down")
+        tick = controller_factory().run()
+        assert tick.errors == 2
+        store.update_last_analyzed_bulk.assert_not_called()
+
+    def test_sharded_run(self, controller_factory, windows: dict):
+        processed = set()
+        for shard in range(3):
+            windows.clear()
+            tick = controller_factory(shard=shard, shards_count=3).run()
+            shard_endpoints = {endpoint for endpoint, _ in windows}
+            assert tick.endpoints == len(shard_endpoints)
+            assert not processed & shard_endpoints
+            processed |= shard_endpoints
+        assert processed == {f"ep-{i}" for i in range(20)}
+
+    def test_shard_runs_are_serialized(self, controller_factory, store: Mock):
+        controller = controller_factory(shard=0, shards_count=2)
+        shard_lock = _shard_locks.setdefault(
+            (controller.project, 0, 2), threading.Lock()
+        )
+        with shard_lock:
+            # the shard is processed by another run
+            assert controller.run() is None
+        store.list_model_endpoints.assert_not_called()
+        assert controller.run().endpoints > 0
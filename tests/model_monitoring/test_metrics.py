@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import os
+import time
 from typing import Union
 
 import numpy as np
@@ -26,6 +27,7 @@ from mlrun.model_monitoring.metrics.histogram_distance import (
     HistogramDistanceMetric,
     KullbackLeiblerDivergence,
     TotalVarianceDistance,
+    compute_metrics_batch,
 )
 
 
@@ -167,3 +169,78 @@ class TestMetricProperties:
             metric_class(distrib_t=distrib_u, distrib_u=distrib_t).compute(),
             atol=1e-8,
         )
+
+    @staticmethod
+    @given(
+        distributions=st.integers(min_value=1, max_value=_max_value).flatmap(
+            lambda length: st.lists(
+                st.tuples(distribution_strategy(length), distribution_strategy(length)),
+                min_size=1,
+                max_size=10,
+            )
+        )
+    )
+    def test_compute_batch(
+        metric_class: type[HistogramDistanceMetric],
+        distributions: list[tuple[np.ndarray, np.ndarray]],
+    ) -> None:
+        distrib_t = np.stack([distrib_t for distrib_t, _ in distributions])
+        distrib_u = np.stack([distrib_u for _, distrib_u in distributions])
+        assert np.allclose(
+            metric_class.compute_batch(distrib_t=distrib_t, distrib_u=distrib_u),
+            [
+                metric_class(distrib_t=distrib_t, distrib_u=distrib_u).compute()
+                for distrib_t, distrib_u in distributions
+            ],
+            atol=1e-8,
+        )
+
+
+def test_compute_metrics_batch_capping() -> None:
+    distrib_t = np.array([[1.0, 0.0], [0.5, 0.5]])
+    distrib_u = np.array([[0.0, 1.0], [0.5, 0.5]])
+    assert np.array_equal(
+        KullbackLeiblerDivergence.compute_batch(
+            distrib_t=distrib_t, distrib_u=distrib_u, capping=10
+        ),
+        [
+            KullbackLeiblerDivergence(
+                distrib_t=distrib_t[0], distrib_u=distrib_u[0]
+            ).compute(capping=10),
+            0,
+        ],
+    )
+    with pytest.raises(ValueError):
+        compute_metrics_batch([TotalVarianceDistance], distrib_t, distrib_u[:1])
+
+
+@pytest.mark.skipif(
+    not os.environ.get("MLRUN_RUN_BENCHMARKS"),
+    reason="benchmark, set MLRUN_RUN_BENCHMARKS to run",
+)
+@pytest.mark.parametrize("features_count", [100, 1000, 5000])
+def test_compute_metrics_batch_benchmark(features_count: int) -> None:
+    rng = np.random.default_rng(features_count)
+    distrib_t = rng.random((features_count, 22))
+    distrib_t /= distrib_t.sum(axis=1, keepdims=True)
+    distrib_u = rng.random((features_count, 22))
+    distrib_u /= distrib_u.sum(axis=1, keepdims=True)
+    metrics = HistogramDistanceMetric.__subclasses__()
+
+    start = time.perf_counter()
+    per_feature = {
+        metric.NAME: [
+            metric(distrib_t=row_t, distrib_u=row_u).compute()
+            for row_t, row_u in zip(distrib_t, distrib_u)
+        ]
+        for metric in metrics
+    }
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = compute_metrics_batch(metrics, distrib_t=distrib_t, distrib_u=distrib_u)
+    batch_time = time.perf_counter() - start
+
+    for name, values in per_feature.items():
+        assert np.allclose(batch[name], values)
+    assert batch_time < loop_time, f"batch={batch_time:.4f}s, loop={loop_time:.4f}s"
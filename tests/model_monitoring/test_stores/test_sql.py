@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import datetime
+import json
 import string
 import time
 import unittest.mock
@@ -26,6 +27,7 @@ import pytest
 
 import mlrun.common.schemas
 import mlrun.model_monitoring
+from mlrun.common.db.sql_session import create_session
 from mlrun.common.schemas.model_monitoring import (
     MetricData,
     ModelEndpointMonitoringMetric,
@@ -188,6 +190,59 @@ class TestSQLStore:
         )
         assert len(filtered_list_of_endpoints) == 1
 
+    @classmethod
+    def test_sql_target_list_model_endpoints_labels_and_pages(
+        cls,
+        new_sql_store: SQLStoreBase,
+        _mock_random_endpoint: mlrun.common.schemas.ModelEndpoint,
+    ) -> None:
+        all_labels = [
+            {"team": "a", "tier": 1},
+            {"team": "b", "tier": 2},
+            {"team": "a"},
+            {},
+            {"team": "a", "tier": "1"},
+        ]
+        for i, labels in enumerate(all_labels):
+            _mock_random_endpoint.metadata.uid = f"ep-{i}"
+            _mock_random_endpoint.metadata.labels = labels
+            _mock_random_endpoint.status.feature_stats = {"f": {"mean": i}}
+            new_sql_store.write_model_endpoint(_mock_random_endpoint.flat_dict())
+
+        def list_uids(**kwargs) -> list[str]:
+            return sorted(
+                endpoint[mlrun.common.schemas.model_monitoring.EventFieldType.UID]
+                for endpoint in new_sql_store.list_model_endpoints(**kwargs)
+            )
+
+        # The SQL label filters match the Python validation of the labels
+        for labels in [["team"], ["team=a"], ["tier=1"], ["team=a", "tier"], ["x"]]:
+            assert list_uids(labels=labels) == [
+                endpoint["uid"]
+                for endpoint in sorted(
+                    new_sql_store.list_model_endpoints(), key=lambda ep: ep["uid"]
+                )
+                if new_sql_store._validate_labels(endpoint, labels)
+            ], labels
+        assert list_uids(labels=["tier=1"]) == ["ep-0", "ep-4"]
+        assert list_uids(labels=["team=a", "tier"]) == ["ep-0", "ep-4"]
+
+        # Keyset pagination
+        pages = []
+        after = None
+        while page := new_sql_store.list_model_endpoints(limit=2, after=after):
+            pages.append([endpoint["uid"] for endpoint in page])
+            after = page[-1]["uid"]
+        assert pages == [["ep-0", "ep-1"], ["ep-2", "ep-3"], ["ep-4"]]
+        assert list_uids(labels=["team=a"], limit=1, after="ep-0") == ["ep-2"]
+
+        # The stats are not returned unless requested
+        endpoint = new_sql_store.list_model_endpoints(limit=1)[0]
+        assert "feature_stats" not in endpoint
+        assert "current_stats" not in endpoint
+        endpoint = new_sql_store.list_model_endpoints(limit=1, include_stats=True)[0]
+        assert json.loads(endpoint["feature_stats"]) == {"f": {"mean": 0}}
+
     @staticmethod
     def test_sql_target_patch_endpoint(
         new_sql_store: SQLStoreBase,
@@ -320,6 +375,141 @@ class TestSQLStore:
         )
         assert get_metrics() == [], "Metric remained after deletion"
 
+    @staticmethod
+    def _results_events(
+        endpoint_id: str, count: int, value: float
+    ) -> list[tuple[_AppResultEvent, WriterEventKind]]:
+        return [
+            (
+                _AppResultEvent(
+                    {
+                        WriterEvent.ENDPOINT_ID: endpoint_id,
+                        WriterEvent.START_INFER_TIME: "2023-09-19 14:26:06.501084",
+                        WriterEvent.END_INFER_TIME: "2023-09-19 16:26:06.501084",
+                        WriterEvent.APPLICATION_NAME: f"app-{i % 3}",
+                        ResultData.RESULT_NAME: f"result-{i}",
+                        ResultData.RESULT_KIND: 0,
+                        ResultData.RESULT_VALUE: value + i,
+                        ResultData.RESULT_STATUS: 0,
+                        ResultData.RESULT_EXTRA_DATA: "",
+                    }
+                ),
+                WriterEventKind.RESULT,
+            )
+            for i in range(count)
+        ]
+
+    @classmethod
+    def test_sql_write_application_events(
+        cls,
+        new_sql_store: SQLStoreBase,
+        metric_event: _AppResultEvent,
+        _mock_random_endpoint: mlrun.common.schemas.ModelEndpoint,
+    ) -> None:
+        new_sql_store.write_model_endpoint(endpoint=_mock_random_endpoint.flat_dict())
+        table = new_sql_store.application_results_table
+
+        # More events than a single statement takes, and an overwritten result in the same batch
+        events = cls._results_events(cls._MODEL_ENDPOINT_ID, count=300, value=0)
+        events.append(cls._results_events(cls._MODEL_ENDPOINT_ID, count=1, value=7)[0])
+        events.append((metric_event, WriterEventKind.METRIC))
+        new_sql_store.write_application_events(events=events)
+
+        with create_session(dsn=new_sql_store._sql_connection_string) as session:
+            values = {
+                record.result_name: record.result_value
+                for record in session.query(table)
+            }
+        assert len(values) == 300
+        assert values["result-0"] == 7
+        assert values["result-299"] == 299
+        assert (
+            len(
+                new_sql_store.get_model_endpoint_metrics(
+                    endpoint_id=cls._MODEL_ENDPOINT_ID,
+                    type=ModelEndpointMonitoringMetricType.METRIC,
+                )
+            )
+            == 1
+        )
+
+        # Upsert the existing results
+        new_sql_store.write_application_events(
+            events=cls._results_events(cls._MODEL_ENDPOINT_ID, count=10, value=1000)
+        )
+        with create_session(dsn=new_sql_store._sql_connection_string) as session:
+            assert session.query(table).count() == 300
+            record = session.query(table).filter(table.result_name == "result-9").one()
+        assert record.result_value == 1009
+        assert record.start_infer_time.replace(
+            tzinfo=datetime.timezone.utc
+        ) == datetime.datetime(2023, 9, 19, 14, 26, 6, 501084, datetime.timezone.utc)
+
+    @staticmethod
+    def test_sql_update_last_analyzed_bulk(new_sql_store: SQLStoreBase) -> None:
+        new_sql_store.update_last_analyzed(
+            endpoint_id="ep-0", application_name="app-0", last_analyzed=1
+        )
+        last_analyzed = {
+            (f"ep-{i}", f"app-{j}"): 100 * i + j for i in range(5) for j in range(3)
+        }
+        new_sql_store.update_last_analyzed_bulk(last_analyzed)
+
+        for (endpoint_id, application_name), value in last_analyzed.items():
+            assert (
+                new_sql_store.get_last_analyzed(
+                    endpoint_id=endpoint_id, application_name=application_name
+                )
+                == value
+            )
+        with create_session(dsn=new_sql_store._sql_connection_string) as session:
+            assert session.query(new_sql_store.MonitoringSchedulesTable).count() == 15
+
+    @classmethod
+    def test_sql_bulk_writes_benchmark(cls, new_sql_store: SQLStoreBase) -> None:
+        """Compare the per-record writes with the bulk writes on a local SQLite database"""
+        events_count = 500
+        single_events = cls._results_events("ep-single", events_count, value=0)
+        bulk_events = cls._results_events("ep-bulk", events_count, value=0)
+        single_pairs = {(f"ep-single-{i}", "app"): i for i in range(events_count)}
+        bulk_pairs = {(f"ep-bulk-{i}", "app"): i for i in range(events_count)}
+
+        start = time.perf_counter()
+        for event, kind in single_events:
+            new_sql_store.write_application_event(event=event, kind=kind)
+        for (endpoint_id, application_name), value in single_pairs.items():
+            new_sql_store.update_last_analyzed(
+                endpoint_id=endpoint_id,
+                application_name=application_name,
+                last_analyzed=value,
+            )
+        single_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        new_sql_store.write_application_events(events=bulk_events)
+        new_sql_store.update_last_analyzed_bulk(bulk_pairs)
+        bulk_duration = time.perf_counter() - start
+
+        with create_session(dsn=new_sql_store._sql_connection_string) as session:
+            table = new_sql_store.application_results_table
+            for endpoint_id in ["ep-single", "ep-bulk"]:
+                assert (
+                    session.query(table)
+                    .filter(table.endpoint_id == endpoint_id)
+                    .count()
+                    == events_count
+                )
+        assert new_sql_store.get_last_analyzed(
+            endpoint_id=f"ep-bulk-{events_count - 1}", application_name="app"
+        ) == new_sql_store.get_last_analyzed(
+            endpoint_id=f"ep-single-{events_count - 1}", application_name="app"
+        )
+        print(
+            f"{events_count} results and last analyzed records: "
+            f"per record {single_duration:.3f}s, bulk {bulk_duration:.3f}s "
+            f"(x{single_duration / bulk_duration:.1f})"
+        )
+
 
 class TestMonitoringSchedules:
     @staticmethod
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 from collections import Counter
 from collections.abc import Iterator
 from dataclasses import dataclass
@@ -240,6 +241,44 @@ def test_write_application_metric(
     kv_client_mock.create_schema.assert_called_once()
 
 
+def test_list_model_endpoints(
+    mocked_client_store: KVStoreBase, kv_client_mock: v3io.dataplane.kv.Model
+) -> None:
+    items = [
+        {
+            mm_constants.EventFieldType.UID: f"ep-{i}",
+            mm_constants.EventFieldType.LABELS: json.dumps(labels),
+        }
+        for i, labels in enumerate(
+            [{"team": "a"}, {"team": "b"}, {"team": "a", "tier": 1}, {}]
+        )
+    ][::-1]
+    # Old schema record
+    items.append({mm_constants.EventFieldType.ENDPOINT_ID: "ep-4", "labels": "{}"})
+    kv_client_mock.new_cursor.return_value = Mock(all=Mock(return_value=items))
+
+    def list_uids(**kwargs) -> list[str]:
+        return [
+            endpoint[mm_constants.EventFieldType.UID]
+            for endpoint in mocked_client_store.list_model_endpoints(**kwargs)
+        ]
+
+    assert list_uids(labels=["team=a"]) == ["ep-2", "ep-0"]
+    assert list_uids(labels=["tier=1"]) == ["ep-2"]
+    assert list_uids(uids=["ep-1", "ep-4"]) == ["ep-1", "ep-4"]
+    assert list_uids(limit=2) == ["ep-0", "ep-1"]
+    assert list_uids(limit=2, after="ep-1") == ["ep-2", "ep-3"]
+    assert list_uids(labels=["team"], after="ep-0") == ["ep-1", "ep-2"]
+
+    # The endpoints are read in a single scan, without the stats unless requested
+    kv_client_mock.get.assert_not_called()
+    attribute_names = kv_client_mock.new_cursor.call_args.kwargs["attribute_names"]
+    assert mm_constants.EventFieldType.FEATURE_STATS not in attribute_names
+    assert mm_constants.EventFieldType.LABELS in attribute_names
+    mocked_client_store.list_model_endpoints(include_stats=True)
+    assert kv_client_mock.new_cursor.call_args.kwargs["attribute_names"] == "*"
+
+
 class TestGetModelEndpointMetrics:
     PROJECT = "demo-proj"
     ENDPOINT = "70450e1ef7cc9506d42369aeeb056eaaaa0bb8bd"
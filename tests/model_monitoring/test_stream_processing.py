@@ -12,15 +12,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datetime
+import json
+import pathlib
+import time
+import typing
+import unittest.mock
+
+import pandas as pd
 import pytest
+import storey
+import storey.steps
 
 import mlrun
-from mlrun.model_monitoring.stream_processing import EventStreamProcessor
+import mlrun.model_monitoring.helpers
+from mlrun.common.schemas.model_monitoring import EventFieldType
+from mlrun.model_monitoring.db.tsdb.stream_graph_steps import (
+    SamplePredictions,
+    UnpackPredictions,
+)
+from mlrun.model_monitoring.stream_processing import (
+    AggregateLatency,
+    EventStreamProcessor,
+    MapFeatureNames,
+    ProcessBeforeParquet,
+    ProcessEndpointEvent,
+    WriteParquetBatch,
+)
 
 
 @pytest.mark.parametrize("tsdb_connector", ["v3io", "taosws"])
 @pytest.mark.parametrize("endpoint_store", ["v3io", "mysql"])
-def test_plot_monitoring_serving_graph(tsdb_connector, endpoint_store):
+@pytest.mark.parametrize("columnar", [False, True])
+def test_plot_monitoring_serving_graph(tsdb_connector, endpoint_store, columnar):
     project_name = "test-stream-processing"
     project = mlrun.get_or_create_project(project_name)
 
@@ -29,6 +53,7 @@ def test_plot_monitoring_serving_graph(tsdb_connector, endpoint_store):
         1000,
         10,
         "mytarget",
+        columnar=columnar,
     )
 
     fn = project.set_function(
@@ -50,8 +75,212 @@ def test_plot_monitoring_serving_graph(tsdb_connector, endpoint_store):
     graph = fn.spec.graph.plot(rankdir="TB")
     print()
     print(
-        f"Graphviz graph definition with tsdb_connector={tsdb_connector}, endpoint_store={endpoint_store}"
+        f"Graphviz graph definition with tsdb_connector={tsdb_connector}, endpoint_store={endpoint_store}, "
+        f"columnar={columnar}"
     )
     print("Feed this to graphviz, or to https://dreampuf.github.io/GraphvizOnline")
     print()
     print(graph)
+
+
+_FEATURES_COUNT = 10
+
+
+def _generate_events(
+    invocations: int, predictions_per_invocation: int
+) -> typing.Iterator[dict]:
+    start = datetime.datetime(2024, 1, 1, 10, 55, tzinfo=datetime.timezone.utc)
+    for i in range(invocations):
+        yield {
+            EventFieldType.FUNCTION_URI: "test-stream-processing/my-fn",
+            EventFieldType.MODEL: "my-model",
+            EventFieldType.VERSIONED_MODEL: "my-model:latest",
+            EventFieldType.ENDPOINT_ID: "my-endpoint",
+            "when": (start + datetime.timedelta(seconds=10 * i)).isoformat(
+                sep=" ", timespec="microseconds"
+            ),
+            "microsec": 100 + i,
+            "class": "MyModel",
+            "request": {
+                "id": f"request-{i}",
+                "inputs": [
+                    [j * _FEATURES_COUNT + k for k in range(_FEATURES_COUNT)]
+                    for j in range(predictions_per_invocation)
+                ],
+            },
+            "resp": {"outputs": [float(j) for j in range(predictions_per_invocation)]},
+        }
+
+
+def _run_stream_graph(
+    columnar: bool, parquet_path: str, events: list[dict]
+) -> tuple[float, dict[str, list]]:
+    """Run the main monitoring stream steps on a local in-memory stream, where the KV and TSDB targets are replaced
+    by collecting the events. Returns the run duration and the collected events."""
+    collected = {}
+
+    def collect(name: str) -> storey.Map:
+        def _collect(event):
+            collected.setdefault(name, []).append(event)
+            return event
+
+        return storey.Map(_collect)
+
+    source = storey.SyncEmitSource()
+    events_flow = source.to(
+        ProcessEndpointEvent(
+            project="test-stream-processing", columnar=columnar, full_event=True
+        )
+    ).to(storey.Filter(lambda event: event is not None))
+    if not columnar:
+        events_flow = events_flow.to(storey.FlatMap(lambda event: event))
+    mapped = events_flow.to(
+        MapFeatureNames(
+            project="test-stream-processing",
+            infer_columns_from_data=True,
+            columnar=columnar,
+        )
+    )
+
+    if columnar:
+        aggregated = mapped.to(AggregateLatency(windows=["5m", "1h"], period="5m"))
+        aggregated.to(collect("aggregated"))
+        aggregated.to(SamplePredictions(window_size=10)).to(
+            storey.FlatMap(lambda event: event)
+        ).to(collect("samples"))
+        mapped.to(
+            UnpackPredictions(fields=[EventFieldType.TIMESTAMP, EventFieldType.LATENCY])
+        ).to(storey.FlatMap(lambda event: event)).to(collect("predictions"))
+        mapped.to(ProcessBeforeParquet(columnar=True)).to(
+            storey.Batch(max_events=1000, flush_after_seconds=60)
+        ).to(WriteParquetBatch(path=parquet_path))
+    else:
+        aggregated = mapped.to(
+            storey.AggregateByKey(
+                [
+                    storey.FieldAggregator(
+                        EventFieldType.LATENCY,
+                        EventFieldType.LATENCY,
+                        ["count", "avg"],
+                        storey.SlidingWindows(["5m", "1h"], "5m"),
+                    )
+                ],
+                storey.Table(".", storey.NoopDriver()),
+                key_field=EventFieldType.ENDPOINT_ID,
+            )
+        )
+        aggregated.to(collect("aggregated"))
+        aggregated.to(
+            storey.steps.SampleWindow(window_size=10, key=EventFieldType.ENDPOINT_ID)
+        ).to(collect("samples"))
+        mapped.to(collect("predictions"))
+        mapped.to(ProcessBeforeParquet()).to(
+            storey.ParquetTarget(
+                parquet_path,
+                max_events=10_000,
+                flush_after_seconds=60,
+                attributes={"infer_columns_from_data": True},
+                index_cols=[EventFieldType.ENDPOINT_ID],
+                key_bucketing_number=0,
+                time_partitioning_granularity="hour",
+                time_field=EventFieldType.TIMESTAMP,
+                partition_cols=["$key", "$year", "$month", "$day", "$hour"],
+            )
+        )
+
+    endpoint_record = {
+        EventFieldType.FEATURE_NAMES: json.dumps(
+            [f"feature_{i}" for i in range(_FEATURES_COUNT)]
+        ),
+        EventFieldType.LABEL_NAMES: json.dumps(["label"]),
+        EventFieldType.ENDPOINT_TYPE: "1",
+    }
+    with unittest.mock.patch.object(
+        mlrun.model_monitoring.helpers,
+        "get_endpoint_record",
+        return_value=endpoint_record,
+    ):
+        controller = source.run()
+        start = time.perf_counter()
+        for event in events:
+            controller.emit(event, key=event[EventFieldType.ENDPOINT_ID])
+        controller.terminate()
+        controller.await_termination()
+        duration = time.perf_counter() - start
+    return duration, collected
+
+
+def _read_parquet(path: pathlib.Path) -> pd.DataFrame:
+    predictions = pd.read_parquet(path).astype({"key": str})
+    return (
+        predictions[sorted(predictions.columns)]
+        .sort_values(["request_id", "label"])
+        .reset_index(drop=True)
+    )
+
+
+def test_columnar_stream_processing(tmp_path: pathlib.Path):
+    events = list(_generate_events(invocations=40, predictions_per_invocation=7))
+    _, rows_collected = _run_stream_graph(
+        columnar=False, parquet_path=str(tmp_path / "rows"), events=events
+    )
+    _, columnar_collected = _run_stream_graph(
+        columnar=True, parquet_path=str(tmp_path / "columnar"), events=events
+    )
+
+    # the predictions are written to the same parquet partitions with the same data
+    assert len(list((tmp_path / "columnar").rglob("*.parquet"))) == 2
+    pd.testing.assert_frame_equal(
+        _read_parquet(tmp_path / "rows"), _read_parquet(tmp_path / "columnar")
+    )
+
+    assert len(rows_collected["predictions"]) == 40 * 7
+    assert len(columnar_collected["predictions"]) == 40 * 7
+
+    for window in ["5m", "1h"]:
+        for aggregation in ["count", "avg"]:
+            key = f"latency_{aggregation}_{window}"
+            assert (
+                rows_collected["aggregated"][-1][key]
+                == columnar_collected["aggregated"][-1][key]
+            )
+
+    # the same predictions are sampled (the first of every 10 predictions)
+    assert len(rows_collected["samples"]) == len(columnar_collected["samples"]) == 28
+    for rows_sample, columnar_sample in zip(
+        rows_collected["samples"], columnar_collected["samples"]
+    ):
+        for key in [
+            EventFieldType.REQUEST_ID,
+            EventFieldType.NAMED_FEATURES,
+            EventFieldType.NAMED_PREDICTIONS,
+        ]:
+            assert rows_sample[key] == columnar_sample[key]
+
+
+def test_columnar_stream_processing_throughput(tmp_path: pathlib.Path):
+    invocations, predictions_per_invocation = 200, 100
+    events = list(
+        _generate_events(
+            invocations=invocations,
+            predictions_per_invocation=predictions_per_invocation,
+        )
+    )
+    # the rows mode logs every event, keep the logs out of the measurement
+    with unittest.mock.patch("mlrun.model_monitoring.stream_processing.logger"):
+        rows_duration, _ = _run_stream_graph(
+            columnar=False, parquet_path=str(tmp_path / "rows"), events=events
+        )
+        columnar_duration, _ = _run_stream_graph(
+            columnar=True, parquet_path=str(tmp_path / "columnar"), events=events
+        )
+
+    predictions_count = invocations * predictions_per_invocation
+    rows_throughput = predictions_count / rows_duration
+    columnar_throughput = predictions_count / columnar_duration
+    print(
+        f"Stream processing of {predictions_count} predictions ({invocations} invocations): "
+        f"rows mode {rows_throughput:.0f} predictions/sec, "
+        f"columnar mode {columnar_throughput:.0f} predictions/sec, "
+        f"speedup x{columnar_throughput / rows_throughput:.1f}"
+    )
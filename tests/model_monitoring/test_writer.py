@@ -15,6 +15,7 @@
 import datetime
 import json
 import os
+import time
 from collections.abc import Iterator
 from unittest.mock import Mock, patch
 
@@ -31,9 +32,11 @@ from mlrun.model_monitoring.writer import (
     ModelMonitoringWriter,
     ResultData,
     WriterEvent,
+    WriterEventKind,
     _AppResultEvent,
     _Notifier,
     _RawEvent,
+    _StoreWriteBuffer,
     _WriterEventTypeError,
     _WriterEventValueError,
 )
@@ -127,6 +130,87 @@ def test_reconstruct_event_error(event: _RawEvent, exception: type[Exception]) -
         ModelMonitoringWriter._reconstruct_event(event)
 
 
+class TestStoreWriteBuffer:
+    @staticmethod
+    def test_flush_on_max_events() -> None:
+        store = Mock()
+        buffer = _StoreWriteBuffer(store=store, max_events=3, timeout=60)
+        events = [({"index": i}, WriterEventKind.RESULT) for i in range(7)]
+        for event, kind in events:
+            buffer.add(event=event, kind=kind)
+        assert [
+            call.kwargs["events"]
+            for call in store.write_application_events.call_args_list
+        ] == [
+            events[:3],
+            events[3:6],
+        ]
+        buffer.flush()
+        assert store.write_application_events.call_args.kwargs["events"] == events[6:]
+
+    @staticmethod
+    def test_flush_on_timeout() -> None:
+        store = Mock()
+        buffer = _StoreWriteBuffer(store=store, max_events=100, timeout=0.1)
+        buffer.add(event={"index": 0}, kind=WriterEventKind.METRIC)
+        store.write_application_events.assert_not_called()
+        deadline = time.monotonic() + 5
+        while not store.write_application_events.called and time.monotonic() < deadline:
+            time.sleep(0.05)
+        store.write_application_events.assert_called_once_with(
+            events=[({"index": 0}, WriterEventKind.METRIC)]
+        )
+
+    @staticmethod
+    def test_failed_write_keeps_events() -> None:
+        store = Mock()
+        store.write_application_events.side_effect = [RuntimeError("db is down"), None]
+        buffer = _StoreWriteBuffer(store=store, max_events=2, timeout=60)
+        buffer.add(event={"index": 0}, kind=WriterEventKind.RESULT)
+        with pytest.raises(RuntimeError):
+            buffer.add(event={"index": 1}, kind=WriterEventKind.RESULT)
+        buffer.add(event={"index": 2}, kind=WriterEventKind.RESULT)
+        assert [
+            event["index"]
+            for event, _ in store.write_application_events.call_args.kwargs["events"]
+        ] == [0, 1, 2]
+
+    @staticmethod
+    def test_failed_writes_keep_bounded_events() -> None:
+        store = Mock()
+        store.write_application_events.side_effect = RuntimeError("db is down")
+        buffer = _StoreWriteBuffer(
+            store=store, max_events=2, timeout=60, max_buffered_events=3
+        )
+        buffer.add(event={"index": 0}, kind=WriterEventKind.RESULT)
+        for index in range(1, 6):
+            with pytest.raises(RuntimeError):
+                buffer.add(event={"index": index}, kind=WriterEventKind.RESULT)
+        # only the newest events are kept while the store is down
+        assert [
+            event["index"]
+            for event, _ in store.write_application_events.call_args.kwargs["events"]
+        ] == [2, 3, 4, 5]
+
+        store.write_application_events.side_effect = None
+        buffer._flush_on_exit()
+        assert [
+            event["index"]
+            for event, _ in store.write_application_events.call_args.kwargs["events"]
+        ] == [3, 4, 5]
+
+    @staticmethod
+    def test_flush_on_exit() -> None:
+        store = Mock()
+        buffer = _StoreWriteBuffer(store=store, max_events=100, timeout=60)
+        buffer.add(event={"index": 0}, kind=WriterEventKind.RESULT)
+        store.write_application_events.assert_not_called()
+        buffer._flush_on_exit()
+        store.write_application_events.assert_called_once_with(
+            events=[({"index": 0}, WriterEventKind.RESULT)]
+        )
+
+
 class TestHistogramGeneralDriftResultEvent:
     @staticmethod
     @pytest.fixture
@@ -16,8 +16,10 @@
 # currently we are running it in the integration tests CI step so adding this file for unit tests for the httpdb
 import enum
 import io
+import re
 import unittest.mock
 
+import aioresponses
 import pytest
 import requests
 import requests_mock
@@ -25,7 +27,10 @@ import urllib3.exceptions
 
 import mlrun.artifacts.base
 import mlrun.config
+import mlrun.db.async_httpdb
 import mlrun.db.httpdb
+import mlrun.errors
+from tests.common_fixtures import aioresponses_mock
 
 
 class SomeEnumClass(str, enum.Enum):
@@ -313,3 +318,110 @@ def test_watch_logs_continue():
     assert (
         adapter.call_count == len(log_lines) + 1
     ), "should have called the adapter once per log line, and one more time at the end of log"
+
+
+def test_api_call_reuses_sessions():
+    db = mlrun.db.httpdb.HTTPRunDB("https://fake-url")
+    with (
+        requests_mock.Mocker() as mocker,
+        unittest.mock.patch.object(
+            db, "_init_session", wraps=db._init_session
+        ) as init_session,
+    ):
+        mocker.register_uri(requests_mock.ANY, requests_mock.ANY, json={})
+        for _ in range(2):
+            db.api_call("GET", "projects")
+            db.api_call("POST", "projects")
+            db.api_call("POST", "run/default/uid")
+
+    # one session for the non retriable requests, and one for the retriable POST requests
+    assert init_session.call_count == 2
+    assert init_session.call_args_list[1] == unittest.mock.call(retry_on_post=True)
+
+
+def test_list_runs_paginated():
+    db = mlrun.db.httpdb.HTTPRunDB("https://fake-url")
+    runs_url = "https://fake-url/api/v1/projects/some-project/runs"
+    with requests_mock.Mocker() as mocker:
+        mocker.get(
+            runs_url,
+            [
+                {"json": {"runs": [{"uid": "1"}], "pagination": {"page-token": "a"}}},
+                {"json": {"runs": [{"uid": "2"}], "pagination": {"page-token": None}}},
+            ],
+        )
+        runs = db.list_runs(project="some-project", name="some-run")
+
+    assert [run["uid"] for run in runs] == ["1", "2"]
+    assert mocker.request_history[0].qs["name"] == ["some-run"]
+    assert mocker.request_history[1].qs == {"page-token": ["a"]}
+
+
+def _mock_paginated_runs(aioresponses_mock: aioresponses_mock, pages: list[list[dict]]):
+    def callback(url, **kwargs):
+        page_token = url.query.get("page-token")
+        page_index = int(page_token) if page_token else 0
+        next_page_token = str(page_index + 1) if page_index + 1 < len(pages) else None
+        return aioresponses.CallbackResult(
+            payload={
+                "runs": pages[page_index],
+                "pagination": {"page-token": next_page_token},
+            }
+        )
+
+    aioresponses_mock.get(
+        re.compile(r"https://fake-url/api/v1/projects/some-project/runs.*"),
+        callback=callback,
+        repeat=True,
+    )
+
+
+async def test_async_stream_runs(aioresponses_mock: aioresponses_mock):
+    pages = [[{"uid": f"{page}-{index}"} for index in range(2)] for page in range(3)]
+    _mock_paginated_runs(aioresponses_mock, pages)
+
+    async with mlrun.db.async_httpdb.AsyncHTTPRunDB("https://fake-url") as db:
+        runs = [
+            run["uid"]
+            async for run in db.stream_runs(
+                project="some-project", states=["completed", "error"]
+            )
+        ]
+        run_list = await db.list_runs(project="some-project", name="some-run")
+
+    assert runs == [run["uid"] for page in pages for run in page]
+    assert len(run_list) == 6
+
+    requests = [call for calls in aioresponses_mock.requests.values() for call in calls]
+    assert len(requests) == 6
+    first_page_params = requests[0].kwargs["params"]
+    assert ("state", "completed") in first_page_params
+    assert ("state", "error") in first_page_params
+    assert ("page", "1") in first_page_params
+
+
+async def test_async_stream_runs_stop_consuming(aioresponses_mock: aioresponses_mock):
+    pages = [[{"uid": f"{page}"}] for page in range(3)]
+    _mock_paginated_runs(aioresponses_mock, pages)
+
+    async with mlrun.db.async_httpdb.AsyncHTTPRunDB("https://fake-url") as db:
+        async for response_body in db.paginated_api_call(
+            "GET", "projects/some-project/runs"
+        ):
+            assert response_body["runs"] == pages[0]
+            break
+
+    # the second page was prefetched, the third was not requested
+    requests = [call for calls in aioresponses_mock.requests.values() for call in calls]
+    assert len(requests) <= 2
+
+
+async def test_async_api_call_error(aioresponses_mock: aioresponses_mock):
+    aioresponses_mock.get(
+        "https://fake-url/api/v1/projects/some-project",
+        status=404,
+        payload={"detail": "project not found"},
+    )
+    async with mlrun.db.async_httpdb.AsyncHTTPRunDB("https://fake-url") as db:
+        with pytest.raises(mlrun.errors.MLRunNotFoundError, match="project not found"):
+            await db.api_call("GET", "projects/some-project", "get project")
@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import os
+import time
+
+import numpy as np
 import pytest
 
 import mlrun
@@ -54,3 +58,131 @@ def test_parallel(executor):
 
     resp = server.test("", {"x": 9})
     assert resp == {"x": 9, "a": 1, "b": 2, "c": 7, "mul": 18}
+
+
+def slow_hnd(event):
+    """example handler which doesn't respond in time"""
+    time.sleep(2)
+    return {"slow": True}
+
+
+@pytest.mark.parametrize("engine", [None, "async"])
+def test_parallel_asyncio_route_timeout(engine):
+    fn = mlrun.new_function("tests", kind="serving")
+    router = mlrun.serving.routers.ParallelRun(
+        extend_event=True, executor_type="asyncio", route_timeout=0.5
+    )
+    if engine:
+        graph = fn.set_topology("flow", engine=engine)
+        graph = graph.to(router, name="router").respond()
+    else:
+        graph = fn.set_topology("router", router)
+    graph.add_route("c1", class_name="Echo", data={"a": 1})
+    graph.add_route("c2", handler="my_hnd")
+    graph.add_route("c3", handler="slow_hnd")
+
+    server = fn.to_mock_server()
+    resp = server.test(body={"x": 8})
+    assert resp == {"x": 8, "a": 1, "mul": 16}
+    if engine:
+        server.wait_for_completion()
+
+
+def test_parallel_asyncio_timed_out_routes_keep_threads():
+    fn = mlrun.new_function("tests", kind="serving")
+    router = mlrun.serving.routers.ParallelRun(
+        extend_event=True,
+        executor_type="asyncio",
+        route_timeout=0.5,
+        max_concurrent_events=4,
+    )
+    graph = fn.set_topology("router", router)
+    graph.add_route("c1", class_name="Echo", data={"a": 1})
+    graph.add_route("c2", handler="slow_hnd")
+
+    server = fn.to_mock_server()
+    # the timed out slow routes still run in their threads, the next events get other threads
+    for i in range(3):
+        assert server.test(body={"x": i}) == {"x": i, "a": 1}
+
+    router = server.graph._object
+    loop = router._loop
+    router._shutdown_pool()
+    assert loop.is_closed()
+
+
+class AsyncEcho:
+    """example class with a non-blocking handler"""
+
+    def __init__(self, context, name=None, async_handler_enabled=True):
+        self.context = context
+        self.name = name
+        self.async_handler_enabled = async_handler_enabled
+
+    def do_event(self, event):
+        event.body = {"sync": True}
+        return event
+
+    async def do_event_async(self, event):
+        event.body = {"async": True}
+        return event
+
+
+def test_parallel_asyncio_async_routes():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology(
+        "router",
+        mlrun.serving.routers.ParallelRun(extend_event=True, executor_type="asyncio"),
+    )
+    graph.add_route("c1", class_name="AsyncEcho")
+    # the route class disables its async handler, so it runs in the thread pool
+    graph.add_route("c2", class_name="AsyncEcho", async_handler_enabled=False)
+
+    server = fn.to_mock_server()
+    assert server.test(body={"x": 8}) == {"x": 8, "async": True, "sync": True}
+    server.graph._object._shutdown_pool()
+
+
+def array_sum(event):
+    """example handler which reduces a large payload"""
+    return {f"sum_{event['scale']}": float(np.sum(event["data"]) * event["scale"])}
+
+
+def _parallel_run_latency(executor, num_routes=4, iterations=100) -> tuple:
+    """return the p50 and p99 latencies (in seconds) of a large payload over the parallel routes"""
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology(
+        "router",
+        mlrun.serving.routers.ParallelRun(executor_type=executor),
+    )
+    for i in range(num_routes):
+        graph.add_route(f"c{i}", handler="array_sum")
+
+    server = fn.to_mock_server()
+    data = np.ones((256, 1024))
+    latencies = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        resp = server.test(body={"data": data, "scale": 1})
+        latencies.append(time.perf_counter() - start)
+    assert resp == {"sum_1": float(data.size)}
+    server.graph._object._shutdown_pool()
+    p50, p99 = np.percentile(latencies, [50, 99])
+    return float(p50), float(p99)
+
+
+@pytest.mark.skipif(
+    not os.environ.get("MLRUN_RUN_BENCHMARKS"),
+    reason="benchmark, set MLRUN_RUN_BENCHMARKS to run",
+)
+def test_parallel_latency_benchmark():
+    modes = mlrun.serving.routers.ParallelRunnerModes
+    latencies = {
+        mode: _parallel_run_latency(mode)
+        for mode in [modes.thread, modes.process, modes.worker]
+    }
+    for p50, p99 in latencies.values():
+        assert 0 < p50 <= p99
+    # the warm workers get the payload through shared memory instead of a pickled copy per route
+    assert latencies[modes.worker][0] < latencies[modes.process][0], latencies
+    assert latencies[modes.worker][1] < latencies[modes.process][1], latencies
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import concurrent.futures
+import json
 import re
 import time
 
@@ -342,6 +344,78 @@ def _echo_handler(request: Request):
     return Response(request.data, status=200)
 
 
+def _batch_handler(request: Request):
+    # the concurrent events join the next batch while this request is processed
+    time.sleep(0.1)
+    return Response(
+        json.dumps([{"y": item["x"] * 2} for item in request.json]),
+        status=200,
+        content_type="application/json",
+    )
+
+
+def test_remote_step_batching(httpserver):
+    httpserver.expect_request("/batch", method="POST").respond_with_handler(
+        _batch_handler
+    )
+    server = _new_server(
+        httpserver.url_for("/batch"),
+        "sync",
+        batch_size=4,
+        batch_wait=0.5,
+        max_in_flight=2,
+    )
+
+    endpoint = httpserver.url_for("/").rstrip("/")
+
+    def pool_requests():
+        # the connection pool is shared with previous tests calling the same endpoint
+        metrics = server.context.get_remote_pools_metrics().get(endpoint, [])
+        return sum(pool_metrics["requests"] for pool_metrics in metrics)
+
+    requests_before = pool_requests()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(executor.map(lambda x: server.test(body={"x": x}), range(4)))
+
+    # each event should get its own result back from the batched request
+    assert responses == [{"y": x * 2} for x in range(4)]
+    batch_requests = pool_requests() - requests_before
+    assert 0 < batch_requests < 4, "events were not batched"
+    for pool_metrics in server.context.get_remote_pools_metrics()[endpoint]:
+        assert pool_metrics["in_flight"] == 0
+
+
+def test_remote_connection_pools_per_max_connections():
+    from mlrun.serving.remote import _get_connection_pool
+
+    url = "http://remote-pools-test:8080/path"
+    pool = _get_connection_pool(url, 2, 3, 1)
+    assert _get_connection_pool(url + "/other", 2, 3, 1) is pool
+    larger_pool = _get_connection_pool(url, 8, 3, 1)
+    assert larger_pool is not pool
+    assert larger_pool.max_connections == 8
+
+    # the keep-alive pool of the mounted adapter is sized by max_connections
+    adapter = larger_pool.session.get_adapter(url)
+    assert adapter._pool_maxsize == 8
+    assert adapter.max_retries.total == 3
+    # connection and read errors are not retried (the requests may not be idempotent)
+    assert adapter.max_retries.connect == 0
+    assert adapter.max_retries.read == 0
+
+
+def test_remote_connection_pool_per_host():
+    from mlrun.serving.remote import RemoteStep
+
+    step = RemoteStep(url_expression="event['url']", max_in_flight=3)
+    first_pool = step._get_session("http://remote-host-1:8080/a")
+    assert step._get_session("http://remote-host-1:8080/b") is first_pool
+    second_pool = step._get_session("http://remote-host-2:8080/a")
+    assert second_pool is not first_pool
+    assert second_pool.endpoint == "http://remote-host-2:8080"
+    assert second_pool.max_connections == 3
+
+
 def test_parallel_remote(httpserver):
     # test calling multiple http clients
     from mlrun.serving.remote import BatchHttpRequests
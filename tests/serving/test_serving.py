@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import concurrent.futures
 import json
 import os
 import pathlib
@@ -425,6 +426,40 @@ def test_ensemble_infer_with_weights(ensemble_spec_parm, executor):
     run_model("", res)
 
 
+class SlowEnsembleModelTestingClass(EnsembleModelTestingClass):
+    def predict(self, request):
+        time.sleep(2)
+        return super().predict(request)
+
+
+def test_ensemble_infer_partial_results():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology(
+        "router",
+        mlrun.serving.routers.VotingEnsemble(
+            vote_type="regression",
+            prediction_col_name="predictions",
+            format_response_with_col_name_flag=True,
+            executor_type="asyncio",
+            route_timeout=0.5,
+        ),
+    )
+    graph.add_route(
+        "m1", class_name="EnsembleModelTestingClass", model_path="", multiplier=100
+    )
+    graph.add_route(
+        "m2", class_name="EnsembleModelTestingClass", model_path="", multiplier=300
+    )
+    graph.add_route(
+        "m3", class_name="SlowEnsembleModelTestingClass", model_path="", multiplier=900
+    )
+    server = fn.to_mock_server()
+
+    # the vote is applied only on the models which responded in time (m1, m2)
+    resp = server.test("/v2/models/infer", testdata_2)
+    assert resp["outputs"] == {"predictions": [1000.0, 1000.0]}
+
+
 def test_v2_infer():
     def run_model(url, expected):
         event = MockEvent(testdata, path=f"/v2/models/{url}/infer")
@@ -439,6 +474,112 @@ def test_v2_infer():
     run_model("m3/versions/v2", 2000)
 
 
+class BatchingModelTestingClass(V2ModelServer):
+    def load(self):
+        self.batch_sizes = []
+
+    def predict(self, request):
+        self.batch_sizes.append(len(request["inputs"]))
+        # the concurrent requests join the next batch while this batch is processed
+        time.sleep(0.1)
+        return [value * 10 for value in request["inputs"]]
+
+
+def test_v2_predict_batching():
+    model = BatchingModelTestingClass(
+        name="m1", model_path="", max_batch_size=4, max_batch_wait=0.5
+    )
+    model.load()
+    model.ready = True
+
+    def infer(index):
+        event = MockEvent({"inputs": [index, index + 1]}, path="/infer")
+        return model.do_event(event).body
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(executor.map(infer, range(4)))
+
+    # every caller should get only its own slice of the batched result
+    for index, response in enumerate(responses):
+        assert response["outputs"] == [index * 10, (index + 1) * 10]
+    assert sum(model.batch_sizes) == 8
+    assert len(model.batch_sizes) < 4, "requests were not batched"
+
+
+def test_v2_predict_batching_single_caller_does_not_wait():
+    model = BatchingModelTestingClass(
+        name="m1", model_path="", max_batch_size=4, max_batch_wait=5
+    )
+    model.load()
+    model.ready = True
+
+    start = time.monotonic()
+    for index in range(3):
+        event = MockEvent({"inputs": [index]}, path="/infer")
+        assert model.do_event(event).body["outputs"] == [index * 10]
+    assert time.monotonic() - start < 1, "single caller waited for the batch"
+    assert model.batch_sizes == [1, 1, 1]
+
+
+def test_v2_predict_batching_in_async_flow():
+    fn = mlrun.new_function("demo", kind="serving")
+    graph = fn.set_topology("flow", engine="async")
+    graph.to(
+        BatchingModelTestingClass(
+            name="m1", model_path=".", max_batch_size=4, max_batch_wait=1
+        )
+    ).respond()
+    server = fn.to_mock_server()
+    model = server.graph["m1"]._object
+
+    def infer(index):
+        return server.test(body={"inputs": [index, index + 1]})
+
+    # the events are emitted concurrently and handled by the single event loop thread
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        responses = list(executor.map(infer, range(8)))
+    server.wait_for_completion()
+
+    for index, response in enumerate(responses):
+        assert response["outputs"] == [index * 10, (index + 1) * 10]
+    assert sum(model.batch_sizes) == 16
+    assert len(model.batch_sizes) < 8, "requests were not batched"
+    assert max(model.batch_sizes) <= 8
+
+
+class OverriddenEventModelTestingClass(BatchingModelTestingClass):
+    def do_event(self, event, *args, **kwargs):
+        event = super().do_event(event, *args, **kwargs)
+        event.body["overridden"] = True
+        return event
+
+
+@pytest.mark.parametrize(
+    "model_class, max_batch_size, expected_handler",
+    [
+        (BatchingModelTestingClass, 1, "do_event"),
+        (BatchingModelTestingClass, 4, "do_event_async"),
+        # an overridden do_event is always called
+        (OverriddenEventModelTestingClass, 4, "do_event"),
+    ],
+)
+def test_v2_async_flow_handler(model_class, max_batch_size, expected_handler):
+    fn = mlrun.new_function("demo", kind="serving")
+    graph = fn.set_topology("flow", engine="async")
+    graph.to(
+        model_class(name="m1", model_path=".", max_batch_size=max_batch_size)
+    ).respond()
+    server = fn.to_mock_server()
+    assert server.graph["m1"]._handler.__name__ == expected_handler
+
+    response = server.test(body={"inputs": [1, 2]})
+    server.wait_for_completion()
+    assert response["outputs"] == [10, 20]
+    assert response.get("overridden") == (
+        model_class is OverriddenEventModelTestingClass
+    )
+
+
 def test_v2_stream_mode():
     # model and operation are specified inside the message body
     context = init_ctx()
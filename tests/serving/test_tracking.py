@@ -13,6 +13,8 @@
 # limitations under the License.
 #
 import json
+import threading
+import time
 from pprint import pprint
 from unittest.mock import patch
 
@@ -21,6 +23,7 @@ import pytest
 
 import mlrun
 from mlrun.common.schemas import ModelMonitoringMode
+from mlrun.serving.utils import _BackgroundSender
 from tests.serving.test_serving import _log_model
 
 testdata = '{"inputs": [[5, 6]]}'
@@ -126,6 +129,163 @@ def test_tracked_function(rundb_mock, enable_tracking):
         ), "model_uri attribute of the model endpoint was not updated as expected"
 
 
+@pytest.mark.parametrize("background", [True, False])
+def test_tracking_micro_batch(background):
+    # test that the events are pushed in micro batches, the last partial batch after the linger time
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.add_model("my", ".", class_name=ModelTestingClass(multiplier=2))
+    fn.set_tracking(
+        "v3io://fake", batch=3, stream_args={"mock": True, "access_key": "x"}
+    )
+    fn.spec.parameters["log_stream_background"] = background
+    fn.spec.parameters["log_stream_linger"] = 0.1
+
+    server = fn.to_mock_server()
+    fake_stream = server.context.stream.output_stream._mock_queue
+    for _ in range(4):
+        server.graph.run(
+            mlrun.serving.server.MockEvent(testdata, path="/v2/models/my/infer")
+        )
+
+    if background:
+        stream = server.context.stream
+        deadline = time.monotonic() + 5
+        while (
+            stream.get_stats()["log-stream-my"]["sent"] < 4
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+        assert stream.get_stats()["log-stream-my"]["queue_depth"] == 0
+        assert [len(json.loads(rec["data"])["values"]) for rec in fake_stream] == [
+            3,
+            1,
+        ]
+    else:
+        # without a background sender only full batches are pushed
+        assert len(fake_stream) == 1
+        assert len(json.loads(fake_stream[0]["data"])["values"]) == 3
+
+
+def test_background_sender_batches():
+    batches = []
+    sender = _BackgroundSender(batches.append, batch_size=2, max_linger=30)
+    for i in range(5):
+        assert sender.put(i)
+    assert sender.flush(timeout=5)
+    assert batches == [[0, 1], [2, 3], [4]]
+    assert sender.get_stats() == {
+        "queue_depth": 0,
+        "in_flight": 0,
+        "sent": 5,
+        "dropped": 0,
+        "sampled_out": 0,
+        "send_errors": 0,
+    }
+    sender.close(timeout=5)
+    assert not sender.put(5)
+
+
+def _blocked_sender(policy, **kwargs):
+    # the sender thread is stuck in send() until the returned event is set
+    release = threading.Event()
+    batches = []
+
+    def send(batch):
+        release.wait(5)
+        batches.append(batch)
+
+    sender = _BackgroundSender(
+        send, batch_size=1, max_linger=0, policy=policy, **kwargs
+    )
+    sender.put("first")
+    deadline = time.monotonic() + 5
+    while sender.get_stats()["in_flight"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return sender, release, batches
+
+
+def test_background_sender_drop_policy():
+    sender, release, batches = _blocked_sender("drop", max_queue_size=4)
+    results = [sender.put(i) for i in range(10)]
+    assert results == [True] * 4 + [False] * 6
+    assert sender.get_stats()["dropped"] == 6
+    release.set()
+    assert sender.flush(timeout=5)
+    assert batches == [["first"], [0], [1], [2], [3]]
+
+
+def test_background_sender_logs_drops(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(
+        mlrun.serving.utils.logger,
+        "warning",
+        lambda message, **kwargs: warnings.append((message, kwargs)),
+    )
+    sender, release, _ = _blocked_sender("drop", max_queue_size=1)
+    for i in range(5):
+        sender.put(i)
+    release.set()
+    assert sender.flush(timeout=5)
+
+    # the drops are logged once per drop_log_interval, with the counters
+    assert len(warnings) == 1
+    message, kwargs = warnings[0]
+    assert message == "Background sender is dropping items"
+    assert kwargs["dropped"] == 1
+
+
+def test_background_sender_sample_policy():
+    sender, release, batches = _blocked_sender(
+        "sample", max_queue_size=10, sample_every=3
+    )
+    results = [sender.put(i) for i in range(14)]
+    release.set()
+    assert sender.flush(timeout=5)
+    stats = sender.get_stats()
+    # the first 5 items fill half of the queue, then only one of every 3 items is kept
+    assert [i for i, result in enumerate(results) if result] == [
+        0,
+        1,
+        2,
+        3,
+        4,
+        7,
+        10,
+        13,
+    ]
+    assert stats["sampled_out"] == 6
+    assert stats["sent"] == 9
+
+
+def test_background_sender_block_policy():
+    sender, release, batches = _blocked_sender("block", max_queue_size=2)
+    sender.put(0)
+    sender.put(1)
+    blocked = threading.Thread(target=sender.put, args=(2,))
+    blocked.start()
+    blocked.join(0.2)
+    assert blocked.is_alive(), "expected put() to wait for room in the queue"
+    release.set()
+    blocked.join(5)
+    assert sender.flush(timeout=5)
+    assert batches == [["first"], [0], [1], [2]]
+    assert sender.get_stats()["dropped"] == 0
+
+
+def test_background_sender_send_error():
+    def send(batch):
+        raise RuntimeError("stream is down")
+
+    sender = _BackgroundSender(send, batch_size=2, max_linger=0)
+    sender.put(0)
+    sender.put(1)
+    assert sender.flush(timeout=5)
+    stats = sender.get_stats()
+    assert stats["send_errors"] >= 1
+    assert stats["dropped"] == 2
+    assert stats["sent"] == 0
+
+
 def rec_to_data(rec):
     data = json.loads(rec["data"])
     inputs = data["request"]["inputs"]
@@ -0,0 +1,58 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import subprocess
+import sys
+
+import pytest
+
+# modules which are slow to import and must only be imported by the processes which use them
+heavy_modules = [
+    "kfp",
+    "mlrun_pipelines.mounts",
+    "mlrun.feature_store",
+    "mlrun.projects",
+    "mlrun.run",
+    "mlrun.runtimes",
+]
+
+
+def _import_in_subprocess(statement: str) -> list[str]:
+    """run the import statement in a fresh interpreter and return the imported modules"""
+    code = f"{statement}; import json, sys; print(json.dumps(sorted(sys.modules)))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True)
+    return json.loads(out.stdout.decode("utf-8"))
+
+
+# the import time is kept low by not importing the heavy modules (wall clock budgets are too flaky for the CI)
+@pytest.mark.parametrize(
+    "statement, unexpected_modules",
+    [
+        (
+            "import mlrun",
+            heavy_modules + ["mlrun.datastore", "mlrun.package", "storey"],
+        ),
+        # the CLI
+        ("import mlrun.__main__", heavy_modules),
+        # the DB client
+        ("import mlrun.db.factory; from mlrun.db import get_run_db", heavy_modules),
+        # the serving functions
+        ("from mlrun.serving.serving_wrapper import init_context", heavy_modules),
+    ],
+)
+def test_import_time(statement, unexpected_modules):
+    imported_modules = _import_in_subprocess(statement)
+
+    unexpectedly_imported = sorted(set(unexpected_modules) & set(imported_modules))
+    assert not unexpectedly_imported, f"'{statement}' imported {unexpectedly_imported}"
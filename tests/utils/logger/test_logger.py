@@ -14,6 +14,7 @@
 #
 import dataclasses
 import datetime
+import time
 from collections.abc import Generator
 from io import StringIO
 
@@ -177,3 +178,121 @@ def test_child_logger():
     # validate parent and child log lines
     assert "test-logger:debug" in log_lines[0]
     assert "test-logger.child:debug" in log_lines[1]
+
+
+@pytest.fixture
+def queue_logger() -> Generator:
+    stream = StringIO()
+    logger = create_logger("info", name="test-queue-logger", stream=stream)
+    logger.enable_queue_mode(max_queue_size=100)
+    yield stream, logger
+    logger.disable_queue_mode()
+
+
+def test_queue_mode(queue_logger):
+    stream, test_logger = queue_logger
+    assert test_logger.queue_mode
+    test_logger.info("Message %s", "somearg", somekwarg="somekwarg-value")
+    test_logger.debug("Disabled level")
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        test_logger.exception("Failed")
+
+    # the handlers of the logger are still reachable by their name
+    test_logger.replace_handler_stream("default", new_stream := StringIO())
+    test_logger.info("After replace")
+
+    test_logger.disable_queue_mode()
+    assert not test_logger.queue_mode
+    log_lines = stream.getvalue() + new_stream.getvalue()
+    assert "Message somearg" in log_lines
+    assert "somekwarg-value" in log_lines
+    assert "division by zero" in log_lines
+    assert "Disabled level" not in log_lines
+    assert "After replace" in new_stream.getvalue()
+
+    # back to writing on the caller's thread
+    test_logger.info("Sync")
+    assert "Sync" in new_stream.getvalue()
+
+
+@pytest.mark.parametrize(
+    ("drop_policy", "expected_messages"),
+    [("drop_new", ["0", "1"]), ("drop_oldest", ["3", "4"])],
+)
+def test_queue_mode_drop_policy(drop_policy, expected_messages):
+    stream = StringIO()
+    test_logger = create_logger("info", name="test-drop-logger", stream=stream)
+    test_logger.enable_queue_mode(max_queue_size=2, drop_policy=drop_policy)
+    # hold the listener so the queue fills up
+    handler = test_logger.get_handler("default")
+    handler.acquire()
+    try:
+        test_logger.info("first")
+        # wait for the listener to take the first record and block on the handler lock
+        deadline = time.monotonic() + 5
+        while (
+            not test_logger._queue_handler.queue.empty() and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+        for i in range(5):
+            test_logger.info(str(i))
+        assert test_logger.dropped_records == 3
+    finally:
+        handler.release()
+    test_logger.disable_queue_mode()
+    messages = [line.rsplit(" ", 1)[-1] for line in stream.getvalue().splitlines()]
+    assert messages == ["first"] + expected_messages
+
+
+class _SlowStream(StringIO):
+    """A stream with blocking writes, as a pipe to a slow log collector"""
+
+    def write(self, s: str) -> int:
+        time.sleep(0.0002)
+        return super().write(s)
+
+
+@pytest.mark.parametrize("stream_class", [StringIO, _SlowStream])
+def test_logging_overhead_benchmark(stream_class):
+    """Compare the per-call overhead of logging with a large payload, at a disabled and an enabled level"""
+    calls = 1000
+    payload = {
+        f"key-{i}": {"values": list(range(20)), "name": str(i)} for i in range(50)
+    }
+
+    def measure(test_logger: Logger, level: str) -> float:
+        start = time.perf_counter()
+        for _ in range(calls):
+            getattr(test_logger, level)("Results", results=payload)
+        return (time.perf_counter() - start) / calls * 1e6
+
+    sync_stream = stream_class()
+    sync_logger = create_logger(
+        "info", FormatterKinds.JSON.name, "test-bench-sync", sync_stream
+    )
+    queue_stream = stream_class()
+    queue_logger = create_logger(
+        "info", FormatterKinds.JSON.name, "test-bench-queue", queue_stream
+    )
+    queue_logger.enable_queue_mode(max_queue_size=calls, drop_policy="block")
+
+    results = {}
+    for name, test_logger in [("sync", sync_logger), ("queue", queue_logger)]:
+        for level in ["debug", "info"]:
+            results[(name, level)] = measure(test_logger, level)
+    queue_logger.disable_queue_mode()
+
+    # no record is lost and the written lines are the same
+    assert queue_logger.dropped_records == 0
+    assert len(queue_stream.getvalue().splitlines()) == calls
+    assert (
+        queue_stream.getvalue().splitlines()[0].split('"level"')[1]
+        == sync_stream.getvalue().splitlines()[0].split('"level"')[1]
+    )
+    for (name, level), duration in results.items():
+        print(
+            f"{stream_class.__name__}, {name} logger, {level} (enabled={level == 'info'}): "
+            f"{duration:.1f}us per call"
+        )
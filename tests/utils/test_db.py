@@ -0,0 +1,210 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import datetime
+import math
+import os
+import pickle
+import timeit
+
+import numpy as np
+import pytest
+
+import mlrun
+import mlrun.common.runtimes.constants
+import mlrun.common.schemas
+import mlrun.errors
+import mlrun.utils.db
+
+
+def _run_struct(results_count: int = 20, artifacts_count: int = 10) -> dict:
+    task = mlrun.new_task(
+        name="training",
+        project="project",
+        handler="train",
+        params={"lr": 0.01, "epochs": 10, "layers": [64, 32, 16]},
+        inputs={"dataset": "store://datasets/project/dataset:latest"},
+    ).set_label("owner", "admin")
+    run = mlrun.RunObject.from_template(task)
+    run.metadata.uid = "0123456789abcdef0123456789abcdef"
+    run.status.state = mlrun.common.runtimes.constants.RunStates.completed
+    run.status.start_time = "2024-08-12T10:14:32.418266+00:00"
+    run.status.results = {f"metric_{i}": i / 7 for i in range(results_count)}
+    run.status.artifacts = [
+        {
+            "kind": "model",
+            "metadata": {"key": f"model-{i}", "project": "project", "tree": "t1"},
+            "spec": {
+                "target_path": f"v3io:///projects/project/artifacts/model-{i}.pkl",
+                "parameters": {"depth": i},
+            },
+            "status": {"state": "created"},
+        }
+        for i in range(artifacts_count)
+    ]
+    return run.to_dict()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {},
+        {"a": 1, "b": [1.5, "x", None, True], "c": {"d": {"e": []}}},
+        _run_struct(),
+    ],
+)
+def test_encode_decode_body(value):
+    body = mlrun.utils.db.encode_body(value, "orjson")
+    assert body[0] == mlrun.utils.db.JSONBodyCodec.version
+    assert mlrun.utils.db.get_body_codec_name(body) == "orjson"
+    assert mlrun.utils.db.decode_body(body) == value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"datetime": datetime.datetime.now()},
+        {"numpy": np.float64(0.5)},
+        {1: "non string key"},
+        {"set": {1, 2}},
+    ],
+)
+def test_encode_body_fallback_to_pickle(value):
+    # values which json can't keep as they are, are pickled
+    body = mlrun.utils.db.encode_body(value, "orjson")
+    assert mlrun.utils.db.get_body_codec_name(body) == "pickle"
+    decoded = mlrun.utils.db.decode_body(body)
+    assert repr(decoded) == repr(value)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ({"tuple": (1, 2)}, {"tuple": [1, 2]}),
+        ({"nan": math.nan}, {"nan": None}),
+        ({"inf": math.inf}, {"inf": None}),
+    ],
+)
+def test_encode_body_json_values(value, expected):
+    # the bodies are stored as json (like the API requests they come from)
+    body = mlrun.utils.db.encode_body(value, "orjson")
+    assert mlrun.utils.db.get_body_codec_name(body) == "orjson"
+    assert mlrun.utils.db.decode_body(body) == expected
+
+
+def test_encode_body_enum_value():
+    # enum members are stored as their values
+    body = mlrun.utils.db.encode_body(
+        {"kind": mlrun.common.schemas.ScheduleKinds.job}, "orjson"
+    )
+    assert mlrun.utils.db.get_body_codec_name(body) == "orjson"
+    decoded = mlrun.utils.db.decode_body(body)
+    assert type(decoded["kind"]) is str
+    assert decoded == {"kind": "job"}
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_decode_legacy_pickled_body(protocol):
+    value = _run_struct()
+    body = pickle.dumps(value, protocol=protocol)
+    assert mlrun.utils.db.get_body_codec_name(body) == "pickle"
+    assert mlrun.utils.db.decode_body(body) == value
+
+
+def test_encode_body_configured_codec(monkeypatch):
+    value = {"a": 1}
+    monkeypatch.setattr(mlrun.mlconf.httpdb.db, "body_codec", "pickle")
+    assert mlrun.utils.db.encode_body(value) == pickle.dumps(value)
+    monkeypatch.setattr(mlrun.mlconf.httpdb.db, "body_codec", "orjson")
+    assert (
+        mlrun.utils.db.get_body_codec_name(mlrun.utils.db.encode_body(value))
+        == "orjson"
+    )
+
+    with pytest.raises(
+        mlrun.errors.MLRunInvalidArgumentError, match="Unknown body codec"
+    ):
+        mlrun.utils.db.encode_body(value, "yaml")
+
+
+def test_zstd_body_codec():
+    value = _run_struct()
+    if mlrun.utils.db.zstandard is None:
+        with pytest.raises(mlrun.errors.MLRunMissingDependencyError):
+            mlrun.utils.db.encode_body(value, "orjson-zstd")
+        return
+
+    body = mlrun.utils.db.encode_body(value, "orjson-zstd")
+    assert mlrun.utils.db.get_body_codec_name(body) == "orjson-zstd"
+    assert len(body) < len(mlrun.utils.db.encode_body(value, "orjson"))
+    assert mlrun.utils.db.decode_body(body) == value
+
+
+def test_register_body_codec_version_conflict():
+    class _Codec(mlrun.utils.db.JSONBodyCodec):
+        name = "other"
+
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError, match="already used"):
+        mlrun.utils.db.register_body_codec(_Codec())
+
+    _Codec.version = 0x80
+    with pytest.raises(
+        mlrun.errors.MLRunInvalidArgumentError, match="Invalid body codec"
+    ):
+        mlrun.utils.db.register_body_codec(_Codec())
+
+
+@pytest.mark.skipif(
+    not os.environ.get("MLRUN_RUN_BENCHMARKS"),
+    reason="benchmark, set MLRUN_RUN_BENCHMARKS to run",
+)
+@pytest.mark.parametrize("results_count", [20, 1000])
+def test_body_codec_benchmark(results_count: int):
+    value = _run_struct(
+        results_count=results_count, artifacts_count=results_count // 10
+    )
+    rounds = 100
+    codecs = ["pickle", "orjson"]
+    if mlrun.utils.db.zstandard is not None:
+        codecs.append("orjson-zstd")
+
+    timings = {}
+    for codec in codecs:
+        body = mlrun.utils.db.encode_body(value, codec)
+        assert mlrun.utils.db.get_body_codec_name(body) == codec
+        assert mlrun.utils.db.decode_body(body) == value
+
+        # the best of a few repeats, to reduce the noise
+        encode_time = (
+            min(
+                timeit.repeat(
+                    lambda: mlrun.utils.db.encode_body(value, codec),
+                    number=rounds,
+                    repeat=5,
+                )
+            )
+            / rounds
+        )
+        decode_time = (
+            min(
+                timeit.repeat(
+                    lambda: mlrun.utils.db.decode_body(body), number=rounds, repeat=5
+                )
+            )
+            / rounds
+        )
+        timings[codec] = encode_time + decode_time
+
+    # the json round trip is expected to be about as fast as pickle (or faster)
+    assert timings["orjson"] < 2 * timings["pickle"], timings